@@ -1,38 +1,75 @@
 """Coinbase AgentKit - Framework for enabling AI agents to take actions onchain."""
 
+from typing import TYPE_CHECKING
+
 from .__version__ import __version__
-from .action_providers import (
-    Action,
-    ActionProvider,
-    allora_action_provider,
-    basename_action_provider,
-    cdp_api_action_provider,
-    compound_action_provider,
-    create_action,
-    erc20_action_provider,
-    hyperbolic_action_provider,
-    morpho_action_provider,
-    nillion_action_provider,
-    onramp_action_provider,
-    pyth_action_provider,
-    ssh_action_provider,
-    superfluid_action_provider,
-    twitter_action_provider,
-    wallet_action_provider,
-    weth_action_provider,
-    wow_action_provider,
-)
+from ._lazy_imports import lazy_imports
+from .action_providers import Action, ActionProvider, create_action
 from .agentkit import AgentKit, AgentKitConfig
-from .wallet_providers import (
-    CdpEvmServerWalletProvider,
-    CdpEvmServerWalletProviderConfig,
-    CdpEvmSmartWalletProvider,
-    CdpEvmSmartWalletProviderConfig,
-    EthAccountWalletProvider,
-    EthAccountWalletProviderConfig,
-    EvmWalletProvider,
-    WalletProvider,
-)
+from .wallet_providers import WalletProvider
+
+if TYPE_CHECKING:
+    from .action_providers import (
+        allora_action_provider,
+        basename_action_provider,
+        cdp_api_action_provider,
+        compound_action_provider,
+        erc20_action_provider,
+        hyperbolic_action_provider,
+        morpho_action_provider,
+        nillion_action_provider,
+        onramp_action_provider,
+        pyth_action_provider,
+        ssh_action_provider,
+        superfluid_action_provider,
+        twitter_action_provider,
+        wallet_action_provider,
+        weth_action_provider,
+        wow_action_provider,
+    )
+    from .http_client import HttpClient, HttpClientConfig, set_http_client
+    from .wallet_providers import (
+        CdpEvmServerWalletProvider,
+        CdpEvmServerWalletProviderConfig,
+        CdpEvmSmartWalletProvider,
+        CdpEvmSmartWalletProviderConfig,
+        EthAccountWalletProvider,
+        EthAccountWalletProviderConfig,
+        EvmWalletProvider,
+    )
+
+_LAZY_IMPORTS = {
+    "allora_action_provider": ".action_providers",
+    "basename_action_provider": ".action_providers",
+    "cdp_api_action_provider": ".action_providers",
+    "compound_action_provider": ".action_providers",
+    "erc20_action_provider": ".action_providers",
+    "hyperbolic_action_provider": ".action_providers",
+    "morpho_action_provider": ".action_providers",
+    "nillion_action_provider": ".action_providers",
+    "onramp_action_provider": ".action_providers",
+    "pyth_action_provider": ".action_providers",
+    "ssh_action_provider": ".action_providers",
+    "superfluid_action_provider": ".action_providers",
+    "twitter_action_provider": ".action_providers",
+    "wallet_action_provider": ".action_providers",
+    "weth_action_provider": ".action_providers",
+    "wow_action_provider": ".action_providers",
+    "CdpEvmServerWalletProvider": ".wallet_providers",
+    "CdpEvmServerWalletProviderConfig": ".wallet_providers",
+    "CdpEvmSmartWalletProvider": ".wallet_providers",
+    "CdpEvmSmartWalletProviderConfig": ".wallet_providers",
+    "EthAccountWalletProvider": ".wallet_providers",
+    "EthAccountWalletProviderConfig": ".wallet_providers",
+    "EvmWalletProvider": ".wallet_providers",
+    "HttpClient": ".http_client",
+    "HttpClientConfig": ".http_client",
+    "set_http_client": ".http_client",
+}
+
+
+__getattr__, __dir__ = lazy_imports(__name__, _LAZY_IMPORTS)
+
 
 __all__ = [
     "AgentKit",
@@ -49,6 +86,9 @@ __all__ = [
     "EvmWalletProvider",
     "EthAccountWalletProvider",
     "EthAccountWalletProviderConfig",
+    "HttpClient",
+    "HttpClientConfig",
+    "set_http_client",
     "allora_action_provider",
     "cdp_api_action_provider",
     "compound_action_provider",
@@ -0,0 +1,43 @@
+"""Lazy attribute imports for the AgentKit packages.
+
+Providers are imported on first access so that applications only pay for the dependencies of
+the providers they use. Each package lists its lazy names and installs the hooks with:
+
+    __getattr__, __dir__ = lazy_imports(__name__, _LAZY_IMPORTS)
+"""
+
+import sys
+from collections.abc import Callable
+from importlib import import_module
+from typing import Any
+
+
+def lazy_imports(
+    package: str, imports: dict[str, str]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Build the module `__getattr__` and `__dir__` hooks for a package.
+
+    Args:
+        package (str): The name of the package the hooks are installed in.
+        imports (dict[str, str]): Each lazy attribute name mapped to the module, relative to
+            the package, that defines it.
+
+    Returns:
+        tuple[Callable[[str], Any], Callable[[], list[str]]]: The `__getattr__` and `__dir__`
+            functions for the package.
+
+    """
+
+    def getattr_(name: str) -> Any:
+        if name not in imports:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+        value = getattr(import_module(imports[name], package), name)
+        # Cache the value on the package so later lookups skip this hook
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def dir_() -> list[str]:
+        return sorted(set(vars(sys.modules[package])) | set(imports))
+
+    return getattr_, dir_
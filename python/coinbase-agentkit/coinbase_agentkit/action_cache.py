@@ -0,0 +1,198 @@
+"""Result cache for read-only actions."""
+
+import asyncio
+import json
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any, NamedTuple
+
+from .action_providers import Action
+from .network import Network
+from .wallet_providers import WalletProvider
+
+DEFAULT_ACTION_CACHE_SIZE = 256
+
+
+class _CacheEntry(NamedTuple):
+    value: Any
+    expires_at: float | None
+    block_number: int | None
+
+
+class ActionResultCache:
+    """A bounded, thread-safe LRU cache of action results.
+
+    Each entry may expire after a time-to-live and may be pinned to the block it was read
+    at. A block-pinned entry is only returned while the caller sees the same block, so
+    on-chain reads are refreshed as soon as the chain advances.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_ACTION_CACHE_SIZE):
+        """Initialize the cache.
+
+        Args:
+            max_size (int): The maximum number of results kept. Zero disables caching.
+
+        """
+        self._max_size = max_size
+        self._entries: OrderedDict[Hashable, _CacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def max_size(self) -> int:
+        """The maximum number of results kept."""
+        return self._max_size
+
+    def __len__(self) -> int:
+        """Get the number of cached results, including expired ones not yet evicted."""
+        return len(self._entries)
+
+    def get(self, key: Hashable, block_number: int | None = None) -> tuple[bool, Any]:
+        """Look up a cached result.
+
+        Args:
+            key (Hashable): The cache key.
+            block_number (int | None): The caller's current block, for block-pinned entries.
+
+        Returns:
+            tuple[bool, Any]: Whether the result was found, and the result if it was.
+
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return False, None
+
+            expired = entry.expires_at is not None and entry.expires_at <= time.monotonic()
+            if expired or entry.block_number != block_number:
+                del self._entries[key]
+                return False, None
+
+            self._entries.move_to_end(key)
+            return True, entry.value
+
+    def set(
+        self,
+        key: Hashable,
+        value: Any,
+        ttl: float | None = None,
+        block_number: int | None = None,
+    ) -> None:
+        """Store a result, evicting the least recently used entry if the cache is full.
+
+        Args:
+            key (Hashable): The cache key.
+            value (Any): The result to store.
+            ttl (float | None): Seconds the result stays valid, or None for no time limit.
+            block_number (int | None): The block the result was read at, if any.
+
+        """
+        if self._max_size <= 0:
+            return
+
+        expires_at = None if ttl is None else time.monotonic() + ttl
+        with self._lock:
+            self._entries[key] = _CacheEntry(value, expires_at, block_number)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached result."""
+        with self._lock:
+            self._entries.clear()
+
+
+def cache_action_results(
+    action: Action,
+    cache: ActionResultCache,
+    wallet_provider: WalletProvider,
+    network: Network,
+) -> Action:
+    """Wrap a read-only action so repeated invocations are answered from a result cache.
+
+    Results are keyed by the action name, the arguments after schema validation, the wallet
+    address and the network. Block-scoped actions are also pinned to the wallet provider's
+    latest block, so a result is reused only until the chain advances. If the wallet provider
+    cannot report its block, block-scoped results are only cached when the action also sets
+    a `cache_ttl`, which then bounds how long they are reused. Error messages are
+    never cached, and invocations whose arguments fail validation bypass the cache so the
+    action reports the error itself.
+
+    Args:
+        action (Action): The action to wrap.
+        cache (ActionResultCache): The cache results are stored in.
+        wallet_provider (WalletProvider): The wallet provider the action is bound to.
+        network (Network): The wallet provider's network.
+
+    Returns:
+        Action: The wrapped action, or `action` itself if it is not read-only.
+
+    """
+    if not action.read_only or cache.max_size <= 0:
+        return action
+
+    get_block_number = getattr(wallet_provider, "get_block_number", None)
+
+    def lookup(args: dict[str, Any]) -> tuple[Hashable | None, int | None]:
+        try:
+            if action.args_schema is not None:
+                args = action.args_schema.model_validate(args).model_dump(mode="json")
+            key = (
+                action.name,
+                json.dumps(args, sort_keys=True, default=str),
+                wallet_provider.get_address(),
+                network.protocol_family,
+                network.network_id,
+                network.chain_id,
+            )
+            block_number = get_block_number() if action.block_scoped and get_block_number else None
+        except Exception:
+            return None, None
+        if action.block_scoped and block_number is None and action.cache_ttl is None:
+            # Without a block to pin to, nothing would ever expire the result.
+            return None, None
+        return key, block_number
+
+    def store(key: Hashable, block_number: int | None, result: Any) -> None:
+        if isinstance(result, str) and result.startswith("Error"):
+            return
+        cache.set(key, result, ttl=action.cache_ttl, block_number=block_number)
+
+    def invoke(args: dict[str, Any]) -> Any:
+        key, block_number = lookup(args)
+        if key is None:
+            return action.invoke(args)
+
+        hit, result = cache.get(key, block_number)
+        if hit:
+            return result
+
+        result = action.invoke(args)
+        store(key, block_number, result)
+        return result
+
+    async def async_invoke(args: dict[str, Any]) -> Any:
+        if action.block_scoped:
+            key, block_number = await asyncio.to_thread(lookup, args)
+        else:
+            key, block_number = lookup(args)
+        if key is None:
+            return await action.async_invoke(args)
+
+        hit, result = cache.get(key, block_number)
+        if hit:
+            return result
+
+        result = await action.async_invoke(args)
+        store(key, block_number, result)
+        return result
+
+    return action.model_copy(
+        update={
+            "invoke": invoke,
+            "async_invoke": async_invoke if action.async_invoke is not None else None,
+        }
+    )
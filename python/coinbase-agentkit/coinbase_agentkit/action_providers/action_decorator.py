@@ -28,21 +28,40 @@ class ActionMetadata(BaseModel):
     args_schema: type[BaseModel] | None
     invoke: Callable
     wallet_provider: bool = False
-
-
-def create_action(name: str, description: str, schema: type[BaseModel] | None = None):
-    """Decorate an action with a name, description, and schema."""
+    is_async: bool = False
+    read_only: bool = False
+    cache_ttl: float | None = None
+
+
+def create_action(
+    name: str,
+    description: str,
+    schema: type[BaseModel] | None = None,
+    read_only: bool = False,
+    cache_ttl: float | None = None,
+):
+    """Decorate an action with a name, description, and schema.
+
+    Both regular functions and `async def` coroutine functions are supported.
+
+    Actions declared `read_only` have no side effects, so AgentKit may answer repeated
+    invocations with the same arguments from its result cache. Results are kept for
+    `cache_ttl` seconds, or without a time limit if it is None. Results of read-only
+    actions that take a wallet provider are also dropped when the chain advances.
+    """
+    if cache_ttl is not None and not read_only:
+        raise ValueError("cache_ttl can only be set on read_only actions")
 
     def decorator(func: Callable) -> Callable:
         signature = inspect.signature(func)
         has_wallet_provider = "wallet_provider" in signature.parameters
+        is_async = inspect.iscoroutinefunction(func)
 
         class_name = func.__qualname__.rsplit(".", 1)[0]
         method_name = func.__name__
         prefixed_name = f"{class_name}_{method_name}"
 
-        @wraps(func)
-        def wrapper(*args: Any, **kwargs: Any) -> Any:
+        def track_invocation(args: tuple[Any, ...]) -> None:
             wallet_metadata = {}
 
             if has_wallet_provider:
@@ -70,7 +89,19 @@ def create_action(name: str, description: str, schema: type[BaseModel] | None =
             except Exception as e:
                 print(f"Warning: Failed to track action invocation: {e}")
 
-            return func(*args, **kwargs)
+        if is_async:
+
+            @wraps(func)
+            async def wrapper(*args: Any, **kwargs: Any) -> Any:
+                track_invocation(args)
+                return await func(*args, **kwargs)
+
+        else:
+
+            @wraps(func)
+            def wrapper(*args: Any, **kwargs: Any) -> Any:
+                track_invocation(args)
+                return func(*args, **kwargs)
 
         wrapper._action_metadata = ActionMetadata(
             name=prefixed_name,
@@ -78,15 +109,11 @@ def create_action(name: str, description: str, schema: type[BaseModel] | None =
             args_schema=schema,
             invoke=wrapper,
             wallet_provider=has_wallet_provider,
+            is_async=is_async,
+            read_only=read_only,
+            cache_ttl=cache_ttl,
         )
 
-        def _add_to_actions(owner: Any) -> None:
-            if not hasattr(owner, "_actions"):
-                owner._actions = []
-            owner._actions.append(wrapper._action_metadata)
-
-        wrapper._add_to_actions = _add_to_actions
-
         return wrapper
 
     return decorator
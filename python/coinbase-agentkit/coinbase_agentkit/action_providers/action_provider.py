@@ -1,17 +1,42 @@
 """Base class for action providers."""
 
+import asyncio
 from abc import ABC, abstractmethod
-from collections.abc import Callable
-from typing import Generic, TypeVar
+from collections.abc import Callable, Coroutine
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, ClassVar, Generic, TypeVar
 
 from pydantic import BaseModel, ConfigDict, Field
 
 from ..network import Network
 from ..wallet_providers import WalletProvider
+from .action_decorator import ActionMetadata
 
 TWalletProvider = TypeVar("TWalletProvider", bound=WalletProvider)
 
 
+def run_coroutine_sync(coroutine: Coroutine[Any, Any, Any]) -> Any:
+    """Run a coroutine to completion from synchronous code.
+
+    If the calling thread is already running an event loop, the coroutine is run on a
+    fresh loop in a helper thread so the caller's loop is never re-entered.
+
+    Args:
+        coroutine: The coroutine to run
+
+    Returns:
+        Any: The result of the coroutine
+
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coroutine)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coroutine).result()
+
+
 class Action(BaseModel):
     """Represents an action that can be performed by an agent."""
 
@@ -19,12 +44,56 @@ class Action(BaseModel):
     description: str
     args_schema: type[BaseModel] | None = None
     invoke: Callable = Field(..., exclude=True)
+    async_invoke: Callable | None = Field(None, exclude=True)
+    read_only: bool = Field(False, exclude=True)
+    cache_ttl: float | None = Field(None, exclude=True)
+    block_scoped: bool = Field(False, exclude=True)
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
+    async def ainvoke(self, args: dict[str, Any]) -> Any:
+        """Invoke the action from async code.
+
+        Async actions are awaited on the caller's event loop. Sync actions are run in the
+        default executor so they never block the loop.
+
+        Args:
+            args: The action arguments
+
+        Returns:
+            Any: The result of the action
+
+        """
+        if self.async_invoke is not None:
+            return await self.async_invoke(args)
+        return await asyncio.to_thread(self.invoke, args)
+
 
 class ActionProvider(Generic[TWalletProvider], ABC):
-    """Base class for all action providers."""
+    """Base class for all action providers.
+
+    Methods decorated with `create_action` are collected into the class-level `_actions`
+    registry when the subclass is defined, so instances share it instead of scanning
+    themselves on construction.
+    """
+
+    _actions: ClassVar[tuple[ActionMetadata, ...]] = ()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Build the subclass's action registry from its own and inherited actions."""
+        super().__init_subclass__(**kwargs)
+
+        actions: dict[str, ActionMetadata] = {}
+        for klass in reversed(cls.__mro__):
+            for attribute_name, attribute in vars(klass).items():
+                metadata = getattr(attribute, "_action_metadata", None)
+                if isinstance(metadata, ActionMetadata):
+                    actions[attribute_name] = metadata
+                else:
+                    # A plain override of an inherited action removes it
+                    actions.pop(attribute_name, None)
+
+        cls._actions = tuple(actions[name] for name in sorted(actions))
 
     def __init__(
         self, name: str, action_providers: list["ActionProvider[TWalletProvider]"]
@@ -32,29 +101,35 @@ class ActionProvider(Generic[TWalletProvider], ABC):
         self.name = name
         self.action_providers = action_providers
 
-        for method_name in dir(self):
-            method = getattr(self, method_name)
-            if hasattr(method, "_add_to_actions"):
-                method._add_to_actions(self)
-
     def get_actions(self, wallet_provider: TWalletProvider) -> list[Action]:
         """Get all actions from this provider and its sub-providers."""
         actions: list[Action] = []
         action_providers = [self, *self.action_providers]
 
         for provider in action_providers:
-            provider_actions = getattr(provider, "_actions", [])
-            for action_metadata in provider_actions:
+            for action_metadata in provider._actions:
+
+                def call(args, m=action_metadata, p=provider):
+                    return (
+                        m.invoke(p, wallet_provider, args)
+                        if m.wallet_provider
+                        else m.invoke(p, args)
+                    )
+
                 actions.append(
                     Action(
                         name=action_metadata.name,
                         description=action_metadata.description,
                         args_schema=action_metadata.args_schema,
-                        invoke=lambda args, m=action_metadata, p=provider: (
-                            m.invoke(p, wallet_provider, args)
-                            if m.wallet_provider
-                            else m.invoke(p, args)
+                        invoke=(
+                            (lambda args, call=call: run_coroutine_sync(call(args)))
+                            if action_metadata.is_async
+                            else call
                         ),
+                        async_invoke=call if action_metadata.is_async else None,
+                        read_only=action_metadata.read_only,
+                        cache_ttl=action_metadata.cache_ttl,
+                        block_scoped=action_metadata.read_only and action_metadata.wallet_provider,
                     )
                 )
 
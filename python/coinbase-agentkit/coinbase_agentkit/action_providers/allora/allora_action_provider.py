@@ -1,8 +1,6 @@
 """Allora Network action provider."""
 
-import asyncio
 import json
-from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 from allora_sdk.v2.api_client import (
@@ -66,24 +64,6 @@ class AlloraActionProvider(ActionProvider[WalletProvider]):
             api_key=api_key or default_api_key,
             chain_slug=chain_slug or ChainSlug.TESTNET,
         )
-        # Create a thread pool executor for running async code
-        self._executor = ThreadPoolExecutor(max_workers=5)
-
-    def _run_async(self, coro):
-        """Run an async coroutine in a synchronous context.
-
-        Args:
-            coro: The coroutine to run
-
-        Returns:
-            The result of the coroutine
-
-        """
-        loop = asyncio.new_event_loop()
-        try:
-            return loop.run_until_complete(coro)
-        finally:
-            loop.close()
 
     @create_action(
         name="get_all_topics",
@@ -119,11 +99,13 @@ Key fields:
 A failure response will return an error message with details.
         """,
         schema=GetAllTopicsInput,
+        read_only=True,
+        cache_ttl=300,
     )
-    def get_all_topics(self, args: dict[str, Any]) -> str:
+    async def get_all_topics(self, args: dict[str, Any]) -> str:
         """Get all available topics from Allora Network."""
         try:
-            topics = self._run_async(self.client.get_all_topics())
+            topics = await self.client.get_all_topics()
             # Convert the topics to dictionaries before serializing
             topics_dict = [_convert_to_dict(topic) for topic in topics]
             topics_json = json.dumps(topics_dict)
@@ -156,10 +138,10 @@ A failure response will return an error message with details.
         """,
         schema=GetInferenceByTopicIdInput,
     )
-    def get_inference_by_topic_id(self, args: dict[str, Any]) -> str:
+    async def get_inference_by_topic_id(self, args: dict[str, Any]) -> str:
         """Get inference data for a specific topic."""
         try:
-            inference = self._run_async(self.client.get_inference_by_topic_id(args["topic_id"]))
+            inference = await self.client.get_inference_by_topic_id(args["topic_id"])
             # Convert the inference data to a dictionary before serializing
             inference_dict = _convert_to_dict(inference.inference_data)
             inference_json = json.dumps(inference_dict)
@@ -190,7 +172,7 @@ A failure response will return an error message with details.
         """,
         schema=GetPriceInferenceInput,
     )
-    def get_price_inference(self, args: dict[str, Any]) -> str:
+    async def get_price_inference(self, args: dict[str, Any]) -> str:
         """Get price inference for a token/timeframe pair."""
         try:
             # Get the input values
@@ -227,11 +209,9 @@ A failure response will return an error message with details.
                 # Fail if the timeframe is not a string or PriceInferenceTimeframe
                 return f"Error: Timeframe must be a string or PriceInferenceTimeframe enum, got {type(timeframe).__name__}"
 
-            inference = self._run_async(
-                self.client.get_price_inference(
-                    asset,
-                    timeframe,
-                )
+            inference = await self.client.get_price_inference(
+                asset,
+                timeframe,
             )
             # Convert the inference data to a dictionary before accessing its fields
             inference_dict = _convert_to_dict(inference.inference_data)
@@ -20,17 +20,17 @@ from .schemas import (
     CompoundBorrowSchema,
     CompoundPortfolioSchema,
     CompoundRepaySchema,
+    CompoundSimulateSchema,
     CompoundSupplySchema,
     CompoundWithdrawSchema,
 )
+from .simulation import format_simulation_markdown, simulate_health
+from .snapshot import get_position_snapshot
 from .utils import (
     format_amount_from_decimals,
     format_amount_with_decimals,
-    get_base_token_address,
     get_collateral_balance,
     get_health_ratio,
-    get_health_ratio_after_borrow,
-    get_health_ratio_after_withdraw,
     get_portfolio_details_markdown,
     get_token_balance,
     get_token_decimals,
@@ -197,8 +197,9 @@ Important notes:
                 return f"Error: Insufficient balance. Trying to withdraw {validated_args.amount}, but only have {human_balance} supplied"
 
             # Check if position would be healthy after withdrawal
-            projected_health_ratio = get_health_ratio_after_withdraw(
-                wallet_provider, comet_address, token_address, amount_atomic
+            position = get_position_snapshot(wallet_provider, comet_address)
+            projected_health_ratio = position.health_ratio_after_withdraw(
+                token_address, amount_atomic
             )
 
             if projected_health_ratio < 1:
@@ -222,11 +223,9 @@ Important notes:
             except Exception as e:
                 return f"Error executing transaction: {e!s}"
 
-            # Get current health ratio for reference
-            current_health = get_health_ratio(wallet_provider, comet_address)
-
             # Get new health ratio
-            new_health = get_health_ratio(wallet_provider, comet_address)
+            current_health = position.health_ratio()
+            new_health = get_position_snapshot(wallet_provider, comet_address).health_ratio()
             token_symbol = get_token_symbol(wallet_provider, token_address)
 
             # Format health ratio strings and compose the final message
@@ -275,22 +274,22 @@ Important notes:
         try:
             validated_args = CompoundBorrowSchema(**args)
             comet_address = self._get_comet_address(wallet_provider.get_network())
-            base_token_address = get_base_token_address(wallet_provider, comet_address)
-            base_token_decimals = get_token_decimals(wallet_provider, base_token_address)
+            position = get_position_snapshot(wallet_provider, comet_address)
+            base_token_address = position.base_token
 
             # Convert human-readable amount to atomic amount
-            amount_atomic = format_amount_with_decimals(validated_args.amount, base_token_decimals)
+            amount_atomic = format_amount_with_decimals(
+                validated_args.amount, position.base_decimals
+            )
 
             # Get current health ratio for reference
-            current_health = get_health_ratio(wallet_provider, comet_address)
+            current_health = position.health_ratio()
             current_health_str = (
                 "Infinity" if current_health == Decimal("Infinity") else f"{current_health:.2f}"
             )
 
             # Check if position would be healthy after borrow
-            projected_health_ratio = get_health_ratio_after_borrow(
-                wallet_provider, comet_address, amount_atomic
-            )
+            projected_health_ratio = position.health_ratio_after_borrow(amount_atomic)
 
             if projected_health_ratio < 1:
                 return f"Error: Borrowing {validated_args.amount} USDC would result in an unhealthy position. Health ratio would be {projected_health_ratio:.2f}"
@@ -311,7 +310,7 @@ Important notes:
                 return f"Error executing transaction: {e!s}"
 
             # Get new health ratio
-            new_health = get_health_ratio(wallet_provider, comet_address)
+            new_health = get_position_snapshot(wallet_provider, comet_address).health_ratio()
             new_health_str = "Inf.%" if new_health == Decimal("Infinity") else f"{new_health:.2f}"
 
             return (
@@ -424,6 +423,7 @@ Returns portfolio details including:
 Formatted in Markdown for readability.
 """,
         schema=CompoundPortfolioSchema,
+        read_only=True,
     )
     def get_portfolio(self, wallet_provider: EvmWalletProvider, args: dict[str, Any]) -> str:
         """Get portfolio details from Compound.
@@ -442,6 +442,59 @@ Formatted in Markdown for readability.
         except Exception as e:
             return f"Error getting portfolio details: {e!s}"
 
+    @create_action(
+        name="simulate_position",
+        description="""
+This tool simulates the health of the Compound position before borrowing or withdrawing.
+It takes:
+- borrow_amounts: Optional candidate amounts of the base asset to borrow, e.g. ["100", "250"]
+- withdraw_asset_id: Optional collateral asset to simulate withdrawals of, e.g. `weth`
+- withdraw_amounts: Optional candidate amounts of that asset to withdraw, e.g. ["0.1", "0.5"]
+- price_shocks: Collateral price changes in percent to simulate, e.g. [0, -10, -25]
+- target_health: The health ratio to stay above, defaults to 1
+
+Returns, for each price change:
+- The maximum amount that can be borrowed safely
+- The maximum amount of each supplied asset that can be withdrawn safely
+- The health ratio after each candidate borrow and withdrawal
+And the collateral prices at which the position would be liquidated.
+Use this instead of guessing amounts when asked how much can safely be borrowed or withdrawn.
+""",
+        schema=CompoundSimulateSchema,
+        read_only=True,
+    )
+    def simulate_position(self, wallet_provider: EvmWalletProvider, args: dict[str, Any]) -> str:
+        """Simulate the health of a Compound position for candidate borrows and withdrawals.
+
+        Args:
+            wallet_provider: The wallet to simulate the position of.
+            args: The candidate amounts, price shocks and target health.
+
+        Returns:
+            str: A markdown formatted string with the simulation results.
+
+        """
+        try:
+            validated_args = CompoundSimulateSchema(**args)
+            network = wallet_provider.get_network()
+            position = get_position_snapshot(wallet_provider, self._get_comet_address(network))
+
+            withdraw_asset = None
+            if validated_args.withdraw_asset_id is not None:
+                withdraw_asset = self._get_asset_address(network, validated_args.withdraw_asset_id)
+
+            simulation = simulate_health(
+                position,
+                borrow_amounts=[float(amount) for amount in validated_args.borrow_amounts],
+                withdraw_asset=withdraw_asset,
+                withdraw_amounts=[float(amount) for amount in validated_args.withdraw_amounts],
+                price_shocks=[shock / 100 for shock in validated_args.price_shocks],
+                target_health=validated_args.target_health,
+            )
+            return format_simulation_markdown(position, simulation)
+        except Exception as e:
+            return f"Error simulating Compound position: {e!s}"
+
     def supports_network(self, network: Network) -> bool:
         """Check if network is supported by Compound."""
         return network.protocol_family == "evm" and network.network_id in SUPPORTED_NETWORKS
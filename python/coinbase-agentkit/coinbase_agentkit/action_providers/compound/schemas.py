@@ -61,3 +61,29 @@ class CompoundPortfolioSchema(BaseModel):
     """Input schema for getting portfolio details from Compound."""
 
     pass  # No inputs required
+
+
+class CompoundSimulateSchema(BaseModel):
+    """Input schema for simulating the health of a Compound position."""
+
+    borrow_amounts: list[str] = Field(
+        default_factory=list,
+        description="Candidate amounts of the base asset to borrow, e.g. [`100`, `250`] usdc",
+    )
+    withdraw_asset_id: Literal["weth", "cbeth", "cbbtc", "wsteth", "usdc"] | None = Field(
+        None,
+        description="The collateral asset to simulate withdrawals of, one of `weth`, `cbeth`, `cbbtc`, `wsteth`, or `usdc`",
+    )
+    withdraw_amounts: list[str] = Field(
+        default_factory=list,
+        description="Candidate amounts of the collateral asset to withdraw, e.g. [`0.1`, `0.5`] weth",
+    )
+    price_shocks: list[float] = Field(
+        default_factory=lambda: [0.0],
+        description="Collateral price changes to simulate in percent, e.g. [0, -10, -25]",
+    )
+    target_health: float = Field(
+        1.0,
+        gt=0,
+        description="The health ratio the maximum safe borrow and withdraw amounts must keep",
+    )
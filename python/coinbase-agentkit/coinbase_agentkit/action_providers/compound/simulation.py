@@ -0,0 +1,229 @@
+"""Vectorized what-if health simulation for Compound positions."""
+
+from collections.abc import Sequence
+from typing import Any
+
+import numpy as np
+from pydantic import BaseModel, ConfigDict, Field
+
+from .snapshot import CompoundAssetPosition, CompoundPositionSnapshot
+
+
+class HealthSimulation(BaseModel):
+    """Projected health of a Compound position across candidate actions and price shocks.
+
+    Every array has the price shocks as its first axis, so row `i` describes the market
+    after every collateral price moved by `price_shocks[i]` against the base token.
+    """
+
+    price_shocks: Any = Field(..., description="Relative collateral price changes, shape (S,)")
+    borrow_amounts: Any = Field(..., description="Additional borrows in base units, shape (B,)")
+    borrow_health_ratios: Any = Field(
+        ..., description="Health ratio after each borrow, shape (S, B)"
+    )
+    withdraw_asset: str | None = Field(None, description="The address of the simulated asset")
+    withdraw_amounts: Any = Field(..., description="Withdrawals in asset units, shape (W,)")
+    withdraw_health_ratios: Any = Field(
+        ..., description="Health ratio after each withdrawal, shape (S, W)"
+    )
+    max_safe_borrow: Any = Field(
+        ..., description="Largest borrow that keeps the target health, shape (S,)"
+    )
+    asset_symbols: list[str] = Field(..., description="Symbols of the supplied assets, (A,)")
+    max_safe_withdraw: Any = Field(
+        ..., description="Largest withdrawal of each asset that keeps the target health, (S, A)"
+    )
+    liquidation_prices: Any = Field(
+        ...,
+        description="Price of each asset at which the position is liquidated, shape (A,), "
+        "or 0 if the other assets alone cover the borrow",
+    )
+    liquidation_shock: float | None = Field(
+        None, description="Uniform collateral price change at which the position is liquidated"
+    )
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+
+def simulate_health(
+    snapshot: CompoundPositionSnapshot,
+    borrow_amounts: Sequence[float] = (),
+    withdraw_asset: str | None = None,
+    withdraw_amounts: Sequence[float] = (),
+    price_shocks: Sequence[float] = (0.0,),
+    target_health: float = 1.0,
+) -> HealthSimulation:
+    """Project a position's health for many candidate actions in one vectorized pass.
+
+    Health ratios use each asset's borrow collateral factor, like `snapshot.health_ratio`.
+    Liquidation prices use the liquidation collateral factor and hold every other price
+    fixed. Amounts are human-readable units of the base token or the withdrawn asset.
+
+    Args:
+        snapshot: The position to simulate.
+        borrow_amounts: Candidate additional borrows of the base token.
+        withdraw_asset: The address of the collateral asset to simulate withdrawals of.
+        withdraw_amounts: Candidate withdrawals of `withdraw_asset`.
+        price_shocks: Relative changes of every collateral price, e.g. -0.2 for a 20% drop.
+        target_health: The health ratio the "max safe" amounts must keep.
+
+    Returns:
+        HealthSimulation: The projected health ratios and limits.
+
+    Raises:
+        ValueError: If `withdraw_amounts` is given without a supplied `withdraw_asset`.
+
+    """
+    assets = snapshot.supplied_assets
+    balances = np.array([float(a.supply_amount) for a in assets], dtype=float)
+    prices = np.array([float(a.price) for a in assets], dtype=float)
+    factors = np.array([float(a.collateral_factor) for a in assets], dtype=float)
+    liquidate_factors = np.array(
+        [float(a.liquidate_collateral_factor) for a in assets], dtype=float
+    )
+
+    shocks = np.asarray(price_shocks, dtype=float)
+    borrows = np.asarray(borrow_amounts, dtype=float)
+    withdrawals = np.asarray(withdraw_amounts, dtype=float)
+    multipliers = 1.0 + shocks
+
+    base_price = float(snapshot.base_price)
+    borrow_value = float(snapshot.borrow_amount) * base_price
+    unit_collateral = prices * factors
+    adjusted_collateral_now = float((balances * unit_collateral).sum())
+    adjusted_collateral = adjusted_collateral_now * multipliers
+
+    # Health after each borrow, per shock
+    borrow_values = (float(snapshot.borrow_amount) + borrows) * base_price
+    borrow_health_ratios = _ratio(adjusted_collateral[:, None], borrow_values[None, :])
+
+    # Health after each withdrawal, per shock
+    if withdrawals.size and withdraw_asset is None:
+        raise ValueError("withdraw_asset is required to simulate withdrawals")
+    if withdraw_asset is not None:
+        index = _asset_index(assets, withdraw_asset)
+        remaining = adjusted_collateral_now - withdrawals * unit_collateral[index]
+        withdraw_health_ratios = _ratio(
+            np.outer(multipliers, remaining), np.full(withdrawals.shape, borrow_value)
+        )
+    else:
+        withdraw_health_ratios = np.empty((shocks.size, 0))
+
+    # Largest borrow and per-asset withdrawal that keep the target health
+    max_safe_borrow = np.maximum(
+        adjusted_collateral / (target_health * base_price) - float(snapshot.borrow_amount), 0.0
+    )
+
+    headroom = adjusted_collateral[:, None] - target_health * borrow_value
+    shocked_unit = np.outer(multipliers, unit_collateral)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        max_safe_withdraw = np.where(
+            shocked_unit > 0, headroom / shocked_unit, np.where(headroom >= 0, np.inf, 0.0)
+        )
+    if borrow_value == 0:
+        max_safe_withdraw = np.full_like(max_safe_withdraw, np.inf)
+    max_safe_withdraw = np.clip(max_safe_withdraw, 0.0, balances[None, :])
+
+    # Price of each asset, others fixed, at which the liquidation threshold is reached
+    liquidation_collateral = balances * prices * liquidate_factors
+    other_collateral = liquidation_collateral.sum() - liquidation_collateral
+    with np.errstate(divide="ignore", invalid="ignore"):
+        liquidation_prices = (borrow_value - other_collateral) / (balances * liquidate_factors)
+    liquidation_prices = np.where(
+        np.isfinite(liquidation_prices), np.maximum(liquidation_prices, 0.0), 0.0
+    )
+
+    total_liquidation_collateral = float(liquidation_collateral.sum())
+    liquidation_shock = (
+        borrow_value / total_liquidation_collateral - 1.0
+        if borrow_value > 0 and total_liquidation_collateral > 0
+        else None
+    )
+
+    return HealthSimulation(
+        price_shocks=shocks,
+        borrow_amounts=borrows,
+        borrow_health_ratios=borrow_health_ratios,
+        withdraw_asset=withdraw_asset,
+        withdraw_amounts=withdrawals,
+        withdraw_health_ratios=withdraw_health_ratios,
+        max_safe_borrow=max_safe_borrow,
+        asset_symbols=[asset.symbol for asset in assets],
+        max_safe_withdraw=max_safe_withdraw,
+        liquidation_prices=liquidation_prices,
+        liquidation_shock=liquidation_shock,
+    )
+
+
+def _ratio(collateral: np.ndarray, borrow_values: np.ndarray) -> np.ndarray:
+    collateral, borrow_values = np.broadcast_arrays(collateral, borrow_values)
+    return np.divide(
+        collateral,
+        borrow_values,
+        out=np.full(collateral.shape, np.inf),
+        where=borrow_values != 0,
+    )
+
+
+def _asset_index(assets: list[CompoundAssetPosition], asset_address: str) -> int:
+    for index, asset in enumerate(assets):
+        if asset.address.lower() == asset_address.lower():
+            return index
+    raise ValueError(f"No supplied collateral for asset {asset_address}")
+
+
+def format_simulation_markdown(
+    snapshot: CompoundPositionSnapshot, simulation: HealthSimulation
+) -> str:
+    """Format a health simulation as markdown.
+
+    Args:
+        snapshot: The simulated position
+        simulation: The simulation results
+
+    Returns:
+        str: Markdown formatted simulation results
+
+    """
+    base = snapshot.base_symbol
+    withdraw_symbol = None
+    if simulation.withdraw_asset is not None:
+        withdraw_symbol = snapshot.get_asset(simulation.withdraw_asset).symbol
+
+    markdown_output = "# Position Simulation\n\n"
+    markdown_output += f"- **Current Health Ratio:** {snapshot.health_ratio():.2f}\n"
+    markdown_output += f"- **Current Borrow:** {snapshot.borrow_amount:.6f} {base}\n\n"
+
+    for i, shock in enumerate(simulation.price_shocks):
+        markdown_output += f"## Collateral Price Change: {shock * 100:+.2f}%\n\n"
+        markdown_output += f"- **Max Safe Borrow:** {simulation.max_safe_borrow[i]:.6f} {base}\n"
+        for symbol, amount in zip(
+            simulation.asset_symbols, simulation.max_safe_withdraw[i], strict=True
+        ):
+            markdown_output += f"- **Max Safe Withdraw {symbol}:** {amount:.6f}\n"
+
+        for amount, health in zip(
+            simulation.borrow_amounts, simulation.borrow_health_ratios[i], strict=True
+        ):
+            markdown_output += f"- Borrow {amount:g} {base}: health ratio {health:.2f}\n"
+        for amount, health in zip(
+            simulation.withdraw_amounts, simulation.withdraw_health_ratios[i], strict=True
+        ):
+            markdown_output += (
+                f"- Withdraw {amount:g} {withdraw_symbol}: health ratio {health:.2f}\n"
+            )
+        markdown_output += "\n"
+
+    markdown_output += "## Liquidation\n\n"
+    if simulation.liquidation_shock is None:
+        markdown_output += "No borrowed assets, the position cannot be liquidated.\n"
+        return markdown_output
+
+    for symbol, price in zip(simulation.asset_symbols, simulation.liquidation_prices, strict=True):
+        markdown_output += f"- **{symbol} Liquidation Price:** ${price:.2f}\n"
+    markdown_output += (
+        f"- **Liquidated if all collateral prices change by:** "
+        f"{simulation.liquidation_shock * 100:+.2f}%\n"
+    )
+
+    return markdown_output
@@ -0,0 +1,268 @@
+"""Point-in-time snapshot of a wallet's Compound position."""
+
+from decimal import Decimal
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+from ...wallet_providers import ContractCall, EvmWalletProvider
+from ..erc20.token_metadata import get_token_metadata_registry
+from .constants import COMET_ABI, PRICE_FEED_ABI
+
+PRICE_FEED_DECIMALS = 8
+COLLATERAL_FACTOR_DECIMALS = 18
+
+
+class CompoundAssetPosition(BaseModel):
+    """A collateral asset of a Compound market and the wallet's balance of it."""
+
+    address: str = Field(..., description="The address of the collateral token")
+    symbol: str = Field(..., description="The symbol of the collateral token")
+    decimals: int = Field(..., description="The number of decimals of the collateral token")
+    balance: int = Field(..., description="The supplied collateral in atomic units")
+    price: Decimal = Field(..., description="The price of the token in USD")
+    collateral_factor: Decimal = Field(..., description="The borrow collateral factor")
+    liquidate_collateral_factor: Decimal = Field(
+        ..., description="The collateral factor below which the position is liquidated"
+    )
+
+    @property
+    def supply_amount(self) -> Decimal:
+        """The human-readable supplied amount."""
+        return Decimal(self.balance) / Decimal(10**self.decimals)
+
+
+class CompoundPositionSnapshot(BaseModel):
+    """A wallet's Compound position, read with batched calls at a single block.
+
+    Health ratios, what-if projections and portfolio summaries are computed from the
+    snapshot in memory, so they are consistent with each other and cost no further reads.
+    """
+
+    comet_address: str = Field(..., description="The address of the Compound market")
+    account: str = Field(..., description="The address of the wallet")
+    block_number: int | None = Field(None, description="The block the position was read at")
+    base_token: str = Field(..., description="The address of the base token")
+    base_symbol: str = Field(..., description="The symbol of the base token")
+    base_decimals: int = Field(..., description="The number of decimals of the base token")
+    base_price: Decimal = Field(..., description="The price of the base token in USD")
+    borrow_balance: int = Field(..., description="The borrowed base token in atomic units")
+    assets: list[CompoundAssetPosition] = Field(..., description="The market's collateral assets")
+
+    @property
+    def borrow_amount(self) -> Decimal:
+        """The human-readable borrowed amount."""
+        return Decimal(self.borrow_balance) / Decimal(10**self.base_decimals)
+
+    @property
+    def supplied_assets(self) -> list[CompoundAssetPosition]:
+        """The collateral assets the wallet has a balance of."""
+        return [asset for asset in self.assets if asset.balance > 0]
+
+    def get_asset(self, asset_address: str) -> CompoundAssetPosition | None:
+        """Look up a collateral asset by address.
+
+        Args:
+            asset_address: The address of the collateral token.
+
+        Returns:
+            CompoundAssetPosition | None: The asset, or None if the market does not list it.
+
+        """
+        for asset in self.assets:
+            if asset.address.lower() == asset_address.lower():
+                return asset
+        return None
+
+    def get_borrow_details(self) -> dict[str, Any]:
+        """Get the borrow amount, token symbol, and price of the position.
+
+        Returns:
+            dict: The same fields as `utils.get_borrow_details`.
+
+        """
+        return {
+            "Token Symbol": self.base_symbol,
+            "Borrow Amount": self.borrow_amount,
+            "Price": self.base_price,
+        }
+
+    def get_supply_details(self) -> list[dict[str, Any]]:
+        """Get supply details for all assets supplied by the wallet.
+
+        Returns:
+            list[dict]: The same fields as `utils.get_supply_details`.
+
+        """
+        return [
+            {
+                "Token Symbol": asset.symbol,
+                "Supply Amount": asset.supply_amount,
+                "Price": asset.price,
+                "Collateral Factor": asset.collateral_factor,
+                "Decimals": asset.decimals,
+            }
+            for asset in self.supplied_assets
+        ]
+
+    def health_ratio(self) -> Decimal:
+        """Calculate the health ratio of the position.
+
+        Returns:
+            Decimal: Adjusted collateral value over borrow value, or infinity without borrows.
+
+        """
+        return self.health_ratio_after()
+
+    def health_ratio_after_borrow(self, borrow_amount: int) -> Decimal:
+        """Calculate what the health ratio would be after a proposed borrow.
+
+        Args:
+            borrow_amount: The additional amount to borrow in atomic units.
+
+        Returns:
+            Decimal: The projected health ratio, or infinity if there would be no borrows.
+
+        """
+        return self.health_ratio_after(borrow_amount=int(borrow_amount))
+
+    def health_ratio_after_withdraw(self, asset_address: str, withdraw_amount: int) -> Decimal:
+        """Calculate what the health ratio would be after a proposed withdrawal.
+
+        Args:
+            asset_address: The address of the asset to withdraw.
+            withdraw_amount: The amount to withdraw in atomic units.
+
+        Returns:
+            Decimal: The projected health ratio, or infinity if there are no borrows.
+
+        """
+        return self.health_ratio_after(withdrawals={asset_address.lower(): int(withdraw_amount)})
+
+    def health_ratio_after(
+        self, borrow_amount: int = 0, withdrawals: dict[str, int] | None = None
+    ) -> Decimal:
+        """Calculate the health ratio after an additional borrow and collateral withdrawals.
+
+        Args:
+            borrow_amount: The additional amount to borrow in atomic units.
+            withdrawals: Atomic amounts to withdraw, keyed by lowercase asset address.
+
+        Returns:
+            Decimal: The projected health ratio, or infinity if there would be no borrows.
+
+        """
+        withdrawals = withdrawals or {}
+
+        borrow = Decimal(self.borrow_balance + borrow_amount) / Decimal(10**self.base_decimals)
+        borrow_value = borrow * self.base_price
+
+        total_adjusted_collateral = Decimal(0)
+        for asset in self.supplied_assets:
+            balance = asset.balance - withdrawals.get(asset.address.lower(), 0)
+            supply_amount = Decimal(balance) / Decimal(10**asset.decimals)
+            total_adjusted_collateral += supply_amount * asset.price * asset.collateral_factor
+
+        return (
+            Decimal("Infinity") if borrow_value == 0 else total_adjusted_collateral / borrow_value
+        )
+
+
+def get_position_snapshot(
+    wallet: EvmWalletProvider, comet_address: str
+) -> CompoundPositionSnapshot:
+    """Read a wallet's Compound position in three batched reads pinned to one block.
+
+    The first batch reads the market layout and the borrow balance, the second the asset
+    list and base token price, and the third every asset's balance and price. Token symbols
+    and decimals come from the token metadata registry, which reads unknown tokens in one
+    more batch.
+
+    Args:
+        wallet: The wallet to read the position of.
+        comet_address: The address of the Compound market.
+
+    Returns:
+        CompoundPositionSnapshot: The position at the wallet's latest block.
+
+    """
+    account = wallet.get_address()
+    block_number = wallet.get_block_number()
+    block_identifier = "latest" if block_number is None else block_number
+
+    def comet_call(function_name: str, args: list[Any] | None = None) -> ContractCall:
+        return ContractCall(
+            contract_address=comet_address, abi=COMET_ABI, function_name=function_name, args=args
+        )
+
+    def read(calls: list[ContractCall]) -> list[Any]:
+        return [r.result for r in wallet.read_contracts(calls, block_identifier=block_identifier)]
+
+    num_assets, base_token, base_price_feed, borrow_balance = read(
+        [
+            comet_call("numAssets"),
+            comet_call("baseToken"),
+            comet_call("baseTokenPriceFeed"),
+            comet_call("borrowBalanceOf", [account]),
+        ]
+    )
+
+    results = read(
+        [
+            *(comet_call("getAssetInfo", [i]) for i in range(num_assets)),
+            _price_call(base_price_feed),
+        ]
+    )
+    asset_infos = results[:num_assets]
+    base_round = results[num_assets]
+
+    base_metadata, *asset_metadata = get_token_metadata_registry().get_many(
+        wallet, [base_token, *(asset_info[1] for asset_info in asset_infos)]
+    )
+
+    calls = []
+    for asset_info in asset_infos:
+        calls.append(comet_call("collateralBalanceOf", [account, asset_info[1]]))
+        calls.append(_price_call(asset_info[2]))
+    results = read(calls)
+
+    assets = []
+    for i, asset_info in enumerate(asset_infos):
+        balance, round_data = results[2 * i : 2 * i + 2]
+        assets.append(
+            CompoundAssetPosition(
+                address=asset_info[1],
+                symbol=asset_metadata[i].symbol,
+                decimals=asset_metadata[i].decimals,
+                balance=balance,
+                price=_price(round_data),
+                collateral_factor=_collateral_factor(asset_info[4]),
+                liquidate_collateral_factor=_collateral_factor(asset_info[5]),
+            )
+        )
+
+    return CompoundPositionSnapshot(
+        comet_address=comet_address,
+        account=account,
+        block_number=block_number,
+        base_token=base_token,
+        base_symbol=base_metadata.symbol,
+        base_decimals=base_metadata.decimals,
+        base_price=_price(base_round),
+        borrow_balance=borrow_balance,
+        assets=assets,
+    )
+
+
+def _price_call(price_feed_address: str) -> ContractCall:
+    return ContractCall(
+        contract_address=price_feed_address, abi=PRICE_FEED_ABI, function_name="latestRoundData"
+    )
+
+
+def _price(round_data: Any) -> Decimal:
+    return Decimal(round_data[1]) / Decimal(10**PRICE_FEED_DECIMALS)
+
+
+def _collateral_factor(raw_factor: int) -> Decimal:
+    return Decimal(raw_factor) / Decimal(10**COLLATERAL_FACTOR_DECIMALS)
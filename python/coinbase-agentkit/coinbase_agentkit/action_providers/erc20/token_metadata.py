@@ -0,0 +1,265 @@
+"""Registry of ERC20 token metadata shared by action providers."""
+
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+
+from pydantic import BaseModel, Field
+
+from ...network import NETWORK_ID_TO_CHAIN_ID
+from ...wallet_providers import ContractCall, EvmWalletProvider
+from .constants import ERC20_ABI
+
+DEFAULT_TOKEN_METADATA_CACHE_SIZE = 1024
+
+# Symbol and decimals of the tokens whose addresses are listed in the action provider constants
+_KNOWN_TOKENS = {
+    "usdc": ("USDC", 6),
+    "weth": ("WETH", 18),
+    "cbeth": ("cbETH", 18),
+    "cbbtc": ("cbBTC", 8),
+    "wsteth": ("wstETH", 18),
+}
+
+
+class TokenMetadata(BaseModel):
+    """Immutable metadata of an ERC20 token."""
+
+    chain_id: str = Field(..., description="The chain ID the token is deployed on")
+    address: str = Field(..., description="The address of the token contract")
+    symbol: str | None = Field(None, description="The token symbol, if the token reports one")
+    decimals: int = Field(..., description="The number of decimals of the token")
+    name: str | None = Field(None, description="The token name, if known")
+
+
+class TokenMetadataRegistry:
+    """Caches token metadata per chain and address, which never changes once deployed.
+
+    Lookups are served from an in-process LRU. Pass `store_path` to also keep metadata in a
+    SQLite file shared by every process using the same path, so a token is only ever read
+    from the chain once. Tokens missing from both are read in a single batched call.
+    """
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_TOKEN_METADATA_CACHE_SIZE,
+        store_path: str | None = None,
+    ):
+        """Initialize the registry.
+
+        Args:
+            max_size (int): The maximum number of tokens kept in memory.
+            store_path (str | None): Optional SQLite file shared between processes.
+
+        """
+        self._max_size = max_size
+        self._entries: OrderedDict[tuple[str, str], TokenMetadata] = OrderedDict()
+        self._lock = threading.Lock()
+
+        self._connection: sqlite3.Connection | None = None
+        if store_path is not None:
+            self._connection = sqlite3.connect(
+                store_path, isolation_level=None, check_same_thread=False
+            )
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS token_metadata (chain_id TEXT, address TEXT, "
+                "symbol TEXT, decimals INTEGER, name TEXT, PRIMARY KEY (chain_id, address))"
+            )
+
+    def get(self, chain_id: str, address: str) -> TokenMetadata | None:
+        """Look up cached metadata without reading the chain.
+
+        Args:
+            chain_id (str): The chain ID the token is deployed on.
+            address (str): The address of the token contract.
+
+        Returns:
+            TokenMetadata | None: The cached metadata, or None if the token is unknown.
+
+        """
+        key = (str(chain_id), address.lower())
+        with self._lock:
+            metadata = self._entries.get(key)
+            if metadata is not None:
+                self._entries.move_to_end(key)
+                return metadata
+
+            if self._connection is None:
+                return None
+            row = self._connection.execute(
+                "SELECT address, symbol, decimals, name FROM token_metadata "
+                "WHERE chain_id = ? AND address = ?",
+                key,
+            ).fetchone()
+            if row is None:
+                return None
+
+            metadata = TokenMetadata(
+                chain_id=key[0], address=row[0], symbol=row[1], decimals=row[2], name=row[3]
+            )
+            self._remember(key, metadata)
+            return metadata
+
+    def put(self, metadata: TokenMetadata) -> None:
+        """Add metadata to the registry.
+
+        Args:
+            metadata (TokenMetadata): The metadata to store.
+
+        """
+        key = (metadata.chain_id, metadata.address.lower())
+        with self._lock:
+            self._remember(key, metadata)
+            if self._connection is not None:
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO token_metadata "
+                    "(chain_id, address, symbol, decimals, name) VALUES (?, ?, ?, ?, ?)",
+                    (*key, metadata.symbol, metadata.decimals, metadata.name),
+                )
+
+    def get_many(self, wallet: EvmWalletProvider, addresses: list[str]) -> list[TokenMetadata]:
+        """Get the metadata of several tokens, reading unknown ones in one batched call.
+
+        Args:
+            wallet (EvmWalletProvider): The wallet provider used to read unknown tokens.
+            addresses (list[str]): The addresses of the token contracts.
+
+        Returns:
+            list[TokenMetadata]: The metadata of each token, in the same order as `addresses`.
+
+        Raises:
+            Exception: If the `decimals` read of an unknown token fails.
+
+        """
+        chain_id = str(wallet.get_network().chain_id)
+        found = {address: self.get(chain_id, address) for address in addresses}
+        missing = list(dict.fromkeys(a for a, metadata in found.items() if metadata is None))
+
+        if missing:
+            calls = []
+            for address in missing:
+                calls.extend(
+                    [
+                        ContractCall(
+                            contract_address=address, abi=ERC20_ABI, function_name="decimals"
+                        ),
+                        ContractCall(
+                            contract_address=address,
+                            abi=ERC20_ABI,
+                            function_name="symbol",
+                            allow_failure=True,
+                        ),
+                        ContractCall(
+                            contract_address=address,
+                            abi=ERC20_ABI,
+                            function_name="name",
+                            allow_failure=True,
+                        ),
+                    ]
+                )
+            results = wallet.read_contracts(calls)
+
+            for i, address in enumerate(missing):
+                decimals, symbol, name = results[3 * i : 3 * i + 3]
+                metadata = TokenMetadata(
+                    chain_id=chain_id,
+                    address=address,
+                    symbol=symbol.result if symbol.success else None,
+                    decimals=decimals.result,
+                    name=name.result if name.success else None,
+                )
+                self.put(metadata)
+                found[address] = metadata
+
+        return [found[address] for address in addresses]
+
+    def close(self) -> None:
+        """Close the SQLite store, if any."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _remember(self, key: tuple[str, str], metadata: TokenMetadata) -> None:
+        self._entries[key] = metadata
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+
+def prefill_known_tokens(registry: TokenMetadataRegistry) -> None:
+    """Add the tokens listed in the Compound and WOW constants to a registry.
+
+    Args:
+        registry (TokenMetadataRegistry): The registry to fill.
+
+    """
+    from ..compound.constants import ASSET_ADDRESSES
+    from ..wow.constants import addresses as wow_addresses
+
+    for network_id, assets in ASSET_ADDRESSES.items():
+        chain_id = NETWORK_ID_TO_CHAIN_ID[network_id]
+        for asset_id, address in assets.items():
+            symbol, decimals = _KNOWN_TOKENS[asset_id]
+            registry.put(
+                TokenMetadata(chain_id=chain_id, address=address, symbol=symbol, decimals=decimals)
+            )
+
+    for network_id, contracts in wow_addresses.items():
+        chain_id = NETWORK_ID_TO_CHAIN_ID[network_id]
+        symbol, decimals = _KNOWN_TOKENS["weth"]
+        registry.put(
+            TokenMetadata(
+                chain_id=chain_id, address=contracts["weth"], symbol=symbol, decimals=decimals
+            )
+        )
+
+
+_registry: TokenMetadataRegistry | None = None
+_registry_lock = threading.Lock()
+
+
+def get_token_metadata_registry() -> TokenMetadataRegistry:
+    """Get the registry shared by the action providers.
+
+    It is created on first use, prefilled with the known tokens, and stored in the SQLite
+    file named by the `TOKEN_METADATA_STORE_PATH` environment variable if it is set.
+
+    Returns:
+        TokenMetadataRegistry: The shared registry.
+
+    """
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = TokenMetadataRegistry(store_path=os.getenv("TOKEN_METADATA_STORE_PATH"))
+            prefill_known_tokens(_registry)
+        return _registry
+
+
+def set_token_metadata_registry(registry: TokenMetadataRegistry | None) -> None:
+    """Replace the registry shared by the action providers.
+
+    Args:
+        registry (TokenMetadataRegistry | None): The new registry, or None to create a
+            default one on next use.
+
+    """
+    global _registry
+    with _registry_lock:
+        _registry = registry
+
+
+def get_token_metadata(wallet: EvmWalletProvider, address: str) -> TokenMetadata:
+    """Get the metadata of a token from the shared registry.
+
+    Args:
+        wallet (EvmWalletProvider): The wallet provider used if the token is unknown.
+        address (str): The address of the token contract.
+
+    Returns:
+        TokenMetadata: The token's metadata.
+
+    """
+    return get_token_metadata_registry().get_many(wallet, [address])[0]
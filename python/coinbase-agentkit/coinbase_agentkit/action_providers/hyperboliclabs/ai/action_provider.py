@@ -7,6 +7,7 @@ It includes functionality for text, image and audio generation.
 import uuid
 from typing import Any
 
+from ....http_client import HttpClient
 from ...action_decorator import create_action
 from ..action_provider import ActionProvider
 from .schemas import (
@@ -32,15 +33,17 @@ class AIActionProvider(ActionProvider):
     def __init__(
         self,
         api_key: str | None = None,
+        http_client: HttpClient | None = None,
     ):
         """Initialize the AI action provider.
 
         Args:
             api_key: The API key for authentication.
+            http_client: Optional HTTP client for requests to the Hyperbolic API.
 
         """
         super().__init__("hyperbolic_ai", [], api_key=api_key)
-        self.ai_service = AIService(api_key=self.api_key)
+        self.ai_service = AIService(self.api_key, http_client=http_client)
 
     @create_action(
         name="generate_text",
@@ -255,12 +258,14 @@ Important notes:
 
 def ai_action_provider(
     api_key: str | None = None,
+    http_client: HttpClient | None = None,
 ) -> AIActionProvider:
     """Create a new instance of the AIActionProvider.
 
     Args:
         api_key: Optional API key for authentication. If not provided,
                 will attempt to read from HYPERBOLIC_API_KEY environment variable.
+        http_client: Optional HTTP client for requests to the Hyperbolic API.
 
     Returns:
         A new AI action provider instance.
@@ -269,4 +274,4 @@ def ai_action_provider(
         ValueError: If API key is not provided and not found in environment.
 
     """
-    return AIActionProvider(api_key=api_key)
+    return AIActionProvider(api_key=api_key, http_client=http_client)
@@ -1,5 +1,6 @@
 """Service for AI-related operations."""
 
+from ....http_client import HttpClient
 from ..constants import AI_SERVICES_BASE_URL, AI_SERVICES_ENDPOINTS, SUPPORTED_IMAGE_MODELS
 from ..service import Base
 from .types import (
@@ -15,14 +16,15 @@ from .types import (
 class AIService(Base):
     """AI service for Hyperbolic platform."""
 
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, http_client: HttpClient | None = None):
         """Initialize AI service.
 
         Args:
             api_key: API key for authentication.
+            http_client: Optional HTTP client for requests.
 
         """
-        super().__init__(api_key, AI_SERVICES_BASE_URL)
+        super().__init__(api_key, AI_SERVICES_BASE_URL, http_client)
 
     def generate_text(
         self,
@@ -6,6 +6,7 @@ It includes functionality for checking balance and spend history.
 
 from typing import Any
 
+from ....http_client import HttpClient
 from ...action_decorator import create_action
 from ..action_provider import ActionProvider
 from ..marketplace.service import MarketplaceService
@@ -32,20 +33,22 @@ class BillingActionProvider(ActionProvider):
     def __init__(
         self,
         api_key: str | None = None,
+        http_client: HttpClient | None = None,
     ):
         """Initialize the Hyperbolic billing action provider.
 
         Args:
             api_key: Optional API key for authentication. If not provided,
                     will attempt to read from HYPERBOLIC_API_KEY environment variable.
+            http_client: Optional HTTP client for requests to the Hyperbolic API.
 
         Raises:
             ValueError: If API key is not provided and not found in environment.
 
         """
         super().__init__("hyperbolic_billing", [], api_key=api_key)
-        self.billing = BillingService(self.api_key)
-        self.marketplace = MarketplaceService(self.api_key)
+        self.billing = BillingService(self.api_key, http_client=http_client)
+        self.marketplace = MarketplaceService(self.api_key, http_client=http_client)
 
     @create_action(
         name="get_current_balance",
@@ -200,12 +203,14 @@ Important notes:
 
 def hyperbolic_billing_action_provider(
     api_key: str | None = None,
+    http_client: HttpClient | None = None,
 ) -> BillingActionProvider:
     """Create a new instance of the BillingActionProvider.
 
     Args:
         api_key: Optional API key for authentication. If not provided,
                 will attempt to read from HYPERBOLIC_API_KEY environment variable.
+        http_client: Optional HTTP client for requests to the Hyperbolic API.
 
     Returns:
         A new Billing action provider instance.
@@ -214,4 +219,4 @@ def hyperbolic_billing_action_provider(
         ValueError: If API key is not provided and not found in environment.
 
     """
-    return BillingActionProvider(api_key=api_key)
+    return BillingActionProvider(api_key=api_key, http_client=http_client)
@@ -1,5 +1,6 @@
 """Service for billing-related operations."""
 
+from ....http_client import HttpClient
 from ..constants import BILLING_BASE_URL, BILLING_ENDPOINTS
 from ..service import Base
 from .types import (
@@ -11,14 +12,15 @@ from .types import (
 class BillingService(Base):
     """Service for billing-related operations."""
 
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, http_client: HttpClient | None = None):
         """Initialize the billing service.
 
         Args:
             api_key: The API key for authentication.
+            http_client: Optional HTTP client for requests.
 
         """
-        super().__init__(api_key, BILLING_BASE_URL)
+        super().__init__(api_key, BILLING_BASE_URL, http_client)
 
     def get_balance(self) -> BillingBalanceResponse:
         """Get current balance information.
@@ -4,6 +4,7 @@ This module provides a unified interface to all Hyperbolic platform services.
 It includes sub-providers for marketplace (GPU compute), billing, AI services, and account settings.
 """
 
+from ...http_client import HttpClient
 from ...network import Network
 from ..action_provider import ActionProvider
 from .ai.action_provider import (
@@ -37,12 +38,14 @@ class HyperbolicActionProvider(ActionProvider):
     def __init__(
         self,
         api_key: str | None = None,
+        http_client: HttpClient | None = None,
     ):
         """Initialize the Hyperbolic action provider with all sub-providers.
 
         Args:
             api_key: Optional API key for authentication. If not provided,
                     will attempt to read from HYPERBOLIC_API_KEY environment variable.
+            http_client: Optional HTTP client shared by all sub-providers.
 
         Raises:
             ValueError: If API key is not provided and not found in environment.
@@ -56,10 +59,10 @@ class HyperbolicActionProvider(ActionProvider):
                 "or set the HYPERBOLIC_API_KEY environment variable."
             ) from e
 
-        self.marketplace_provider = MarketplaceActionProvider(api_key)
-        self.billing_provider = BillingActionProvider(api_key)
-        self.ai_provider = AIActionProvider(api_key)
-        self.settings_provider = SettingsActionProvider(api_key)
+        self.marketplace_provider = MarketplaceActionProvider(api_key, http_client=http_client)
+        self.billing_provider = BillingActionProvider(api_key, http_client=http_client)
+        self.ai_provider = AIActionProvider(api_key, http_client=http_client)
+        self.settings_provider = SettingsActionProvider(api_key, http_client=http_client)
 
         super().__init__(
             "hyperbolic",
@@ -86,15 +89,17 @@ class HyperbolicActionProvider(ActionProvider):
 
 def hyperbolic_action_provider(
     api_key: str | None = None,
+    http_client: HttpClient | None = None,
 ) -> HyperbolicActionProvider:
     """Create a new instance of the HyperbolicActionProvider.
 
     Args:
         api_key: Optional API key for authentication. If not provided,
                 will attempt to read from HYPERBOLIC_API_KEY environment variable.
+        http_client: Optional HTTP client shared by all sub-providers.
 
     Returns:
         A new Hyperbolic action provider instance.
 
     """
-    return HyperbolicActionProvider(api_key=api_key)
+    return HyperbolicActionProvider(api_key=api_key, http_client=http_client)
@@ -6,6 +6,7 @@ It includes functionality for managing GPU instances and SSH access.
 
 from typing import Any
 
+from ....http_client import HttpClient
 from ...action_decorator import create_action
 from ..action_provider import ActionProvider
 from .schemas import (
@@ -38,19 +39,21 @@ class MarketplaceActionProvider(ActionProvider):
     def __init__(
         self,
         api_key: str | None = None,
+        http_client: HttpClient | None = None,
     ):
         """Initialize the Hyperbolic marketplace action provider.
 
         Args:
             api_key: Optional API key for authentication. If not provided,
                     will attempt to read from HYPERBOLIC_API_KEY environment variable.
+            http_client: Optional HTTP client for requests to the Hyperbolic API.
 
         Raises:
             ValueError: If API key is not provided and not found in environment.
 
         """
         super().__init__("hyperbolic_marketplace", [], api_key=api_key)
-        self.marketplace = MarketplaceService(self.api_key)
+        self.marketplace = MarketplaceService(self.api_key, http_client=http_client)
 
     @create_action(
         name="get_available_gpus",
@@ -77,6 +80,8 @@ Important notes:
 - GPU availability is real-time and may change between queries
 """,
         schema=GetAvailableGpusSchema,
+        read_only=True,
+        cache_ttl=30,
     )
     def get_available_gpus(self, args: dict[str, Any]) -> str:
         """Retrieve available GPU instances from the marketplace.
@@ -391,12 +396,14 @@ Important notes:
 
 def hyperbolic_marketplace_action_provider(
     api_key: str | None = None,
+    http_client: HttpClient | None = None,
 ) -> MarketplaceActionProvider:
     """Create a new instance of the MarketplaceActionProvider.
 
     Args:
         api_key: Optional API key for authentication. If not provided,
                 will attempt to read from HYPERBOLIC_API_KEY environment variable.
+        http_client: Optional HTTP client for requests to the Hyperbolic API.
 
     Returns:
         A new Marketplace action provider instance.
@@ -405,4 +412,4 @@ def hyperbolic_marketplace_action_provider(
         ValueError: If API key is not provided and not found in environment.
 
     """
-    return MarketplaceActionProvider(api_key=api_key)
+    return MarketplaceActionProvider(api_key=api_key, http_client=http_client)
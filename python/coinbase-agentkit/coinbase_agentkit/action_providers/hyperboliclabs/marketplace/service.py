@@ -1,5 +1,6 @@
 """Service for marketplace-related operations."""
 
+from ....http_client import HttpClient
 from ..constants import MARKETPLACE_BASE_URL, MARKETPLACE_ENDPOINTS
 from ..service import Base
 from .types import (
@@ -16,14 +17,15 @@ from .types import (
 class MarketplaceService(Base):
     """Service for marketplace-related operations."""
 
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, http_client: HttpClient | None = None):
         """Initialize the marketplace service.
 
         Args:
             api_key: The API key for authentication.
+            http_client: Optional HTTP client for requests.
 
         """
-        super().__init__(api_key, MARKETPLACE_BASE_URL)
+        super().__init__(api_key, MARKETPLACE_BASE_URL, http_client)
 
     def get_available_instances(self) -> AvailableInstancesResponse:
         """Get available GPU instances from the marketplace.
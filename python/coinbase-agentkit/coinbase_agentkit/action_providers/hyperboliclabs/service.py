@@ -4,23 +4,29 @@ from typing import Any
 
 import requests
 
+from ...http_client import HttpClient, get_http_client
 from .constants import API_BASE_URL
 
 
 class Base:
     """Base class with common functionality."""
 
-    def __init__(self, api_key: str, base_url: str | None = None):
+    def __init__(
+        self, api_key: str, base_url: str | None = None, http_client: HttpClient | None = None
+    ):
         """Initialize the service.
 
         Args:
             api_key: The API key for authentication.
             base_url: Optional base URL for the service. If not provided,
                      will use API_BASE_URL from constants.
+            http_client: Optional HTTP client for requests. If not provided,
+                     will use the shared client.
 
         """
         self.api_key = api_key
         self.base_url = base_url or API_BASE_URL
+        self.http_client = http_client
 
     def make_request(
         self,
@@ -55,9 +61,8 @@ class Base:
         )
 
         url = f"{self.base_url}{endpoint}"
-        response = requests.request(
-            method=method, url=url, headers=headers, json=data, params=params
-        )
+        client = self.http_client or get_http_client()
+        response = client.request(method=method, url=url, headers=headers, json=data, params=params)
 
         try:
             response.raise_for_status()
@@ -6,6 +6,7 @@ It includes functionality for managing account settings like wallet linking.
 
 from typing import Any
 
+from ....http_client import HttpClient
 from ...action_decorator import create_action
 from ..action_provider import ActionProvider
 from .schemas import LinkWalletAddressSchema
@@ -25,19 +26,21 @@ class SettingsActionProvider(ActionProvider):
     def __init__(
         self,
         api_key: str | None = None,
+        http_client: HttpClient | None = None,
     ):
         """Initialize the Hyperbolic settings action provider.
 
         Args:
             api_key: Optional API key for authentication. If not provided,
                     will attempt to read from HYPERBOLIC_API_KEY environment variable.
+            http_client: Optional HTTP client for requests to the Hyperbolic API.
 
         Raises:
             ValueError: If API key is not provided and not found in environment.
 
         """
         super().__init__("hyperbolic_settings", [], api_key=api_key)
-        self.settings = SettingsService(self.api_key)
+        self.settings = SettingsService(self.api_key, http_client=http_client)
 
     @create_action(
         name="link_wallet_address",
@@ -97,12 +100,14 @@ Important notes:
 
 def hyperbolic_settings_action_provider(
     api_key: str | None = None,
+    http_client: HttpClient | None = None,
 ) -> SettingsActionProvider:
     """Create a new instance of the SettingsActionProvider.
 
     Args:
         api_key: Optional API key for authentication. If not provided,
                 will attempt to read from HYPERBOLIC_API_KEY environment variable.
+        http_client: Optional HTTP client for requests to the Hyperbolic API.
 
     Returns:
         A new Settings action provider instance.
@@ -111,4 +116,4 @@ def hyperbolic_settings_action_provider(
         ValueError: If API key is not provided and not found in environment.
 
     """
-    return SettingsActionProvider(api_key=api_key)
+    return SettingsActionProvider(api_key=api_key, http_client=http_client)
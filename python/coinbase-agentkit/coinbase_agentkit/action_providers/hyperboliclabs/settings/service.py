@@ -1,5 +1,6 @@
 """Service for account settings-related operations."""
 
+from ....http_client import HttpClient
 from ..constants import SETTINGS_BASE_URL, SETTINGS_ENDPOINTS
 from ..service import Base
 from .types import WalletLinkRequest, WalletLinkResponse
@@ -8,14 +9,15 @@ from .types import WalletLinkRequest, WalletLinkResponse
 class SettingsService(Base):
     """Service for account settings operations."""
 
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, http_client: HttpClient | None = None):
         """Initialize the settings service.
 
         Args:
             api_key: The API key for authentication.
+            http_client: Optional HTTP client for requests.
 
         """
-        super().__init__(api_key, SETTINGS_BASE_URL)
+        super().__init__(api_key, SETTINGS_BASE_URL, http_client)
 
     def link_wallet(self, request: WalletLinkRequest) -> WalletLinkResponse:
         """Link a wallet address to the Hyperbolic account.
@@ -1,12 +1,17 @@
 """Nillion action provider."""
 
-from collections import deque, defaultdict
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from itertools import chain, islice
 import json
+import multiprocessing
 import os
 import time
 import re
+import threading
 import uuid
-from typing import Any, Generator
+from typing import Any, TypeVar
 
 import jwt
 import nilql
@@ -22,13 +27,77 @@ from coinbase_agentkit.action_providers.nillion.schemas import (
     NillionDataUploadInput,
     NillionDataDownloadInput,
 )
+from coinbase_agentkit.http_client import HttpClient, get_http_client
 from coinbase_agentkit.network import Network
 
+DEFAULT_NODE_TIMEOUT = 30.0
+DEFAULT_SCHEMA_CACHE_TTL = 300.0
+TOKEN_LIFETIME = 3600
+TOKEN_REFRESH_MARGIN = 300
+DEFAULT_UPLOAD_BATCH_SIZE = 500
+
+T = TypeVar("T")
+
+
+def _encrypt_secret_attributes(key: Any, entry: dict) -> None:
+    """Apply encryption or secret sharing to all fields in schema that are indicated w/ %share keyname."""
+    keys = list(entry.keys())
+    for name in keys:
+        value = entry[name]
+        if name == "_id":
+            entry[name] = str(uuid.uuid4())
+        elif name == "%share":
+            del entry["%share"]
+            entry["%allot"] = nilql.encrypt(key, value)
+        elif isinstance(value, dict):
+            _encrypt_secret_attributes(key, value)
+
+
+def _encrypt_records(key: Any, records: list[dict]) -> list[dict]:
+    """Encrypt the secret fields of a batch of records; run in worker processes."""
+    for record in records:
+        _encrypt_secret_attributes(key, record)
+    return records
+
+
+def _batched(records: Iterable[dict], size: int) -> Iterator[list[dict]]:
+    iterator = iter(records)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+class NillionUploadError(Exception):
+    """Raised when an upload fails after some of its records were already stored.
+
+    The UUIDs of the records stored before the failure are kept in `record_uuids`.
+    """
+
+    def __init__(self, message: str, record_uuids: list[str]):
+        """Initialize with the error message and the UUIDs of the stored records.
+
+        Args:
+            message: The error message
+            record_uuids: UUIDs of the records uploaded before the failure
+
+        """
+        super().__init__(message)
+        self.record_uuids = record_uuids
+
 
 class NillionActionProvider(ActionProvider):
     """Provides actions for interacting with Nillion SecretVault storage."""
 
-    def __init__(self, llm: Any, org_did: str | None = None, secret_key: str | None = None):
+    def __init__(
+        self,
+        llm: Any,
+        org_did: str | None = None,
+        secret_key: str | None = None,
+        http_client: HttpClient | None = None,
+        node_timeout: float = DEFAULT_NODE_TIMEOUT,
+        schema_cache_ttl: float = DEFAULT_SCHEMA_CACHE_TTL,
+        upload_batch_size: int = DEFAULT_UPLOAD_BATCH_SIZE,
+        encrypt_workers: int | None = None,
+    ):
         super().__init__("nillion", [])
 
         secret_key = secret_key or os.getenv("NILLION_SECRET_KEY")
@@ -40,99 +109,311 @@ class NillionActionProvider(ActionProvider):
             raise ValueError("NILLION_ORG_ID is not configured.")
 
         self.llm = llm
+        self.http_client = http_client or get_http_client()
+        self.node_timeout = node_timeout
+        self.schema_cache_ttl = schema_cache_ttl
+        self.upload_batch_size = upload_batch_size
+        self.encrypt_workers = encrypt_workers or min(os.cpu_count() or 1, 4)
+        self._process_pool: ProcessPoolExecutor | None = None
 
         """Initialize config with JWTs signed with ES256K for multiple node_ids; Add cluster key."""
         self.org_did = org_did
-        response = requests.post(
+        response = self.http_client.post(
             "https://secret-vault-registration.replit.app/api/config",
             headers={
                 "Content-Type": "application/json",
             },
             json={"org_did": org_did},
+            timeout=node_timeout,
         )
         self.nodes = response.json()["nodes"]
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(len(self.nodes), 1), thread_name_prefix="agentkit-nillion"
+        )
 
         # Convert the secret key from hex to bytes
         private_key = bytes.fromhex(secret_key)
-        signer = SigningKey.from_string(private_key, curve=SECP256k1)
+        self._signer_pem = SigningKey.from_string(private_key, curve=SECP256k1).to_pem()
+        self._issue_tokens()
+
+        self._schema_lock = threading.Lock()
+        self._schemas: list | None = None
+        self._schemas_etag: str | None = None
+        self._schemas_fetched_at = 0.0
+        self._validators: dict[str, Any] = {}
+
+        self._stop = threading.Event()
+        self._token_worker = threading.Thread(
+            target=self._refresh_tokens, name="agentkit-nillion-tokens", daemon=True
+        )
+        self._token_worker.start()
 
+        self.key = nilql.ClusterKey.generate({"nodes": [{}] * len(self.nodes)}, {"store": True})
+
+    def _issue_tokens(self) -> None:
+        """Sign a fresh ES256K bearer JWT for every node."""
+        expires_at = int(time.time()) + TOKEN_LIFETIME
         for node in self.nodes:
             # Create payload for each node_id
             payload = {
-                "iss": org_did,
+                "iss": self.org_did,
                 "aud": node["did"],
-                "exp": int(time.time()) + 3600,
+                "exp": expires_at,
             }
 
             # Create and sign the JWT
-            node["bearer"] = jwt.encode(payload, signer.to_pem(), algorithm="ES256K")
+            node["bearer"] = jwt.encode(payload, self._signer_pem, algorithm="ES256K")
+        self._tokens_expire_at = expires_at
+
+    def _refresh_tokens(self) -> None:
+        """Re-issue the bearer tokens shortly before they expire, off the request path."""
+        while not self._stop.wait(
+            max(self._tokens_expire_at - TOKEN_REFRESH_MARGIN - time.time(), 1)
+        ):
+            if time.time() >= self._tokens_expire_at - TOKEN_REFRESH_MARGIN:
+                try:
+                    self._issue_tokens()
+                except Exception as e:
+                    print(f"Warning: Failed to refresh Nillion tokens: {e}")
+
+    def _headers(self, node: dict) -> dict:
+        """Build the request headers for a node, re-issuing tokens if they have expired."""
+        if time.time() >= self._tokens_expire_at:
+            self._issue_tokens()
+        return {
+            "Authorization": f'Bearer {node["bearer"]}',
+            "Content-Type": "application/json",
+        }
 
-        self.key = nilql.ClusterKey.generate({"nodes": [{}] * len(self.nodes)}, {"store": True})
+    def close(self) -> None:
+        """Stop the threads used to reach the nildb nodes and refresh tokens."""
+        self._stop.set()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        if self._process_pool is not None:
+            self._process_pool.shutdown(wait=False, cancel_futures=True)
+            self._process_pool = None
+
+    def post(self, nodes: list, endpoint: str, payload: dict) -> list[requests.Response]:
+        """Post the same payload to nildb nodes concurrently."""
+        return self._fan_out(nodes, lambda _, node: self._post_node(node, endpoint, payload))
+
+    def _post_node(self, node: dict, endpoint: str, payload: dict) -> requests.Response:
+        """Post payload to one nildb node, failing unless it reports success."""
+        response = self.http_client.post(
+            f"{node['url']}/api/v1/{endpoint}",
+            headers=self._headers(node),
+            json=payload,
+            timeout=self.node_timeout,
+        )
 
-    def post(
-        self, nodes: list, endpoint: str, payload: dict
-    ) -> Generator[requests.Response, Any, Any]:
-        """Post payload to nildb nodes."""
-        for node in nodes:
-            headers = {
-                "Authorization": f'Bearer {node["bearer"]}',
-                "Content-Type": "application/json",
-            }
+        assert response.status_code == 200 and response.json().get("errors", []) == [], (
+            f"{endpoint} failed on {node['url']}: " + response.content.decode("utf8")
+        )
 
-            response = requests.post(
-                f"{node['url']}/api/v1/{endpoint}",
-                headers=headers,
-                json=payload,
+        return response
+
+    def _fan_out(self, nodes: list, request: Callable[[int, dict], T]) -> list[T]:
+        """Run a request against every node concurrently and return the results in node order.
+
+        Each record is split into one share per node and every share is needed to rebuild it,
+        so the quorum is the whole cluster: the first node to fail fails the call without
+        waiting for the others.
+        """
+        futures = {self._executor.submit(request, idx, node): idx for idx, node in enumerate(nodes)}
+        results: list[Any] = [None] * len(nodes)
+        try:
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+        finally:
+            for future in futures:
+                future.cancel()
+        return results
+
+    def fetch_schemas(self, refresh: bool = False) -> list:
+        """Get all my schemas from the first server.
+
+        The list is cached for `schema_cache_ttl` seconds. After that it is revalidated with
+        the ETag of the cached copy, so an unchanged list is not downloaded again.
+        """
+        with self._schema_lock:
+            if (
+                not refresh
+                and self._schemas is not None
+                and time.monotonic() - self._schemas_fetched_at < self.schema_cache_ttl
+            ):
+                return self._schemas
+
+            node = self.nodes[0]
+            headers = self._headers(node)
+            if self._schemas is not None and self._schemas_etag:
+                headers["If-None-Match"] = self._schemas_etag
+
+            response = self.http_client.get(
+                f"{node['url']}/api/v1/schemas", headers=headers, timeout=self.node_timeout
             )
 
+            if response.status_code == 304 and self._schemas is not None:
+                self._schemas_fetched_at = time.monotonic()
+                return self._schemas
+
             assert (
                 response.status_code == 200 and response.json().get("errors", []) == []
             ), response.content.decode("utf8")
 
-            yield response
-
-    def fetch_schemas(self) -> list:
-        """Get all my schemas from the first server."""
-        headers = {
-            "Authorization": f'Bearer {self.nodes[0]["bearer"]}',
-            "Content-Type": "application/json",
-        }
-
-        response = requests.get(f"{self.nodes[0]['url']}/api/v1/schemas", headers=headers)
+            schema_list = response.json()["data"]
+            assert len(schema_list) > 0, "failed to fetch schemas from nildb"
 
-        assert (
-            response.status_code == 200 and response.json().get("errors", []) == []
-        ), response.content.decode("utf8")
+            self._schemas = schema_list
+            self._schemas_etag = response.headers.get("ETag")
+            self._schemas_fetched_at = time.monotonic()
+            self._validators = {}
+            return schema_list
 
-        schema_list = response.json()["data"]
-        assert len(schema_list) > 0, "failed to fetch schemas from nildb"
-        return schema_list
+    def invalidate_schemas(self) -> None:
+        """Drop the cached schema list and validators."""
+        with self._schema_lock:
+            self._schemas = None
+            self._schemas_etag = None
+            self._validators = {}
 
     def find_schema(self, schema_uuid: str, schema_list: list | None = None) -> dict:
-        """Filter a list of schemas by single desired schema id."""
-        if not schema_list:
-            schema_list = self.fetch_schemas()
+        """Filter a list of schemas by single desired schema id.
 
-        my_schema = None
-        for this_schema in schema_list:
-            if this_schema["_id"] == schema_uuid:
-                my_schema = this_schema["schema"]
-                break
+        If the schema is not in the cached list, the list is fetched again once in case the
+        schema was created since.
+        """
+        my_schema = self._find_schema(schema_uuid, schema_list or self.fetch_schemas())
+        if my_schema is None and not schema_list:
+            my_schema = self._find_schema(schema_uuid, self.fetch_schemas(refresh=True))
         assert my_schema is not None, "failed to lookup schema"
         return my_schema
 
+    @staticmethod
+    def _find_schema(schema_uuid: str, schema_list: list) -> dict | None:
+        for this_schema in schema_list:
+            if this_schema["_id"] == schema_uuid:
+                return this_schema["schema"]
+        return None
+
+    def get_validator(self, schema_uuid: str) -> Any:
+        """Get the compiled validator for a schema, building it on first use."""
+        validator = self._validators.get(schema_uuid)
+        if validator is None:
+            schema = self.find_schema(schema_uuid)
+            validator = self._validator_builder()(schema)
+            with self._schema_lock:
+                # The schema list may have been replaced while the validator was built, in
+                # which case the validator belongs to a list that is no longer cached.
+                if self._find_schema(schema_uuid, self._schemas or []) is schema:
+                    self._validators[schema_uuid] = validator
+        return validator
+
     def _mutate_secret_attributes(self, entry: dict) -> None:
         """Apply encryption or secret sharing to all fields in schema that are indicated w/ %share keyname."""
-        keys = list(entry.keys())
-        for key in keys:
-            value = entry[key]
-            if key == "_id":
-                entry[key] = str(uuid.uuid4())
-            elif key == "%share":
-                del entry["%share"]
-                entry["%allot"] = nilql.encrypt(self.key, value)
-            elif isinstance(value, dict):
-                self._mutate_secret_attributes(value)
+        _encrypt_secret_attributes(self.key, entry)
+
+    def _encrypt_batches(self, batches: Iterator[list[dict]]) -> Iterator[list[dict]]:
+        """Encrypt batches of records in worker processes, keeping a bounded number in flight.
+
+        A single batch is encrypted in this process, since starting workers would cost more
+        than the encryption itself.
+        """
+        head = list(islice(batches, 2))
+        if len(head) < 2 or self.encrypt_workers <= 1:
+            for batch in chain(head, batches):
+                yield _encrypt_records(self.key, batch)
+            return
+
+        if self._process_pool is None:
+            # Forking would copy this process's token refresh and node threads mid-flight
+            self._process_pool = ProcessPoolExecutor(
+                max_workers=self.encrypt_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+
+        pending = deque()
+        for batch in chain(head, batches):
+            pending.append(self._process_pool.submit(_encrypt_records, self.key, batch))
+            if len(pending) > 2 * self.encrypt_workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+    def bulk_upload(self, schema_uuid: str, records: Iterable[dict]) -> list[str]:
+        """Upload records in batches, encrypting later batches while earlier ones are sent.
+
+        Args:
+            schema_uuid: The UUID of the schema the records follow.
+            records: The records to upload. May be a generator, so the full data set never
+                has to be in memory.
+
+        Returns:
+            list[str]: The UUIDs of the uploaded records.
+
+        Raises:
+            NillionUploadError: If a batch fails after earlier batches were stored. Records
+                of the failed batch may be stored on some nodes but are not reported.
+
+        """
+        validator = self.get_validator(schema_uuid)
+
+        record_uuids = []
+        try:
+            for encrypted in self._encrypt_batches(_batched(records, self.upload_batch_size)):
+                payloads = nilql.allot(encrypted)
+                for shard in payloads:
+                    validator.validate(shard)
+
+                self._fan_out(
+                    self.nodes[: len(payloads)],
+                    lambda idx, node, payloads=payloads: self._post_node(
+                        node, "data/create", {"schema": schema_uuid, "data": payloads[idx]}
+                    ),
+                )
+                record_uuids.extend(record["_id"] for record in encrypted)
+        except Exception as e:
+            if not record_uuids:
+                raise
+            raise NillionUploadError(
+                f"upload failed after {len(record_uuids)} records were stored: {e!s}",
+                record_uuids,
+            ) from e
+        return record_uuids
+
+    def iter_records(
+        self,
+        schema_uuid: str,
+        filter: dict | None = None,
+        offset: int = 0,
+        limit: int | None = None,
+    ) -> Iterator[dict]:
+        """Read records from every node and yield them decrypted, one at a time.
+
+        Args:
+            schema_uuid: The UUID of the schema to read.
+            filter: A nildb filter selecting the records to read, applied by the nodes.
+            offset: The number of matching records to skip.
+            limit: The maximum number of records to return, or None for all of them.
+
+        Returns:
+            Iterator[dict]: The decrypted records. Only records inside the page are
+                decrypted, shares are released as records are yielded, and records that are
+                not consumed are never decrypted.
+
+        """
+        responses = self.post(
+            self.nodes, "data/read", {"schema": schema_uuid, "filter": filter or {}}
+        )
+        indexes = [
+            {d["_id"]: d for d in response.json().get("data") or []} for response in responses
+        ]
+        del responses
+
+        stop = offset + limit if limit is not None else None
+        record_ids = list(dict.fromkeys(chain.from_iterable(indexes)))[offset:stop]
+        for record_id in record_ids:
+            shares = [index.pop(record_id) for index in indexes if record_id in index]
+            yield nilql.unify(self.key, shares)
 
     def _validator_builder(self):
         """Build a validator to validate the candidate document against loaded schema."""
@@ -363,9 +644,8 @@ A failure response will return a tuple with empty values
                 print(f"Error invoking model: {str(e)}")
                 raise
 
-            deque(
-                self.post(self.nodes, "schemas", schema), maxlen=0
-            )  # discard results since we throw on err
+            self.post(self.nodes, "schemas", schema)  # throws on err
+            self.invalidate_schemas()
             return schema["_id"], schema
         except Exception as e:
             print(f"Error creating schema: {str(e)}")
@@ -380,7 +660,8 @@ the desired schema itself. If you do not have the schema UUID you must use the l
 action of the NillionActionProvider.
 
 
-Success will return  a list of created record UUIDs, failure is an empty list.
+Success will return  a list of created record UUIDs, failure is an empty list. If the upload
+fails partway, the UUIDs of the records stored before the failure are returned.
     """,
         schema=NillionDataUploadInput,
     )
@@ -399,39 +680,11 @@ Success will return  a list of created record UUIDs, failure is an empty list.
         try:
             validated_args = NillionDataUploadInput(**args)
 
-            schema_definition = self.find_schema(validated_args.schema_uuid)
-
-            builder = self._validator_builder()
-            validator = builder(schema_definition)
-
-            for entry in validated_args.data_to_store:
-                self._mutate_secret_attributes(entry)
-
-            record_uuids = [x["_id"] for x in validated_args.data_to_store]
-            payloads = nilql.allot(validated_args.data_to_store)
-
-            for idx, shard in enumerate(payloads):
-                validator.validate(shard)
-
-                node = self.nodes[idx]
-                headers = {
-                    "Authorization": f'Bearer {node["bearer"]}',
-                    "Content-Type": "application/json",
-                }
-
-                body = {"schema": validated_args.schema_uuid, "data": shard}
-
-                response = requests.post(
-                    f"{node['url']}/api/v1/data/create",
-                    headers=headers,
-                    json=body,
-                )
-
-                assert response.status_code == 200 and response.json().get("errors", []) == [], (
-                    f"upload (host-{idx}) failed: " + response.content.decode("utf8")
-                )
-            return record_uuids
+            return self.bulk_upload(validated_args.schema_uuid, validated_args.data_to_store)
 
+        except NillionUploadError as e:
+            print(f"Error creating records in node: {str(e)}")
+            return e.record_uuids
         except Exception as e:
             print(f"Error creating records in node: {str(e)}")
             return []
@@ -444,6 +697,9 @@ Download all the data from your privacy preserving database, called the Nillion
 that you require. If you do not have the schema UUID you must use the lookup_schema action of the
 NillionActionProvider.
 
+To download only some records, pass a filter on the record fields (e.g. {"name": "alice"}), and
+use offset and limit to page through large results.
+
 Success will return true, whereas a failure response will return false.
     """,
         schema=NillionDataDownloadInput,
@@ -463,45 +719,56 @@ Success will return true, whereas a failure response will return false.
         try:
             validated_args = NillionDataDownloadInput(**args)
 
-            shares = defaultdict(list)
-            for node in self.nodes:
-                headers = {
-                    "Authorization": f'Bearer {node["bearer"]}',
-                    "Content-Type": "application/json",
-                }
-
-                body = {
-                    "schema": validated_args.schema_uuid,
-                    "filter": {},
-                }
-
-                response = requests.post(
-                    f"{node['url']}/api/v1/data/read",
-                    headers=headers,
-                    json=body,
-                )
-                assert response.status_code == 200, "upload failed: " + response.content.decode(
-                    "utf8"
+            return list(
+                self.iter_records(
+                    validated_args.schema_uuid,
+                    validated_args.filter,
+                    offset=validated_args.offset,
+                    limit=validated_args.limit,
                 )
-                data = response.json().get("data")
-                for d in data:
-                    shares[d["_id"]].append(d)
-            decrypted = []
-            for k in shares:
-                decrypted.append(nilql.unify(self.key, shares[k]))
-            return decrypted
+            )
         except Exception as e:
             print(f"Error retrieving records in node: {e!r}")
             return []
 
 
 def nillion_action_provider(
-    llm: Any, org_did: str | None = None, secret_key: str | None = None
+    llm: Any,
+    org_did: str | None = None,
+    secret_key: str | None = None,
+    http_client: HttpClient | None = None,
+    node_timeout: float = DEFAULT_NODE_TIMEOUT,
+    schema_cache_ttl: float = DEFAULT_SCHEMA_CACHE_TTL,
+    upload_batch_size: int = DEFAULT_UPLOAD_BATCH_SIZE,
+    encrypt_workers: int | None = None,
 ) -> NillionActionProvider:
     """Create a new Nillion action provider.
 
+    Args:
+        llm: The language model used to pick and write schemas.
+        org_did: The organization DID. Defaults to the NILLION_ORG_ID environment variable.
+        secret_key: The organization secret key. Defaults to the NILLION_SECRET_KEY
+            environment variable.
+        http_client: The HTTP client used to call the nildb nodes. Defaults to the shared
+            client.
+        node_timeout: The timeout in seconds for each request to a nildb node.
+        schema_cache_ttl: The number of seconds the schema list is cached before it is
+            revalidated.
+        upload_batch_size: The number of records uploaded per request.
+        encrypt_workers: The number of processes secret fields are encrypted in. Defaults to
+            the number of CPUs, up to 4.
+
     Returns:
         NillionActionProvider: A new Nillion action provider instance.
 
     """
-    return NillionActionProvider(llm=llm, org_did=org_did, secret_key=secret_key)
+    return NillionActionProvider(
+        llm=llm,
+        org_did=org_did,
+        secret_key=secret_key,
+        http_client=http_client,
+        node_timeout=node_timeout,
+        schema_cache_ttl=schema_cache_ttl,
+        upload_batch_size=upload_batch_size,
+        encrypt_workers=encrypt_workers,
+    )
@@ -15,6 +15,14 @@ class NillionDataDownloadInput(BaseModel):
     """Input argument schema for data download action."""
 
     schema_uuid: str = Field(description="the UUID4 obtained from the nildb_schema_lookup_tool")
+    filter: dict[str, Any] = Field(
+        default_factory=dict,
+        description='optional filter on record fields, e.g. {"name": "alice"}',
+    )
+    offset: int = Field(0, ge=0, description="the number of matching records to skip")
+    limit: int | None = Field(
+        None, gt=0, description="the maximum number of records to return, or all if unset"
+    )
 
 
 class NillionDataUploadInput(BaseModel):
@@ -0,0 +1,253 @@
+"""Local catalog of Pyth price feeds."""
+
+import bisect
+import json
+import os
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from ...http_client import HttpClient, get_http_client
+from .constants import HERMES_API_URL
+
+DEFAULT_CATALOG_TTL = 3600.0
+DEFAULT_RETRY_INTERVAL = 60.0
+DEFAULT_REQUEST_TIMEOUT = 10.0
+
+
+def fetch_price_feeds(
+    base_url: str = HERMES_API_URL,
+    timeout: float | None = DEFAULT_REQUEST_TIMEOUT,
+    http_client: HttpClient | None = None,
+) -> list[dict[str, Any]]:
+    """Download the full list of Pyth price feeds from Hermes.
+
+    Args:
+        base_url: The Hermes API URL
+        timeout: The request timeout in seconds
+        http_client: The HTTP client to use. Defaults to the shared client.
+
+    Returns:
+        list[dict[str, Any]]: Every price feed with its id and attributes.
+
+    """
+    client = http_client or get_http_client()
+    response = client.get(f"{base_url}/v2/price_feeds", timeout=timeout)
+    response.raise_for_status()
+    return response.json()
+
+
+@dataclass(frozen=True)
+class PythPriceFeed:
+    """A Pyth price feed and the asset pair it prices."""
+
+    id: str
+    symbol: str
+    base: str
+    quote: str
+    asset_type: str
+
+
+class _CatalogIndex:
+    """Immutable lookup tables over one download of the feed list."""
+
+    def __init__(self, raw_feeds: list[dict[str, Any]]):
+        self.feeds: dict[str, PythPriceFeed] = {}
+        self.by_key: dict[str, list[PythPriceFeed]] = {}
+
+        for item in raw_feeds:
+            attributes = item.get("attributes", {})
+            base = attributes.get("base", "")
+            quote = attributes.get("quote_currency") or attributes.get("quote", "")
+            feed = PythPriceFeed(
+                id=item["id"],
+                symbol=attributes.get("symbol") or f"{base}/{quote}",
+                base=base,
+                quote=quote,
+                asset_type=attributes.get("asset_type", ""),
+            )
+            self.feeds[feed.id] = feed
+
+            keys = {
+                feed.symbol,
+                attributes.get("display_symbol") or f"{base}/{quote}",
+                attributes.get("generic_symbol") or f"{base}{quote}",
+                base,
+            }
+            for key in keys:
+                if key:
+                    self.by_key.setdefault(key.lower(), []).append(feed)
+
+        self.sorted_keys = sorted(self.by_key)
+
+
+class PythFeedCatalog:
+    """Resolves asset symbols to Pyth price feed ids without a request per lookup.
+
+    The full feed list is downloaded once and indexed by symbol (`Crypto.BTC/USD`), pair
+    (`BTC/USD` and `BTCUSD`) and base asset (`BTC`), so resolving a symbol is a dictionary
+    lookup and prefix search is a binary search over the sorted keys. Once the list is older
+    than `ttl` it keeps being served while a background thread downloads a fresh copy.
+
+    Pass `store_path` to save each download to a JSON file. A new catalog then starts from
+    that file instead of waiting on Hermes, and refreshes it in the background if it is stale.
+    """
+
+    def __init__(
+        self,
+        ttl: float = DEFAULT_CATALOG_TTL,
+        store_path: str | None = None,
+        fetch_feeds: Callable[[], list[dict[str, Any]]] | None = None,
+        retry_interval: float = DEFAULT_RETRY_INTERVAL,
+        http_client: HttpClient | None = None,
+    ):
+        """Initialize the catalog. Nothing is downloaded until the first lookup.
+
+        Args:
+            ttl (float): Seconds before the feed list is refreshed.
+            store_path (str | None): Optional JSON file the feed list is saved to and loaded
+                from on start.
+            fetch_feeds (Callable[[], list[dict[str, Any]]] | None): Returns the full feed
+                list. Defaults to `fetch_price_feeds`.
+            retry_interval (float): Seconds to wait before retrying a failed background
+                refresh.
+            http_client (HttpClient | None): The HTTP client the default `fetch_feeds`
+                downloads with. Defaults to the shared client.
+
+        """
+        self._ttl = ttl
+        self._store_path = store_path
+        self._fetch_feeds = fetch_feeds or (lambda: fetch_price_feeds(http_client=http_client))
+        self._retry_interval = retry_interval
+
+        self._index: _CatalogIndex | None = None
+        self._refresh_at = 0.0
+        self._load_lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._worker: threading.Thread | None = None
+
+    def resolve(
+        self, symbol: str, asset_type: str | None = "crypto", quote: str = "USD"
+    ) -> str | None:
+        """Get the id of the price feed for a symbol.
+
+        Args:
+            symbol (str): A base asset such as `BTC`, a pair such as `BTC/USD`, or a full
+                Pyth symbol such as `Crypto.BTC/USD`. Matching ignores case.
+            asset_type (str | None): Only match feeds of this asset type, or any if None.
+            quote (str): The quote currency preferred when `symbol` is a base asset.
+
+        Returns:
+            str | None: The price feed id, or None if no feed matches.
+
+        """
+        feeds = [
+            feed
+            for feed in self._get_index().by_key.get(symbol.lower(), [])
+            if asset_type is None or feed.asset_type.lower() == asset_type.lower()
+        ]
+        if not feeds:
+            return None
+
+        bases = [feed for feed in feeds if feed.base.lower() == symbol.lower()]
+        if bases:
+            quoted = [feed for feed in bases if feed.quote.lower() == quote.lower()]
+            return (quoted or bases)[0].id
+        return feeds[0].id
+
+    def get(self, feed_id: str) -> PythPriceFeed | None:
+        """Get a price feed by id.
+
+        Args:
+            feed_id (str): The price feed id, with or without a 0x prefix.
+
+        Returns:
+            PythPriceFeed | None: The feed, or None if it is not in the catalog.
+
+        """
+        return self._get_index().feeds.get(feed_id.lower().removeprefix("0x"))
+
+    def search(self, prefix: str, limit: int = 10) -> list[PythPriceFeed]:
+        """Find price feeds with a symbol, pair or base asset starting with a prefix.
+
+        Args:
+            prefix (str): The start of the symbol. Matching ignores case.
+            limit (int): The maximum number of feeds returned.
+
+        Returns:
+            list[PythPriceFeed]: The matching feeds, ordered by the key they matched.
+
+        """
+        index = self._get_index()
+        prefix = prefix.lower()
+        found: dict[str, PythPriceFeed] = {}
+        position = bisect.bisect_left(index.sorted_keys, prefix)
+        while position < len(index.sorted_keys) and len(found) < limit:
+            key = index.sorted_keys[position]
+            if not key.startswith(prefix):
+                break
+            for feed in index.by_key[key]:
+                found.setdefault(feed.id, feed)
+            position += 1
+        return list(found.values())[:limit]
+
+    def refresh(self) -> None:
+        """Download the feed list and rebuild the index on the calling thread."""
+        with self._refresh_lock:
+            raw_feeds = self._fetch_feeds()
+            fetched_at = time.time()
+            self._install(raw_feeds, fetched_at)
+            if self._store_path is not None:
+                self._save(raw_feeds, fetched_at)
+
+    def _get_index(self) -> _CatalogIndex:
+        index = self._index
+        if index is None:
+            with self._load_lock:
+                if self._index is None and not self._load():
+                    self.refresh()
+                index = self._index
+
+        if time.time() >= self._refresh_at:
+            self._refresh_in_background()
+        return index
+
+    def _install(self, raw_feeds: list[dict[str, Any]], fetched_at: float) -> None:
+        index = _CatalogIndex(raw_feeds)
+        self._index = index
+        self._refresh_at = fetched_at + self._ttl
+
+    def _refresh_in_background(self) -> None:
+        with self._load_lock:
+            if self._worker is not None and self._worker.is_alive():
+                return
+            self._worker = threading.Thread(
+                target=self._run_refresh, name="agentkit-pyth-catalog", daemon=True
+            )
+            self._worker.start()
+
+    def _run_refresh(self) -> None:
+        try:
+            self.refresh()
+        except Exception as e:
+            self._refresh_at = time.time() + self._retry_interval
+            print(f"Warning: Failed to refresh Pyth price feed catalog: {e}")
+
+    def _load(self) -> bool:
+        if self._store_path is None or not os.path.exists(self._store_path):
+            return False
+        try:
+            with open(self._store_path, encoding="utf-8") as f:
+                stored = json.load(f)
+            self._install(stored["feeds"], stored["fetched_at"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return False
+        return True
+
+    def _save(self, raw_feeds: list[dict[str, Any]], fetched_at: float) -> None:
+        temp_path = f"{self._store_path}.{os.getpid()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump({"fetched_at": fetched_at, "feeds": raw_feeds}, f)
+        os.replace(temp_path, self._store_path)
@@ -0,0 +1,3 @@
+"""Constants for Pyth action provider."""
+
+HERMES_API_URL = "https://hermes.pyth.network"
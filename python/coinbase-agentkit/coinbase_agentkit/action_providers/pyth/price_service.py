@@ -0,0 +1,292 @@
+"""Batched and streaming Pyth price fetching."""
+
+import json
+import random
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+import requests
+
+from ...http_client import HttpClient, get_http_client
+from .constants import HERMES_API_URL
+
+DEFAULT_MAX_STALENESS = 10.0
+DEFAULT_REQUEST_TIMEOUT = 10.0
+DEFAULT_STREAM_READ_TIMEOUT = 30.0
+MAX_STREAM_RETRY_DELAY = 30.0
+
+
+def _normalize_id(feed_id: str) -> str:
+    return feed_id.lower().removeprefix("0x")
+
+
+def fetch_latest_prices(
+    feed_ids: list[str],
+    base_url: str = HERMES_API_URL,
+    timeout: float | None = DEFAULT_REQUEST_TIMEOUT,
+    http_client: HttpClient | None = None,
+) -> list[dict[str, Any]]:
+    """Fetch the latest prices of several Pyth price feeds in one request.
+
+    Args:
+        feed_ids: The price feed ids
+        base_url: The Hermes API URL
+        timeout: The request timeout in seconds
+        http_client: The HTTP client to use. Defaults to the shared client.
+
+    Returns:
+        list[dict[str, Any]]: The parsed price updates returned by Hermes.
+
+    """
+    client = http_client or get_http_client()
+    response = client.get(
+        f"{base_url}/v2/updates/price/latest",
+        params={"ids[]": feed_ids, "parsed": "true"},
+        timeout=timeout,
+    )
+    response.raise_for_status()
+    return response.json().get("parsed") or []
+
+
+def format_price(price: int, exponent: int) -> str:
+    """Format a Pyth fixed point price with two decimals, rounding down.
+
+    Args:
+        price: The price mantissa
+        exponent: The power of ten the mantissa is scaled by
+
+    Returns:
+        str: The formatted price.
+
+    """
+    if exponent < 0:
+        adjusted_price = price * 100
+        divisor = 10**-exponent
+        scaled_price = adjusted_price // divisor
+        price_str = f"{scaled_price // 100}.{scaled_price % 100:02}"
+        return price_str if not price_str.startswith(".") else f"0{price_str}"
+
+    return str(price * 10**exponent)
+
+
+@dataclass(frozen=True)
+class PythPrice:
+    """A price published by a Pyth price feed."""
+
+    feed_id: str
+    price: int
+    conf: int
+    expo: int
+    publish_time: int
+
+    @classmethod
+    def from_update(cls, update: dict[str, Any]) -> "PythPrice":
+        """Create a price from a parsed Hermes price update.
+
+        Args:
+            update: One entry of the `parsed` list returned by Hermes
+
+        Returns:
+            PythPrice: The price.
+
+        """
+        price = update["price"]
+        return cls(
+            feed_id=_normalize_id(update["id"]),
+            price=int(price["price"]),
+            conf=int(price.get("conf", 0)),
+            expo=int(price["expo"]),
+            publish_time=int(price.get("publish_time", 0)),
+        )
+
+    def format(self) -> str:
+        """Format the price with two decimals.
+
+        Returns:
+            str: The formatted price.
+
+        """
+        return format_price(self.price, self.expo)
+
+
+class PythPriceService:
+    """Keeps the latest Pyth prices in memory and fetches missing ones in batches.
+
+    `get_prices` answers from the latest-price map when a feed's price was published less
+    than `max_staleness` seconds ago, and fetches every other feed in a single Hermes
+    request. `subscribe` additionally keeps a server-sent events stream open for some feeds,
+    so their prices stay fresh without any requests; if the stream drops it reconnects with
+    jittered exponential backoff, and lookups fall back to fetching in the meantime.
+    """
+
+    def __init__(
+        self,
+        base_url: str = HERMES_API_URL,
+        max_staleness: float = DEFAULT_MAX_STALENESS,
+        timeout: float = DEFAULT_REQUEST_TIMEOUT,
+        stream_read_timeout: float = DEFAULT_STREAM_READ_TIMEOUT,
+        fetch_prices: Callable[[list[str]], list[dict[str, Any]]] | None = None,
+        http_client: HttpClient | None = None,
+    ):
+        """Initialize the price service.
+
+        Args:
+            base_url (str): The Hermes API URL.
+            max_staleness (float): The age in seconds after which a price is fetched again.
+            timeout (float): The request timeout in seconds.
+            stream_read_timeout (float): Seconds without a stream message before
+                reconnecting.
+            fetch_prices (Callable[[list[str]], list[dict[str, Any]]] | None): Fetches the
+                parsed updates of several feeds. Defaults to `fetch_latest_prices`.
+            http_client (HttpClient | None): The HTTP client prices and the price stream are
+                requested with. Defaults to the shared client.
+
+        """
+        self._base_url = base_url
+        self._max_staleness = max_staleness
+        self._timeout = timeout
+        self._stream_read_timeout = stream_read_timeout
+        self._http_client = http_client
+        self._fetch_prices = fetch_prices or (
+            lambda feed_ids: fetch_latest_prices(feed_ids, base_url, timeout, http_client)
+        )
+
+        self._prices: dict[str, PythPrice] = {}
+        self._lock = threading.Lock()
+
+        self._subscribed: set[str] = set()
+        self._stream_stop: threading.Event | None = None
+        self._stream_response: requests.Response | None = None
+        self._stream_worker: threading.Thread | None = None
+
+    def get_price(self, feed_id: str) -> PythPrice:
+        """Get the latest price of a feed.
+
+        Args:
+            feed_id (str): The price feed id, with or without a 0x prefix.
+
+        Returns:
+            PythPrice: The price.
+
+        Raises:
+            ValueError: If Hermes has no price for the feed.
+
+        """
+        price = self.get_prices([feed_id]).get(_normalize_id(feed_id))
+        if price is None:
+            raise ValueError(f"No price data found for {feed_id}")
+        return price
+
+    def get_prices(self, feed_ids: list[str]) -> dict[str, PythPrice]:
+        """Get the latest prices of several feeds, fetching stale ones in one request.
+
+        Args:
+            feed_ids (list[str]): The price feed ids, with or without a 0x prefix.
+
+        Returns:
+            dict[str, PythPrice]: The price of each feed Hermes knows, keyed by the feed id
+                without a 0x prefix.
+
+        """
+        ids = list(dict.fromkeys(_normalize_id(feed_id) for feed_id in feed_ids))
+        now = time.time()
+
+        with self._lock:
+            prices = {
+                feed_id: self._prices[feed_id]
+                for feed_id in ids
+                if feed_id in self._prices
+                and now - self._prices[feed_id].publish_time <= self._max_staleness
+            }
+
+        missing = [feed_id for feed_id in ids if feed_id not in prices]
+        if missing:
+            fetched = self._store(self._fetch_prices(missing))
+            prices.update({feed_id: fetched[feed_id] for feed_id in missing if feed_id in fetched})
+
+        return prices
+
+    def subscribe(self, feed_ids: list[str]) -> None:
+        """Keep the prices of some feeds up to date from the Hermes price stream.
+
+        Args:
+            feed_ids (list[str]): The price feed ids to add to the stream.
+
+        """
+        ids = {_normalize_id(feed_id) for feed_id in feed_ids}
+        if ids <= self._subscribed:
+            return
+
+        self._subscribed |= ids
+        self._stop_stream()
+        stop = threading.Event()
+        self._stream_stop = stop
+        self._stream_worker = threading.Thread(
+            target=self._run_stream,
+            args=(sorted(self._subscribed), stop),
+            name="agentkit-pyth-stream",
+            daemon=True,
+        )
+        self._stream_worker.start()
+
+    def close(self) -> None:
+        """Close the price stream, if any."""
+        self._subscribed = set()
+        self._stop_stream()
+
+    def _store(self, updates: list[dict[str, Any]]) -> dict[str, PythPrice]:
+        prices = {}
+        for update in updates:
+            price = PythPrice.from_update(update)
+            prices[price.feed_id] = price
+
+        with self._lock:
+            for feed_id, price in prices.items():
+                current = self._prices.get(feed_id)
+                if current is None or current.publish_time <= price.publish_time:
+                    self._prices[feed_id] = price
+        return prices
+
+    def _stop_stream(self) -> None:
+        if self._stream_stop is not None:
+            self._stream_stop.set()
+        response = self._stream_response
+        if response is not None:
+            response.close()
+        worker = self._stream_worker
+        if worker is not None and worker is not threading.current_thread():
+            worker.join(self._timeout)
+        self._stream_stop = None
+        self._stream_worker = None
+
+    def _run_stream(self, feed_ids: list[str], stop: threading.Event) -> None:
+        delay = 1.0
+        while not stop.is_set():
+            try:
+                client = self._http_client or get_http_client()
+                with client.get(
+                    f"{self._base_url}/v2/updates/price/stream",
+                    params={"ids[]": feed_ids, "parsed": "true"},
+                    stream=True,
+                    timeout=(self._timeout, self._stream_read_timeout),
+                ) as response:
+                    self._stream_response = response
+                    response.raise_for_status()
+                    for line in response.iter_lines(decode_unicode=True):
+                        if stop.is_set():
+                            return
+                        if line and line.startswith("data:"):
+                            self._store(json.loads(line[len("data:") :]).get("parsed") or [])
+                            delay = 1.0
+            except Exception as e:
+                if stop.is_set():
+                    return
+                print(f"Warning: Pyth price stream disconnected: {e}")
+            finally:
+                self._stream_response = None
+
+            stop.wait(delay * (0.5 + random.random()))
+            delay = min(delay * 2, MAX_STREAM_RETRY_DELAY)
@@ -1,14 +1,17 @@
 """Pyth action provider."""
 
+import os
 from typing import Any
 
-import requests
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 
+from ...http_client import HttpClient
 from ...network import Network
 from ...wallet_providers import WalletProvider
 from ..action_decorator import create_action
 from ..action_provider import ActionProvider
+from .catalog import PythFeedCatalog
+from .price_service import PythPriceService
 
 
 class FetchPriceFeedIdSchema(BaseModel):
@@ -23,16 +26,67 @@ class FetchPriceSchema(BaseModel):
     price_feed_id: str = Field(..., description="The Pyth price feed ID to fetch the price for.")
 
 
+class FetchPricesSchema(BaseModel):
+    """Input schema for fetching several Pyth prices at once."""
+
+    token_symbols: list[str] = Field(
+        default_factory=list,
+        description="The token symbols to fetch prices for (e.g. BTC, ETH, etc.).",
+        max_length=100,
+    )
+    price_feed_ids: list[str] = Field(
+        default_factory=list,
+        description="The Pyth price feed IDs to fetch prices for.",
+        max_length=100,
+    )
+
+    @model_validator(mode="after")
+    def check_assets_provided(self) -> "FetchPricesSchema":
+        """Ensure at least one token symbol or price feed ID is provided.
+
+        Returns:
+            FetchPricesSchema: The validated schema.
+
+        Raises:
+            ValueError: If neither token symbols nor price feed IDs are provided.
+
+        """
+        if not self.token_symbols and not self.price_feed_ids:
+            raise ValueError("At least one token symbol or price feed ID must be provided")
+        return self
+
+
 class PythActionProvider(ActionProvider[WalletProvider]):
     """Provides actions for interacting with Pyth price feeds."""
 
-    def __init__(self):
+    def __init__(
+        self,
+        catalog: PythFeedCatalog | None = None,
+        price_service: PythPriceService | None = None,
+        http_client: HttpClient | None = None,
+    ):
+        """Initialize the Pyth action provider.
+
+        Args:
+            catalog (PythFeedCatalog | None): The price feed catalog used to resolve symbols.
+                Defaults to a catalog saved to the PYTH_CATALOG_PATH file, if set.
+            price_service (PythPriceService | None): The service prices are fetched with.
+            http_client (HttpClient | None): The HTTP client the default catalog and price
+                service use. Defaults to the shared client.
+
+        """
         super().__init__("pyth", [])
+        self._catalog = catalog or PythFeedCatalog(
+            store_path=os.getenv("PYTH_CATALOG_PATH"), http_client=http_client
+        )
+        self._price_service = price_service or PythPriceService(http_client=http_client)
 
     @create_action(
         name="fetch_price_feed_id",
         description="Fetch the price feed ID for a given token symbol (e.g. BTC, ETH, etc.) from Pyth.",
         schema=FetchPriceFeedIdSchema,
+        read_only=True,
+        cache_ttl=3600,
     )
     def fetch_price_feed_id(self, args: dict[str, Any]) -> str:
         """Fetch the price feed ID for a given token symbol from Pyth.
@@ -45,21 +99,12 @@ class PythActionProvider(ActionProvider[WalletProvider]):
 
         """
         token_symbol = args["token_symbol"]
-        url = f"https://hermes.pyth.network/v2/price_feeds?query={token_symbol}&asset_type=crypto"
-        response = requests.get(url)
-        response.raise_for_status()
-        data = response.json()
-
-        if not data:
-            raise ValueError(f"No price feed found for {token_symbol}")
+        price_feed_id = self._catalog.resolve(token_symbol)
 
-        filtered_data = [
-            item for item in data if item["attributes"]["base"].lower() == token_symbol.lower()
-        ]
-        if not filtered_data:
+        if price_feed_id is None:
             raise ValueError(f"No price feed found for {token_symbol}")
 
-        return filtered_data[0]["id"]
+        return price_feed_id
 
     @create_action(
         name="get_price",
@@ -84,43 +129,79 @@ Important notes:
 
         """
         try:
-            price_feed_id = args["price_feed_id"]
-            url = f"https://hermes.pyth.network/v2/updates/price/latest?ids[]={price_feed_id}"
-            response = requests.get(url)
-            response.raise_for_status()
-            data = response.json()
-            parsed_data = data["parsed"]
-
-            if not parsed_data:
-                raise ValueError(f"No price data found for {price_feed_id}")
-
-            price_info = parsed_data[0]["price"]
-            price = int(price_info["price"])
-            exponent = price_info["expo"]
-
-            if exponent < 0:
-                adjusted_price = price * 100
-                divisor = 10**-exponent
-                scaled_price = adjusted_price // divisor
-                price_str = f"{scaled_price // 100}.{scaled_price % 100:02}"
-                return price_str if not price_str.startswith(".") else f"0{price_str}"
-
-            scaled_price = price // (10**exponent)
-
-            return str(scaled_price)
+            return self._price_service.get_price(args["price_feed_id"]).format()
         except Exception as e:
             return f"Error fetching price from Pyth: {e!s}"
 
+    @create_action(
+        name="get_prices",
+        description="""
+Fetch the prices of several assets from Pyth in one call, e.g. for every asset in a portfolio.
+
+Inputs:
+- Token symbols (e.g. BTC, ETH, etc.), resolved to Pyth price feeds automatically
+- Pyth price feed IDs (optional), for feeds that are not identified by a token symbol
+
+Important notes:
+- Prefer this action over calling get_price repeatedly when more than one price is needed.
+- This action only fetches price inputs from Pyth price feeds. No other source.
+""",
+        schema=FetchPricesSchema,
+    )
+    def fetch_prices(self, args: dict[str, Any]) -> str:
+        """Fetch prices from Pyth for several token symbols and price feed IDs.
+
+        Args:
+            args (dict[str, Any]): Input arguments for the action.
+
+        Returns:
+            str: A message containing the prices or error details.
+
+        """
+        try:
+            validated_args = FetchPricesSchema(**args)
+
+            feed_ids = {}
+            for symbol in validated_args.token_symbols:
+                feed_ids[symbol] = self._catalog.resolve(symbol)
+            for price_feed_id in validated_args.price_feed_ids:
+                feed_ids[price_feed_id] = price_feed_id
+
+            prices = self._price_service.get_prices(
+                [feed_id for feed_id in feed_ids.values() if feed_id is not None]
+            )
+
+            lines = []
+            for asset, feed_id in feed_ids.items():
+                if feed_id is None:
+                    lines.append(f"{asset}: no price feed found")
+                    continue
+                price = prices.get(feed_id.lower().removeprefix("0x"))
+                lines.append(f"{asset}: {price.format() if price else 'no price data found'}")
+
+            return "\n".join(lines)
+        except Exception as e:
+            return f"Error fetching prices from Pyth: {e!s}"
+
     def supports_network(self, network: Network) -> bool:
         """Check if network is supported by Pyth."""
         return True
 
 
-def pyth_action_provider() -> PythActionProvider:
+def pyth_action_provider(
+    catalog: PythFeedCatalog | None = None,
+    price_service: PythPriceService | None = None,
+    http_client: HttpClient | None = None,
+) -> PythActionProvider:
     """Create a new Pyth action provider.
 
+    Args:
+        catalog (PythFeedCatalog | None): The price feed catalog used to resolve symbols.
+        price_service (PythPriceService | None): The service prices are fetched with.
+        http_client (HttpClient | None): The HTTP client used to call Hermes.
+
     Returns:
         PythActionProvider: A new Pyth action provider instance.
 
     """
-    return PythActionProvider()
+    return PythActionProvider(catalog=catalog, price_service=price_service, http_client=http_client)
@@ -3,10 +3,23 @@
 This package provides SSH connection functionality for the agent toolkit.
 """
 
-from .connection import SSHConnection, SSHConnectionError, SSHConnectionParams, SSHKeyError
+from .connection import (
+    CommandResult,
+    CommandStream,
+    OutputChunk,
+    SSHCommandTimeoutError,
+    SSHConnection,
+    SSHConnectionError,
+    SSHConnectionParams,
+    SSHKeyError,
+)
 from .connection_pool import SSHConnectionPool
 
 __all__ = [
+    "CommandResult",
+    "CommandStream",
+    "OutputChunk",
+    "SSHCommandTimeoutError",
     "SSHConnection",
     "SSHConnectionPool",
     "SSHConnectionParams",
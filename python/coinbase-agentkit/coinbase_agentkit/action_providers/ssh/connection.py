@@ -6,10 +6,15 @@ to remote servers and provides functionality for executing commands.
 @module ssh/connection
 """
 
+import codecs
 import contextlib
 import io
 import os
+import time
+from collections import deque
+from collections.abc import Callable, Iterator
 from datetime import datetime
+from typing import NamedTuple
 
 import paramiko
 from pydantic import BaseModel, Field, model_validator
@@ -45,12 +50,259 @@ class SSHConnectionParams(BaseModel):
         return cls
 
 
+class CommandResult(BaseModel):
+    """The outcome of running a command on one connection."""
+
+    connection_id: str = Field(description="The connection the command ran on")
+    exit_status: int | None = Field(None, description="The exit status, if the command finished")
+    stdout: str = Field("", description="Standard output of the command")
+    stderr: str = Field("", description="Standard error of the command")
+    output: str = Field("", description="Standard output and error interleaved as they arrived")
+    truncated: bool = Field(False, description="Whether output exceeded the cap and was cut")
+    error: str | None = Field(None, description="Why the command could not be run or finished")
+    timed_out: bool = Field(False, description="Whether the command exceeded its timeout")
+    stopped: bool = Field(False, description="Whether the caller stopped the command early")
+    duration: float = Field(0.0, description="Seconds spent running the command")
+
+    @property
+    def succeeded(self) -> bool:
+        """Whether the command finished with exit status 0."""
+        return self.error is None and self.exit_status == 0
+
+
+def truncate_output(text: str, limit: int) -> str:
+    """Shorten text to at most roughly `limit` characters, keeping its head and tail.
+
+    Args:
+        text: The text to shorten
+        limit: The maximum number of characters to keep
+
+    Returns:
+        str: The text, with its middle replaced by a marker if it was too long
+
+    """
+    if len(text) <= limit:
+        return text
+    head = limit // 2
+    tail = limit - head
+    omitted = len(text) - limit
+    return f"{text[:head]}\n... [{omitted} characters truncated] ...\n{text[len(text) - tail :]}"
+
+
+MAX_OUTPUT_CHARS = 100_000
+
+
+class BoundedOutput:
+    """Accumulates text up to a size cap, keeping its head and its most recent tail.
+
+    Half of the cap is spent on the first characters received and half on the last ones, so
+    memory stays bounded however much a command prints while both the start of the output
+    and its latest state are preserved.
+    """
+
+    def __init__(self, max_chars: int = MAX_OUTPUT_CHARS):
+        """Initialize the buffer.
+
+        Args:
+            max_chars: The maximum number of characters to keep
+
+        """
+        self._head_limit = max_chars // 2
+        self._tail_limit = max_chars - self._head_limit
+        self._head: list[str] = []
+        self._head_size = 0
+        self._tail: deque[str] = deque()
+        self._tail_size = 0
+        self.dropped = 0
+
+    @property
+    def truncated(self) -> bool:
+        """Whether any text was dropped."""
+        return self.dropped > 0
+
+    def append(self, text: str) -> None:
+        """Add text, dropping the oldest text after the head once the cap is reached.
+
+        Args:
+            text: The text to add
+
+        """
+        room = self._head_limit - self._head_size
+        if room > 0:
+            self._head.append(text[:room])
+            self._head_size += min(room, len(text))
+            text = text[room:]
+        if not text:
+            return
+
+        self._tail.append(text)
+        self._tail_size += len(text)
+        while self._tail_size > self._tail_limit:
+            excess = self._tail_size - self._tail_limit
+            oldest = self._tail[0]
+            if len(oldest) <= excess:
+                self._tail.popleft()
+                removed = len(oldest)
+            else:
+                self._tail[0] = oldest[excess:]
+                removed = excess
+            self._tail_size -= removed
+            self.dropped += removed
+
+    def getvalue(self) -> str:
+        """Get the retained text.
+
+        Returns:
+            str: The head and tail, separated by a marker if text was dropped
+
+        """
+        head = "".join(self._head)
+        tail = "".join(self._tail)
+        if self.dropped:
+            return f"{head}\n... [{self.dropped} characters truncated] ...\n{tail}"
+        return head + tail
+
+
+class OutputChunk(NamedTuple):
+    """A piece of command output, in the order it arrived."""
+
+    stream: str
+    data: str
+
+
+class CommandStream:
+    """Yields a running command's output as it arrives.
+
+    Standard output and error are read from the channel as soon as data is available and
+    yielded in arrival order. Iteration ends when the command exits or the timeout elapses;
+    check `exit_status` and `timed_out` afterwards. Closing the stream before then abandons
+    the command.
+    """
+
+    def __init__(
+        self,
+        channel: paramiko.Channel,
+        timeout: float,
+        poll_interval: float = 0.05,
+        chunk_size: int = 32768,
+    ):
+        """Initialize the stream.
+
+        Args:
+            channel: The channel the command is running on
+            timeout: Seconds the command has to finish
+            poll_interval: Seconds to wait between polls when no output is ready
+            chunk_size: The maximum number of bytes to read at once
+
+        """
+        self.channel = channel
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+        self.chunk_size = chunk_size
+        self.exit_status: int | None = None
+        self.timed_out = False
+        self._deadline = time.monotonic() + timeout
+
+    def __iter__(self) -> Iterator[OutputChunk]:
+        """Yield output chunks until the command exits or times out.
+
+        Yields:
+            OutputChunk: The next piece of stdout or stderr
+
+        """
+        channel = self.channel
+        readers = (
+            ("stdout", channel.recv_ready, channel.recv),
+            ("stderr", channel.recv_stderr_ready, channel.recv_stderr),
+        )
+        decoders = {
+            stream: codecs.getincrementaldecoder("utf-8")(errors="replace")
+            for stream, _, _ in readers
+        }
+
+        try:
+            while True:
+                received = False
+                for stream, ready, recv in readers:
+                    if ready():
+                        data = recv(self.chunk_size)
+                        text = decoders[stream].decode(data)
+                        received = received or bool(data)
+                        if text:
+                            yield OutputChunk(stream, text)
+                if received:
+                    continue
+
+                if channel.exit_status_ready():
+                    # Output sent before the exit status may have been buffered since the
+                    # reads above, so drain it before finishing.
+                    if any(ready() for _, ready, _ in readers):
+                        continue
+                    self.exit_status = channel.recv_exit_status()
+                    break
+                if time.monotonic() >= self._deadline:
+                    self.timed_out = True
+                    break
+                time.sleep(self.poll_interval)
+
+            for stream, decoder in decoders.items():
+                text = decoder.decode(b"", final=True)
+                if text:
+                    yield OutputChunk(stream, text)
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        """Abandon the command if it has not exited."""
+        if self.exit_status is None:
+            with contextlib.suppress(Exception):
+                self.channel.close()
+
+    def __enter__(self):
+        """Enter context manager.
+
+        Returns:
+            CommandStream: The stream
+
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Exit context manager and abandon the command if it is still running.
+
+        Args:
+            exc_type: Exception type
+            exc_val: Exception value
+            exc_tb: Exception traceback
+
+        """
+        self.close()
+
+
 class SSHConnectionError(Exception):
     """Exception raised for SSH connection errors."""
 
     pass
 
 
+class SSHCommandTimeoutError(SSHConnectionError):
+    """Exception raised when a command does not finish within its timeout.
+
+    The output received before the timeout is kept in `partial_output`.
+    """
+
+    def __init__(self, message: str, partial_output: str = ""):
+        """Initialize with error message and the output received so far.
+
+        Args:
+            message: The error message
+            partial_output: Output the command produced before timing out
+
+        """
+        super().__init__(message)
+        self.partial_output = partial_output
+
+
 class SSHKeyError(Exception):
     """Exception raised for SSH key-related errors."""
 
@@ -110,17 +362,19 @@ class SSHConnection:
     establishing connections, executing commands, and managing the connection state.
     """
 
-    def __init__(self, params: SSHConnectionParams):
+    def __init__(self, params: SSHConnectionParams, keepalive_interval: int = 30):
         """Initialize SSH connection.
 
         Args:
             params: SSH connection parameters
+            keepalive_interval: Seconds between transport keepalive packets, or 0 to disable
 
         Raises:
             ValueError: If the parameters are invalid
 
         """
         self.params = params
+        self.keepalive_interval = keepalive_interval
 
         self.connected = False
         self.connection_time = None
@@ -131,6 +385,9 @@ class SSHConnection:
     def is_connected(self) -> bool:
         """Check if there's an active SSH connection.
 
+        This only inspects the local transport state, so it does not cost a round trip. A
+        dead peer is detected once a keepalive or command fails to reach it.
+
         Returns:
             bool: Whether the connection is active
 
@@ -141,15 +398,11 @@ class SSHConnection:
         if not self.connected:
             return False
 
-        result = None
-
-        try:
-            _, stdout, _ = self.ssh_client.exec_command("echo 1", timeout=5)
-            result = stdout.read().decode().strip()
-        except Exception:
-            pass
+        transport = None
+        with contextlib.suppress(Exception):
+            transport = self.ssh_client.get_transport()
 
-        if result != "1":
+        if transport is None or not transport.is_active():
             self.reset_connection()
             return False
 
@@ -216,6 +469,10 @@ class SSHConnection:
                 self.connected = False
                 raise SSHConnectionError(f"Connection test failed: {e!s}")
 
+            transport = self.ssh_client.get_transport()
+            if transport is not None and self.keepalive_interval:
+                transport.set_keepalive(self.keepalive_interval)
+
             self.connected = True
             self.connection_time = datetime.now()
 
@@ -440,18 +697,26 @@ class SSHConnection:
         except Exception as e:
             raise SSHConnectionError(f"Failed to connect with password: {e!s}") from e
 
-    def execute(self, command: str, timeout: int = 30, ignore_stderr: bool = False) -> str:
+    def execute(
+        self,
+        command: str,
+        timeout: int = 30,
+        ignore_stderr: bool = False,
+        max_output_chars: int = MAX_OUTPUT_CHARS,
+    ) -> str:
         """Execute command on connected server.
 
         Args:
             command: Shell command to execute
             timeout: Command execution timeout in seconds
             ignore_stderr: If True, stderr output won't cause exceptions
+            max_output_chars: Maximum characters of stdout and of stderr to keep
 
         Returns:
             str: Command output (stdout) and optionally stderr if present
 
         Raises:
+            SSHCommandTimeoutError: If the command does not finish in time
             SSHConnectionError: If connection is lost or command execution fails
 
         """
@@ -461,38 +726,125 @@ class SSHConnection:
                 f"No active SSH connection for {params.connection_id}. Please connect first."
             )
 
-        try:
-            stdin, stdout, stderr = self.ssh_client.exec_command(command, timeout=timeout)
-            exit_status = stdout.channel.recv_exit_status()
-            output = stdout.read().decode()
-            error_output = stderr.read().decode()
-
-            if error_output and (ignore_stderr or exit_status == 0):
-                if output:
-                    return f"{output}\n[stderr]: {error_output}"
-                return error_output
-
-            if exit_status != 0 and error_output:
-                raise SSHConnectionError(
-                    f"Command execution failed on {params.connection_id} (exit code {exit_status}): {error_output}"
-                )
+        result = self.run(command, timeout=timeout, max_output_chars=max_output_chars)
+        if result.timed_out:
+            raise SSHCommandTimeoutError(
+                f"Command timed out after {timeout}s on {params.connection_id}",
+                partial_output=result.output,
+            )
+        if result.error:
+            raise SSHConnectionError(result.error)
 
-            if exit_status != 0:
-                raise SSHConnectionError(
-                    f"Command execution failed on {params.connection_id} with exit code {exit_status}"
-                )
+        exit_status = result.exit_status
+        output = result.stdout
+        error_output = result.stderr
+
+        if error_output and (ignore_stderr or exit_status == 0):
+            if output:
+                return f"{output}\n[stderr]: {error_output}"
+            return error_output
+
+        if exit_status != 0 and error_output:
+            raise SSHConnectionError(
+                f"Command execution failed on {params.connection_id} (exit code {exit_status}): {error_output}"
+            )
+
+        if exit_status != 0:
+            raise SSHConnectionError(
+                f"Command execution failed on {params.connection_id} with exit code {exit_status}"
+            )
+
+        return output
+
+    def stream(self, command: str, timeout: float = 30) -> CommandStream:
+        """Start a command and stream its output as it arrives.
+
+        Args:
+            command: Shell command to execute
+            timeout: Seconds the command has to finish
+
+        Returns:
+            CommandStream: An iterable of output chunks for the running command
 
-            if not output and exit_status == 0:
-                return ""
+        Raises:
+            SSHConnectionError: If there is no active connection or the command cannot start
 
-            return output
+        """
+        params = self.params
+        if not self.is_connected():
+            raise SSHConnectionError(
+                f"No active SSH connection for {params.connection_id}. Please connect first."
+            )
 
+        try:
+            _, stdout, _ = self.ssh_client.exec_command(command, timeout=timeout)
         except Exception as e:
             self.reset_connection()
             raise SSHConnectionError(
                 f"Command execution failed on {params.connection_id}: {e!s}"
             ) from e
 
+        return CommandStream(stdout.channel, timeout)
+
+    def run(
+        self,
+        command: str,
+        timeout: float = 30,
+        max_output_chars: int = MAX_OUTPUT_CHARS,
+        until: Callable[[OutputChunk], bool] | None = None,
+    ) -> CommandResult:
+        """Run a command and report its exit status and output without raising on failure.
+
+        Unlike `execute`, a non-zero exit status is part of the result rather than an error.
+        Output is capped, keeping its beginning and end, and whatever arrived is returned
+        even if the command times out or is stopped early.
+
+        Args:
+            command: Shell command to execute
+            timeout: Seconds to wait for the command to finish
+            max_output_chars: Maximum characters to keep of stdout, stderr and the
+                interleaved output each
+            until: Optional predicate called with each output chunk; returning True stops
+                waiting for the command and returns the output received so far
+
+        Returns:
+            CommandResult: The exit status and output, or the reason the command did not finish
+
+        """
+        params = self.params
+        started = time.monotonic()
+        result = CommandResult(connection_id=params.connection_id)
+        captured = {
+            "stdout": BoundedOutput(max_output_chars),
+            "stderr": BoundedOutput(max_output_chars),
+        }
+        interleaved = BoundedOutput(max_output_chars)
+
+        try:
+            with self.stream(command, timeout=timeout) as stream:
+                for chunk in stream:
+                    captured[chunk.stream].append(chunk.data)
+                    interleaved.append(chunk.data)
+                    if until is not None and until(chunk):
+                        result.stopped = True
+                        break
+            result.exit_status = stream.exit_status
+            if stream.timed_out:
+                result.timed_out = True
+                result.error = f"Command timed out after {timeout}s"
+        except SSHConnectionError as e:
+            result.error = str(e)
+        except Exception as e:
+            self.reset_connection()
+            result.error = f"Command execution failed on {params.connection_id}: {e!s}"
+
+        result.stdout = captured["stdout"].getvalue()
+        result.stderr = captured["stderr"].getvalue()
+        result.output = interleaved.getvalue()
+        result.truncated = any(buffer.truncated for buffer in (*captured.values(), interleaved))
+        result.duration = time.monotonic() - started
+        return result
+
     def disconnect(self) -> None:
         """Close SSH connection.
 
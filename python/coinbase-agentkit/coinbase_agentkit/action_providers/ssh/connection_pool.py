@@ -6,7 +6,11 @@ and provides methods to create, retrieve, and close connections.
 @module ssh/pool
 """
 
-from .connection import SSHConnection, SSHConnectionError, SSHConnectionParams
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from .connection import CommandResult, SSHConnection, SSHConnectionError, SSHConnectionParams
 
 
 class SSHConnectionPool:
@@ -14,18 +18,43 @@ class SSHConnectionPool:
 
     This class maintains a pool of SSH connections, limits the total number
     of connections, and provides methods to create, retrieve, and close connections.
+
+    When the pool is full the least recently used connection is closed to make room. Connections
+    closed by the pool, whether evicted, idle or found dead by the heartbeat, keep their
+    parameters and are reconnected transparently the next time they are requested.
     """
 
-    def __init__(self, max_connections: int = 5):
+    def __init__(
+        self,
+        max_connections: int = 5,
+        idle_timeout: float | None = None,
+        keepalive_interval: int = 30,
+        heartbeat_interval: float | None = 60,
+    ):
         """Initialize connection pool.
 
         Args:
             max_connections: Maximum number of concurrent connections
+            idle_timeout: Seconds a connection may go unused before it is closed, or None to
+                keep idle connections open
+            keepalive_interval: Seconds between transport keepalive packets on each connection,
+                or 0 to disable
+            heartbeat_interval: Seconds between background sweeps for dead and idle
+                connections, or None to only sweep when a connection is created
 
         """
         self.connections = {}
         self.max_connections = max_connections
         self.connection_params = {}
+        self.idle_timeout = idle_timeout
+        self.keepalive_interval = keepalive_interval
+        self.heartbeat_interval = heartbeat_interval
+
+        self._lock = threading.RLock()
+        self._last_used: dict[str, float] = {}
+        self._evicted: set[str] = set()
+        self._heartbeat: threading.Thread | None = None
+        self._heartbeat_stop = threading.Event()
 
     def has_connection(self, connection_id: str) -> bool:
         """Check if a connection exists in the pool.
@@ -34,14 +63,18 @@ class SSHConnectionPool:
             connection_id: Unique identifier for the connection
 
         Returns:
-            bool: True if the connection exists in the pool
+            bool: True if the connection exists in the pool or was closed by the pool and
+                can be reconnected
 
         """
-        return connection_id in self.connections
+        return connection_id in self.connections or connection_id in self._evicted
 
     def get_connection(self, connection_id: str) -> SSHConnection:
         """Get an existing connection from the pool.
 
+        If the connection was closed by the pool, it is recreated from its stored parameters
+        and reconnected, evicting the least recently used connection if the pool is full.
+
         Args:
             connection_id: Unique identifier for the connection
 
@@ -49,34 +82,96 @@ class SSHConnectionPool:
             SSHConnection: The connection object
 
         Raises:
-            SSHConnectionError: If the connection ID is not found or connection limit reached
+            SSHConnectionError: If the connection ID is not found or reconnecting fails
 
         """
-        if connection_id in self.connections:
-            return self.connections[connection_id]
+        with self._lock:
+            if connection_id in self.connections:
+                self._last_used[connection_id] = time.monotonic()
+                return self.connections[connection_id]
+
+            params = self._get_connection_params(connection_id)
+            if not params:
+                raise SSHConnectionError(f"Connection ID '{connection_id}' not found")
 
-        params = self._get_connection_params(connection_id)
-        if not params:
-            raise SSHConnectionError(f"Connection ID '{connection_id}' not found")
+            reconnect = connection_id in self._evicted
+            connection = self.create_connection(params)
 
-        if len(self.connections) >= self.max_connections:
-            raise SSHConnectionError(f"Connection limit reached ({self.max_connections})")
+        if reconnect:
+            connection.connect()
+        return connection
+
+    def run_many(
+        self,
+        connection_ids: list[str],
+        command: str,
+        timeout: float = 30,
+        max_workers: int | None = None,
+    ) -> list[CommandResult]:
+        """Run a command on several connections concurrently.
+
+        Each host is bounded by its own timeout, so the call takes about as long as the slowest
+        host rather than the sum of all of them. Failures are reported per host and never
+        stop the other hosts. The pool holds at most `max_connections` open connections, so
+        longer lists run in waves of that size, open connections first, and later waves
+        reconnect the hosts that earlier ones evicted.
+
+        Args:
+            connection_ids: The connections to run the command on
+            command: Shell command to execute
+            timeout: Seconds each host has to finish the command
+            max_workers: Maximum number of hosts to run on at once. Defaults to a whole wave.
+
+        Returns:
+            list[CommandResult]: One result per unique connection ID, in the order given
 
-        return self.create_connection(params)
+        """
+        connection_ids = list(dict.fromkeys(connection_ids))
+        with self._lock:
+            ordered = sorted(connection_ids, key=lambda cid: cid not in self.connections)
+
+        results: dict[str, CommandResult] = {}
+        for start in range(0, len(ordered), self.max_connections):
+            wave = ordered[start : start + self.max_connections]
+            # Mark the wave as most recently used so reconnecting one of its hosts evicts a
+            # connection outside the wave instead of another host that is still running.
+            with self._lock:
+                now = time.monotonic()
+                for connection_id in wave:
+                    if connection_id in self.connections:
+                        self._last_used[connection_id] = now
+
+            workers = min(max_workers or len(wave), len(wave))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="agentkit-ssh") as pool:
+                wave_results = pool.map(lambda cid: self._run_on(cid, command, timeout), wave)
+                results.update(zip(wave, wave_results, strict=True))
+
+        return [results[connection_id] for connection_id in connection_ids]
 
     def close_idle_connections(self) -> int:
-        """Close any idle connections in the pool.
+        """Close dead connections and connections unused for longer than the idle timeout.
+
+        Liveness is read from the local transport state, so a sweep does not run any remote
+        commands.
 
         Returns:
             int: Number of closed connections
 
         """
-        closed_count = 0
-        for conn_id, conn in list(self.connections.items()):
-            if not conn.is_connected():
-                self.close_connection(conn_id)
-                closed_count += 1
-        return closed_count
+        now = time.monotonic()
+        with self._lock:
+            expired = [
+                conn_id
+                for conn_id, conn in list(self.connections.items())
+                if not conn.is_connected()
+                or (
+                    self.idle_timeout is not None
+                    and now - self._last_used.get(conn_id, now) > self.idle_timeout
+                )
+            ]
+            for conn_id in expired:
+                self._evict(conn_id)
+        return len(expired)
 
     def create_connection(self, params: SSHConnectionParams) -> SSHConnection:
         """Create a new connection and add it to the pool.
@@ -88,27 +183,32 @@ class SSHConnectionPool:
             SSHConnection: The newly created SSH connection
 
         Raises:
-            SSHConnectionError: If the connection limit is reached
             ValueError: If the connection parameters are invalid
 
         """
-        self.close_idle_connections()
-
-        if len(self.connections) >= self.max_connections:
-            raise SSHConnectionError(f"Connection limit reached ({self.max_connections})")
-
-        try:
-            stored_params = self._set_connection_params(params)
-            connection = SSHConnection(stored_params)
-
-            self.connections[params.connection_id] = connection
-
-            return connection
-        except ValueError as e:
-            self._remove_connection_params(params.connection_id)
-            raise ValueError(
-                f"Invalid connection parameters for '{params.connection_id}': {e!s}"
-            ) from e
+        with self._lock:
+            self.close_idle_connections()
+
+            while self.connections and len(self.connections) >= self.max_connections:
+                self._evict(self._least_recently_used())
+
+            try:
+                stored_params = self._set_connection_params(params)
+                connection = SSHConnection(
+                    stored_params, keepalive_interval=self.keepalive_interval
+                )
+
+                self.connections[params.connection_id] = connection
+                self._last_used[params.connection_id] = time.monotonic()
+                self._evicted.discard(params.connection_id)
+            except ValueError as e:
+                self._remove_connection_params(params.connection_id)
+                raise ValueError(
+                    f"Invalid connection parameters for '{params.connection_id}': {e!s}"
+                ) from e
+
+        self._ensure_heartbeat()
+        return connection
 
     def close_connection(self, connection_id: str) -> SSHConnection | None:
         """Close and remove a connection from the pool.
@@ -117,14 +217,13 @@ class SSHConnectionPool:
             connection_id: Unique identifier for the connection
 
         """
-        if connection_id not in self.connections:
-            return None
-
-        connection = self.connections[connection_id]
-        connection.disconnect()
-
-        del self.connections[connection_id]
+        with self._lock:
+            self._evicted.discard(connection_id)
+            self._last_used.pop(connection_id, None)
+            connection = self.connections.pop(connection_id, None)
 
+        if connection is not None:
+            connection.disconnect()
         return connection
 
     def close_and_remove_connection(self, connection_id: str) -> None:
@@ -143,9 +242,17 @@ class SSHConnectionPool:
             self.close_connection(connection_id)
 
     def clear_connection_pool(self) -> None:
-        """Close all connections and clear all stored parameters."""
-        self.close_all_connections()
-        self.connection_params.clear()
+        """Close all connections, clear all stored parameters and stop the heartbeat."""
+        self._heartbeat_stop.set()
+        heartbeat, self._heartbeat = self._heartbeat, None
+        if heartbeat is not None and heartbeat is not threading.current_thread():
+            heartbeat.join()
+        self._heartbeat_stop.clear()
+
+        with self._lock:
+            self.close_all_connections()
+            self.connection_params.clear()
+            self._evicted.clear()
 
     def get_connections(self):
         """Get all connections in the pool.
@@ -176,6 +283,64 @@ class SSHConnectionPool:
         """
         self.clear_connection_pool()
 
+    def _least_recently_used(self) -> str:
+        """Get the ID of the connection that has gone unused the longest.
+
+        Returns:
+            str: The connection ID
+
+        """
+        return min(self.connections, key=lambda conn_id: self._last_used.get(conn_id, 0))
+
+    def _evict(self, connection_id: str) -> None:
+        """Close a connection but keep its parameters so it can be reconnected on demand.
+
+        Args:
+            connection_id: Unique identifier for the connection
+
+        """
+        self.close_connection(connection_id)
+        if connection_id in self.connection_params:
+            self._evicted.add(connection_id)
+
+    def _run_on(self, connection_id: str, command: str, timeout: float) -> CommandResult:
+        """Run a command on one connection, reporting any failure in the result.
+
+        Args:
+            connection_id: Unique identifier for the connection
+            command: Shell command to execute
+            timeout: Seconds the command has to finish
+
+        Returns:
+            CommandResult: The outcome of the command
+
+        """
+        try:
+            if not self.has_connection(connection_id):
+                raise SSHConnectionError(f"Connection ID '{connection_id}' not found")
+            return self.get_connection(connection_id).run(command, timeout=timeout)
+        except Exception as e:
+            return CommandResult(connection_id=connection_id, error=str(e))
+
+    def _ensure_heartbeat(self) -> None:
+        """Start the background heartbeat thread if it is not running."""
+        if not self.heartbeat_interval:
+            return
+        with self._lock:
+            if self._heartbeat is None or not self._heartbeat.is_alive():
+                self._heartbeat = threading.Thread(
+                    target=self._run_heartbeat, name="agentkit-ssh-heartbeat", daemon=True
+                )
+                self._heartbeat.start()
+
+    def _run_heartbeat(self) -> None:
+        """Periodically close dead and idle connections until the pool is cleared."""
+        while not self._heartbeat_stop.wait(self.heartbeat_interval):
+            try:
+                self.close_idle_connections()
+            except Exception as e:
+                print(f"Warning: SSH connection heartbeat failed: {e}")
+
     def _get_connection_params(self, connection_id: str) -> SSHConnectionParams | None:
         """Get stored connection parameters.
 
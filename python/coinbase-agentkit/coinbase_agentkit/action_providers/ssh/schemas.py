@@ -34,6 +34,23 @@ class RemoteShellSchema(BaseModel):
     timeout: int = Field(30, description="Command execution timeout in seconds")
 
 
+class RemoteShellFanOutSchema(BaseModel):
+    """Schema for remote_shell_fan_out action."""
+
+    connection_ids: list[str] = Field(
+        description="Identifiers for the SSH connections to run the command on",
+        min_length=1,
+    )
+    command: str = Field(
+        description="The shell command to execute on every remote server",
+        min_length=1,
+    )
+    timeout: int = Field(30, gt=0, description="Command execution timeout in seconds per host")
+    max_output_chars: int = Field(
+        2000, gt=0, description="Maximum characters of output to return per host"
+    )
+
+
 class DisconnectSchema(BaseModel):
     """Schema for ssh_disconnect action."""
 
@@ -17,7 +17,14 @@ from pydantic import ValidationError
 from ...network import Network
 from ..action_decorator import create_action
 from ..action_provider import ActionProvider
-from .connection import SSHConnectionError, SSHKeyError, UnknownHostKeyError
+from .connection import (
+    CommandResult,
+    SSHCommandTimeoutError,
+    SSHConnectionError,
+    SSHKeyError,
+    UnknownHostKeyError,
+    truncate_output,
+)
 from .connection_pool import SSHConnectionPool
 from .schemas import (
     AddHostKeySchema,
@@ -26,6 +33,7 @@ from .schemas import (
     FileDownloadSchema,
     FileUploadSchema,
     ListConnectionsSchema,
+    RemoteShellFanOutSchema,
     RemoteShellSchema,
     SSHConnectionSchema,
 )
@@ -38,10 +46,27 @@ class SshActionProvider(ActionProvider):
     It supports managing multiple concurrent SSH connections.
     """
 
-    def __init__(self, max_connections: int = 10):
-        """Initialize the SshActionProvider."""
+    def __init__(
+        self,
+        max_connections: int = 10,
+        idle_timeout: float | None = 1800,
+        keepalive_interval: int = 30,
+    ):
+        """Initialize the SshActionProvider.
+
+        Args:
+            max_connections: Maximum number of concurrent SSH connections
+            idle_timeout: Seconds a connection may go unused before it is closed, or None to
+                keep idle connections open
+            keepalive_interval: Seconds between SSH keepalive packets, or 0 to disable
+
+        """
         super().__init__("ssh", [])
-        self.connection_pool = SSHConnectionPool(max_connections=max_connections)
+        self.connection_pool = SSHConnectionPool(
+            max_connections=max_connections,
+            idle_timeout=idle_timeout,
+            keepalive_interval=keepalive_interval,
+        )
 
     @create_action(
         name="ssh_connect",
@@ -145,6 +170,8 @@ Important notes:
 - Use 'ssh_status' to check current connection status
 - Commands are executed in the connected SSH session
 - Returns command output as a string
+- Very long output is truncated, keeping its beginning and end
+- If the command exceeds the timeout, the output produced so far is returned
 - You can install any packages you need on the remote server
 """,
         schema=RemoteShellSchema,
@@ -176,6 +203,12 @@ Important notes:
             result = connection.execute(command, timeout=timeout, ignore_stderr=ignore_stderr)
             return f"Output from connection '{connection_id}':\n\n{result}"
 
+        except SSHCommandTimeoutError as e:
+            return (
+                f"Partial output from connection '{connection_id}' "
+                f"(command still running after {timeout}s and was abandoned):\n\n"
+                f"{e.partial_output}"
+            )
         except SSHConnectionError as e:
             return f"Error: Connection: {e!s}. Please reconnect using ssh_connect."
         except ValidationError as e:
@@ -183,6 +216,101 @@ Important notes:
         except Exception as e:
             return f"Error: Command execution: {e!s}"
 
+    @create_action(
+        name="remote_shell_fan_out",
+        description="""
+This tool executes the same shell command on several SSH connections concurrently.
+
+Required inputs:
+- connection_ids: Identifiers for the SSH connections to use
+- command: The shell command to execute
+
+Optional inputs:
+- timeout: Execution timeout in seconds for each host (default: 30)
+- max_output_chars: Maximum characters of output returned per host (default: 2000)
+
+Example successful response:
+    Ran command on 2 connections: 1 succeeded, 1 failed
+
+    [gpu-1] exit 0 (0.42s)
+    ok
+
+    [gpu-2] exit 1 (0.40s)
+    [stderr]: disk full
+
+Important notes:
+- Hosts run in parallel, so the call takes about as long as the slowest host
+- More hosts than the pool's connection limit run in successive waves, reconnecting hosts as needed
+- A failing or timed out host does not affect the others; a timed out host reports the output it produced so far
+- Long output is truncated per host, keeping its beginning and end
+- Requires active connections established via ssh_connect
+""",
+        schema=RemoteShellFanOutSchema,
+    )
+    def remote_shell_fan_out(self, args: dict[str, Any]) -> str:
+        """Execute a command on several remote servers concurrently.
+
+        Args:
+            args (dict[str, Any]): Input arguments for the action.
+
+        Returns:
+            str: A message containing the per-host results or error details.
+
+        """
+        try:
+            validated_args = RemoteShellFanOutSchema(**args)
+            results = self.connection_pool.run_many(
+                validated_args.connection_ids,
+                validated_args.command.strip(),
+                timeout=validated_args.timeout,
+            )
+
+            succeeded = sum(1 for result in results if result.succeeded)
+            lines = [
+                f"Ran command on {len(results)} connections: "
+                f"{succeeded} succeeded, {len(results) - succeeded} failed"
+            ]
+            for result in results:
+                lines.append("")
+                lines.append(self._format_command_result(result, validated_args.max_output_chars))
+
+            return "\n".join(lines)
+
+        except SSHConnectionError as e:
+            return f"Error: Connection: {e!s}"
+        except ValidationError as e:
+            return f"Error: Invalid parameters: {e!s}"
+        except Exception as e:
+            return f"Error: Command execution: {e!s}"
+
+    @staticmethod
+    def _format_command_result(result: CommandResult, max_output_chars: int) -> str:
+        """Format one host's result for the remote_shell_fan_out response.
+
+        Args:
+            result: The result to format
+            max_output_chars: Maximum characters of stdout and stderr to include
+
+        Returns:
+            str: The formatted result
+
+        """
+        if result.timed_out:
+            if not result.output:
+                return f"[{result.connection_id}] {result.error}"
+            partial = truncate_output(result.output.rstrip("\n"), max_output_chars)
+            return f"[{result.connection_id}] {result.error}, partial output:\n{partial}"
+        if result.error:
+            return f"[{result.connection_id}] error: {result.error}"
+
+        lines = [f"[{result.connection_id}] exit {result.exit_status} ({result.duration:.2f}s)"]
+        if result.stdout:
+            lines.append(truncate_output(result.stdout.rstrip("\n"), max_output_chars))
+        if result.stderr:
+            stderr = truncate_output(result.stderr.rstrip("\n"), max_output_chars)
+            lines.append(f"[stderr]: {stderr}")
+        return "\n".join(lines)
+
     @create_action(
         name="ssh_disconnect",
         description="""
@@ -595,14 +723,22 @@ Important notes:
 
 def ssh_action_provider(
     max_connections: int = 10,
+    idle_timeout: float | None = 1800,
+    keepalive_interval: int = 30,
 ) -> SshActionProvider:
     """Create a new instance of the SshActionProvider.
 
     Args:
         max_connections: Maximum number of concurrent SSH connections (default: 10)
+        idle_timeout: Seconds a connection may go unused before it is closed (default: 1800)
+        keepalive_interval: Seconds between SSH keepalive packets (default: 30)
 
     Returns:
         An initialized SshActionProvider
 
     """
-    return SshActionProvider(max_connections=max_connections)
+    return SshActionProvider(
+        max_connections=max_connections,
+        idle_timeout=idle_timeout,
+        keepalive_interval=keepalive_interval,
+    )
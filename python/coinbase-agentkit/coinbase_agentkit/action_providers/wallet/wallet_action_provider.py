@@ -25,6 +25,7 @@ class WalletActionProvider(ActionProvider[WalletProvider]):
     - Wallet provider name
     """,
         schema=GetWalletDetailsSchema,
+        read_only=True,
     )
     def get_wallet_details(self, wallet_provider: WalletProvider, args: dict[str, Any]) -> str:
         """Get details about the connected wallet.
@@ -58,6 +59,7 @@ class WalletActionProvider(ActionProvider[WalletProvider]):
         name="get_balance",
         description="This tool will get the native currency balance of the connected wallet.",
         schema=GetBalanceSchema,
+        read_only=True,
     )
     def get_balance(self, wallet_provider: WalletProvider, args: dict[str, Any]) -> str:
         """Get the native currency balance for the connected wallet.
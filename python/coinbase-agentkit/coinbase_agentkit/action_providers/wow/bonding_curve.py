@@ -0,0 +1,83 @@
+"""Local implementation of the WOW bonding curve.
+
+WOW tokens are priced on the exponential curve `price = A * e^(B * supply)` until they
+graduate to Uniswap. The quotes below follow the `BondingCurve` contract step by step in
+18 decimal fixed point, so they match the contract's `getEthBuyQuote` and
+`getTokenSellQuote` up to the rounding of its `expWad` and `lnWad` approximations.
+"""
+
+from dataclasses import dataclass
+from decimal import ROUND_FLOOR, Decimal, localcontext
+
+WAD = 10**18
+
+# Enough digits to evaluate exp and ln of 18 decimal fixed point numbers exactly
+_PRECISION = 80
+
+
+def _mul_wad(x: int, y: int) -> int:
+    return x * y // WAD
+
+
+def _div_wad(x: int, y: int) -> int:
+    return x * WAD // y
+
+
+def _exp_wad(x: int) -> int:
+    with localcontext() as ctx:
+        ctx.prec = _PRECISION
+        result = (Decimal(x) / WAD).exp() * WAD
+        return int(result.to_integral_value(rounding=ROUND_FLOOR))
+
+
+def _ln_wad(x: int) -> int:
+    if x <= 0:
+        raise ValueError("ln is undefined for non-positive values")
+    with localcontext() as ctx:
+        ctx.prec = _PRECISION
+        result = (Decimal(x) / WAD).ln() * WAD
+        return int(result.to_integral_value(rounding=ROUND_FLOOR))
+
+
+@dataclass(frozen=True)
+class BondingCurve:
+    """Parameters of a WOW bonding curve contract."""
+
+    a: int
+    b: int
+
+    def get_eth_buy_quote(self, current_supply: int, eth_order_size: int) -> int:
+        """Get the number of tokens an amount of ETH buys.
+
+        Args:
+            current_supply: The token's total supply, in wei.
+            eth_order_size: The amount of ETH spent, in wei.
+
+        Returns:
+            int: The number of tokens received, in wei.
+
+        """
+        exp_b_x0 = _exp_wad(_mul_wad(self.b, current_supply))
+        exp_b_x1 = exp_b_x0 + eth_order_size * self.b // self.a
+        return _div_wad(_ln_wad(exp_b_x1), self.b) - current_supply
+
+    def get_token_sell_quote(self, current_supply: int, tokens_to_sell: int) -> int:
+        """Get the amount of ETH received for selling tokens.
+
+        Args:
+            current_supply: The token's total supply, in wei.
+            tokens_to_sell: The number of tokens sold, in wei.
+
+        Returns:
+            int: The amount of ETH received, in wei.
+
+        Raises:
+            ValueError: If more tokens are sold than are in circulation.
+
+        """
+        if tokens_to_sell > current_supply:
+            raise ValueError("Cannot sell more tokens than the current supply")
+
+        exp_b_x0 = _exp_wad(_mul_wad(self.b, current_supply))
+        exp_b_x1 = _exp_wad(_mul_wad(self.b, current_supply - tokens_to_sell))
+        return (exp_b_x0 - exp_b_x1) * self.a // self.b
@@ -816,6 +816,23 @@ WOW_ABI = [
     {"stateMutability": "payable", "type": "receive"},
 ]
 
+BONDING_CURVE_ABI = [
+    {
+        "inputs": [],
+        "name": "A",
+        "outputs": [{"internalType": "uint256", "name": "", "type": "uint256"}],
+        "stateMutability": "view",
+        "type": "function",
+    },
+    {
+        "inputs": [],
+        "name": "B",
+        "outputs": [{"internalType": "uint256", "name": "", "type": "uint256"}],
+        "stateMutability": "view",
+        "type": "function",
+    },
+]
+
 WOW_FACTORY_CONTRACT_ADDRESSES = {
     "base-sepolia": "0x04870e22fa217Cb16aa00501D7D5253B8838C1eA",
     "base-mainnet": "0x997020E5F59cCB79C74D527Be492Cc610CB9fA2B",
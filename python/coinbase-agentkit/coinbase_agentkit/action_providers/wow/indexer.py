@@ -0,0 +1,300 @@
+"""Local index of WOW tokens built from their creation events."""
+
+import sqlite3
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+from eth_utils import event_abi_to_log_topic
+from web3 import Web3
+
+from ...wallet_providers import EvmWalletProvider
+from .constants import WOW_ABI, WOW_FACTORY_CONTRACT_ADDRESSES
+
+DEFAULT_LOOKBACK_BLOCKS = 43_200
+DEFAULT_BLOCK_RANGE = 2_000
+MAX_BLOCK_RANGE = 10_000
+
+_TOKEN_CREATED_ABI = next(
+    item for item in WOW_ABI if item.get("type") == "event" and item["name"] == "WowTokenCreated"
+)
+TOKEN_CREATED_TOPIC = "0x" + event_abi_to_log_topic(_TOKEN_CREATED_ABI).hex()
+
+
+@dataclass(frozen=True)
+class WowTokenRecord:
+    """A WOW token found in the factory's creation events."""
+
+    token_address: str
+    name: str
+    symbol: str
+    creator: str
+    token_uri: str
+    pool_address: str
+    bonding_curve: str
+    block_number: int
+    log_index: int
+    transaction_hash: str
+
+
+class WowTokenIndexer:
+    """Keeps a SQLite index of the tokens deployed by the WOW factory.
+
+    WOW tokens announce themselves with a `WowTokenCreated` event that carries the factory
+    address as an indexed topic, so `sync` pages through `eth_getLogs` filtered on that
+    topic and stores each token once. The last block scanned is checkpointed per chain and
+    factory in the same transaction as the tokens it covered, so a later `sync`, in this
+    process or another one sharing the file, only asks for new blocks.
+
+    Any contract can emit a log with these topics, so logs that do not decode, or that were
+    not emitted by the token they announce, are skipped. The filter still cannot tell a
+    genuine WOW token from an imitation that emits the same event, so the index is not proof
+    that a token came from the factory.
+
+    Nodes cap the size of log queries, so the block range adapts: it is halved whenever a
+    query fails and doubled again after each query that succeeds.
+    """
+
+    def __init__(
+        self,
+        store_path: str | None = None,
+        lookback_blocks: int = DEFAULT_LOOKBACK_BLOCKS,
+        block_range: int = DEFAULT_BLOCK_RANGE,
+        max_block_range: int = MAX_BLOCK_RANGE,
+        lock_timeout: float = 30.0,
+    ):
+        """Initialize the indexer.
+
+        Args:
+            store_path (str | None): Optional SQLite file to keep the index in. The index
+                is held in memory when omitted.
+            lookback_blocks (int): How many blocks before the chain head the first sync
+                starts from.
+            block_range (int): The number of blocks asked for in the first log query.
+            max_block_range (int): The largest number of blocks asked for in one query.
+            lock_timeout (float): Seconds to wait for the SQLite write lock.
+
+        """
+        self._lookback_blocks = lookback_blocks
+        self._block_range = max(1, min(block_range, max_block_range))
+        self._max_block_range = max_block_range
+        self._lock = threading.Lock()
+        self._event = Web3().eth.contract(abi=WOW_ABI).events.WowTokenCreated()
+
+        self._connection = sqlite3.connect(
+            store_path or ":memory:",
+            timeout=lock_timeout,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS wow_tokens ("
+            "chain_id TEXT, token_address TEXT, name TEXT, symbol TEXT, creator TEXT, "
+            "token_uri TEXT, pool_address TEXT, bonding_curve TEXT, block_number INTEGER, "
+            "log_index INTEGER, transaction_hash TEXT, PRIMARY KEY (chain_id, token_address))"
+        )
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS wow_tokens_symbol "
+            "ON wow_tokens (chain_id, symbol COLLATE NOCASE)"
+        )
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS wow_index_checkpoints "
+            "(chain_id TEXT, factory_address TEXT, last_block INTEGER, "
+            "PRIMARY KEY (chain_id, factory_address))"
+        )
+
+    def sync(self, wallet_provider: EvmWalletProvider, to_block: int | None = None) -> int:
+        """Index the tokens created since the last checkpoint.
+
+        Args:
+            wallet_provider (EvmWalletProvider): The wallet provider to read logs with.
+            to_block (int | None): The last block to index. Defaults to the chain head.
+
+        Returns:
+            int: The number of tokens added to the index.
+
+        Raises:
+            ValueError: If the network has no WOW factory or its block number is unknown.
+
+        """
+        network = wallet_provider.get_network()
+        if network.network_id not in WOW_FACTORY_CONTRACT_ADDRESSES:
+            raise ValueError(f"WOW is not deployed on network {network.network_id}")
+        chain_id = str(network.chain_id)
+        factory_address = WOW_FACTORY_CONTRACT_ADDRESSES[network.network_id].lower()
+
+        if to_block is None:
+            to_block = wallet_provider.get_block_number()
+            if to_block is None:
+                raise ValueError("Wallet provider cannot report the latest block number")
+
+        factory_topic = "0x" + factory_address[2:].rjust(64, "0")
+        added = 0
+        with self._lock:
+            checkpoint = self._load_checkpoint(chain_id, factory_address)
+            from_block = (
+                checkpoint + 1
+                if checkpoint is not None
+                else max(0, to_block - self._lookback_blocks + 1)
+            )
+
+            while from_block <= to_block:
+                end_block = min(from_block + self._block_range - 1, to_block)
+                try:
+                    logs = wallet_provider.get_logs(
+                        {
+                            "fromBlock": from_block,
+                            "toBlock": end_block,
+                            "topics": [TOKEN_CREATED_TOPIC, factory_topic],
+                        }
+                    )
+                except NotImplementedError:
+                    raise
+                except Exception:
+                    if end_block == from_block:
+                        raise
+                    self._block_range = max(1, (end_block - from_block + 1) // 2)
+                    continue
+
+                added += self._store(chain_id, factory_address, end_block, logs)
+                from_block = end_block + 1
+                self._block_range = min(self._block_range * 2, self._max_block_range)
+
+        return added
+
+    def list_recent(self, chain_id: str, limit: int = 10) -> list[WowTokenRecord]:
+        """List the most recently created tokens in the index.
+
+        Args:
+            chain_id (str): The chain to list tokens for.
+            limit (int): The maximum number of tokens returned.
+
+        Returns:
+            list[WowTokenRecord]: The tokens, newest first.
+
+        """
+        return self._query(
+            "WHERE chain_id = ? ORDER BY block_number DESC, log_index DESC LIMIT ?",
+            (str(chain_id), limit),
+        )
+
+    def search(self, chain_id: str, symbol: str, limit: int = 10) -> list[WowTokenRecord]:
+        """Find tokens whose symbol starts with a prefix, ignoring case.
+
+        Args:
+            chain_id (str): The chain to search.
+            symbol (str): The symbol, or the start of it.
+            limit (int): The maximum number of tokens returned.
+
+        Returns:
+            list[WowTokenRecord]: Exact matches first, then the newest tokens.
+
+        """
+        pattern = symbol.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+        return self._query(
+            "WHERE chain_id = ? AND symbol LIKE ? ESCAPE '\\' "
+            "ORDER BY symbol = ? COLLATE NOCASE DESC, block_number DESC, log_index DESC LIMIT ?",
+            (str(chain_id), pattern, symbol, limit),
+        )
+
+    def get_checkpoint(self, chain_id: str, factory_address: str) -> int | None:
+        """Get the last block indexed for a factory.
+
+        Args:
+            chain_id (str): The chain the factory is deployed on.
+            factory_address (str): The factory's address.
+
+        Returns:
+            int | None: The last block indexed, or None before the first sync.
+
+        """
+        with self._lock:
+            return self._load_checkpoint(str(chain_id), factory_address.lower())
+
+    def close(self) -> None:
+        """Close the SQLite store."""
+        self._connection.close()
+
+    @contextmanager
+    def _transaction(self) -> Iterator[None]:
+        self._connection.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+        except BaseException:
+            self._connection.execute("ROLLBACK")
+            raise
+        self._connection.execute("COMMIT")
+
+    def _load_checkpoint(self, chain_id: str, factory_address: str) -> int | None:
+        row = self._connection.execute(
+            "SELECT last_block FROM wow_index_checkpoints "
+            "WHERE chain_id = ? AND factory_address = ?",
+            (chain_id, factory_address),
+        ).fetchone()
+        return None if row is None else row[0]
+
+    def _store(self, chain_id: str, factory_address: str, last_block: int, logs: list) -> int:
+        records = [record for record in map(self._decode, logs) if record is not None]
+        with self._transaction():
+            added = 0
+            for record in records:
+                cursor = self._connection.execute(
+                    "INSERT OR IGNORE INTO wow_tokens VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        chain_id,
+                        record.token_address.lower(),
+                        record.name,
+                        record.symbol,
+                        record.creator,
+                        record.token_uri,
+                        record.pool_address,
+                        record.bonding_curve,
+                        record.block_number,
+                        record.log_index,
+                        record.transaction_hash,
+                    ),
+                )
+                added += cursor.rowcount
+            # Another process may have indexed further already, so never move backwards
+            self._connection.execute(
+                "INSERT INTO wow_index_checkpoints (chain_id, factory_address, last_block) "
+                "VALUES (?, ?, ?) ON CONFLICT (chain_id, factory_address) "
+                "DO UPDATE SET last_block = MAX(last_block, excluded.last_block)",
+                (chain_id, factory_address, last_block),
+            )
+        return added
+
+    def _decode(self, log) -> WowTokenRecord | None:
+        try:
+            event = self._event.process_log(log)
+        except Exception:
+            # Any contract can emit a log with our topics, so skip the ones that do not decode
+            return None
+        args = event["args"]
+        if str(log.get("address", "")).lower() != args["tokenAddress"].lower():
+            return None
+        transaction_hash = event["transactionHash"]
+        return WowTokenRecord(
+            token_address=Web3.to_checksum_address(args["tokenAddress"]),
+            name=args["name"],
+            symbol=args["symbol"],
+            creator=Web3.to_checksum_address(args["tokenCreator"]),
+            token_uri=args["tokenURI"],
+            pool_address=Web3.to_checksum_address(args["poolAddress"]),
+            bonding_curve=Web3.to_checksum_address(args["bondingCurve"]),
+            block_number=event["blockNumber"],
+            log_index=event["logIndex"],
+            transaction_hash=transaction_hash
+            if isinstance(transaction_hash, str)
+            else "0x" + bytes(transaction_hash).hex(),
+        )
+
+    def _query(self, clause: str, params: tuple) -> list[WowTokenRecord]:
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT token_address, name, symbol, creator, token_uri, pool_address, "
+                f"bonding_curve, block_number, log_index, transaction_hash FROM wow_tokens {clause}",
+                params,
+            ).fetchall()
+        return [WowTokenRecord(Web3.to_checksum_address(row[0]), *row[1:]) for row in rows]
@@ -65,3 +65,18 @@ class WowSellTokenSchema(BaseModel):
 
         """
         return validate_eth_address(v)
+
+
+class WowListTokensSchema(BaseModel):
+    """Input schema for listing recently created WOW tokens."""
+
+    limit: int = Field(10, description="The maximum number of tokens to list", ge=1, le=100)
+
+
+class WowSearchTokensSchema(BaseModel):
+    """Input schema for searching WOW tokens by symbol."""
+
+    symbol: str = Field(
+        ..., description="The token symbol, or the start of it, e.g. WOW", min_length=1
+    )
+    limit: int = Field(10, description="The maximum number of tokens to return", ge=1, le=100)
@@ -0,0 +1,221 @@
+"""Cache of WOW token market state."""
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from ...wallet_providers import ContractCall, EvmWalletProvider
+from .bonding_curve import BondingCurve
+from .constants import BONDING_CURVE_ABI, WOW_ABI, addresses
+
+DEFAULT_TOKEN_STATE_CACHE_SIZE = 1024
+
+BONDING_CURVE_MARKET = 0
+UNISWAP_POOL_MARKET = 1
+
+
+@dataclass(frozen=True)
+class WowTokenState:
+    """The market state of a WOW token at a block."""
+
+    token_address: str
+    market_type: int
+    total_supply: int
+    bonding_curve: BondingCurve
+    block_number: int | None = None
+
+    @property
+    def has_graduated(self) -> bool:
+        """Whether the token trades on Uniswap instead of its bonding curve."""
+        return self.market_type == UNISWAP_POOL_MARKET
+
+    def get_eth_buy_quote(self, eth_order_size: int) -> int:
+        """Get the number of tokens an amount of ETH buys on the bonding curve.
+
+        Args:
+            eth_order_size: The amount of ETH spent, in wei.
+
+        Returns:
+            int: The number of tokens received, in wei.
+
+        """
+        return self.bonding_curve.get_eth_buy_quote(self.total_supply, eth_order_size)
+
+    def get_token_sell_quote(self, tokens_to_sell: int) -> int:
+        """Get the amount of ETH received for selling tokens on the bonding curve.
+
+        Args:
+            tokens_to_sell: The number of tokens sold, in wei.
+
+        Returns:
+            int: The amount of ETH received, in wei.
+
+        """
+        return self.bonding_curve.get_token_sell_quote(self.total_supply, tokens_to_sell)
+
+
+class WowTokenStateCache:
+    """Caches the market type, supply and bonding curve of WOW tokens.
+
+    States are reused while the wallet provider reports the same block, and forever once a
+    token has graduated, since graduation cannot be undone. Bonding curve parameters are
+    constants of the curve contract and are read once per contract. Tokens missing from
+    the cache are read in a single batched call.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_TOKEN_STATE_CACHE_SIZE):
+        """Initialize the cache.
+
+        Args:
+            max_size (int): The maximum number of token states kept.
+
+        """
+        self._max_size = max_size
+        self._states: OrderedDict[tuple[str, str], WowTokenState] = OrderedDict()
+        self._curves: dict[tuple[str, str], BondingCurve] = {}
+        self._lock = threading.Lock()
+
+    def get(self, wallet_provider: EvmWalletProvider, token_address: str) -> WowTokenState:
+        """Get the state of a WOW token.
+
+        Args:
+            wallet_provider: The wallet provider to use for contract calls
+            token_address: Address of the token contract
+
+        Returns:
+            WowTokenState: The token's state at the wallet provider's latest block.
+
+        """
+        return self.get_many(wallet_provider, [token_address])[0]
+
+    def get_many(
+        self, wallet_provider: EvmWalletProvider, token_addresses: list[str]
+    ) -> list[WowTokenState]:
+        """Get the state of several WOW tokens, reading stale ones in one batched call.
+
+        Args:
+            wallet_provider: The wallet provider to use for contract calls
+            token_addresses: Addresses of the token contracts
+
+        Returns:
+            list[WowTokenState]: The state of each token, in the same order as `token_addresses`.
+
+        """
+        network = wallet_provider.get_network()
+        chain_id = str(network.chain_id)
+        block_number = wallet_provider.get_block_number()
+
+        found: dict[str, WowTokenState | None] = {}
+        with self._lock:
+            for address in token_addresses:
+                state = self._states.get((chain_id, address.lower()))
+                fresh = state is not None and (
+                    state.has_graduated
+                    or (block_number is not None and state.block_number == block_number)
+                )
+                found[address] = state if fresh else None
+        missing = list(dict.fromkeys(a for a, state in found.items() if state is None))
+
+        if missing:
+            calls = []
+            for address in missing:
+                calls.extend(
+                    ContractCall(contract_address=address, abi=WOW_ABI, function_name=name)
+                    for name in ("marketType", "totalSupply", "bondingCurve")
+                )
+
+            # Tokens from the WOW factory share its bonding curve, so read it up front
+            default_curve = addresses.get(network.network_id, {}).get("bonding_curve")
+            read_default_curve = (
+                default_curve is not None and (chain_id, default_curve.lower()) not in self._curves
+            )
+            if read_default_curve:
+                calls.extend(_curve_calls(default_curve))
+
+            results = [
+                r.result
+                for r in wallet_provider.read_contracts(
+                    calls, block_identifier="latest" if block_number is None else block_number
+                )
+            ]
+            if read_default_curve:
+                self._curves[(chain_id, default_curve.lower())] = BondingCurve(*results[-2:])
+
+            unknown_curves = list(
+                dict.fromkeys(
+                    results[3 * i + 2]
+                    for i in range(len(missing))
+                    if (chain_id, results[3 * i + 2].lower()) not in self._curves
+                )
+            )
+            if unknown_curves:
+                curve_results = wallet_provider.read_contracts(
+                    [call for curve in unknown_curves for call in _curve_calls(curve)]
+                )
+                for i, curve in enumerate(unknown_curves):
+                    self._curves[(chain_id, curve.lower())] = BondingCurve(
+                        curve_results[2 * i].result, curve_results[2 * i + 1].result
+                    )
+
+            with self._lock:
+                for i, address in enumerate(missing):
+                    market_type, total_supply, curve = results[3 * i : 3 * i + 3]
+                    state = WowTokenState(
+                        token_address=address,
+                        market_type=market_type,
+                        total_supply=total_supply,
+                        bonding_curve=self._curves[(chain_id, curve.lower())],
+                        block_number=block_number,
+                    )
+                    found[address] = state
+                    self._states[(chain_id, address.lower())] = state
+                    self._states.move_to_end((chain_id, address.lower()))
+                while len(self._states) > self._max_size:
+                    self._states.popitem(last=False)
+
+        return [found[address] for address in token_addresses]
+
+    def clear(self) -> None:
+        """Drop every cached token state."""
+        with self._lock:
+            self._states.clear()
+
+
+def _curve_calls(curve_address: str) -> list[ContractCall]:
+    return [
+        ContractCall(contract_address=curve_address, abi=BONDING_CURVE_ABI, function_name=name)
+        for name in ("A", "B")
+    ]
+
+
+_token_state_cache = WowTokenStateCache()
+
+
+def get_wow_token_state(wallet_provider: EvmWalletProvider, token_address: str) -> WowTokenState:
+    """Get the state of a WOW token from the shared cache.
+
+    Args:
+        wallet_provider: The wallet provider to use for contract calls
+        token_address: Address of the token contract, such as `0x036CbD53842c5426634e7929541eC2318f3dCF7e`
+
+    Returns:
+        WowTokenState: The token's state at the wallet provider's latest block.
+
+    """
+    return _token_state_cache.get(wallet_provider, token_address)
+
+
+def get_wow_token_states(
+    wallet_provider: EvmWalletProvider, token_addresses: list[str]
+) -> list[WowTokenState]:
+    """Get the state of several WOW tokens from the shared cache.
+
+    Args:
+        wallet_provider: The wallet provider to use for contract calls
+        token_addresses: Addresses of the token contracts
+
+    Returns:
+        list[WowTokenState]: The state of each token, in the same order as `token_addresses`.
+
+    """
+    return _token_state_cache.get_many(wallet_provider, token_addresses)
@@ -0,0 +1,224 @@
+"""Uniswap v3 pool state for quoting WOW swaps locally."""
+
+import threading
+from dataclasses import dataclass, field
+from typing import Any
+
+from ....wallet_providers import ContractCall, EvmWalletProvider
+from ..constants import WOW_ABI
+from .constants import UNISWAP_V3_ABI
+from .v3_math import (
+    MAX_SQRT_RATIO,
+    MAX_TICK,
+    MIN_SQRT_RATIO,
+    MIN_TICK,
+    compute_swap_step,
+    get_sqrt_ratio_at_tick,
+    next_initialized_tick_within_one_word,
+    tick_bitmap_position,
+    tick_bitmap_word,
+)
+
+# Bitmap words read on each side of the current tick
+DEFAULT_BITMAP_WORDS = 2
+
+
+class LocalQuoteUnavailableError(Exception):
+    """Exception raised when a swap cannot be quoted from the locally loaded pool state."""
+
+    pass
+
+
+@dataclass(frozen=True)
+class PoolImmutables:
+    """Fields of a uniswap v3 pool that are fixed at deployment."""
+
+    token0: str
+    token1: str
+    fee: int
+    tick_spacing: int
+
+
+@dataclass
+class UniswapV3PoolState:
+    """The state of a uniswap v3 pool around its current tick, read at a single block."""
+
+    address: str
+    token0: str
+    token1: str
+    fee: int
+    tick_spacing: int
+    sqrt_price_x96: int
+    tick: int
+    liquidity: int
+    balance0: int
+    balance1: int
+    block_number: int | None = None
+    tick_bitmap: dict[int, int] = field(default_factory=dict)
+    liquidity_net: dict[int, int] = field(default_factory=dict)
+
+    def quote_exact_input(self, token_in: str, amount_in: int) -> int:
+        """Quote an exact input swap with the pool's tick math, without any reads.
+
+        Args:
+            token_in: The address of the token swapped in, token0 or token1.
+            amount_in: The amount swapped in, in atomic units.
+
+        Returns:
+            int: The amount received, in atomic units.
+
+        Raises:
+            ValueError: If `token_in` is not one of the pool's tokens.
+            LocalQuoteUnavailableError: If the swap crosses ticks outside the loaded bitmap
+                words, or the pool cannot absorb the whole input.
+
+        """
+        if token_in.lower() == self.token0.lower():
+            zero_for_one = True
+        elif token_in.lower() == self.token1.lower():
+            zero_for_one = False
+        else:
+            raise ValueError(f"Token {token_in} is not traded in pool {self.address}")
+
+        sqrt_price_limit_x96 = MIN_SQRT_RATIO + 1 if zero_for_one else MAX_SQRT_RATIO - 1
+        amount_remaining = int(amount_in)
+        amount_out = 0
+        sqrt_price_x96, tick, liquidity = self.sqrt_price_x96, self.tick, self.liquidity
+
+        while amount_remaining > 0:
+            if sqrt_price_x96 == sqrt_price_limit_x96:
+                raise LocalQuoteUnavailableError("Swap exhausts the pool's liquidity")
+
+            word = tick_bitmap_word(tick, self.tick_spacing, zero_for_one)
+            if word not in self.tick_bitmap:
+                raise LocalQuoteUnavailableError(f"Tick bitmap word {word} is not loaded")
+            tick_next, initialized = next_initialized_tick_within_one_word(
+                self.tick_bitmap[word], tick, self.tick_spacing, zero_for_one
+            )
+            tick_next = min(max(tick_next, MIN_TICK), MAX_TICK)
+
+            sqrt_price_next_x96 = get_sqrt_ratio_at_tick(tick_next)
+            if zero_for_one:
+                sqrt_price_target_x96 = max(sqrt_price_next_x96, sqrt_price_limit_x96)
+            else:
+                sqrt_price_target_x96 = min(sqrt_price_next_x96, sqrt_price_limit_x96)
+
+            sqrt_price_x96, step_in, step_out, fee_amount = compute_swap_step(
+                sqrt_price_x96, sqrt_price_target_x96, liquidity, amount_remaining, self.fee
+            )
+            amount_remaining -= step_in + fee_amount
+            amount_out += step_out
+
+            if sqrt_price_x96 == sqrt_price_next_x96:
+                if initialized:
+                    if tick_next not in self.liquidity_net:
+                        raise LocalQuoteUnavailableError(f"Tick {tick_next} is not loaded")
+                    liquidity_net = self.liquidity_net[tick_next]
+                    liquidity += -liquidity_net if zero_for_one else liquidity_net
+                tick = tick_next - 1 if zero_for_one else tick_next
+
+        return amount_out
+
+
+_pool_immutables: dict[tuple[str, str], PoolImmutables] = {}
+_pool_immutables_lock = threading.Lock()
+
+
+def _pool_call(
+    pool_address: str, function_name: str, args: list[Any] | None = None
+) -> ContractCall:
+    return ContractCall(
+        contract_address=pool_address,
+        abi=UNISWAP_V3_ABI,
+        function_name=function_name,
+        args=args,
+    )
+
+
+def get_pool_state(
+    wallet_provider: EvmWalletProvider,
+    pool_address: str,
+    bitmap_words: int = DEFAULT_BITMAP_WORDS,
+) -> UniswapV3PoolState:
+    """Read the state of a uniswap v3 pool needed to quote swaps locally.
+
+    The price, liquidity and, the first time a pool is seen, its immutable tokens, fee and
+    tick spacing are read in one batch. A second batch reads the token balances and the
+    tick bitmap words around the current tick, and a third the net liquidity of every
+    initialized tick in those words. All batches are pinned to the same block.
+
+    Args:
+        wallet_provider: The wallet provider to use for contract calls
+        pool_address: Uniswap v3 pool address
+        bitmap_words: The number of tick bitmap words to read on each side of the current tick
+
+    Returns:
+        UniswapV3PoolState: The pool state.
+
+    """
+    block_number = wallet_provider.get_block_number()
+    block_identifier = "latest" if block_number is None else block_number
+
+    def read(calls: list[ContractCall]) -> list[Any]:
+        results = wallet_provider.read_contracts(calls, block_identifier=block_identifier)
+        return [result.result for result in results]
+
+    key = (str(wallet_provider.get_network().chain_id), pool_address.lower())
+    immutables = _pool_immutables.get(key)
+
+    calls = [_pool_call(pool_address, "slot0"), _pool_call(pool_address, "liquidity")]
+    if immutables is None:
+        calls.extend(
+            _pool_call(pool_address, name) for name in ("token0", "token1", "fee", "tickSpacing")
+        )
+    slot0, liquidity, *immutable_results = read(calls)
+    if immutables is None:
+        immutables = PoolImmutables(*immutable_results)
+        with _pool_immutables_lock:
+            _pool_immutables[key] = immutables
+
+    tick = slot0[1]
+    current_word, _ = tick_bitmap_position(tick // immutables.tick_spacing)
+    words = list(range(current_word - bitmap_words, current_word + bitmap_words + 1))
+
+    balance0, balance1, *bitmap = read(
+        [
+            ContractCall(
+                contract_address=token,
+                abi=WOW_ABI,
+                function_name="balanceOf",
+                args=[pool_address],
+            )
+            for token in (immutables.token0, immutables.token1)
+        ]
+        + [_pool_call(pool_address, "tickBitmap", [word]) for word in words]
+    )
+    tick_bitmap = dict(zip(words, bitmap, strict=True))
+
+    initialized_ticks = [
+        ((word << 8) + bit) * immutables.tick_spacing
+        for word, bits in tick_bitmap.items()
+        for bit in range(256)
+        if bits >> bit & 1
+    ]
+    tick_infos = (
+        read([_pool_call(pool_address, "ticks", [t]) for t in initialized_ticks])
+        if initialized_ticks
+        else []
+    )
+
+    return UniswapV3PoolState(
+        address=pool_address,
+        token0=immutables.token0,
+        token1=immutables.token1,
+        fee=immutables.fee,
+        tick_spacing=immutables.tick_spacing,
+        sqrt_price_x96=slot0[0],
+        tick=tick,
+        liquidity=liquidity,
+        balance0=balance0,
+        balance1=balance1,
+        block_number=block_number,
+        tick_bitmap=tick_bitmap,
+        liquidity_net={t: info[1] for t, info in zip(initialized_ticks, tick_infos, strict=True)},
+    )
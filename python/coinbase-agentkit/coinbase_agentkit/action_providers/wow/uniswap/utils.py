@@ -9,7 +9,8 @@ from web3.types import Wei
 
 from ....wallet_providers import EvmWalletProvider
 from ..constants import WOW_ABI, addresses
-from .constants import UNISWAP_QUOTER_ABI, UNISWAP_V3_ABI
+from .constants import UNISWAP_QUOTER_ABI
+from .pool import LocalQuoteUnavailableError, get_pool_state
 
 
 @dataclass
@@ -76,26 +77,6 @@ def create_price_info(wei_amount: Wei, eth_price_in_usd: float) -> PriceInfo:
     return PriceInfo(eth=wei_amount, usd=Decimal(str(usd)))
 
 
-def get_has_graduated(wallet_provider: EvmWalletProvider, token_address: str) -> bool:
-    """Check if a token has graduated from the Zora Wow protocol.
-
-    Args:
-        wallet_provider: The wallet provider to use for contract calls
-        token_address: Token address, such as `0x036CbD53842c5426634e7929541eC2318f3dCF7e`
-
-    Returns:
-        bool: True if the token has graduated, False otherwise
-
-    """
-    market_type = wallet_provider.read_contract(
-        contract_address=token_address,
-        abi=WOW_ABI,
-        function_name="marketType",
-        args=[],
-    )
-    return market_type == 1
-
-
 def get_pool_info(wallet_provider: EvmWalletProvider, pool_address: str) -> PoolInfo:
     """Get pool info for a given uniswap v3 pool address.
 
@@ -108,63 +89,20 @@ def get_pool_info(wallet_provider: EvmWalletProvider, pool_address: str) -> Pool
 
     """
     try:
-        token0 = wallet_provider.read_contract(
-            contract_address=pool_address,
-            abi=UNISWAP_V3_ABI,
-            function_name="token0",
-            args=[],
-        )
-        token1 = wallet_provider.read_contract(
-            contract_address=pool_address,
-            abi=UNISWAP_V3_ABI,
-            function_name="token1",
-            args=[],
-        )
-        fee = wallet_provider.read_contract(
-            contract_address=pool_address,
-            abi=UNISWAP_V3_ABI,
-            function_name="fee",
-            args=[],
-        )
-        liquidity = wallet_provider.read_contract(
-            contract_address=pool_address,
-            abi=UNISWAP_V3_ABI,
-            function_name="liquidity",
-            args=[],
-        )
-        slot0 = wallet_provider.read_contract(
-            contract_address=pool_address,
-            abi=UNISWAP_V3_ABI,
-            function_name="slot0",
-            args=[],
-        )
-
-        balance0 = wallet_provider.read_contract(
-            contract_address=token0,
-            abi=WOW_ABI,
-            function_name="balanceOf",
-            args=[pool_address],
-        )
-
-        balance1 = wallet_provider.read_contract(
-            contract_address=token1,
-            abi=WOW_ABI,
-            function_name="balanceOf",
-            args=[pool_address],
-        )
-
-        return PoolInfo(
-            token0=token0,
-            balance0=balance0,
-            token1=token1,
-            balance1=balance1,
-            fee=fee,
-            liquidity=liquidity,
-            sqrt_price_x96=slot0[0],
-        )
+        state = get_pool_state(wallet_provider, pool_address)
     except Exception as error:
         raise Exception(f"Failed to fetch pool information: {error!s}") from error
 
+    return PoolInfo(
+        token0=state.token0,
+        balance0=state.balance0,
+        token1=state.token1,
+        balance1=state.balance1,
+        fee=state.fee,
+        liquidity=state.liquidity,
+        sqrt_price_x96=state.sqrt_price_x96,
+    )
+
 
 def exact_input_single(
     wallet_provider: EvmWalletProvider, token_in: str, token_out: str, amount_in: int, fee: str
@@ -183,8 +121,7 @@ def exact_input_single(
 
     """
     try:
-        chain_id = wallet_provider.get_network().chain_id
-        network = "base-mainnet" if chain_id == 8453 else "base-sepolia"
+        network = wallet_provider.get_network().network_id
         if network not in addresses:
             raise ValueError(f"Unsupported network: {network}")
 
@@ -226,18 +163,35 @@ def get_uniswap_quote(
         Quote: A Quote object containing the amount in, amount out, balance, fee, and any error messages.
 
     """
-    pool = None
-    tokens = None
-    balances = None
-    eth_price_in_usd = None
-    quote_result = None
-    utilization = Wei(0)
-    insufficient_liquidity = False
-
-    chain_id = wallet_provider.get_network().chain_id
-    network = "base-mainnet" if chain_id == 8453 else "base-sepolia"
+    return get_uniswap_quotes(wallet_provider, token_address, [amount], quote_type)[0]
+
+
+def get_uniswap_quotes(
+    wallet_provider: EvmWalletProvider,
+    token_address: str,
+    amounts: list[int],
+    quote_type: Literal["buy", "sell"],
+) -> list[Quote]:
+    """Get Uniswap quotes for buying or selling several amounts of a token.
+
+    The pool state is read once and every amount is quoted locally with the pool's tick
+    math. The on-chain quoter is only called for amounts whose swap leaves the tick range
+    that was read, so exploring price impact costs no reads per amount.
+
+    Args:
+        wallet_provider: The wallet provider to use for contract calls
+        token_address: Token address, such as `0x036CbD53842c5426634e7929541eC2318f3dCF7e`
+        amounts: Amounts of tokens (in Wei)
+        quote_type: 'buy' or 'sell'
+
+    Returns:
+        list[Quote]: One Quote per amount, in the same order as `amounts`.
+
+    """
+    network = wallet_provider.get_network().network_id
     if network not in addresses:
         raise ValueError(f"Unsupported network: {network}")
+    weth = addresses[network]["weth"].lower()
 
     pool_address = wallet_provider.read_contract(
         contract_address=token_address,
@@ -247,73 +201,72 @@ def get_uniswap_quote(
     )
     invalid_pool_error = "Invalid pool address" if not pool_address else None
 
+    state = None
     try:
-        pool_info = get_pool_info(wallet_provider, pool_address)
-        token0, token1 = pool_info.token0, pool_info.token1
-        balance0, balance1 = pool_info.balance0, pool_info.balance1
-        fee = pool_info.fee
-
-        pool = pool_info
-        tokens = (token0, token1)
-        balances = (balance0, balance1)
-
-        is_token0_weth = token0.lower() == addresses[network]["weth"].lower()
-        token_in = (
-            token0
-            if (quote_type == "buy" and is_token0_weth)
-            or (quote_type == "sell" and not is_token0_weth)
-            else token1
-        )
-
-        token_out, balance_out = (token1, balance1) if token_in == token0 else (token0, balance0)
-
-        if isinstance(balance_out, list | tuple):
-            balance_out = balance_out[0] if balance_out else 0
-        balance_out = int(balance_out)
-
-        insufficient_liquidity = quote_type == "buy" and amount > balance_out
-        utilization = (
-            Wei(int(amount / balance_out)) if quote_type == "buy" and balance_out > 0 else Wei(0)
-        )
-
-        quote_result = exact_input_single(wallet_provider, token_in, token_out, amount, fee)
-
+        state = get_pool_state(wallet_provider, pool_address)
     except Exception as e:
-        print(f"Error fetching quote: {e!s}")
-
-    insufficient_liquidity = (
-        quote_type == "sell" and pool and not quote_result
-    ) or insufficient_liquidity
-
-    error_msg = None
-    if not pool or not eth_price_in_usd:
-        error_msg = "Failed fetching pool"
-    elif insufficient_liquidity:
-        error_msg = "Insufficient liquidity"
-    elif not quote_result and utilization >= Wei(int(0.9 * 1e18)):
-        error_msg = "Price impact too high"
-    elif not quote_result:
-        error_msg = "Failed fetching quote"
-
-    balance_result = None
-    if tokens and balances:
-        is_weth_token0 = tokens[0].lower() == addresses[network]["weth"].lower()
-        balance_result = Balance(
-            erc20z=Wei(balances[1][0] if isinstance(balances[1], list | tuple) else balances[1])
-            if is_weth_token0
-            else Wei(balances[0][0] if isinstance(balances[0], list | tuple) else balances[0]),
-            weth=Wei(balances[0][0] if isinstance(balances[0], list | tuple) else balances[0])
-            if is_weth_token0
-            else Wei(balances[1][0] if isinstance(balances[1], list | tuple) else balances[1]),
+        print(f"Error fetching pool: {e!s}")
+
+    quotes = []
+    for amount in amounts:
+        quote_result = None
+        insufficient_liquidity = False
+        utilization = Wei(0)
+        balance_result = None
+
+        if state is not None:
+            is_token0_weth = state.token0.lower() == weth
+            token_in = state.token0 if (quote_type == "buy") == is_token0_weth else state.token1
+            token_out, balance_out = (
+                (state.token1, state.balance1)
+                if token_in == state.token0
+                else (state.token0, state.balance0)
+            )
+
+            insufficient_liquidity = quote_type == "buy" and amount > balance_out
+            utilization = (
+                Wei(int(amount / balance_out))
+                if quote_type == "buy" and balance_out > 0
+                else Wei(0)
+            )
+
+            try:
+                quote_result = state.quote_exact_input(token_in, amount)
+            except LocalQuoteUnavailableError:
+                quote_result = exact_input_single(
+                    wallet_provider, token_in, token_out, amount, state.fee
+                )
+
+            balance_result = Balance(
+                erc20z=Wei(state.balance1 if is_token0_weth else state.balance0),
+                weth=Wei(state.balance0 if is_token0_weth else state.balance1),
+            )
+
+        insufficient_liquidity = (
+            quote_type == "sell" and state is not None and not quote_result
+        ) or insufficient_liquidity
+
+        error_msg = None
+        if state is None:
+            error_msg = "Failed fetching pool"
+        elif insufficient_liquidity:
+            error_msg = "Insufficient liquidity"
+        elif not quote_result and utilization >= Wei(int(0.9 * 1e18)):
+            error_msg = "Price impact too high"
+        elif not quote_result:
+            error_msg = "Failed fetching quote"
+
+        quotes.append(
+            Quote(
+                amount_in=amount,
+                amount_out=quote_result if quote_result else Wei(0),
+                balance=balance_result,
+                fee=state.fee / 1000000 if state is not None else None,
+                error=invalid_pool_error or error_msg,
+            )
         )
 
-    return Quote(
-        amount_in=amount,
-        amount_out=quote_result if quote_result else Wei(0),
-        balance=balance_result,
-        fee=pool.fee / 1000000 if pool else None,
-        error=invalid_pool_error or error_msg,
-    )
+    return quotes
 
 
 def get_pool_address(wallet_provider: EvmWalletProvider, token_address: str) -> str:
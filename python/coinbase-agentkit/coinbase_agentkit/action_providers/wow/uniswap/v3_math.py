@@ -0,0 +1,287 @@
+"""Integer ports of the Uniswap v3 core libraries used to quote swaps locally.
+
+The functions mirror `TickMath`, `SqrtPriceMath`, `SwapMath` and `TickBitmap` from
+`Uniswap/v3-core`, including their rounding, so local quotes match the on-chain quoter.
+"""
+
+MIN_TICK = -887272
+MAX_TICK = 887272
+MIN_SQRT_RATIO = 4295128739
+MAX_SQRT_RATIO = 1461446703485210103287273052203988822378723970342
+
+Q96 = 1 << 96
+FEE_DENOMINATOR = 1_000_000
+
+_UINT256_MAX = (1 << 256) - 1
+
+# Multipliers of TickMath.getSqrtRatioAtTick, one per bit of the absolute tick
+_TICK_RATIOS = (
+    (0x2, 0xFFF97272373D413259A46990580E213A),
+    (0x4, 0xFFF2E50F5F656932EF12357CF3C7FDCC),
+    (0x8, 0xFFE5CACA7E10E4E61C3624EAA0941CD0),
+    (0x10, 0xFFCB9843D60F6159C9DB58835C926644),
+    (0x20, 0xFF973B41FA98C081472E6896DFB254C0),
+    (0x40, 0xFF2EA16466C96A3843EC78B326B52861),
+    (0x80, 0xFE5DEE046A99A2A811C461F1969C3053),
+    (0x100, 0xFCBE86C7900A88AEDCFFC83B479AA3A4),
+    (0x200, 0xF987A7253AC413176F2B074CF7815E54),
+    (0x400, 0xF3392B0822B70005940C7A398E4B70F3),
+    (0x800, 0xE7159475A2C29B7443B29C7FA6E889D9),
+    (0x1000, 0xD097F3BDFD2022B8845AD8F792AA5825),
+    (0x2000, 0xA9F746462D870FDF8A65DC1F90E061E5),
+    (0x4000, 0x70D869A156D2A1B890BB3DF62BAF32F7),
+    (0x8000, 0x31BE135F97D08FD981231505542FCFA6),
+    (0x10000, 0x9AA508B5B7A84E1C677DE54F3E99BC9),
+    (0x20000, 0x5D6AF8DEDB81196699C329225EE604),
+    (0x40000, 0x2216E584F5FA1EA926041BEDFE98),
+    (0x80000, 0x48A170391F7DC42444E8FA2),
+)
+
+
+def _mul_div_rounding_up(a: int, b: int, denominator: int) -> int:
+    return -(-a * b // denominator)
+
+
+def _div_rounding_up(a: int, b: int) -> int:
+    return -(-a // b)
+
+
+def get_sqrt_ratio_at_tick(tick: int) -> int:
+    """Calculate sqrt(1.0001^tick) as a Q64.96 fixed point number.
+
+    Args:
+        tick: The tick to get the price at.
+
+    Returns:
+        int: The square root of the price at the tick, times 2^96.
+
+    Raises:
+        ValueError: If the tick is outside the range supported by Uniswap v3.
+
+    """
+    abs_tick = abs(tick)
+    if abs_tick > MAX_TICK:
+        raise ValueError(f"Tick {tick} is out of range")
+
+    ratio = (
+        0xFFFCB933BD6FAD37AA2D162D1A594001
+        if abs_tick & 0x1
+        else 0x100000000000000000000000000000000
+    )
+    for bit, multiplier in _TICK_RATIOS:
+        if abs_tick & bit:
+            ratio = (ratio * multiplier) >> 128
+
+    if tick > 0:
+        ratio = _UINT256_MAX // ratio
+
+    return (ratio >> 32) + (0 if ratio % (1 << 32) == 0 else 1)
+
+
+def get_amount0_delta(
+    sqrt_ratio_a_x96: int, sqrt_ratio_b_x96: int, liquidity: int, round_up: bool
+) -> int:
+    """Calculate the amount of token0 between two prices for a given liquidity.
+
+    Args:
+        sqrt_ratio_a_x96: One bound of the price range.
+        sqrt_ratio_b_x96: The other bound of the price range.
+        liquidity: The liquidity in the range.
+        round_up: Whether to round the amount up or down.
+
+    Returns:
+        int: The amount of token0.
+
+    """
+    if sqrt_ratio_a_x96 > sqrt_ratio_b_x96:
+        sqrt_ratio_a_x96, sqrt_ratio_b_x96 = sqrt_ratio_b_x96, sqrt_ratio_a_x96
+
+    numerator1 = liquidity << 96
+    numerator2 = sqrt_ratio_b_x96 - sqrt_ratio_a_x96
+
+    if round_up:
+        return _div_rounding_up(
+            _mul_div_rounding_up(numerator1, numerator2, sqrt_ratio_b_x96), sqrt_ratio_a_x96
+        )
+    return numerator1 * numerator2 // sqrt_ratio_b_x96 // sqrt_ratio_a_x96
+
+
+def get_amount1_delta(
+    sqrt_ratio_a_x96: int, sqrt_ratio_b_x96: int, liquidity: int, round_up: bool
+) -> int:
+    """Calculate the amount of token1 between two prices for a given liquidity.
+
+    Args:
+        sqrt_ratio_a_x96: One bound of the price range.
+        sqrt_ratio_b_x96: The other bound of the price range.
+        liquidity: The liquidity in the range.
+        round_up: Whether to round the amount up or down.
+
+    Returns:
+        int: The amount of token1.
+
+    """
+    if sqrt_ratio_a_x96 > sqrt_ratio_b_x96:
+        sqrt_ratio_a_x96, sqrt_ratio_b_x96 = sqrt_ratio_b_x96, sqrt_ratio_a_x96
+
+    if round_up:
+        return _mul_div_rounding_up(liquidity, sqrt_ratio_b_x96 - sqrt_ratio_a_x96, Q96)
+    return liquidity * (sqrt_ratio_b_x96 - sqrt_ratio_a_x96) // Q96
+
+
+def get_next_sqrt_price_from_input(
+    sqrt_price_x96: int, liquidity: int, amount_in: int, zero_for_one: bool
+) -> int:
+    """Calculate the price after adding an input amount of one token to the pool.
+
+    Args:
+        sqrt_price_x96: The starting price.
+        liquidity: The liquidity in range.
+        amount_in: The amount of token0 or token1 being swapped in.
+        zero_for_one: Whether token0 is swapped in.
+
+    Returns:
+        int: The price after the input amount is added.
+
+    """
+    if zero_for_one:
+        if amount_in == 0:
+            return sqrt_price_x96
+        numerator1 = liquidity << 96
+        product = amount_in * sqrt_price_x96
+        if product <= _UINT256_MAX and numerator1 + product <= _UINT256_MAX:
+            return _mul_div_rounding_up(numerator1, sqrt_price_x96, numerator1 + product)
+        return _div_rounding_up(numerator1, numerator1 // sqrt_price_x96 + amount_in)
+
+    return sqrt_price_x96 + (amount_in << 96) // liquidity
+
+
+def compute_swap_step(
+    sqrt_ratio_current_x96: int,
+    sqrt_ratio_target_x96: int,
+    liquidity: int,
+    amount_remaining: int,
+    fee_pips: int,
+) -> tuple[int, int, int, int]:
+    """Compute one exact input swap step within a single tick range.
+
+    Args:
+        sqrt_ratio_current_x96: The current price of the pool.
+        sqrt_ratio_target_x96: The price the step cannot go past.
+        liquidity: The liquidity in range.
+        amount_remaining: The input amount still to be swapped, including fees.
+        fee_pips: The pool fee in hundredths of a basis point.
+
+    Returns:
+        tuple[int, int, int, int]: The price after the step, and the amount in, amount out
+            and fee of the step.
+
+    """
+    zero_for_one = sqrt_ratio_current_x96 >= sqrt_ratio_target_x96
+
+    amount_remaining_less_fee = amount_remaining * (FEE_DENOMINATOR - fee_pips) // FEE_DENOMINATOR
+    if zero_for_one:
+        amount_in = get_amount0_delta(
+            sqrt_ratio_target_x96, sqrt_ratio_current_x96, liquidity, True
+        )
+    else:
+        amount_in = get_amount1_delta(
+            sqrt_ratio_current_x96, sqrt_ratio_target_x96, liquidity, True
+        )
+
+    if amount_remaining_less_fee >= amount_in:
+        sqrt_ratio_next_x96 = sqrt_ratio_target_x96
+    else:
+        sqrt_ratio_next_x96 = get_next_sqrt_price_from_input(
+            sqrt_ratio_current_x96, liquidity, amount_remaining_less_fee, zero_for_one
+        )
+
+    reached_target = sqrt_ratio_next_x96 == sqrt_ratio_target_x96
+
+    if zero_for_one:
+        if not reached_target:
+            amount_in = get_amount0_delta(
+                sqrt_ratio_next_x96, sqrt_ratio_current_x96, liquidity, True
+            )
+        amount_out = get_amount1_delta(
+            sqrt_ratio_next_x96, sqrt_ratio_current_x96, liquidity, False
+        )
+    else:
+        if not reached_target:
+            amount_in = get_amount1_delta(
+                sqrt_ratio_current_x96, sqrt_ratio_next_x96, liquidity, True
+            )
+        amount_out = get_amount0_delta(
+            sqrt_ratio_current_x96, sqrt_ratio_next_x96, liquidity, False
+        )
+
+    if reached_target:
+        fee_amount = _mul_div_rounding_up(amount_in, fee_pips, FEE_DENOMINATOR - fee_pips)
+    else:
+        fee_amount = amount_remaining - amount_in
+
+    return sqrt_ratio_next_x96, amount_in, amount_out, fee_amount
+
+
+def tick_bitmap_position(compressed_tick: int) -> tuple[int, int]:
+    """Get the bitmap word and bit of a tick divided by the tick spacing.
+
+    Args:
+        compressed_tick: The tick divided by the tick spacing, rounded down.
+
+    Returns:
+        tuple[int, int]: The word position and the bit position within the word.
+
+    """
+    return compressed_tick >> 8, compressed_tick % 256
+
+
+def next_initialized_tick_within_one_word(
+    bitmap_word: int, tick: int, tick_spacing: int, lte: bool
+) -> tuple[int, bool]:
+    """Find the next initialized tick in the bitmap word containing a tick.
+
+    Args:
+        bitmap_word: The bitmap word of the compressed tick, or the next one if `lte` is
+            false, as returned by `tick_bitmap_word`.
+        tick: The starting tick.
+        tick_spacing: The tick spacing of the pool.
+        lte: Whether to search to the left, at or below the starting tick.
+
+    Returns:
+        tuple[int, bool]: The next tick, and whether it is initialized. Without an
+            initialized tick the word boundary is returned.
+
+    """
+    compressed = tick // tick_spacing
+
+    if lte:
+        _, bit_pos = tick_bitmap_position(compressed)
+        masked = bitmap_word & ((1 << (bit_pos + 1)) - 1)
+        if masked:
+            return (compressed - (bit_pos - (masked.bit_length() - 1))) * tick_spacing, True
+        return (compressed - bit_pos) * tick_spacing, False
+
+    _, bit_pos = tick_bitmap_position(compressed + 1)
+    masked = bitmap_word & (_UINT256_MAX ^ ((1 << bit_pos) - 1))
+    if masked:
+        lsb = (masked & -masked).bit_length() - 1
+        return (compressed + 1 + (lsb - bit_pos)) * tick_spacing, True
+    return (compressed + 1 + (255 - bit_pos)) * tick_spacing, False
+
+
+def tick_bitmap_word(tick: int, tick_spacing: int, lte: bool) -> int:
+    """Get the bitmap word `next_initialized_tick_within_one_word` searches.
+
+    Args:
+        tick: The starting tick.
+        tick_spacing: The tick spacing of the pool.
+        lte: Whether to search to the left, at or below the starting tick.
+
+    Returns:
+        int: The word position.
+
+    """
+    compressed = tick // tick_spacing
+    word_pos, _ = tick_bitmap_position(compressed if lte else compressed + 1)
+    return word_pos
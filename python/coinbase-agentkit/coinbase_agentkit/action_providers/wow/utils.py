@@ -2,7 +2,8 @@
 
 from ...wallet_providers import EvmWalletProvider
 from .constants import WOW_ABI, WOW_FACTORY_CONTRACT_ADDRESSES
-from .uniswap.utils import get_has_graduated, get_uniswap_quote
+from .token_state import WowTokenState, get_wow_token_state
+from .uniswap.utils import get_uniswap_quotes
 
 
 def get_factory_address(chain_id: str) -> str:
@@ -47,7 +48,10 @@ def get_current_supply(wallet_provider: EvmWalletProvider, token_address: str) -
 
 
 def get_buy_quote(
-    wallet_provider: EvmWalletProvider, token_address: str, amount_eth_in_wei: str
+    wallet_provider: EvmWalletProvider,
+    token_address: str,
+    amount_eth_in_wei: str,
+    state: WowTokenState | None = None,
 ) -> int:
     """Get quote for buying tokens.
 
@@ -55,30 +59,60 @@ def get_buy_quote(
         wallet_provider: The wallet provider to use for contract calls
         token_address: Address of the token contract, such as `0x036CbD53842c5426634e7929541eC2318f3dCF7e`
         amount_eth_in_wei: Amount of ETH to buy (in wei), meaning 1 is 1 wei or 0.000000000000000001 of ETH
+        state: The token's state, read from the cache if not given
 
     Returns:
         int: The amount of tokens that would be received for the given ETH amount
 
     """
-    amount_eth_in_wei_int = int(amount_eth_in_wei)
-    has_graduated = get_has_graduated(wallet_provider, token_address)
-
-    token_quote = (
-        has_graduated
-        and (
-            get_uniswap_quote(wallet_provider, token_address, amount_eth_in_wei_int, "buy")
-        ).amount_out
-    ) or wallet_provider.read_contract(
-        contract_address=token_address,
-        abi=WOW_ABI,
-        function_name="getEthBuyQuote",
-        args=[amount_eth_in_wei_int],
-    )
-    return token_quote
+    return get_buy_quotes(wallet_provider, token_address, [amount_eth_in_wei], state)[0]
+
+
+def get_buy_quotes(
+    wallet_provider: EvmWalletProvider,
+    token_address: str,
+    amounts_eth_in_wei: list[str],
+    state: WowTokenState | None = None,
+) -> list[int]:
+    """Get quotes for buying tokens with several amounts of ETH from a single state read.
+
+    Tokens on the bonding curve are quoted locally. Graduated tokens are quoted from their
+    Uniswap pool, falling back to the token contract if the pool returns no quote.
+
+    Args:
+        wallet_provider: The wallet provider to use for contract calls
+        token_address: Address of the token contract, such as `0x036CbD53842c5426634e7929541eC2318f3dCF7e`
+        amounts_eth_in_wei: Amounts of ETH to buy (in wei)
+        state: The token's state, read from the cache if not given
+
+    Returns:
+        list[int]: The amount of tokens received for each ETH amount
+
+    """
+    amounts = [int(amount) for amount in amounts_eth_in_wei]
+    state = state or get_wow_token_state(wallet_provider, token_address)
+
+    if not state.has_graduated:
+        return [state.get_eth_buy_quote(amount) for amount in amounts]
+
+    quotes = get_uniswap_quotes(wallet_provider, token_address, amounts, "buy")
+    return [
+        quote.amount_out
+        or wallet_provider.read_contract(
+            contract_address=token_address,
+            abi=WOW_ABI,
+            function_name="getEthBuyQuote",
+            args=[amount],
+        )
+        for amount, quote in zip(amounts, quotes, strict=True)
+    ]
 
 
 def get_sell_quote(
-    wallet_provider: EvmWalletProvider, token_address: str, amount_tokens_in_wei: str
+    wallet_provider: EvmWalletProvider,
+    token_address: str,
+    amount_tokens_in_wei: str,
+    state: WowTokenState | None = None,
 ) -> int:
     """Get quote for selling tokens.
 
@@ -86,23 +120,50 @@ def get_sell_quote(
         wallet_provider: The wallet provider to use for contract calls
         token_address: Address of the token contract, such as `0x036CbD53842c5426634e7929541eC2318f3dCF7e`
         amount_tokens_in_wei: Amount of tokens to sell (in wei), meaning 1 is 1 wei or 0.000000000000000001 of the token
+        state: The token's state, read from the cache if not given
 
     Returns:
         int: The amount of ETH that would be received for the given token amount
 
     """
-    amount_tokens_in_wei_int = int(amount_tokens_in_wei)
-    has_graduated = get_has_graduated(wallet_provider, token_address)
-
-    token_quote = (
-        has_graduated
-        and (
-            get_uniswap_quote(wallet_provider, token_address, amount_tokens_in_wei_int, "sell")
-        ).amount_out
-    ) or wallet_provider.read_contract(
-        contract_address=token_address,
-        abi=WOW_ABI,
-        function_name="getTokenSellQuote",
-        args=[amount_tokens_in_wei_int],
-    )
-    return token_quote
+    return get_sell_quotes(wallet_provider, token_address, [amount_tokens_in_wei], state)[0]
+
+
+def get_sell_quotes(
+    wallet_provider: EvmWalletProvider,
+    token_address: str,
+    amounts_tokens_in_wei: list[str],
+    state: WowTokenState | None = None,
+) -> list[int]:
+    """Get quotes for selling several amounts of tokens from a single state read.
+
+    Tokens on the bonding curve are quoted locally. Graduated tokens are quoted from their
+    Uniswap pool, falling back to the token contract if the pool returns no quote.
+
+    Args:
+        wallet_provider: The wallet provider to use for contract calls
+        token_address: Address of the token contract, such as `0x036CbD53842c5426634e7929541eC2318f3dCF7e`
+        amounts_tokens_in_wei: Amounts of tokens to sell (in wei)
+        state: The token's state, read from the cache if not given
+
+    Returns:
+        list[int]: The amount of ETH received for each token amount
+
+    """
+    amounts = [int(amount) for amount in amounts_tokens_in_wei]
+    state = state or get_wow_token_state(wallet_provider, token_address)
+
+    if not state.has_graduated:
+        return [state.get_token_sell_quote(amount) for amount in amounts]
+
+    quotes = get_uniswap_quotes(wallet_provider, token_address, amounts, "sell")
+    return [
+        quote.amount_out
+        or wallet_provider.read_contract(
+            contract_address=token_address,
+            abi=WOW_ABI,
+            function_name="getTokenSellQuote",
+            args=[amount],
+        )
+        for amount, quote in zip(amounts, quotes, strict=True)
+    ]
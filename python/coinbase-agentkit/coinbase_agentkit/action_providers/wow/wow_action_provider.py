@@ -1,6 +1,7 @@
 """WOW action provider."""
 
 import math
+import os
 from typing import Any
 
 from web3 import Web3
@@ -14,11 +15,18 @@ from .constants import (
     WOW_ABI,
     WOW_FACTORY_ABI,
 )
-from .schemas import WowBuyTokenSchema, WowCreateTokenSchema, WowSellTokenSchema
+from .indexer import WowTokenIndexer, WowTokenRecord
+from .schemas import (
+    WowBuyTokenSchema,
+    WowCreateTokenSchema,
+    WowListTokensSchema,
+    WowSearchTokensSchema,
+    WowSellTokenSchema,
+)
+from .token_state import get_wow_token_state
 from .utils import (
     get_buy_quote,
     get_factory_address,
-    get_has_graduated,
     get_sell_quote,
 )
 
@@ -28,9 +36,23 @@ SUPPORTED_CHAINS = ["8453", "84532"]
 class WowActionProvider(ActionProvider[EvmWalletProvider]):
     """Provides actions for interacting with WOW protocol."""
 
-    def __init__(self):
-        """Initialize WOW action provider."""
+    def __init__(self, index_path: str | None = None):
+        """Initialize WOW action provider.
+
+        Args:
+            index_path (str | None): Optional SQLite file for the token index, so it
+                survives restarts. Falls back to the WOW_INDEX_PATH environment variable,
+                and to an in-memory index if neither is set.
+
+        """
         super().__init__("wow", [])
+        self._index_path = index_path or os.getenv("WOW_INDEX_PATH")
+        self._indexer: WowTokenIndexer | None = None
+
+    def _get_indexer(self) -> WowTokenIndexer:
+        if self._indexer is None:
+            self._indexer = WowTokenIndexer(self._index_path)
+        return self._indexer
 
     @create_action(
         name="buy_token",
@@ -61,15 +83,16 @@ Important notes:
 
         """
         try:
+            state = get_wow_token_state(wallet_provider, args["contract_address"])
             token_quote = get_buy_quote(
-                wallet_provider, args["contract_address"], args["amount_eth_in_wei"]
+                wallet_provider, args["contract_address"], args["amount_eth_in_wei"], state
             )
 
             if isinstance(token_quote, list | tuple):
                 token_quote = token_quote[0] if token_quote else 0
             token_quote = int(token_quote)
 
-            has_graduated = get_has_graduated(wallet_provider, args["contract_address"])
+            has_graduated = state.has_graduated
 
             min_tokens = math.floor(float(token_quote) * 0.99)
 
@@ -208,15 +231,16 @@ Important notes:
 
         """
         try:
+            state = get_wow_token_state(wallet_provider, args["contract_address"])
             eth_quote = get_sell_quote(
-                wallet_provider, args["contract_address"], args["amount_tokens_in_wei"]
+                wallet_provider, args["contract_address"], args["amount_tokens_in_wei"], state
             )
 
             if isinstance(eth_quote, list | tuple):
                 eth_quote = eth_quote[0] if eth_quote else 0
             eth_quote = int(eth_quote)
 
-            has_graduated = get_has_graduated(wallet_provider, args["contract_address"])
+            has_graduated = state.has_graduated
 
             min_eth = math.floor(float(eth_quote) * 0.98)
 
@@ -254,6 +278,91 @@ Important notes:
         except Exception as e:
             return f"Error selling Zora Wow ERC20 memecoin: {e!s}"
 
+    @create_action(
+        name="list_tokens",
+        description="""
+This tool lists the most recently created Zora Wow ERC20 memecoins on the current network, newest first.
+It answers from a local index of the WOW factory's token creation events, which is brought up to date before answering.
+
+Inputs:
+- Maximum number of tokens to list (optional, defaults to 10)
+
+Important notes:
+- Any contract can emit the creation event, so a listed token is not proof it came from the WOW factory. Always confirm the contract address before trading a token found here.""",
+        schema=WowListTokensSchema,
+        read_only=True,
+    )
+    def list_tokens(self, wallet_provider: EvmWalletProvider, args: dict[str, Any]) -> str:
+        """List recently created WOW tokens.
+
+        Args:
+            wallet_provider (EvmWalletProvider): The wallet provider to read logs with.
+            args (dict[str, Any]): Input arguments containing an optional limit.
+
+        Returns:
+            str: A message listing the tokens or an error message.
+
+        """
+        try:
+            validated_args = WowListTokensSchema(**args)
+            indexer = self._get_indexer()
+            indexer.sync(wallet_provider)
+            tokens = indexer.list_recent(
+                wallet_provider.get_network().chain_id, validated_args.limit
+            )
+
+            if not tokens:
+                return "No Zora Wow ERC20 memecoins were created recently."
+
+            return "Recently created Zora Wow ERC20 memecoins:\n" + _format_tokens(tokens)
+        except Exception as e:
+            return f"Error listing Zora Wow ERC20 memecoins: {e!s}"
+
+    @create_action(
+        name="search_tokens",
+        description="""
+This tool searches the Zora Wow ERC20 memecoins on the current network by symbol.
+It answers from a local index of the WOW factory's token creation events, which is brought up to date before answering.
+
+Inputs:
+- Token symbol, or the start of it (e.g. WOW). Matching ignores case.
+- Maximum number of tokens to return (optional, defaults to 10)
+
+Important notes:
+- Symbols are not unique, and any contract can emit the creation event, so a token found here is not proof it came from the WOW factory. Always confirm the contract address before trading it.""",
+        schema=WowSearchTokensSchema,
+        read_only=True,
+    )
+    def search_tokens(self, wallet_provider: EvmWalletProvider, args: dict[str, Any]) -> str:
+        """Search WOW tokens by symbol.
+
+        Args:
+            wallet_provider (EvmWalletProvider): The wallet provider to read logs with.
+            args (dict[str, Any]): Input arguments containing symbol and an optional limit.
+
+        Returns:
+            str: A message listing the matching tokens or an error message.
+
+        """
+        try:
+            validated_args = WowSearchTokensSchema(**args)
+            indexer = self._get_indexer()
+            indexer.sync(wallet_provider)
+            tokens = indexer.search(
+                wallet_provider.get_network().chain_id,
+                validated_args.symbol,
+                validated_args.limit,
+            )
+
+            if not tokens:
+                return f"No Zora Wow ERC20 memecoins found with symbol {validated_args.symbol}."
+
+            return f"Zora Wow ERC20 memecoins matching {validated_args.symbol}:\n" + _format_tokens(
+                tokens
+            )
+        except Exception as e:
+            return f"Error searching Zora Wow ERC20 memecoins: {e!s}"
+
     def supports_network(self, network: Network) -> bool:
         """Check if network is supported by WOW protocol.
 
@@ -267,6 +376,14 @@ Important notes:
         return network.protocol_family == "evm" and network.chain_id in SUPPORTED_CHAINS
 
 
-def wow_action_provider() -> WowActionProvider:
+def _format_tokens(tokens: list[WowTokenRecord]) -> str:
+    return "\n".join(
+        f"- {token.name} ({token.symbol}): {token.token_address}, "
+        f"created by {token.creator} in block {token.block_number}"
+        for token in tokens
+    )
+
+
+def wow_action_provider(index_path: str | None = None) -> WowActionProvider:
     """Create a new WowActionProvider instance."""
-    return WowActionProvider()
+    return WowActionProvider(index_path=index_path)
@@ -1,13 +1,13 @@
 """AgentKit - The framework for enabling AI agents to take actions onchain."""
 
+import threading
+from collections.abc import Hashable
+
 from pydantic import BaseModel, ConfigDict
 
-from .action_providers import Action, ActionProvider, wallet_action_provider
-from .wallet_providers import (
-    CdpEvmServerWalletProvider,
-    CdpEvmServerWalletProviderConfig,
-    WalletProvider,
-)
+from .action_cache import DEFAULT_ACTION_CACHE_SIZE, ActionResultCache, cache_action_results
+from .action_providers import Action, ActionProvider
+from .wallet_providers import WalletProvider
 
 
 class AgentKitConfig(BaseModel):
@@ -18,6 +18,7 @@ class AgentKitConfig(BaseModel):
     cdp_wallet_secret: str | None = None
     wallet_provider: WalletProvider | None = None
     action_providers: list[ActionProvider] | None = None
+    action_cache_size: int = DEFAULT_ACTION_CACHE_SIZE
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
@@ -40,18 +41,78 @@ class AgentKit:
         if not config:
             config = AgentKitConfig()
 
-        self.wallet_provider = config.wallet_provider or CdpEvmServerWalletProvider(
+        self._catalog_lock = threading.Lock()
+        self._catalog_key: Hashable | None = None
+        self._actions: list[Action] = []
+        self._actions_by_name: dict[str, Action] = {}
+        self._result_cache = ActionResultCache(config.action_cache_size)
+
+        self.wallet_provider = config.wallet_provider or self._default_wallet_provider(config)
+        self.action_providers = config.action_providers or self._default_action_providers()
+
+    @staticmethod
+    def _default_wallet_provider(config: AgentKitConfig) -> WalletProvider:
+        """Create the CDP server wallet provider used when none is configured.
+
+        Args:
+            config (AgentKitConfig): The AgentKit configuration holding the CDP credentials
+
+        Returns:
+            WalletProvider: A CDP EVM server wallet provider
+
+        """
+        from .wallet_providers.cdp_evm_server_wallet_provider import (
+            CdpEvmServerWalletProvider,
+            CdpEvmServerWalletProviderConfig,
+        )
+
+        return CdpEvmServerWalletProvider(
             CdpEvmServerWalletProviderConfig(
                 api_key_id=config.cdp_api_key_id,
                 api_key_secret=config.cdp_api_key_secret,
                 wallet_secret=config.cdp_wallet_secret,
             )
         )
-        self.action_providers = config.action_providers or [wallet_action_provider()]
+
+    @staticmethod
+    def _default_action_providers() -> list[ActionProvider]:
+        """Create the action providers used when none are configured.
+
+        Returns:
+            list[ActionProvider]: The wallet action provider
+
+        """
+        from .action_providers.wallet.wallet_action_provider import wallet_action_provider
+
+        return [wallet_action_provider()]
+
+    @property
+    def wallet_provider(self) -> WalletProvider | None:
+        """The wallet provider actions are run with."""
+        return self._wallet_provider
+
+    @wallet_provider.setter
+    def wallet_provider(self, wallet_provider: WalletProvider | None) -> None:
+        self._wallet_provider = wallet_provider
+        self.invalidate_actions()
+
+    @property
+    def action_providers(self) -> list[ActionProvider]:
+        """The action providers actions are collected from."""
+        return self._action_providers
+
+    @action_providers.setter
+    def action_providers(self, action_providers: list[ActionProvider]) -> None:
+        self._action_providers = action_providers
+        self.invalidate_actions()
 
     def get_actions(self) -> list[Action]:
         """Get all available actions for the current wallet and network.
 
+        The action list is built once per combination of action providers, wallet provider
+        and network and reused by later calls. Read-only actions answer repeated invocations
+        from a shared result cache holding up to `AgentKitConfig.action_cache_size` results.
+
         Returns:
             list[Action]: List of available actions from all providers
 
@@ -59,12 +120,59 @@ class AgentKit:
             ValueError: If no wallet provider is configured
 
         """
+        self._refresh_catalog()
+        return list(self._actions)
+
+    def get_action(self, name: str) -> Action | None:
+        """Look up an available action by name.
+
+        Args:
+            name (str): The action name, as returned in `Action.name`
+
+        Returns:
+            Action | None: The action, or None if no available action has that name
+
+        Raises:
+            ValueError: If no wallet provider is configured
+
+        """
+        self._refresh_catalog()
+        return self._actions_by_name.get(name)
+
+    def invalidate_actions(self) -> None:
+        """Drop the cached action catalog and action results so the next lookup rebuilds them."""
+        with self._catalog_lock:
+            self._catalog_key = None
+            self._result_cache.clear()
+
+    def _refresh_catalog(self) -> None:
+        """Rebuild the cached actions if the providers or network changed since the last call."""
         if not self.wallet_provider:
             raise ValueError("No wallet provider configured")
 
-        actions: list[Action] = []
-        for provider in self.action_providers:
-            if provider.supports_network(self.wallet_provider.get_network()):
-                actions.extend(provider.get_actions(self.wallet_provider))
+        network = self.wallet_provider.get_network()
+        key = (
+            tuple(self.action_providers),
+            self.wallet_provider,
+            network.protocol_family,
+            network.network_id,
+            network.chain_id,
+        )
 
-        return actions
+        with self._catalog_lock:
+            if key == self._catalog_key:
+                return
+
+            actions: list[Action] = []
+            for provider in self.action_providers:
+                if provider.supports_network(network):
+                    actions.extend(
+                        cache_action_results(
+                            action, self._result_cache, self.wallet_provider, network
+                        )
+                        for action in provider.get_actions(self.wallet_provider)
+                    )
+
+            self._actions = actions
+            self._actions_by_name = {action.name: action for action in actions}
+            self._catalog_key = key
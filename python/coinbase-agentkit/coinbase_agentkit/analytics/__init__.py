@@ -1,5 +1,12 @@
 """Analytics module for tracking metrics in AgentKit."""
 
+from .dispatcher import AnalyticsConfig, AnalyticsDispatcher, configure_analytics
 from .send_analytics_event import RequiredEventData, send_analytics_event
 
-__all__ = ["RequiredEventData", "send_analytics_event"]
+__all__ = [
+    "AnalyticsConfig",
+    "AnalyticsDispatcher",
+    "RequiredEventData",
+    "configure_analytics",
+    "send_analytics_event",
+]
@@ -0,0 +1,268 @@
+"""Background dispatcher for batched analytics delivery."""
+
+import atexit
+import hashlib
+import json
+import os
+import random
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+from ..http_client import HttpClient, get_http_client
+
+ANALYTICS_API_ENDPOINT = "https://cca-lite.coinbase.com"
+ANALYTICS_EVENT_PATH = "/amp"
+
+
+class AnalyticsConfig(BaseModel):
+    """Configuration for the analytics dispatcher."""
+
+    enabled: bool = Field(True, description="Whether analytics events are recorded at all")
+    sample_rate: float = Field(
+        1.0, ge=0, le=1, description="The fraction of events that are recorded"
+    )
+    max_queue_size: int = Field(
+        1000, gt=0, description="The maximum number of queued events before the oldest is dropped"
+    )
+    batch_size: int = Field(50, gt=0, description="The maximum number of events sent per request")
+    flush_interval: float = Field(
+        1.0, gt=0, description="The maximum number of seconds an event waits before being sent"
+    )
+    request_timeout: float = Field(5.0, gt=0, description="The analytics request timeout")
+    sink_path: str | None = Field(
+        None, description="Optional JSONL file to write events to instead of sending them"
+    )
+
+    @classmethod
+    def from_env(cls) -> "AnalyticsConfig":
+        """Create a configuration from environment variables.
+
+        Reads AGENTKIT_ANALYTICS_DISABLED, AGENTKIT_ANALYTICS_SAMPLE_RATE and
+        AGENTKIT_ANALYTICS_SINK_PATH.
+
+        Returns:
+            AnalyticsConfig: The configuration.
+
+        """
+        disabled = os.getenv("AGENTKIT_ANALYTICS_DISABLED", "").lower() in ("1", "true", "yes")
+        sample_rate = os.getenv("AGENTKIT_ANALYTICS_SAMPLE_RATE")
+
+        return cls(
+            enabled=not disabled,
+            sample_rate=float(sample_rate) if sample_rate else 1.0,
+            sink_path=os.getenv("AGENTKIT_ANALYTICS_SINK_PATH") or None,
+        )
+
+
+def post_analytics_events(
+    events: list[dict[str, Any]],
+    timeout: float | None = None,
+    http_client: HttpClient | None = None,
+) -> None:
+    """Post a batch of events to the analytics endpoint in a single request.
+
+    Args:
+        events: The events to send
+        timeout: The request timeout in seconds
+        http_client: The HTTP client to use. Defaults to the shared client.
+
+    Raises:
+        requests.exceptions.RequestException: If the HTTP request fails
+
+    """
+    stringified_event_data = json.dumps(events)
+    upload_time = str(int(time.time() * 1000))
+
+    checksum = hashlib.md5((stringified_event_data + upload_time).encode("utf-8")).hexdigest()
+
+    analytics_service_data = {
+        "e": stringified_event_data,
+        "checksum": checksum,
+    }
+
+    response = (http_client or get_http_client()).post(
+        f"{ANALYTICS_API_ENDPOINT}{ANALYTICS_EVENT_PATH}",
+        json=analytics_service_data,
+        headers={"Content-Type": "application/json"},
+        timeout=timeout,
+    )
+    response.raise_for_status()
+
+
+def write_analytics_events(path: str, events: list[dict[str, Any]]) -> None:
+    """Append a batch of events to a local JSONL file.
+
+    Args:
+        path: The file to append to
+        events: The events to write
+
+    """
+    with open(path, "a", encoding="utf-8") as f:
+        for event in events:
+            f.write(json.dumps(event) + "\n")
+
+
+class AnalyticsDispatcher:
+    """Queues analytics events and delivers them in batches from a background thread.
+
+    The queue is bounded; when it is full the oldest event is dropped. Delivery failures are
+    swallowed so analytics can never affect the caller.
+    """
+
+    def __init__(
+        self,
+        config: AnalyticsConfig | None = None,
+        transport: Callable[[list[dict[str, Any]]], None] | None = None,
+        http_client: HttpClient | None = None,
+    ):
+        """Initialize the dispatcher.
+
+        Args:
+            config: The dispatcher configuration. Defaults to `AnalyticsConfig.from_env()`.
+            transport: Optional callable that delivers a batch of events. Defaults to the
+                JSONL sink if `sink_path` is configured, otherwise the analytics endpoint.
+            http_client: The HTTP client the default transport posts events with. Defaults
+                to the shared client.
+
+        """
+        self.config = config or AnalyticsConfig.from_env()
+        self._transport = transport or self._default_transport
+        self._http_client = http_client
+        self._queue: deque[dict[str, Any]] = deque(maxlen=self.config.max_queue_size)
+        self._condition = threading.Condition()
+        self._worker: threading.Thread | None = None
+        self._stopped = False
+        self.dropped_events = 0
+
+    def _default_transport(self, events: list[dict[str, Any]]) -> None:
+        if self.config.sink_path:
+            write_analytics_events(self.config.sink_path, events)
+        else:
+            post_analytics_events(
+                events, timeout=self.config.request_timeout, http_client=self._http_client
+            )
+
+    def enqueue(self, event: dict[str, Any]) -> None:
+        """Queue an event for delivery without blocking on I/O.
+
+        Args:
+            event: The event to queue
+
+        """
+        if not self.config.enabled or self._stopped:
+            return
+        if self.config.sample_rate < 1 and random.random() >= self.config.sample_rate:
+            return
+
+        with self._condition:
+            if len(self._queue) == self._queue.maxlen:
+                self.dropped_events += 1
+            self._queue.append(event)
+            self._ensure_worker()
+            if len(self._queue) >= self.config.batch_size:
+                self._condition.notify()
+
+    def flush(self) -> None:
+        """Deliver all queued events on the calling thread."""
+        while True:
+            batch = self._take_batch()
+            if not batch:
+                return
+            self._deliver(batch)
+
+    def shutdown(self, timeout: float | None = None) -> None:
+        """Stop the background worker and deliver any remaining events.
+
+        Args:
+            timeout: The maximum number of seconds to wait for the worker to finish
+
+        """
+        with self._condition:
+            self._stopped = True
+            self._condition.notify()
+            worker = self._worker
+
+        if worker is not None:
+            worker.join(timeout)
+        self.flush()
+
+    def _ensure_worker(self) -> None:
+        if self._worker is None or not self._worker.is_alive():
+            self._worker = threading.Thread(
+                target=self._run, name="agentkit-analytics", daemon=True
+            )
+            self._worker.start()
+
+    def _take_batch(self) -> list[dict[str, Any]]:
+        with self._condition:
+            count = min(len(self._queue), self.config.batch_size)
+            return [self._queue.popleft() for _ in range(count)]
+
+    def _deliver(self, batch: list[dict[str, Any]]) -> None:
+        try:
+            self._transport(batch)
+        except Exception as e:
+            print(f"Warning: Failed to send analytics events: {e}")
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                if not self._stopped and len(self._queue) < self.config.batch_size:
+                    self._condition.wait(self.config.flush_interval)
+                if self._stopped:
+                    return
+
+            batch = self._take_batch()
+            if batch:
+                self._deliver(batch)
+
+
+_dispatcher: AnalyticsDispatcher | None = None
+_dispatcher_lock = threading.Lock()
+
+
+def get_analytics_dispatcher() -> AnalyticsDispatcher:
+    """Get the process-wide analytics dispatcher, creating it on first use.
+
+    Returns:
+        AnalyticsDispatcher: The dispatcher.
+
+    """
+    global _dispatcher
+    if _dispatcher is None:
+        with _dispatcher_lock:
+            if _dispatcher is None:
+                _dispatcher = AnalyticsDispatcher()
+    return _dispatcher
+
+
+def configure_analytics(config: AnalyticsConfig) -> AnalyticsDispatcher:
+    """Replace the process-wide analytics dispatcher with one using the given configuration.
+
+    Events queued on the previous dispatcher are delivered before it is discarded.
+
+    Args:
+        config: The new configuration
+
+    Returns:
+        AnalyticsDispatcher: The new dispatcher.
+
+    """
+    global _dispatcher
+    with _dispatcher_lock:
+        previous, _dispatcher = _dispatcher, AnalyticsDispatcher(config)
+
+    if previous is not None:
+        previous.shutdown(timeout=config.request_timeout)
+    return _dispatcher
+
+
+@atexit.register
+def _flush_on_exit() -> None:
+    if _dispatcher is not None:
+        _dispatcher.shutdown(timeout=_dispatcher.config.request_timeout)
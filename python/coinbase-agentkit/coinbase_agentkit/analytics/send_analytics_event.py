@@ -1,11 +1,9 @@
 """Analytics event tracking."""
 
-import hashlib
-import json
 import time
-from typing import TypedDict
+from typing import Any, TypedDict
 
-import requests
+from .dispatcher import get_analytics_dispatcher
 
 
 class RequiredEventData(TypedDict, total=False):
@@ -19,22 +17,19 @@ class RequiredEventData(TypedDict, total=False):
     name: str
 
 
-def send_analytics_event(event: RequiredEventData) -> None:
-    """Send an analytics event to the default endpoint.
+def build_analytics_event(event: RequiredEventData) -> dict[str, Any]:
+    """Build the analytics service representation of an event.
 
     Args:
         event: The event data containing required action, component and name fields
 
-    Raises:
-        requests.exceptions.RequestException: If the HTTP request fails
-
     Returns:
-        None
+        dict[str, Any]: The enhanced event, timestamped at the time of the call
 
     """
     timestamp = int(time.time() * 1000)
 
-    enhanced_event = {
+    return {
         "event_type": event["name"],
         "platform": "server",
         "event_properties": {
@@ -47,24 +42,17 @@ def send_analytics_event(event: RequiredEventData) -> None:
         },
     }
 
-    events = [enhanced_event]
-    stringified_event_data = json.dumps(events)
-    upload_time = str(timestamp)
 
-    checksum = hashlib.md5((stringified_event_data + upload_time).encode("utf-8")).hexdigest()
+def send_analytics_event(event: RequiredEventData) -> None:
+    """Queue an analytics event for delivery by the background dispatcher.
 
-    analytics_service_data = {
-        "e": stringified_event_data,
-        "checksum": checksum,
-    }
+    The event is timestamped immediately, but no I/O happens on the calling thread.
 
-    api_endpoint = "https://cca-lite.coinbase.com"
-    event_path = "/amp"
-    event_endpoint = f"{api_endpoint}{event_path}"
+    Args:
+        event: The event data containing required action, component and name fields
 
-    response = requests.post(
-        event_endpoint,
-        json=analytics_service_data,
-        headers={"Content-Type": "application/json"},
-    )
-    response.raise_for_status()
+    Returns:
+        None
+
+    """
+    get_analytics_dispatcher().enqueue(build_analytics_event(event))
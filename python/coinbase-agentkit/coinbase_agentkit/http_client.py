@@ -0,0 +1,290 @@
+"""Shared HTTP client for providers that call HTTP APIs."""
+
+import asyncio
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any
+
+import requests
+from pydantic import BaseModel, Field
+from requests.adapters import HTTPAdapter
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+# Statuses that mean the server did not act on the request, so any method may be retried
+UNPROCESSED_STATUSES = frozenset({429, 503})
+
+
+class HttpClientConfig(BaseModel):
+    """Configuration for the shared HTTP client."""
+
+    connect_timeout: float = Field(5.0, gt=0, description="Seconds to wait for a connection")
+    read_timeout: float = Field(30.0, gt=0, description="Seconds to wait for response data")
+    max_retries: int = Field(3, ge=0, description="The maximum number of retries per request")
+    backoff_factor: float = Field(
+        0.5, ge=0, description="The base delay in seconds, doubled after each retry"
+    )
+    max_backoff: float = Field(10.0, ge=0, description="The maximum delay between retries")
+    retry_statuses: frozenset[int] = Field(
+        frozenset({429, 500, 502, 503, 504}), description="Response statuses that are retried"
+    )
+    pool_connections: int = Field(10, gt=0, description="The number of hosts to keep pools for")
+    pool_maxsize: int = Field(10, gt=0, description="The maximum connections kept per host")
+    http2: bool = Field(False, description="Whether the async client negotiates HTTP/2")
+
+
+class HttpClient:
+    """A pooled HTTP client with default timeouts and retries.
+
+    Connections are kept alive in one pool per host, so repeated calls to the same API skip
+    the TCP and TLS handshakes. Every request gets the configured connect and read timeouts
+    unless the caller passes its own. Responses with a retryable status and connection
+    failures are retried with full-jitter exponential backoff, honoring `Retry-After`.
+    Requests that are not idempotent are only retried when the server cannot have acted on
+    them: connection timeouts and 429 or 503 responses.
+    """
+
+    def __init__(self, config: HttpClientConfig | None = None):
+        """Initialize the client.
+
+        Args:
+            config (HttpClientConfig | None): The client configuration.
+
+        """
+        self.config = config or HttpClientConfig()
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.config.pool_connections,
+            pool_maxsize=self.config.pool_maxsize,
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """Send a request, retrying it if it fails transiently.
+
+        Args:
+            method (str): The HTTP method.
+            url (str): The URL to request.
+            **kwargs: Any other argument accepted by `requests.Session.request`.
+
+        Returns:
+            requests.Response: The response. Its status is not checked.
+
+        Raises:
+            requests.RequestException: If the request fails after all retries.
+
+        """
+        kwargs.setdefault("timeout", (self.config.connect_timeout, self.config.read_timeout))
+        idempotent = method.upper() in IDEMPOTENT_METHODS
+
+        for attempt in range(self.config.max_retries + 1):
+            last_attempt = attempt == self.config.max_retries
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if last_attempt or not (idempotent or isinstance(e, requests.ConnectTimeout)):
+                    raise
+                time.sleep(retry_delay(self.config, attempt))
+                continue
+
+            if last_attempt or not _should_retry(self.config, response.status_code, idempotent):
+                return response
+            delay = retry_delay(self.config, attempt, response)
+            response.close()
+            time.sleep(delay)
+
+        raise AssertionError("unreachable")
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        """Send a GET request.
+
+        Args:
+            url (str): The URL to request.
+            **kwargs: Any other argument accepted by `requests.Session.request`.
+
+        Returns:
+            requests.Response: The response.
+
+        """
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> requests.Response:
+        """Send a POST request.
+
+        Args:
+            url (str): The URL to request.
+            **kwargs: Any other argument accepted by `requests.Session.request`.
+
+        Returns:
+            requests.Response: The response.
+
+        """
+        return self.request("POST", url, **kwargs)
+
+    def close(self) -> None:
+        """Close every pooled connection."""
+        self.session.close()
+
+
+class AsyncHttpClient:
+    """The asynchronous counterpart of `HttpClient`, with optional HTTP/2.
+
+    Requires the `http2` extra: `pip install "coinbase-agentkit[http2]"`.
+    """
+
+    def __init__(self, config: HttpClientConfig | None = None):
+        """Initialize the client.
+
+        Args:
+            config (HttpClientConfig | None): The client configuration.
+
+        Raises:
+            ImportError: If httpx is not installed.
+
+        """
+        try:
+            import httpx
+        except ImportError as e:
+            raise ImportError(
+                "Failed to import httpx. Please install it with 'pip install coinbase-agentkit[http2]'."
+            ) from e
+
+        self.config = config or HttpClientConfig()
+        self._httpx = httpx
+        self.client = httpx.AsyncClient(
+            http2=self.config.http2,
+            timeout=httpx.Timeout(self.config.read_timeout, connect=self.config.connect_timeout),
+            limits=httpx.Limits(max_keepalive_connections=self.config.pool_maxsize),
+        )
+
+    async def request(self, method: str, url: str, **kwargs: Any) -> Any:
+        """Send a request, retrying it if it fails transiently.
+
+        Args:
+            method (str): The HTTP method.
+            url (str): The URL to request.
+            **kwargs: Any other argument accepted by `httpx.AsyncClient.request`.
+
+        Returns:
+            httpx.Response: The response. Its status is not checked.
+
+        Raises:
+            httpx.HTTPError: If the request fails after all retries.
+
+        """
+        httpx = self._httpx
+        idempotent = method.upper() in IDEMPOTENT_METHODS
+
+        for attempt in range(self.config.max_retries + 1):
+            last_attempt = attempt == self.config.max_retries
+            try:
+                response = await self.client.request(method, url, **kwargs)
+            except (httpx.TransportError, httpx.TimeoutException) as e:
+                if last_attempt or not (idempotent or isinstance(e, httpx.ConnectTimeout)):
+                    raise
+                await asyncio.sleep(retry_delay(self.config, attempt))
+                continue
+
+            if last_attempt or not _should_retry(self.config, response.status_code, idempotent):
+                return response
+            delay = retry_delay(self.config, attempt, response)
+            await response.aclose()
+            await asyncio.sleep(delay)
+
+        raise AssertionError("unreachable")
+
+    async def get(self, url: str, **kwargs: Any) -> Any:
+        """Send a GET request.
+
+        Args:
+            url (str): The URL to request.
+            **kwargs: Any other argument accepted by `httpx.AsyncClient.request`.
+
+        Returns:
+            httpx.Response: The response.
+
+        """
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs: Any) -> Any:
+        """Send a POST request.
+
+        Args:
+            url (str): The URL to request.
+            **kwargs: Any other argument accepted by `httpx.AsyncClient.request`.
+
+        Returns:
+            httpx.Response: The response.
+
+        """
+        return await self.request("POST", url, **kwargs)
+
+    async def aclose(self) -> None:
+        """Close every pooled connection."""
+        await self.client.aclose()
+
+
+def _should_retry(config: HttpClientConfig, status: int, idempotent: bool) -> bool:
+    return status in config.retry_statuses and (idempotent or status in UNPROCESSED_STATUSES)
+
+
+def retry_delay(config: HttpClientConfig, attempt: int, response: Any = None) -> float:
+    """Get how long to wait before retrying a request.
+
+    Args:
+        config (HttpClientConfig): The client configuration.
+        attempt (int): The number of the attempt that failed, starting at zero.
+        response (Any): The failed response, if the server sent one.
+
+    Returns:
+        float: The delay in seconds. A `Retry-After` header is honored up to `max_backoff`;
+            otherwise a random delay up to the exponential backoff is used.
+
+    """
+    retry_after = response.headers.get("Retry-After") if response is not None else None
+    if retry_after:
+        try:
+            delay = float(retry_after)
+        except ValueError:
+            try:
+                delay = parsedate_to_datetime(retry_after).timestamp() - time.time()
+            except (TypeError, ValueError):
+                delay = None
+        if delay is not None:
+            return min(max(delay, 0.0), config.max_backoff)
+
+    return random.uniform(0, min(config.max_backoff, config.backoff_factor * 2**attempt))
+
+
+_http_client: HttpClient | None = None
+_http_client_lock = threading.Lock()
+
+
+def get_http_client() -> HttpClient:
+    """Get the process-wide HTTP client, creating it on first use.
+
+    Returns:
+        HttpClient: The client.
+
+    """
+    global _http_client
+    if _http_client is None:
+        with _http_client_lock:
+            if _http_client is None:
+                _http_client = HttpClient()
+    return _http_client
+
+
+def set_http_client(client: HttpClient | None) -> None:
+    """Replace the process-wide HTTP client.
+
+    Args:
+        client (HttpClient | None): The new client, or None to create a default one on next use.
+
+    """
+    global _http_client
+    with _http_client_lock:
+        _http_client = client
@@ -1,17 +1,42 @@
 """Wallet providers for AgentKit."""
 
-from .cdp_evm_server_wallet_provider import (
-    CdpEvmServerWalletProvider,
-    CdpEvmServerWalletProviderConfig,
-)
-from .cdp_evm_smart_wallet_provider import (
-    CdpEvmSmartWalletProvider,
-    CdpEvmSmartWalletProviderConfig,
-)
-from .eth_account_wallet_provider import EthAccountWalletProvider, EthAccountWalletProviderConfig
-from .evm_wallet_provider import EvmWalletProvider
+from typing import TYPE_CHECKING
+
+from .._lazy_imports import lazy_imports
 from .wallet_provider import WalletProvider
 
+if TYPE_CHECKING:
+    from .cdp_evm_server_wallet_provider import (
+        CdpEvmServerWalletProvider,
+        CdpEvmServerWalletProviderConfig,
+    )
+    from .cdp_evm_smart_wallet_provider import (
+        CdpEvmSmartWalletProvider,
+        CdpEvmSmartWalletProviderConfig,
+    )
+    from .eth_account_wallet_provider import (
+        EthAccountWalletProvider,
+        EthAccountWalletProviderConfig,
+    )
+    from .evm_wallet_provider import EvmWalletProvider
+    from .multicall import ContractCall, ContractCallResult
+
+_LAZY_IMPORTS = {
+    "CdpEvmServerWalletProvider": ".cdp_evm_server_wallet_provider",
+    "CdpEvmServerWalletProviderConfig": ".cdp_evm_server_wallet_provider",
+    "CdpEvmSmartWalletProvider": ".cdp_evm_smart_wallet_provider",
+    "CdpEvmSmartWalletProviderConfig": ".cdp_evm_smart_wallet_provider",
+    "EthAccountWalletProvider": ".eth_account_wallet_provider",
+    "EthAccountWalletProviderConfig": ".eth_account_wallet_provider",
+    "EvmWalletProvider": ".evm_wallet_provider",
+    "ContractCall": ".multicall",
+    "ContractCallResult": ".multicall",
+}
+
+
+__getattr__, __dir__ = lazy_imports(__name__, _LAZY_IMPORTS)
+
+
 __all__ = [
     "WalletProvider",
     "CdpEvmServerWalletProvider",
@@ -19,6 +44,8 @@ __all__ = [
     "CdpEvmSmartWalletProvider",
     "CdpEvmSmartWalletProviderConfig",
     "EvmWalletProvider",
+    "ContractCall",
+    "ContractCallResult",
     "EthAccountWalletProvider",
     "EthAccountWalletProviderConfig",
 ]
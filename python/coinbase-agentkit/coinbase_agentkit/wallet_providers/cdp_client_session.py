@@ -0,0 +1,129 @@
+"""Long-lived CDP client bound to a dedicated event loop thread."""
+
+import asyncio
+import threading
+from collections.abc import Callable, Coroutine
+from concurrent.futures import Future
+from typing import Any, TypeVar
+
+from cdp import CdpClient
+
+T = TypeVar("T")
+
+
+class CdpClientSession:
+    """Owns a single `CdpClient` and the background event loop it runs on.
+
+    The CDP SDK keeps its HTTP connection pool on the event loop the first request was made
+    from, so every call for a session is scheduled onto the same loop. This lets the client,
+    its keep-alive connections and its auth setup be reused across calls instead of being
+    rebuilt for every operation. The loop thread and client are created lazily and torn down
+    by `close()`; a closed session is reopened on next use.
+    """
+
+    def __init__(self, client_factory: Callable[[], CdpClient]):
+        """Initialize the session.
+
+        Args:
+            client_factory (Callable[[], CdpClient]): Builds the client on first use.
+
+        """
+        self._client_factory = client_factory
+        self._client: CdpClient | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def client(self) -> CdpClient:
+        """Get the session's client.
+
+        Only use the client from coroutines scheduled through `run` or `arun`.
+
+        Returns:
+            CdpClient: The long-lived CDP client
+
+        """
+        with self._lock:
+            if self._client is None:
+                self._client = self._client_factory()
+            return self._client
+
+    @property
+    def is_open(self) -> bool:
+        """Whether the background loop is running."""
+        return self._loop is not None
+
+    def run(self, coroutine: Coroutine[Any, Any, T]) -> T:
+        """Run a coroutine on the session loop and block until it completes.
+
+        Args:
+            coroutine: The coroutine to run
+
+        Returns:
+            The result of the coroutine
+
+        Raises:
+            RuntimeError: If called from the session loop itself
+
+        """
+        loop = self._ensure_loop()
+        if threading.current_thread() is self._thread:
+            coroutine.close()
+            raise RuntimeError("CdpClientSession.run cannot be called from the session loop")
+        return self._submit(loop, coroutine).result()
+
+    async def arun(self, coroutine: Coroutine[Any, Any, T]) -> T:
+        """Run a coroutine on the session loop from another event loop.
+
+        Args:
+            coroutine: The coroutine to run
+
+        Returns:
+            The result of the coroutine
+
+        """
+        loop = self._ensure_loop()
+        if asyncio.get_running_loop() is loop:
+            return await coroutine
+        return await asyncio.wrap_future(self._submit(loop, coroutine))
+
+    def close(self) -> None:
+        """Close the client and stop the background loop.
+
+        Raises:
+            RuntimeError: If called from the session loop itself
+
+        """
+        if self._thread is not None and threading.current_thread() is self._thread:
+            raise RuntimeError("CdpClientSession.close cannot be called from the session loop")
+
+        with self._lock:
+            loop, thread, client = self._loop, self._thread, self._client
+            self._loop = self._thread = self._client = None
+
+        if loop is None:
+            return
+
+        try:
+            if client is not None:
+                asyncio.run_coroutine_threadsafe(client.close(), loop).result()
+        finally:
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
+            loop.close()
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=loop.run_forever, name="cdp-client-session", daemon=True
+                )
+                thread.start()
+                self._loop, self._thread = loop, thread
+            return self._loop
+
+    @staticmethod
+    def _submit(loop: asyncio.AbstractEventLoop, coroutine: Coroutine[Any, Any, T]) -> Future:
+        return asyncio.run_coroutine_threadsafe(coroutine, loop)
@@ -1,6 +1,5 @@
 """CDP EVM Server Wallet provider."""
 
-import asyncio
 import os
 from decimal import Decimal
 from typing import Any
@@ -9,9 +8,17 @@ from cdp import CdpClient
 from cdp.evm_transaction_types import TransactionRequestEIP1559
 from pydantic import BaseModel, Field
 from web3 import Web3
-from web3.types import BlockIdentifier, ChecksumAddress, HexStr, TxParams
+from web3.types import (
+    BlockIdentifier,
+    ChecksumAddress,
+    FilterParams,
+    HexStr,
+    LogReceipt,
+    TxParams,
+)
 
 from ..network import NETWORK_ID_TO_CHAIN, Network
+from .cdp_client_session import CdpClientSession
 from .evm_wallet_provider import EvmWalletProvider
 
 
@@ -32,7 +39,11 @@ class CdpEvmServerWalletProviderConfig(CdpEvmServerProviderConfig):
 
 
 class CdpEvmServerWalletProvider(EvmWalletProvider):
-    """A wallet provider that uses the CDP EVM Server SDK."""
+    """A wallet provider that uses the CDP EVM Server SDK.
+
+    The provider keeps one CDP client open for its lifetime. Call `close()`, or use the
+    provider as a context manager, to release it.
+    """
 
     def __init__(self, config: CdpEvmServerWalletProviderConfig):
         """Initialize CDP EVM Server wallet provider.
@@ -68,20 +79,43 @@ class CdpEvmServerWalletProvider(EvmWalletProvider):
             )
             self._web3 = Web3(Web3.HTTPProvider(rpc_url))
 
-            client = self.get_client()
+            self._session = CdpClientSession(self.get_client)
             if config.address:
-                account = asyncio.run(self._get_account(client, config.address))
+                account = self._run_async(self._get_account(config.address))
             else:
-                account = asyncio.run(self._create_account(client))
+                account = self._run_async(self._create_account())
 
             self._account = account
 
         except Exception as e:
+            self.close()
             raise ValueError(f"Failed to initialize CDP wallet: {e!s}") from e
 
+    def __enter__(self) -> "CdpEvmServerWalletProvider":
+        """Enter the context manager.
+
+        Returns:
+            CdpEvmServerWalletProvider: The provider itself
+
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Exit the context manager and close the CDP client."""
+        self.close()
+
+    def close(self) -> None:
+        """Close the provider's CDP client and its background event loop."""
+        session = getattr(self, "_session", None)
+        if session is not None:
+            session.close()
+
     def get_client(self) -> CdpClient:
         """Get a new CDP client instance.
 
+        The caller owns the returned client and is responsible for closing it. The provider's
+        own operations use a long-lived client instead.
+
         Returns:
             Cdp: A new CDP client instance
 
@@ -132,6 +166,19 @@ class CdpEvmServerWalletProvider(EvmWalletProvider):
     def native_transfer(self, to: str, value: Decimal) -> str:
         """Transfer the native asset of the network.
 
+        Args:
+            to (str): The destination address to receive the transfer
+            value (Decimal): The amount to transfer in whole units (e.g. 1.5 for 1.5 ETH)
+
+        Returns:
+            str: The transaction hash as a string
+
+        """
+        return self._run_async(self.anative_transfer(to, value))
+
+    async def anative_transfer(self, to: str, value: Decimal) -> str:
+        """Transfer the native asset of the network on the caller's event loop.
+
         Args:
             to (str): The destination address to receive the transfer
             value (Decimal): The amount to transfer in whole units (e.g. 1.5 for 1.5 ETH)
@@ -141,20 +188,38 @@ class CdpEvmServerWalletProvider(EvmWalletProvider):
 
         """
         value_wei = Web3.to_wei(value, "ether")
-        client = self.get_client()
-
-        async def _send_transaction():
-            async with client as cdp:
-                return await cdp.evm.send_transaction(
-                    address=self.get_address(),
-                    transaction=TransactionRequestEIP1559(
-                        to=to,
-                        value=value_wei,
-                    ),
-                    network=self._network.network_id,
-                )
 
-        return self._run_async(_send_transaction())
+        return await self._session.arun(
+            self._session.client.evm.send_transaction(
+                address=self.get_address(),
+                transaction=TransactionRequestEIP1559(
+                    to=to,
+                    value=value_wei,
+                ),
+                network=self._network.network_id,
+            )
+        )
+
+    def get_block_number(self) -> int:
+        """Get the number of the latest block on the wallet's network.
+
+        Returns:
+            int: The latest block number
+
+        """
+        return self._web3.eth.block_number
+
+    def get_logs(self, filter_params: FilterParams) -> list[LogReceipt]:
+        """Get the event logs matching a filter.
+
+        Args:
+            filter_params (FilterParams): The block range, addresses and topics to match
+
+        Returns:
+            list[LogReceipt]: The matching logs
+
+        """
+        return self._web3.eth.get_logs(filter_params)
 
     def read_contract(
         self,
@@ -193,21 +258,29 @@ class CdpEvmServerWalletProvider(EvmWalletProvider):
             HexStr: The transaction hash as a hex string
 
         """
-        client = self.get_client()
-
-        async def _send_transaction():
-            async with client as cdp:
-                return await cdp.evm.send_transaction(
-                    address=self.get_address(),
-                    transaction=TransactionRequestEIP1559(
-                        to=transaction["to"],
-                        value=transaction.get("value", 0),
-                        data=transaction.get("data", "0x"),
-                    ),
-                    network=self._network.network_id,
-                )
+        return self._run_async(self.asend_transaction(transaction))
+
+    async def asend_transaction(self, transaction: TxParams) -> HexStr:
+        """Send a transaction to the network on the caller's event loop.
 
-        return self._run_async(_send_transaction())
+        Args:
+            transaction (TxParams): Transaction parameters including to, value, and data
+
+        Returns:
+            HexStr: The transaction hash as a hex string
+
+        """
+        return await self._session.arun(
+            self._session.client.evm.send_transaction(
+                address=self.get_address(),
+                transaction=TransactionRequestEIP1559(
+                    to=transaction["to"],
+                    value=transaction.get("value", 0),
+                    data=transaction.get("data", "0x"),
+                ),
+                network=self._network.network_id,
+            )
+        )
 
     def wait_for_transaction_receipt(
         self, tx_hash: HexStr, timeout: float = 120, poll_latency: float = 0.1
@@ -240,16 +313,24 @@ class CdpEvmServerWalletProvider(EvmWalletProvider):
             HexStr: The signature as a hex string
 
         """
-        client = self.get_client()
+        return self._run_async(self.asign_message(message))
 
-        async def _sign_message():
-            async with client as cdp:
-                return await cdp.evm.sign_message(
-                    address=self.get_address(),
-                    message=message,
-                )
+    async def asign_message(self, message: str | bytes) -> HexStr:
+        """Sign a message on the caller's event loop.
+
+        Args:
+            message (str | bytes): The message to sign, either as a string or bytes
+
+        Returns:
+            HexStr: The signature as a hex string
 
-        return self._run_async(_sign_message())
+        """
+        return await self._session.arun(
+            self._session.client.evm.sign_message(
+                address=self.get_address(),
+                message=message,
+            )
+        )
 
     def sign_typed_data(self, typed_data: dict[str, Any]) -> HexStr:
         """Sign typed data according to EIP-712 standard.
@@ -261,25 +342,33 @@ class CdpEvmServerWalletProvider(EvmWalletProvider):
             HexStr: The signature as a hex string
 
         """
-        client = self.get_client()
+        return self._run_async(self.asign_typed_data(typed_data))
+
+    async def asign_typed_data(self, typed_data: dict[str, Any]) -> HexStr:
+        """Sign typed data according to EIP-712 standard on the caller's event loop.
+
+        Args:
+            typed_data (dict[str, Any]): The typed data to sign following EIP-712 format
+
+        Returns:
+            HexStr: The signature as a hex string
 
+        """
         # Extract required parameters from typed_data
         domain = typed_data.get("domain", {})
         types = typed_data.get("types", {})
         primary_type = typed_data.get("primaryType", "")
         message = typed_data.get("message", {})
 
-        async def _sign_typed_data():
-            async with client as cdp:
-                return await cdp.evm.sign_typed_data(
-                    address=self.get_address(),
-                    domain=domain,
-                    types=types,
-                    primary_type=primary_type,
-                    message=message,
-                )
-
-        return self._run_async(_sign_typed_data())
+        return await self._session.arun(
+            self._session.client.evm.sign_typed_data(
+                address=self.get_address(),
+                domain=domain,
+                types=types,
+                primary_type=primary_type,
+                message=message,
+            )
+        )
 
     def sign_transaction(self, transaction: TxParams) -> HexStr:
         """Sign an EVM transaction.
@@ -291,51 +380,53 @@ class CdpEvmServerWalletProvider(EvmWalletProvider):
             HexStr: The transaction signature as a hex string
 
         """
-        client = self.get_client()
-
-        async def _sign_transaction():
-            async with client as cdp:
-                return await cdp.evm.sign_transaction(
-                    address=self.get_address(),
-                    transaction=TransactionRequestEIP1559(
-                        to=transaction["to"],
-                        value=transaction.get("value", 0),
-                        data=transaction.get("data", "0x"),
-                    ),
-                    network=self._network.network_id,
-                )
+        return self._run_async(self.asign_transaction(transaction))
+
+    async def asign_transaction(self, transaction: TxParams) -> HexStr:
+        """Sign an EVM transaction on the caller's event loop.
+
+        Args:
+            transaction (TxParams): Transaction parameters including to, value, and data
 
-        return self._run_async(_sign_transaction())
+        Returns:
+            HexStr: The transaction signature as a hex string
+
+        """
+        return await self._session.arun(
+            self._session.client.evm.sign_transaction(
+                address=self.get_address(),
+                transaction=TransactionRequestEIP1559(
+                    to=transaction["to"],
+                    value=transaction.get("value", 0),
+                    data=transaction.get("data", "0x"),
+                ),
+                network=self._network.network_id,
+            )
+        )
 
-    async def _get_account(self, client: CdpClient, address: str):
+    async def _get_account(self, address: str):
         """Get an existing account by address.
 
         Args:
-            client (CdpClient): The CDP client instance
             address (str): The address of the account to get
 
         Returns:
             Any: The account object
 
         """
-        async with client as cdp:
-            return await cdp.evm.get_account(address=address)
+        return await self._session.client.evm.get_account(address=address)
 
-    async def _create_account(self, client: CdpClient):
+    async def _create_account(self):
         """Create a new account.
 
-        Args:
-            client (CdpClient): The CDP client instance
-
         Returns:
             Any: The newly created account object
 
         """
-        async with client as cdp:
-            return await cdp.evm.create_account(idempotency_key=self._idempotency_key)
+        return await self._session.client.evm.create_account(idempotency_key=self._idempotency_key)
 
     def _run_async(self, coroutine):
-        """Run an async coroutine synchronously.
+        """Run an async coroutine synchronously on the provider's CDP session loop.
 
         Args:
             coroutine: The coroutine to run
@@ -344,9 +435,4 @@ class CdpEvmServerWalletProvider(EvmWalletProvider):
             Any: The result of the coroutine
 
         """
-        try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-        return loop.run_until_complete(coroutine)
+        return self._session.run(coroutine)
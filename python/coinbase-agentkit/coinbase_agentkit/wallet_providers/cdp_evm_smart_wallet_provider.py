@@ -1,6 +1,5 @@
 """CDP EVM Smart Wallet provider."""
 
-import asyncio
 import os
 from decimal import Decimal
 from typing import Any
@@ -10,9 +9,17 @@ from cdp.evm_call_types import EncodedCall
 from eth_account import Account
 from pydantic import BaseModel, Field
 from web3 import Web3
-from web3.types import BlockIdentifier, ChecksumAddress, HexStr, TxParams
+from web3.types import (
+    BlockIdentifier,
+    ChecksumAddress,
+    FilterParams,
+    HexStr,
+    LogReceipt,
+    TxParams,
+)
 
 from ..network import NETWORK_ID_TO_CHAIN, Network
+from .cdp_client_session import CdpClientSession
 from .evm_wallet_provider import EvmGasConfig, EvmWalletProvider
 
 
@@ -34,7 +41,11 @@ class CdpEvmSmartWalletProviderConfig(BaseModel):
 
 
 class CdpEvmSmartWalletProvider(EvmWalletProvider):
-    """A wallet provider that uses the CDP EVM Smart Account SDK."""
+    """A wallet provider that uses the CDP EVM Smart Account SDK.
+
+    The provider keeps one CDP client and the resolved owner and smart account for its
+    lifetime. Call `close()`, or use the provider as a context manager, to release them.
+    """
 
     def __init__(self, config: CdpEvmSmartWalletProviderConfig):
         """Initialize CDP EVM Smart Wallet provider.
@@ -74,33 +85,30 @@ class CdpEvmSmartWalletProvider(EvmWalletProvider):
             )
             self._web3 = Web3(Web3.HTTPProvider(rpc_url))
 
-            client = self.get_client()
-            try:
-
-                async def initialize_accounts():
-                    async with client as cdp:
-                        if (
-                            owner_address_or_private_key.startswith("0x")
-                            and len(owner_address_or_private_key) == 42
-                        ):
-                            owner = await cdp.evm.get_account(address=owner_address_or_private_key)
-                        else:
-                            owner = Account.from_key(owner_address_or_private_key)
-
-                        if config.address:
-                            smart_account = await cdp.evm.get_smart_account(
-                                owner=owner, address=config.address
-                            )
-                        else:
-                            smart_account = await cdp.evm.create_smart_account(owner=owner)
-                        return owner, smart_account
-
-                owner, smart_account = asyncio.run(initialize_accounts())
-                self._address = smart_account.address
-                self._owner = owner
-
-            finally:
-                asyncio.run(client.close())
+            self._session = CdpClientSession(self.get_client)
+
+            async def initialize_accounts():
+                cdp = self._session.client
+                if (
+                    owner_address_or_private_key.startswith("0x")
+                    and len(owner_address_or_private_key) == 42
+                ):
+                    owner = await cdp.evm.get_account(address=owner_address_or_private_key)
+                else:
+                    owner = Account.from_key(owner_address_or_private_key)
+
+                if config.address:
+                    smart_account = await cdp.evm.get_smart_account(
+                        owner=owner, address=config.address
+                    )
+                else:
+                    smart_account = await cdp.evm.create_smart_account(owner=owner)
+                return owner, smart_account
+
+            owner, smart_account = self._run_async(initialize_accounts())
+            self._address = smart_account.address
+            self._owner = owner
+            self._smart_account = smart_account
 
             self._gas_limit_multiplier = (
                 max(config.gas.gas_limit_multiplier, 1)
@@ -115,15 +123,39 @@ class CdpEvmSmartWalletProvider(EvmWalletProvider):
             )
 
         except ImportError as e:
+            self.close()
             raise ImportError(
                 "Failed to import cdp. Please install it with 'pip install cdp-sdk'."
             ) from e
         except Exception as e:
+            self.close()
             raise ValueError(f"Failed to initialize CDP smart wallet: {e!s}") from e
 
+    def __enter__(self) -> "CdpEvmSmartWalletProvider":
+        """Enter the context manager.
+
+        Returns:
+            CdpEvmSmartWalletProvider: The provider itself
+
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Exit the context manager and close the CDP client."""
+        self.close()
+
+    def close(self) -> None:
+        """Close the provider's CDP client and its background event loop."""
+        session = getattr(self, "_session", None)
+        if session is not None:
+            session.close()
+
     def get_client(self) -> CdpClient:
         """Get a new CDP client instance.
 
+        The caller owns the returned client and is responsible for closing it. The provider's
+        own operations use a long-lived client instead.
+
         Returns:
             Cdp: A new CDP client instance
 
@@ -135,7 +167,7 @@ class CdpEvmSmartWalletProvider(EvmWalletProvider):
         )
 
     def _run_async(self, coroutine):
-        """Run an async coroutine synchronously.
+        """Run an async coroutine synchronously on the provider's CDP session loop.
 
         Args:
             coroutine: The coroutine to run
@@ -144,33 +176,21 @@ class CdpEvmSmartWalletProvider(EvmWalletProvider):
             Any: The result of the coroutine
 
         """
-        try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-        return loop.run_until_complete(coroutine)
-
-    async def _get_smart_account(self, cdp):
-        """Get the smart account, handling server wallet owners differently.
+        return self._session.run(coroutine)
 
-        Args:
-            cdp: CDP client instance
+    async def _get_smart_account(self):
+        """Get the smart account, fetching it once per provider.
 
         Returns:
             The smart account object
 
         """
-        # Check if owner is a server wallet (not an eth_account)
-        if not isinstance(self._owner, Account):
-            # For server wallets, create a fresh owner reference to avoid nested client sessions
-            owner = await cdp.evm.get_account(address=self._owner.address)
-            smart_account = await cdp.evm.get_smart_account(owner=owner, address=self._address)
-        else:
-            # Using eth_account is simpler - no nested client sessions
-            smart_account = await cdp.evm.get_smart_account(
+        smart_account = getattr(self, "_smart_account", None)
+        if smart_account is None:
+            smart_account = await self._session.client.evm.get_smart_account(
                 owner=self._owner, address=self._address
             )
+            self._smart_account = smart_account
         return smart_account
 
     def get_address(self) -> str:
@@ -213,6 +233,19 @@ class CdpEvmSmartWalletProvider(EvmWalletProvider):
     def native_transfer(self, to: str, value: Decimal) -> str:
         """Transfer the native asset of the network using a user operation.
 
+        Args:
+            to (str): The destination address to receive the transfer
+            value (Decimal): The amount to transfer in whole units (e.g. 1.5 for 1.5 ETH)
+
+        Returns:
+            str: The transaction hash as a string
+
+        """
+        return self._run_async(self.anative_transfer(to, value))
+
+    async def anative_transfer(self, to: str, value: Decimal) -> str:
+        """Transfer the native asset of the network using a user operation on the caller's event loop.
+
         Args:
             to (str): The destination address to receive the transfer
             value (Decimal): The amount to transfer in whole units (e.g. 1.5 for 1.5 ETH)
@@ -222,27 +255,28 @@ class CdpEvmSmartWalletProvider(EvmWalletProvider):
 
         """
         value_wei = Web3.to_wei(value, "ether")
-        client = self.get_client()
+        return await self.asend_user_operation([EncodedCall(to=to, value=value_wei, data="0x")])
 
-        async def _send_user_operation():
-            async with client as cdp:
-                smart_account = await self._get_smart_account(cdp)
+    def get_block_number(self) -> int:
+        """Get the number of the latest block on the wallet's network.
 
-                user_operation = await cdp.evm.send_user_operation(
-                    smart_account=smart_account,
-                    network=self._network.network_id,
-                    calls=[EncodedCall(to=to, value=value_wei, data="0x")],
-                    paymaster_url=self._paymaster_url,
-                )
-                return await cdp.evm.wait_for_user_operation(
-                    smart_account_address=self._address,
-                    user_op_hash=user_operation.user_op_hash,
-                )
+        Returns:
+            int: The latest block number
 
-        try:
-            return self._run_async(_send_user_operation()).transaction_hash
-        finally:
-            self._run_async(client.close())
+        """
+        return self._web3.eth.block_number
+
+    def get_logs(self, filter_params: FilterParams) -> list[LogReceipt]:
+        """Get the event logs matching a filter.
+
+        Args:
+            filter_params (FilterParams): The block range, addresses and topics to match
+
+        Returns:
+            list[LogReceipt]: The matching logs
+
+        """
+        return self._web3.eth.get_logs(filter_params)
 
     def read_contract(
         self,
@@ -281,32 +315,27 @@ class CdpEvmSmartWalletProvider(EvmWalletProvider):
             HexStr: The transaction hash as a hex string
 
         """
-        client = self.get_client()
-
-        async def _send_user_operation():
-            async with client as cdp:
-                smart_account = await self._get_smart_account(cdp)
-                user_operation = await cdp.evm.send_user_operation(
-                    smart_account=smart_account,
-                    network=self._network.network_id,
-                    calls=[
-                        EncodedCall(
-                            to=transaction["to"],
-                            value=transaction.get("value", 0),
-                            data=transaction.get("data", "0x"),
-                        )
-                    ],
-                    paymaster_url=self._paymaster_url,
-                )
-                return await cdp.evm.wait_for_user_operation(
-                    smart_account_address=self._address,
-                    user_op_hash=user_operation.user_op_hash,
-                )
+        return self._run_async(self.asend_transaction(transaction))
 
-        try:
-            return self._run_async(_send_user_operation()).transaction_hash
-        finally:
-            self._run_async(client.close())
+    async def asend_transaction(self, transaction: TxParams) -> HexStr:
+        """Send a transaction using a user operation on the caller's event loop.
+
+        Args:
+            transaction (TxParams): Transaction parameters including to, value, and data
+
+        Returns:
+            HexStr: The transaction hash as a hex string
+
+        """
+        return await self.asend_user_operation(
+            [
+                EncodedCall(
+                    to=transaction["to"],
+                    value=transaction.get("value", 0),
+                    data=transaction.get("data", "0x"),
+                )
+            ]
+        )
 
     def wait_for_transaction_receipt(
         self, tx_hash: HexStr, timeout: float = 120, poll_latency: float = 0.1
@@ -390,23 +419,40 @@ class CdpEvmSmartWalletProvider(EvmWalletProvider):
             str: The transaction hash of the executed user operation
 
         """
-        client = self.get_client()
-
-        async def _send_user_operation():
-            async with client as cdp:
-                smart_account = await self._get_smart_account(cdp)
-                user_operation = await cdp.evm.send_user_operation(
-                    smart_account=smart_account,
-                    network=self._network.network_id,
-                    calls=calls,
-                    paymaster_url=self._paymaster_url,
-                )
-                return await cdp.evm.wait_for_user_operation(
-                    smart_account_address=self._address,
-                    user_op_hash=user_operation.user_op_hash,
-                )
+        return self._run_async(self.asend_user_operation(calls))
 
-        try:
-            return self._run_async(_send_user_operation()).transaction_hash
-        finally:
-            self._run_async(client.close())
+    async def asend_user_operation(self, calls: list[EncodedCall]) -> str:
+        """Send a user operation with multiple calls on the caller's event loop.
+
+        Args:
+            calls (List[EncodedCall]): List of encoded calls to execute in the user operation
+
+        Returns:
+            str: The transaction hash of the executed user operation
+
+        """
+        return await self._session.arun(self._send_user_operation(calls))
+
+    async def _send_user_operation(self, calls: list[EncodedCall]) -> str:
+        """Send a user operation and wait for it on the session loop.
+
+        Args:
+            calls (List[EncodedCall]): List of encoded calls to execute in the user operation
+
+        Returns:
+            str: The transaction hash of the executed user operation
+
+        """
+        cdp = self._session.client
+        smart_account = await self._get_smart_account()
+        user_operation = await cdp.evm.send_user_operation(
+            smart_account=smart_account,
+            network=self._network.network_id,
+            calls=calls,
+            paymaster_url=self._paymaster_url,
+        )
+        result = await cdp.evm.wait_for_user_operation(
+            smart_account_address=self._address,
+            user_op_hash=user_operation.user_op_hash,
+        )
+        return result.transaction_hash
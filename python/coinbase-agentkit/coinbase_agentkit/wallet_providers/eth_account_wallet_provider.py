@@ -9,10 +9,19 @@ from eth_account.messages import encode_defunct
 from pydantic import BaseModel, Field
 from web3 import Web3
 from web3.middleware import SignAndSendRawMiddlewareBuilder
-from web3.types import BlockIdentifier, ChecksumAddress, HexStr, TxParams
+from web3.types import (
+    BlockIdentifier,
+    ChecksumAddress,
+    FilterParams,
+    HexStr,
+    LogReceipt,
+    TxParams,
+)
 
 from ..network import CHAIN_ID_TO_NETWORK_ID, NETWORK_ID_TO_CHAIN, Network
 from .evm_wallet_provider import EvmGasConfig, EvmWalletProvider
+from .fee_oracle import get_fee_oracle
+from .nonce_manager import NonceManager, is_nonce_error
 
 
 class EthAccountWalletProviderConfig(BaseModel):
@@ -22,6 +31,10 @@ class EthAccountWalletProviderConfig(BaseModel):
     chain_id: str
     gas: EvmGasConfig | None = Field(None, description="Gas configuration settings")
     rpc_url: str | None = Field(None, description="Optional RPC URL to override default chain RPC")
+    nonce_store_path: str | None = Field(
+        None,
+        description="Optional SQLite file used to share nonces between processes sending from the same account",
+    )
 
     class Config:
         """Configuration for EthAccountWalletProvider."""
@@ -73,6 +86,15 @@ class EthAccountWalletProvider(EvmWalletProvider):
             else 1
         )
 
+        self._fee_oracle = get_fee_oracle(self.web3)
+        self._nonce_manager = NonceManager(
+            key=f"{self.config.chain_id}:{self.account.address}",
+            fetch_nonce=lambda: self.web3.eth.get_transaction_count(
+                self.account.address, "pending"
+            ),
+            store_path=config.nonce_store_path,
+        )
+
     def get_address(self) -> str:
         """Get the wallet address.
 
@@ -159,30 +181,18 @@ class EthAccountWalletProvider(EvmWalletProvider):
     def estimate_fees(self):
         """Estimate gas fees for a transaction, applying the configured fee multipliers.
 
+        Fees come from the fee oracle shared by every provider on the same node, which
+        samples recent priority fees with `eth_feeHistory` and caches the result per block.
+
         Returns:
             tuple[int, int]: Tuple of (max_priority_fee_per_gas, max_fee_per_gas) in wei
 
         """
+        fees = self._fee_oracle.get_fees()
 
-        def get_base_fee():
-            """Get the base fee from the latest block and apply the multiplier.
-
-            Returns:
-                int: The adjusted base fee in wei
-
-            """
-            latest_block = self.web3.eth.get_block("latest")
-            base_fee = latest_block["baseFeePerGas"]
-            # Multiply the configured fee multiplier to give some buffer
-            return int(base_fee * self._fee_per_gas_multiplier)
-
-        def get_max_priority_fee():
-            max_priority_fee_per_gas = Web3.to_wei(0.1, "gwei")
-            # Multiply the configured fee multiplier to give some buffer
-            return int(max_priority_fee_per_gas * self._fee_per_gas_multiplier)
-
-        base_fee_per_gas = get_base_fee()
-        max_priority_fee_per_gas = get_max_priority_fee()
+        # Multiply the configured fee multiplier to give some buffer
+        base_fee_per_gas = int(fees.base_fee_per_gas * self._fee_per_gas_multiplier)
+        max_priority_fee_per_gas = int(fees.max_priority_fee_per_gas * self._fee_per_gas_multiplier)
         max_fee_per_gas = base_fee_per_gas + max_priority_fee_per_gas
 
         return (max_priority_fee_per_gas, max_fee_per_gas)
@@ -190,6 +200,9 @@ class EthAccountWalletProvider(EvmWalletProvider):
     def send_transaction(self, transaction: TxParams) -> HexStr:
         """Send a signed transaction to the network.
 
+        The nonce is taken from the local nonce manager, so this returns as soon as the
+        transaction is broadcast and can be called again before it is mined.
+
         Args:
             transaction (TxParams): Transaction parameters including to, value, and data
 
@@ -200,20 +213,97 @@ class EthAccountWalletProvider(EvmWalletProvider):
             Exception: If transaction preparation or sending fails
 
         """
-        transaction["from"] = self.account.address
-        transaction["chainId"] = int(self._network.chain_id)
+        return self.send_transactions([transaction])[0]
+
+    def send_transactions(self, transactions: list[TxParams]) -> list[HexStr]:
+        """Send several transactions back to back without waiting for receipts.
+
+        Fees are estimated once for the batch and consecutive nonces are reserved up front.
+        Gas is estimated for each transaction just before it is sent, unless it already sets
+        `gas`. Estimates run against the latest block, so a transaction that depends on an
+        earlier one in the batch, such as a swap after an approval, must set `gas` itself.
+        If a transaction fails, the nonces of it and the transactions after it are released
+        and the error is raised.
+
+        Args:
+            transactions (list[TxParams]): Transaction parameters including to, value, and data
 
-        nonce = self.web3.eth.get_transaction_count(self.account.address)
-        transaction["nonce"] = nonce
+        Returns:
+            list[HexStr]: The transaction hashes, in the order the transactions were given
+
+        Raises:
+            Exception: If transaction preparation or sending fails
+
+        """
+        if not transactions:
+            return []
 
         max_priority_fee_per_gas, max_fee_per_gas = self.estimate_fees()
-        transaction["maxPriorityFeePerGas"] = max_priority_fee_per_gas
-        transaction["maxFeePerGas"] = max_fee_per_gas
+        for transaction in transactions:
+            transaction["from"] = self.account.address
+            transaction["chainId"] = int(self._network.chain_id)
+            transaction["maxPriorityFeePerGas"] = max_priority_fee_per_gas
+            transaction["maxFeePerGas"] = max_fee_per_gas
+
+        managed = ["nonce" not in transaction for transaction in transactions]
+        self._assign_nonces(transactions, managed)
+
+        hashes = []
+        for index, transaction in enumerate(transactions):
+            try:
+                if "gas" not in transaction:
+                    gas = self.web3.eth.estimate_gas(transaction)
+                    transaction["gas"] = int(gas * self._gas_limit_multiplier)
+                hashes.append(self._broadcast(transactions[index:], managed[index:]))
+            except Exception:
+                for unsent, is_managed in reversed(
+                    list(zip(transactions[index:], managed[index:], strict=True))
+                ):
+                    if is_managed:
+                        self._nonce_manager.release(unsent["nonce"])
+                raise
+        return hashes
+
+    def _assign_nonces(self, transactions: list[TxParams], managed: list[bool]) -> None:
+        """Reserve consecutive nonces for the transactions whose nonce is managed.
+
+        Args:
+            transactions (list[TxParams]): The transactions to assign nonces to
+            managed (list[bool]): Whether each transaction's nonce comes from the nonce manager
+
+        """
+        nonces = iter(self._nonce_manager.reserve_many(sum(managed)))
+        for transaction, is_managed in zip(transactions, managed, strict=True):
+            if is_managed:
+                transaction["nonce"] = next(nonces)
 
-        gas = int(self.web3.eth.estimate_gas(transaction) * self._gas_limit_multiplier)
-        transaction["gas"] = gas
+    def _broadcast(self, pending: list[TxParams], managed: list[bool]) -> HexStr:
+        """Broadcast the first pending transaction, resyncing the nonce manager on nonce errors.
+
+        A resync discards every local reservation, so the managed nonces of all pending
+        transactions are reassigned before the retry to keep the rest of the batch
+        consecutive. On failure the caller releases the pending transactions' nonces.
+
+        Args:
+            pending (list[TxParams]): The prepared transactions not yet sent, in order
+            managed (list[bool]): Whether each pending transaction's nonce is managed
+
+        Returns:
+            HexStr: The transaction hash as a hex string
+
+        """
+        transaction = pending[0]
+        try:
+            hash = self.web3.eth.send_transaction(transaction)
+        except Exception as e:
+            if not managed[0] or not is_nonce_error(e):
+                raise
+
+            # Another sender used the account or a transaction was dropped; retry once
+            self._nonce_manager.resync()
+            self._assign_nonces(pending, managed)
+            hash = self.web3.eth.send_transaction(transaction)
 
-        hash = self.web3.eth.send_transaction(transaction)
         return Web3.to_hex(hash)
 
     def wait_for_transaction_receipt(
@@ -237,6 +327,27 @@ class EthAccountWalletProvider(EvmWalletProvider):
             tx_hash, timeout=timeout, poll_latency=poll_latency
         )
 
+    def get_block_number(self) -> int:
+        """Get the number of the latest block on the wallet's network.
+
+        Returns:
+            int: The latest block number
+
+        """
+        return self.web3.eth.block_number
+
+    def get_logs(self, filter_params: FilterParams) -> list[LogReceipt]:
+        """Get the event logs matching a filter.
+
+        Args:
+            filter_params (FilterParams): The block range, addresses and topics to match
+
+        Returns:
+            list[LogReceipt]: The matching logs
+
+        """
+        return self.web3.eth.get_logs(filter_params)
+
     def read_contract(
         self,
         contract_address: ChecksumAddress,
@@ -1,12 +1,28 @@
 """Base class for EVM-compatible wallet providers."""
 
+import asyncio
 from abc import ABC, abstractmethod
 from typing import Any
 
 from eth_account.datastructures import SignedTransaction
 from pydantic import BaseModel, Field
-from web3.types import BlockIdentifier, ChecksumAddress, HexStr, TxParams
+from web3.types import (
+    BlockIdentifier,
+    ChecksumAddress,
+    FilterParams,
+    HexStr,
+    LogReceipt,
+    TxParams,
+)
 
+from .multicall import (
+    MULTICALL3_ABI,
+    ContractCall,
+    ContractCallResult,
+    decode_result,
+    encode_call,
+    get_multicall3_address,
+)
 from .wallet_provider import WalletProvider
 
 
@@ -62,3 +78,153 @@ class EvmWalletProvider(WalletProvider, ABC):
     ) -> Any:
         """Read data from a smart contract."""
         pass
+
+    def get_block_number(self) -> int | None:
+        """Get the number of the latest block on the wallet's network.
+
+        Returns:
+            int | None: The latest block number, or None if the provider cannot report it
+
+        """
+        return None
+
+    def get_logs(self, filter_params: FilterParams) -> list[LogReceipt]:
+        """Get the event logs matching a filter.
+
+        Args:
+            filter_params (FilterParams): The block range, addresses and topics to match
+
+        Returns:
+            list[LogReceipt]: The matching logs
+
+        Raises:
+            NotImplementedError: If the provider cannot read logs
+
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support reading logs")
+
+    def read_contracts(
+        self,
+        calls: list[ContractCall],
+        block_identifier: BlockIdentifier = "latest",
+    ) -> list[ContractCallResult]:
+        """Read data from multiple smart contracts in a single round-trip.
+
+        Calls are aggregated through the network's multicall3 contract. On networks without
+        multicall3 the calls are executed sequentially with the same semantics.
+
+        Args:
+            calls (list[ContractCall]): The contract reads to execute, in order
+            block_identifier (BlockIdentifier): The block number to read from, defaults to 'latest'
+
+        Returns:
+            list[ContractCallResult]: One result per call, in the same order as `calls`
+
+        Raises:
+            Exception: If a call that does not allow failure reverts or cannot be decoded
+
+        """
+        if not calls:
+            return []
+
+        multicall_address = get_multicall3_address(self.get_network(), block_identifier)
+        if multicall_address is None:
+            return [self._read_contract_result(call, block_identifier) for call in calls]
+
+        return_data = self.read_contract(
+            contract_address=multicall_address,
+            abi=MULTICALL3_ABI,
+            function_name="aggregate3",
+            args=[[encode_call(call) for call in calls]],
+            block_identifier=block_identifier,
+        )
+
+        results = []
+        for call, (success, data) in zip(calls, return_data, strict=True):
+            if not success:
+                results.append(
+                    ContractCallResult(success=False, error=f"{call.function_name} reverted")
+                )
+                continue
+
+            try:
+                results.append(ContractCallResult(success=True, result=decode_result(call, data)))
+            except Exception as e:
+                if not call.allow_failure:
+                    raise
+                results.append(ContractCallResult(success=False, error=str(e)))
+
+        return results
+
+    def _read_contract_result(
+        self, call: ContractCall, block_identifier: BlockIdentifier
+    ) -> ContractCallResult:
+        """Execute a single contract call with the failure semantics of `read_contracts`.
+
+        Args:
+            call (ContractCall): The call to execute
+            block_identifier (BlockIdentifier): The block number to read from
+
+        Returns:
+            ContractCallResult: The result of the call
+
+        """
+        try:
+            result = self.read_contract(
+                contract_address=call.contract_address,
+                abi=call.abi,
+                function_name=call.function_name,
+                args=call.args,
+                block_identifier=block_identifier,
+            )
+        except Exception as e:
+            if not call.allow_failure:
+                raise
+            return ContractCallResult(success=False, error=str(e))
+
+        return ContractCallResult(success=True, result=result)
+
+    async def asign_message(self, message: str | bytes) -> HexStr:
+        """Sign a message without blocking the event loop."""
+        return await asyncio.to_thread(self.sign_message, message)
+
+    async def asign_typed_data(self, typed_data: dict[str, Any]) -> HexStr:
+        """Sign typed data according to EIP-712 without blocking the event loop."""
+        return await asyncio.to_thread(self.sign_typed_data, typed_data)
+
+    async def asign_transaction(self, transaction: TxParams) -> SignedTransaction:
+        """Sign an EVM transaction without blocking the event loop."""
+        return await asyncio.to_thread(self.sign_transaction, transaction)
+
+    async def asend_transaction(self, transaction: TxParams) -> HexStr:
+        """Send a transaction without blocking the event loop."""
+        return await asyncio.to_thread(self.send_transaction, transaction)
+
+    async def await_for_transaction_receipt(
+        self, tx_hash: HexStr, timeout: float = 120, poll_latency: float = 0.1
+    ) -> dict[str, Any]:
+        """Wait for transaction confirmation without blocking the event loop."""
+        return await asyncio.to_thread(
+            self.wait_for_transaction_receipt, tx_hash, timeout, poll_latency
+        )
+
+    async def aread_contract(
+        self,
+        contract_address: ChecksumAddress,
+        abi: list[dict[str, Any]],
+        function_name: str,
+        args: list[Any] | None = None,
+        block_identifier: BlockIdentifier = "latest",
+    ) -> Any:
+        """Read data from a smart contract without blocking the event loop."""
+        return await asyncio.to_thread(
+            self.read_contract, contract_address, abi, function_name, args, block_identifier
+        )
+
+    async def aread_contracts(
+        self,
+        calls: list[ContractCall],
+        block_identifier: BlockIdentifier = "latest",
+    ) -> list[ContractCallResult]:
+        """Read data from multiple smart contracts without blocking the event loop."""
+        return await asyncio.to_thread(self.read_contracts, calls, block_identifier)
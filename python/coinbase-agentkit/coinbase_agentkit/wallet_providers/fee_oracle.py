@@ -0,0 +1,111 @@
+"""EIP-1559 fee estimation shared by EVM wallet providers."""
+
+import statistics
+import threading
+from typing import Any
+
+from pydantic import BaseModel, Field
+from web3 import Web3
+
+DEFAULT_PRIORITY_FEE_PER_GAS = 100_000_000  # 0.1 gwei
+
+
+class FeeEstimate(BaseModel):
+    """Fee parameters for transactions sent on top of a given block."""
+
+    block_number: int = Field(..., description="The block the estimate was made at")
+    base_fee_per_gas: int = Field(..., description="The base fee of the next block in wei")
+    max_priority_fee_per_gas: int = Field(..., description="The suggested priority fee in wei")
+
+
+class FeeOracle:
+    """Estimates EIP-1559 fees with `eth_feeHistory`, caching the result per block.
+
+    The priority fee is the median of the requested reward percentile over the last
+    `block_count` blocks, and the base fee is the one the node projects for the next block.
+    Callers asking during the same block share one estimate, so a burst of sends costs a
+    single `eth_blockNumber` lookup each and one `eth_feeHistory` call in total. Nodes
+    without `eth_feeHistory` fall back to the latest block's base fee and a fixed priority
+    fee.
+    """
+
+    def __init__(
+        self,
+        web3: Web3,
+        block_count: int = 10,
+        reward_percentile: float = 50.0,
+        fallback_priority_fee_per_gas: int = DEFAULT_PRIORITY_FEE_PER_GAS,
+    ):
+        """Initialize the fee oracle.
+
+        Args:
+            web3 (Web3): The web3 instance used to query the node.
+            block_count (int): The number of recent blocks to sample priority fees from.
+            reward_percentile (float): The priority fee percentile to sample from each block.
+            fallback_priority_fee_per_gas (int): The priority fee used when no samples exist.
+
+        """
+        self._web3 = web3
+        self._block_count = block_count
+        self._reward_percentile = reward_percentile
+        self._fallback_priority_fee_per_gas = fallback_priority_fee_per_gas
+        self._lock = threading.Lock()
+        self._cached: FeeEstimate | None = None
+
+    def get_fees(self) -> FeeEstimate:
+        """Get the fee estimate for the current block.
+
+        Returns:
+            FeeEstimate: The cached estimate if the chain has not advanced, else a new one.
+
+        """
+        block_number = self._web3.eth.block_number
+        with self._lock:
+            if self._cached is None or self._cached.block_number != block_number:
+                self._cached = self._estimate(block_number)
+            return self._cached
+
+    def _estimate(self, block_number: int) -> FeeEstimate:
+        try:
+            history = self._web3.eth.fee_history(
+                self._block_count, block_number, [self._reward_percentile]
+            )
+        except Exception:
+            block = self._web3.eth.get_block(block_number)
+            return FeeEstimate(
+                block_number=block_number,
+                base_fee_per_gas=block["baseFeePerGas"],
+                max_priority_fee_per_gas=self._fallback_priority_fee_per_gas,
+            )
+
+        rewards = [reward[0] for reward in history.get("reward") or [] if reward and reward[0]]
+        priority_fee = (
+            int(statistics.median(rewards)) if rewards else self._fallback_priority_fee_per_gas
+        )
+
+        return FeeEstimate(
+            block_number=block_number,
+            base_fee_per_gas=history["baseFeePerGas"][-1],
+            max_priority_fee_per_gas=priority_fee,
+        )
+
+
+_fee_oracles: dict[Any, FeeOracle] = {}
+_fee_oracles_lock = threading.Lock()
+
+
+def get_fee_oracle(web3: Web3) -> FeeOracle:
+    """Get the fee oracle shared by every wallet provider connected to the same node.
+
+    Args:
+        web3 (Web3): The web3 instance of the wallet provider.
+
+    Returns:
+        FeeOracle: The shared fee oracle for the web3 instance's endpoint.
+
+    """
+    key = getattr(web3.provider, "endpoint_uri", None) or id(web3)
+    with _fee_oracles_lock:
+        if key not in _fee_oracles:
+            _fee_oracles[key] = FeeOracle(web3)
+        return _fee_oracles[key]
@@ -0,0 +1,137 @@
+"""Multicall3 helpers for batching EVM contract reads."""
+
+from typing import Any
+
+from eth_abi import decode, encode
+from eth_utils import get_abi_input_types, get_abi_output_types
+from pydantic import BaseModel, ConfigDict, Field
+from web3 import Web3
+from web3._utils.abi import map_abi_data
+from web3._utils.normalizers import BASE_RETURN_NORMALIZERS
+from web3.types import BlockIdentifier, ChecksumAddress
+from web3.utils.abi import get_abi_element, get_abi_element_info
+
+from ..network import CHAIN_ID_TO_NETWORK_ID, NETWORK_ID_TO_CHAIN, Network
+
+MULTICALL3_ABI = [
+    {
+        "inputs": [
+            {
+                "components": [
+                    {"internalType": "address", "name": "target", "type": "address"},
+                    {"internalType": "bool", "name": "allowFailure", "type": "bool"},
+                    {"internalType": "bytes", "name": "callData", "type": "bytes"},
+                ],
+                "internalType": "struct Multicall3.Call3[]",
+                "name": "calls",
+                "type": "tuple[]",
+            }
+        ],
+        "name": "aggregate3",
+        "outputs": [
+            {
+                "components": [
+                    {"internalType": "bool", "name": "success", "type": "bool"},
+                    {"internalType": "bytes", "name": "returnData", "type": "bytes"},
+                ],
+                "internalType": "struct Multicall3.Result[]",
+                "name": "returnData",
+                "type": "tuple[]",
+            }
+        ],
+        "stateMutability": "payable",
+        "type": "function",
+    },
+]
+
+
+class ContractCall(BaseModel):
+    """A single contract read to be executed as part of a batch."""
+
+    contract_address: str = Field(..., description="The address of the contract to read from")
+    abi: list[dict[str, Any]] = Field(..., description="The ABI of the contract")
+    function_name: str = Field(..., description="The name of the function to call")
+    args: list[Any] | None = Field(None, description="Arguments to pass to the function call")
+    allow_failure: bool = Field(
+        False, description="Whether a revert of this call should be returned instead of raised"
+    )
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+
+class ContractCallResult(BaseModel):
+    """The outcome of a single contract read from a batch."""
+
+    success: bool = Field(..., description="Whether the call succeeded")
+    result: Any = Field(None, description="The decoded return value of the call")
+    error: str | None = Field(None, description="The error message if the call failed")
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+
+def get_multicall3_address(
+    network: Network, block_identifier: BlockIdentifier = "latest"
+) -> ChecksumAddress | None:
+    """Get the multicall3 address for a network, if it is deployed.
+
+    Args:
+        network (Network): The network to look up.
+        block_identifier (BlockIdentifier): The block the read will be executed at.
+
+    Returns:
+        ChecksumAddress | None: The multicall3 address, or None if it is not available.
+
+    """
+    network_id = network.network_id or CHAIN_ID_TO_NETWORK_ID.get(network.chain_id or "")
+    chain = NETWORK_ID_TO_CHAIN.get(network_id or "")
+    if chain is None or "multicall3" not in chain.contracts:
+        return None
+
+    multicall3 = chain.contracts["multicall3"]
+    if (
+        isinstance(block_identifier, int)
+        and multicall3.block_created is not None
+        and block_identifier < multicall3.block_created
+    ):
+        return None
+
+    return Web3.to_checksum_address(multicall3.address)
+
+
+def encode_call(call: ContractCall) -> tuple[ChecksumAddress, bool, bytes]:
+    """Encode a contract call as a multicall3 Call3 struct.
+
+    Args:
+        call (ContractCall): The call to encode.
+
+    Returns:
+        tuple[ChecksumAddress, bool, bytes]: The target, allowFailure flag and calldata.
+
+    """
+    info = get_abi_element_info(call.abi, call.function_name, *(call.args or []))
+    call_data = Web3.to_bytes(hexstr=info["selector"]) + encode(
+        get_abi_input_types(info["abi"]), info["arguments"]
+    )
+    return (Web3.to_checksum_address(call.contract_address), call.allow_failure, call_data)
+
+
+def decode_result(call: ContractCall, return_data: bytes) -> Any:
+    """Decode the return data of a contract call the same way `read_contract` does.
+
+    Args:
+        call (ContractCall): The call the data was returned for.
+        return_data (bytes): The raw return data.
+
+    Returns:
+        Any: The decoded value, unwrapped when the function has a single output.
+
+    """
+    function_abi = get_abi_element(call.abi, call.function_name, *(call.args or []))
+    output_types = get_abi_output_types(function_abi)
+
+    decoded = decode(output_types, return_data)
+    normalized = map_abi_data(BASE_RETURN_NORMALIZERS, output_types, decoded)
+
+    if len(normalized) == 1:
+        return normalized[0]
+    return normalized
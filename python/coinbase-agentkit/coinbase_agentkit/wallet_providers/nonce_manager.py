@@ -0,0 +1,226 @@
+"""Local nonce tracking for EVM accounts."""
+
+import heapq
+import sqlite3
+import threading
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+
+NONCE_ERROR_MESSAGES = (
+    "nonce too low",
+    "nonce too high",
+    "invalid nonce",
+    "already known",
+    "replacement transaction underpriced",
+)
+
+
+def is_nonce_error(error: Exception) -> bool:
+    """Check whether an RPC error was caused by a stale or conflicting nonce.
+
+    Args:
+        error (Exception): The error raised while sending a transaction.
+
+    Returns:
+        bool: True if the error indicates the local nonce is out of sync.
+
+    """
+    message = str(error).lower()
+    return any(fragment in message for fragment in NONCE_ERROR_MESSAGES)
+
+
+class NonceManager:
+    """Hands out nonces for one account without querying the chain for every transaction.
+
+    The next nonce is read from the chain's pending transaction count once and then tracked
+    locally, so several transactions can be submitted without waiting for earlier ones to be
+    mined. Nonces that were reserved but never broadcast are released and handed out again
+    first, which keeps the sequence free of gaps. Call `resync` when the node reports a
+    nonce error to start again from the chain's view.
+
+    By default state is held in memory and shared by the threads of one process. Pass
+    `store_path` to keep it in a SQLite file instead; every reservation then takes a write
+    lock on that file, so several processes sending from the same account never collide.
+    """
+
+    def __init__(
+        self,
+        key: str,
+        fetch_nonce: Callable[[], int],
+        store_path: str | None = None,
+        lock_timeout: float = 30.0,
+    ):
+        """Initialize the nonce manager.
+
+        Args:
+            key (str): Identifies the account, e.g. "<chain id>:<address>".
+            fetch_nonce (Callable[[], int]): Returns the account's pending transaction count.
+            store_path (str | None): Optional SQLite file shared between processes.
+            lock_timeout (float): Seconds to wait for the SQLite write lock.
+
+        """
+        self._key = key
+        self._fetch_nonce = fetch_nonce
+        self._lock = threading.Lock()
+
+        self._next_nonce: int | None = None
+        self._released: list[int] = []
+
+        self._connection: sqlite3.Connection | None = None
+        if store_path is not None:
+            self._connection = sqlite3.connect(
+                store_path, timeout=lock_timeout, isolation_level=None, check_same_thread=False
+            )
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS nonces (key TEXT PRIMARY KEY, next_nonce INTEGER)"
+            )
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS released_nonces "
+                "(key TEXT, nonce INTEGER, PRIMARY KEY (key, nonce))"
+            )
+
+    def reserve(self) -> int:
+        """Reserve the next nonce.
+
+        Returns:
+            int: A nonce no other caller sharing this manager's state will receive.
+
+        """
+        return self.reserve_many(1)[0]
+
+    def reserve_many(self, count: int) -> list[int]:
+        """Reserve several nonces at once.
+
+        Args:
+            count (int): The number of nonces to reserve.
+
+        Returns:
+            list[int]: The reserved nonces in ascending order.
+
+        """
+        with self._transaction():
+            nonces = []
+            for _ in range(count):
+                released = self._pop_released()
+                if released is not None:
+                    nonces.append(released)
+                    continue
+
+                next_nonce = self._load_next()
+                if next_nonce is None:
+                    next_nonce = self._fetch_nonce()
+                nonces.append(next_nonce)
+                self._store_next(next_nonce + 1)
+            return sorted(nonces)
+
+    def release(self, nonce: int) -> None:
+        """Return a reserved nonce whose transaction was never broadcast.
+
+        Args:
+            nonce (int): The nonce to release.
+
+        """
+        with self._transaction():
+            next_nonce = self._load_next()
+            if next_nonce is None or nonce >= next_nonce:
+                return
+
+            if nonce != next_nonce - 1:
+                self._push_released(nonce)
+                return
+
+            # Roll the counter back over the released nonce and any directly below it
+            next_nonce = nonce
+            while self._discard_released(next_nonce - 1):
+                next_nonce -= 1
+            self._store_next(next_nonce)
+
+    def resync(self) -> int:
+        """Discard local state and reload the next nonce from the chain.
+
+        Returns:
+            int: The chain's pending transaction count.
+
+        """
+        with self._transaction():
+            next_nonce = self._fetch_nonce()
+            self._clear_released()
+            self._store_next(next_nonce)
+            return next_nonce
+
+    def close(self) -> None:
+        """Close the SQLite store, if any."""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    @contextmanager
+    def _transaction(self) -> Iterator[None]:
+        with self._lock:
+            if self._connection is None:
+                yield
+                return
+
+            self._connection.execute("BEGIN IMMEDIATE")
+            try:
+                yield
+            except BaseException:
+                self._connection.execute("ROLLBACK")
+                raise
+            self._connection.execute("COMMIT")
+
+    def _load_next(self) -> int | None:
+        if self._connection is None:
+            return self._next_nonce
+        row = self._connection.execute(
+            "SELECT next_nonce FROM nonces WHERE key = ?", (self._key,)
+        ).fetchone()
+        return None if row is None else row[0]
+
+    def _store_next(self, next_nonce: int) -> None:
+        if self._connection is None:
+            self._next_nonce = next_nonce
+            return
+        self._connection.execute(
+            "INSERT OR REPLACE INTO nonces (key, next_nonce) VALUES (?, ?)",
+            (self._key, next_nonce),
+        )
+
+    def _pop_released(self) -> int | None:
+        if self._connection is None:
+            return heapq.heappop(self._released) if self._released else None
+        row = self._connection.execute(
+            "SELECT MIN(nonce) FROM released_nonces WHERE key = ?", (self._key,)
+        ).fetchone()
+        if row[0] is None:
+            return None
+        self._discard_released(row[0])
+        return row[0]
+
+    def _push_released(self, nonce: int) -> None:
+        if self._connection is None:
+            if nonce not in self._released:
+                heapq.heappush(self._released, nonce)
+            return
+        self._connection.execute(
+            "INSERT OR IGNORE INTO released_nonces (key, nonce) VALUES (?, ?)",
+            (self._key, nonce),
+        )
+
+    def _discard_released(self, nonce: int) -> bool:
+        if self._connection is None:
+            if nonce not in self._released:
+                return False
+            self._released.remove(nonce)
+            heapq.heapify(self._released)
+            return True
+        cursor = self._connection.execute(
+            "DELETE FROM released_nonces WHERE key = ? AND nonce = ?", (self._key, nonce)
+        )
+        return cursor.rowcount > 0
+
+    def _clear_released(self) -> None:
+        if self._connection is None:
+            self._released.clear()
+            return
+        self._connection.execute("DELETE FROM released_nonces WHERE key = ?", (self._key,))
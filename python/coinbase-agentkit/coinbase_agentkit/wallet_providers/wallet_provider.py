@@ -1,5 +1,6 @@
 """Base class for wallet providers."""
 
+import asyncio
 from abc import ABC, ABCMeta, abstractmethod
 from decimal import Decimal
 
@@ -69,3 +70,15 @@ class WalletProvider(ABC, metaclass=WalletProviderMeta):
     def native_transfer(self, to: str, value: Decimal) -> str:
         """Transfer the native asset of the network."""
         pass
+
+    async def aget_balance(self) -> Decimal:
+        """Get the wallet balance in native currency without blocking the event loop."""
+        return await asyncio.to_thread(self.get_balance)
+
+    async def asign_message(self, message: str) -> str:
+        """Sign a message with the wallet without blocking the event loop."""
+        return await asyncio.to_thread(self.sign_message, message)
+
+    async def anative_transfer(self, to: str, value: Decimal) -> str:
+        """Transfer the native asset of the network without blocking the event loop."""
+        return await asyncio.to_thread(self.native_transfer, to, value)
@@ -37,19 +37,9 @@ def provider(mock_client):
     provider = AlloraActionProvider(api_key="test-api-key", chain_slug=ChainSlug.TESTNET)
     provider.client = mock_client.return_value
 
-    # Instead of mocking _run_async, we'll patch it to directly return the value
-    # that would be returned by the coroutine
-    def mock_run_async(coro):
-        # For AsyncMock objects, we need to access their return_value
-        if isinstance(coro, AsyncMock):
-            return coro.return_value
-        # For AsyncMock with side_effect=Exception, we need to raise the exception
-        try:
-            return coro
-        except Exception as e:
-            raise e
-
-    provider._run_async = mock_run_async
+    provider.client.get_all_topics = AsyncMock()
+    provider.client.get_inference_by_topic_id = AsyncMock()
+    provider.client.get_price_inference = AsyncMock()
     return provider
 
 
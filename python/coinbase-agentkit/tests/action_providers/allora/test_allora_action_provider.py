@@ -1,5 +1,6 @@
 """Tests for Allora action provider."""
 
+import asyncio
 import json
 from unittest.mock import MagicMock
 
@@ -10,7 +11,6 @@ from allora_sdk.v2.api_client import (
 )
 from pydantic import ValidationError
 
-from coinbase_agentkit.action_providers.allora.allora_action_provider import AlloraActionProvider
 from coinbase_agentkit.action_providers.allora.schemas import (
     GetAllTopicsInput,
     GetInferenceByTopicIdInput,
@@ -97,7 +97,7 @@ def test_get_all_topics_success(provider, mock_client):
 
     # Set up the mock to return the mock_topics directly
     mock_client.return_value.get_all_topics.return_value = mock_topics
-    result = provider.get_all_topics({})
+    result = asyncio.run(provider.get_all_topics({}))
 
     assert "The available topics at Allora Network are:" in result
     assert json.dumps(mock_topics) in result
@@ -110,7 +110,7 @@ def test_get_all_topics_error(provider, mock_client):
     # Set up the mock to raise an exception when called
     mock_client.return_value.get_all_topics.side_effect = Exception(error_msg)
 
-    result = provider.get_all_topics({})
+    result = asyncio.run(provider.get_all_topics({}))
     assert "Error getting all topics:" in result
     assert error_msg in result
 
@@ -130,7 +130,7 @@ def test_get_inference_by_topic_id_success(provider, mock_client):
 
     # Set up the mock to return the mock_inference directly
     mock_client.return_value.get_inference_by_topic_id.return_value = mock_inference
-    result = provider.get_inference_by_topic_id({"topic_id": mock_topic_id})
+    result = asyncio.run(provider.get_inference_by_topic_id({"topic_id": mock_topic_id}))
 
     assert f"The inference for topic {mock_topic_id} is:" in result
     assert json.dumps(mock_inference.inference_data) in result
@@ -144,7 +144,7 @@ def test_get_inference_by_topic_id_error(provider, mock_client):
     # Set up the mock to raise an exception when called
     mock_client.return_value.get_inference_by_topic_id.side_effect = Exception(error_msg)
 
-    result = provider.get_inference_by_topic_id({"topic_id": mock_topic_id})
+    result = asyncio.run(provider.get_inference_by_topic_id({"topic_id": mock_topic_id}))
     assert f"Error getting inference for topic {mock_topic_id}:" in result
     assert error_msg in result
 
@@ -161,11 +161,13 @@ def test_get_price_inference_success(provider, mock_client):
 
     # Set up the mock to return the mock_inference directly
     mock_client.return_value.get_price_inference.return_value = mock_inference
-    result = provider.get_price_inference(
-        {
-            "asset": mock_asset,
-            "timeframe": mock_timeframe,
-        }
+    result = asyncio.run(
+        provider.get_price_inference(
+            {
+                "asset": mock_asset,
+                "timeframe": mock_timeframe,
+            }
+        )
     )
 
     expected_response = {
@@ -188,11 +190,13 @@ def test_get_price_inference_error(provider, mock_client):
     # Set up the mock to raise an exception when called
     mock_client.return_value.get_price_inference.side_effect = Exception(error_msg)
 
-    result = provider.get_price_inference(
-        {
-            "asset": mock_asset,
-            "timeframe": mock_timeframe,
-        }
+    result = asyncio.run(
+        provider.get_price_inference(
+            {
+                "asset": mock_asset,
+                "timeframe": mock_timeframe,
+            }
+        )
     )
     assert (
         f"Error getting price inference for {mock_asset.value} ({mock_timeframe.value}):" in result
@@ -200,16 +204,12 @@ def test_get_price_inference_error(provider, mock_client):
     assert error_msg in result
 
 
-def test_run_async_method(provider):
-    """Test the _run_async helper method."""
-
-    # Create a mock coroutine
-    async def mock_coro():
-        return "test_result"
+def test_actions_are_async(provider, mock_client):
+    """Test that the actions are exposed as async and can be invoked both ways."""
+    mock_client.return_value.get_all_topics.return_value = [{"topic_id": 1}]
 
-    # Reset the mock to test the actual implementation
-    provider._run_async = AlloraActionProvider._run_async.__get__(provider, AlloraActionProvider)
+    action = next(a for a in provider.get_actions(None) if a.name.endswith("get_all_topics"))
 
-    # Test that _run_async correctly runs the coroutine
-    result = provider._run_async(mock_coro())
-    assert result == "test_result"
+    assert action.async_invoke is not None
+    assert "The available topics" in action.invoke({})
+    assert "The available topics" in asyncio.run(action.ainvoke({}))
@@ -11,6 +11,7 @@ Optional configuration via environment variables:
 - ALLORA_CHAIN_SLUG: Chain slug to use (testnet or mainnet)
 """
 
+import asyncio
 import json
 
 import pytest
@@ -25,7 +26,7 @@ pytestmark = pytest.mark.integration
 
 def test_get_all_topics_integration(integration_provider):
     """Test getting all topics from the Allora API."""
-    result = integration_provider.get_all_topics({})
+    result = asyncio.run(integration_provider.get_all_topics({}))
 
     # Check that the response contains the expected text
     assert (
@@ -58,7 +59,7 @@ def test_get_all_topics_integration(integration_provider):
 def test_get_inference_by_topic_id_integration(integration_provider):
     """Test getting inference by topic ID from the Allora API."""
     # First, get all topics to find a valid topic ID
-    all_topics_result = integration_provider.get_all_topics({})
+    all_topics_result = asyncio.run(integration_provider.get_all_topics({}))
 
     # If there's an error, we can't test further
     if "Error getting all topics:" in all_topics_result:
@@ -84,7 +85,7 @@ def test_get_inference_by_topic_id_integration(integration_provider):
     topic_id = active_topics[0]["topic_id"]
 
     # Now test getting inference for this topic
-    result = integration_provider.get_inference_by_topic_id({"topic_id": topic_id})
+    result = asyncio.run(integration_provider.get_inference_by_topic_id({"topic_id": topic_id}))
 
     # Check that the response contains the expected text
     assert (
@@ -115,11 +116,13 @@ def test_get_price_inference_btc_integration(integration_provider):
     asset = "BTC"
     timeframe = "8h"
 
-    result = integration_provider.get_price_inference(
-        {
-            "asset": asset,
-            "timeframe": timeframe,
-        }
+    result = asyncio.run(
+        integration_provider.get_price_inference(
+            {
+                "asset": asset,
+                "timeframe": timeframe,
+            }
+        )
     )
 
     print(f"Result: {result}")
@@ -157,11 +160,13 @@ def test_get_price_inference_eth_integration(integration_provider):
     asset = "ETH"
     timeframe = "8h"
 
-    result = integration_provider.get_price_inference(
-        {
-            "asset": asset,
-            "timeframe": timeframe,
-        }
+    result = asyncio.run(
+        integration_provider.get_price_inference(
+            {
+                "asset": asset,
+                "timeframe": timeframe,
+            }
+        )
     )
 
     # Check that the response contains the expected text or an error
@@ -196,7 +201,9 @@ def test_error_handling_invalid_topic_id(integration_provider):
     # Use a very large topic ID that is unlikely to exist
     invalid_topic_id = 999999999
 
-    result = integration_provider.get_inference_by_topic_id({"topic_id": invalid_topic_id})
+    result = asyncio.run(
+        integration_provider.get_inference_by_topic_id({"topic_id": invalid_topic_id})
+    )
 
     # Check that the response contains an error message
     assert f"Error getting inference for topic {invalid_topic_id}:" in result
@@ -224,11 +231,13 @@ def test_get_price_inference_unsupported_values(integration_provider):
     asset = "SOL"
     timeframe = "24h"
 
-    result = integration_provider.get_price_inference(
-        {
-            "asset": asset,
-            "timeframe": timeframe,
-        }
+    result = asyncio.run(
+        integration_provider.get_price_inference(
+            {
+                "asset": asset,
+                "timeframe": timeframe,
+            }
+        )
     )
 
     # Check that the response contains an error message
@@ -243,11 +252,13 @@ def test_get_price_inference_unsupported_values(integration_provider):
     asset = "BTC"
     timeframe = "24h"
 
-    result = integration_provider.get_price_inference(
-        {
-            "asset": asset,
-            "timeframe": timeframe,
-        }
+    result = asyncio.run(
+        integration_provider.get_price_inference(
+            {
+                "asset": asset,
+                "timeframe": timeframe,
+            }
+        )
     )
 
     # Check that the response contains an error message
@@ -5,6 +5,7 @@ import pytest
 from coinbase_agentkit.action_providers.compound.compound_action_provider import (
     CompoundActionProvider,
 )
+from coinbase_agentkit.action_providers.compound.snapshot import CompoundPositionSnapshot
 
 
 @pytest.fixture
@@ -31,3 +32,14 @@ def compound_wallet():
     fake_receipt.transaction_link = "http://example.com/tx/0xTxHash"
     wallet.wait_for_transaction_receipt.return_value = fake_receipt
     return wallet
+
+
+def make_position(health_ratio, projected_health_ratio=None, base_token="0xBaseToken"):
+    """Create a mock position snapshot with the given current and projected health."""
+    position = MagicMock(spec=CompoundPositionSnapshot)
+    position.base_token = base_token
+    position.base_decimals = 6
+    position.health_ratio.return_value = health_ratio
+    position.health_ratio_after_borrow.return_value = projected_health_ratio
+    position.health_ratio_after_withdraw.return_value = projected_health_ratio
+    return position
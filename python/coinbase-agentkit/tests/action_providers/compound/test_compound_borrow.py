@@ -1,6 +1,8 @@
 from decimal import Decimal
 from unittest.mock import MagicMock, patch
 
+from .conftest import make_position
+
 
 def test_borrow_action_success(compound_wallet, compound_provider):
     """Test that the borrow action in CompoundActionProvider successfully borrows USDC."""
@@ -8,27 +10,22 @@ def test_borrow_action_success(compound_wallet, compound_provider):
     input_args = {"asset_id": "usdc", "amount": "1000"}
 
     with (
-        patch(
-            "coinbase_agentkit.action_providers.compound.compound_action_provider.get_base_token_address",
-            return_value="0xBaseToken",
-        ),
         patch(
             "coinbase_agentkit.action_providers.compound.compound_action_provider.format_amount_with_decimals"
         ) as mock_format_amount_with_decimals,
         patch(
-            "coinbase_agentkit.action_providers.compound.compound_action_provider.get_health_ratio_after_borrow"
-        ) as mock_get_health_ratio_after_borrow,
-        patch(
-            "coinbase_agentkit.action_providers.compound.compound_action_provider.get_health_ratio"
-        ) as mock_get_health_ratio,
+            "coinbase_agentkit.action_providers.compound.compound_action_provider.get_position_snapshot"
+        ) as mock_get_position_snapshot,
         patch(
             "coinbase_agentkit.action_providers.compound.compound_action_provider.Web3"
         ) as mock_web3,
     ):
         atomic_amount = 1000000000  # 1000 USDC with 6 decimals
         mock_format_amount_with_decimals.return_value = atomic_amount
-        mock_get_health_ratio.side_effect = [Decimal("Infinity"), Decimal("2.0")]
-        mock_get_health_ratio_after_borrow.return_value = Decimal("2.0")
+        mock_get_position_snapshot.side_effect = [
+            make_position(Decimal("Infinity"), Decimal("2.0")),
+            make_position(Decimal("2.0")),
+        ]
 
         fake_contract = MagicMock()
         fake_contract.encode_abi.return_value = "encoded_borrow_data"
@@ -60,16 +57,12 @@ def test_borrow_unhealthy_position(compound_wallet, compound_provider):
             "coinbase_agentkit.action_providers.compound.compound_action_provider.format_amount_with_decimals"
         ) as mock_format_amount_with_decimals,
         patch(
-            "coinbase_agentkit.action_providers.compound.compound_action_provider.get_health_ratio_after_borrow"
-        ) as mock_get_health_ratio_after_borrow,
-        patch(
-            "coinbase_agentkit.action_providers.compound.compound_action_provider.get_health_ratio"
-        ) as mock_get_health_ratio,
+            "coinbase_agentkit.action_providers.compound.compound_action_provider.get_position_snapshot"
+        ) as mock_get_position_snapshot,
     ):
         atomic_amount = 1000000000
         mock_format_amount_with_decimals.return_value = atomic_amount
-        mock_get_health_ratio.return_value = Decimal("2.0")
-        mock_get_health_ratio_after_borrow.return_value = Decimal("0.8")
+        mock_get_position_snapshot.return_value = make_position(Decimal("2.0"), Decimal("0.8"))
 
         result = provider.borrow(compound_wallet, input_args)
 
@@ -87,19 +80,15 @@ def test_borrow_transaction_failure(compound_wallet, compound_provider):
             "coinbase_agentkit.action_providers.compound.compound_action_provider.format_amount_with_decimals"
         ) as mock_format_amount_with_decimals,
         patch(
-            "coinbase_agentkit.action_providers.compound.compound_action_provider.get_health_ratio_after_borrow"
-        ) as mock_get_health_ratio_after_borrow,
-        patch(
-            "coinbase_agentkit.action_providers.compound.compound_action_provider.get_health_ratio"
-        ) as mock_get_health_ratio,
+            "coinbase_agentkit.action_providers.compound.compound_action_provider.get_position_snapshot"
+        ) as mock_get_position_snapshot,
         patch(
             "coinbase_agentkit.action_providers.compound.compound_action_provider.Web3"
         ) as mock_web3,
     ):
         atomic_amount = 1000000000
         mock_format_amount_with_decimals.return_value = atomic_amount
-        mock_get_health_ratio.return_value = Decimal("2.0")
-        mock_get_health_ratio_after_borrow.return_value = Decimal("1.5")
+        mock_get_position_snapshot.return_value = make_position(Decimal("2.0"), Decimal("1.5"))
 
         fake_contract = MagicMock()
         fake_contract.encode_abi.return_value = "encoded_borrow_data"
@@ -119,9 +108,15 @@ def test_borrow_general_error(compound_wallet, compound_provider):
     provider = compound_provider
     input_args = {"asset_id": "usdc", "amount": "1000"}
 
-    with patch(
-        "coinbase_agentkit.action_providers.compound.compound_action_provider.format_amount_with_decimals"
-    ) as mock_format_amount_with_decimals:
+    with (
+        patch(
+            "coinbase_agentkit.action_providers.compound.compound_action_provider.get_position_snapshot",
+            return_value=make_position(Decimal("2.0")),
+        ),
+        patch(
+            "coinbase_agentkit.action_providers.compound.compound_action_provider.format_amount_with_decimals"
+        ) as mock_format_amount_with_decimals,
+    ):
         mock_format_amount_with_decimals.side_effect = Exception("Unexpected error occurred")
 
         result = provider.borrow(compound_wallet, input_args)
@@ -0,0 +1,171 @@
+"""Tests for the vectorized Compound health simulation."""
+
+from decimal import Decimal
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from coinbase_agentkit.action_providers.compound.simulation import simulate_health
+from coinbase_agentkit.action_providers.compound.snapshot import (
+    CompoundAssetPosition,
+    CompoundPositionSnapshot,
+)
+
+WETH = "0xWeth"
+CBBTC = "0xCbbtc"
+
+
+def _position(borrow_balance=500 * 10**6):
+    """Create a position with 1 WETH at $2000 and 0.01 cbBTC at $60000 against USDC."""
+    return CompoundPositionSnapshot(
+        comet_address="0xComet",
+        account="0xWallet",
+        block_number=1,
+        base_token="0xUsdc",
+        base_symbol="USDC",
+        base_decimals=6,
+        base_price=Decimal(1),
+        borrow_balance=borrow_balance,
+        assets=[
+            CompoundAssetPosition(
+                address=WETH,
+                symbol="WETH",
+                decimals=18,
+                balance=10**18,
+                price=Decimal(2000),
+                collateral_factor=Decimal("0.8"),
+                liquidate_collateral_factor=Decimal("0.85"),
+            ),
+            CompoundAssetPosition(
+                address=CBBTC,
+                symbol="cbBTC",
+                decimals=8,
+                balance=10**6,
+                price=Decimal(60000),
+                collateral_factor=Decimal("0.7"),
+                liquidate_collateral_factor=Decimal("0.75"),
+            ),
+            CompoundAssetPosition(
+                address="0xCbeth",
+                symbol="cbETH",
+                decimals=18,
+                balance=0,
+                price=Decimal(2100),
+                collateral_factor=Decimal("0.75"),
+                liquidate_collateral_factor=Decimal("0.8"),
+            ),
+        ],
+    )
+
+
+def test_matches_scalar_health_ratios():
+    """Test that the vectorized health ratios match the snapshot's scalar projections."""
+    position = _position()
+    borrows = [0, 100, 1000, 2000]
+    withdrawals = [0, 0.25, 0.5, 1]
+
+    simulation = simulate_health(
+        position, borrow_amounts=borrows, withdraw_asset=WETH, withdraw_amounts=withdrawals
+    )
+
+    assert simulation.borrow_health_ratios.shape == (1, 4)
+    assert simulation.withdraw_health_ratios.shape == (1, 4)
+    for amount, health in zip(borrows, simulation.borrow_health_ratios[0], strict=True):
+        expected = position.health_ratio_after_borrow(amount * 10**6)
+        assert health == pytest.approx(float(expected))
+    for amount, health in zip(withdrawals, simulation.withdraw_health_ratios[0], strict=True):
+        expected = position.health_ratio_after_withdraw(WETH, int(amount * 10**18))
+        assert health == pytest.approx(float(expected))
+
+
+def test_price_shocks_scale_collateral():
+    """Test that price shocks scale health and safe borrow along the first axis."""
+    simulation = simulate_health(
+        _position(), borrow_amounts=[0], price_shocks=[0.0, -0.5], target_health=1.0
+    )
+
+    # Adjusted collateral is 2000 * 0.8 + 600 * 0.7 = 2020
+    assert simulation.borrow_health_ratios[:, 0] == pytest.approx([2020 / 500, 1010 / 500])
+    assert simulation.max_safe_borrow == pytest.approx([1520, 510])
+
+
+def test_max_safe_withdraw_per_asset():
+    """Test the largest withdrawal of each supplied asset that keeps the target health."""
+    simulation = simulate_health(_position(), price_shocks=[0.0], target_health=2.0)
+
+    assert simulation.asset_symbols == ["WETH", "cbBTC"]
+    # 2020 - 2 * 500 = 1020 of headroom, worth 1020 / 1600 WETH and capped at 0.01 cbBTC
+    assert simulation.max_safe_withdraw[0] == pytest.approx([1020 / 1600, 0.01])
+
+    position = _position()
+    after = position.health_ratio_after_withdraw(WETH, int(1020 / 1600 * 10**18))
+    assert float(after) == pytest.approx(2.0)
+
+
+def test_liquidation_prices():
+    """Test liquidation prices per asset and the uniform liquidation shock."""
+    simulation = simulate_health(_position(borrow_balance=2000 * 10**6))
+
+    # Liquidation collateral: WETH 1700, cbBTC 450
+    assert simulation.liquidation_prices == pytest.approx(
+        [(2000 - 450) / 0.85, (2000 - 1700) / 0.0075]
+    )
+    assert simulation.liquidation_shock == pytest.approx(2000 / 2150 - 1)
+
+
+def test_no_borrows():
+    """Test a position without borrows."""
+    simulation = simulate_health(_position(borrow_balance=0), borrow_amounts=[0, 100])
+
+    assert np.isinf(simulation.borrow_health_ratios[0, 0])
+    assert simulation.borrow_health_ratios[0, 1] == pytest.approx(20.2)
+    assert simulation.max_safe_withdraw[0] == pytest.approx([1, 0.01])
+    assert simulation.liquidation_shock is None
+
+
+def test_withdraw_amounts_require_asset():
+    """Test that withdrawals need a supplied asset."""
+    with pytest.raises(ValueError, match="withdraw_asset"):
+        simulate_health(_position(), withdraw_amounts=[1])
+    with pytest.raises(ValueError, match="No supplied collateral"):
+        simulate_health(_position(), withdraw_asset="0xCbeth", withdraw_amounts=[1])
+
+
+def test_simulate_position_action(compound_wallet, compound_provider):
+    """Test that the action answers from one snapshot."""
+    compound_provider._get_asset_address = lambda network, asset_id: WETH
+
+    with patch(
+        "coinbase_agentkit.action_providers.compound.compound_action_provider.get_position_snapshot",
+        return_value=_position(),
+    ) as mock_get_position_snapshot:
+        result = compound_provider.simulate_position(
+            compound_wallet,
+            {
+                "borrow_amounts": ["100"],
+                "withdraw_asset_id": "weth",
+                "withdraw_amounts": ["0.5"],
+                "price_shocks": [0, -10],
+            },
+        )
+
+    mock_get_position_snapshot.assert_called_once_with(compound_wallet, "0xComet")
+    assert "- **Current Health Ratio:** 4.04" in result
+    assert "## Collateral Price Change: -10.00%" in result
+    assert "- **Max Safe Borrow:** 1520.000000 USDC" in result
+    assert "- Borrow 100 USDC: health ratio 3.37" in result
+    assert "- Withdraw 0.5 WETH: health ratio 2.44" in result
+    assert "- **WETH Liquidation Price:** $58.82" in result
+    assert "- **cbBTC Liquidation Price:** $0.00" in result
+
+
+def test_simulate_position_error(compound_wallet, compound_provider):
+    """Test that simulation errors are reported."""
+    with patch(
+        "coinbase_agentkit.action_providers.compound.compound_action_provider.get_position_snapshot",
+        side_effect=Exception("RPC down"),
+    ):
+        result = compound_provider.simulate_position(compound_wallet, {})
+
+    assert result == "Error simulating Compound position: RPC down"
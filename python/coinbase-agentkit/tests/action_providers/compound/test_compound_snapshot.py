@@ -0,0 +1,170 @@
+"""Tests for Compound position snapshots."""
+
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+import pytest
+
+from coinbase_agentkit.action_providers.compound.snapshot import get_position_snapshot
+from coinbase_agentkit.action_providers.compound.utils import (
+    get_borrow_details,
+    get_health_ratio,
+    get_health_ratio_after_borrow,
+    get_health_ratio_after_withdraw,
+    get_portfolio_details_markdown,
+    get_supply_details,
+)
+from coinbase_agentkit.wallet_providers import ContractCallResult
+
+BLOCK_NUMBER = 1234
+WETH = "0xWeth"
+CBBTC = "0xCbbtc"
+
+TOKENS = {
+    "0xUsdc": ("USDC", 6),
+    WETH: ("WETH", 18),
+    CBBTC: ("cbBTC", 8),
+}
+PRICES = {"0xUsdcFeed": 1 * 10**8, "0xWethFeed": 2000 * 10**8, "0xCbbtcFeed": 60000 * 10**8}
+ASSET_INFOS = [
+    (0, WETH, "0xWethFeed", 10**18, 8 * 10**17, 85 * 10**16, 0, 0),
+    (1, CBBTC, "0xCbbtcFeed", 10**8, 7 * 10**17, 75 * 10**16, 0, 0),
+]
+COLLATERAL = {WETH: 10**18, CBBTC: 0}
+
+
+def _answer(call):
+    """Answer a contract call against the fake market."""
+    name, args = call.function_name, call.args or []
+    if name == "numAssets":
+        return len(ASSET_INFOS)
+    if name == "baseToken":
+        return "0xUsdc"
+    if name == "baseTokenPriceFeed":
+        return "0xUsdcFeed"
+    if name == "borrowBalanceOf":
+        return 500 * 10**6
+    if name == "getAssetInfo":
+        return ASSET_INFOS[args[0]]
+    if name == "collateralBalanceOf":
+        return COLLATERAL[args[1]]
+    if name == "symbol":
+        return TOKENS[call.contract_address][0]
+    if name == "decimals":
+        return TOKENS[call.contract_address][1]
+    if name == "name":
+        raise AssertionError("name is read with allow_failure")
+    if name == "latestRoundData":
+        return (0, PRICES[call.contract_address], 0, 0, 0)
+    raise AssertionError(f"unexpected call {name}")
+
+
+@pytest.fixture
+def wallet():
+    """Create a mock wallet that answers batched reads from the fake market."""
+    wallet = MagicMock()
+    wallet.get_address.return_value = "0xWallet"
+    wallet.get_block_number.return_value = BLOCK_NUMBER
+    wallet.read_contracts.side_effect = lambda calls, block_identifier="latest": [
+        _result(call) for call in calls
+    ]
+    return wallet
+
+
+def _result(call):
+    try:
+        return ContractCallResult(success=True, result=_answer(call))
+    except AssertionError:
+        if not call.allow_failure:
+            raise
+        return ContractCallResult(success=False, result=None)
+
+
+def test_snapshot_reads_in_three_pinned_batches(wallet):
+    """Test that the snapshot is read in three batches at one block once tokens are known."""
+    snapshot = get_position_snapshot(wallet, "0xComet")
+
+    # Unknown tokens cost one extra batch for their metadata
+    assert wallet.read_contracts.call_count == 4
+    wallet.read_contracts.reset_mock()
+
+    snapshot = get_position_snapshot(wallet, "0xComet")
+
+    assert wallet.read_contracts.call_count == 3
+    for read in wallet.read_contracts.call_args_list:
+        assert read.kwargs["block_identifier"] == BLOCK_NUMBER
+    wallet.read_contract.assert_not_called()
+
+    assert snapshot.block_number == BLOCK_NUMBER
+    assert snapshot.base_symbol == "USDC"
+    assert snapshot.base_decimals == 6
+    assert snapshot.borrow_amount == Decimal(500)
+    assert [asset.symbol for asset in snapshot.supplied_assets] == ["WETH"]
+    assert snapshot.get_asset(CBBTC).decimals == 8
+    assert snapshot.get_asset(CBBTC).collateral_factor == Decimal("0.7")
+    assert snapshot.get_asset(CBBTC).liquidate_collateral_factor == Decimal("0.75")
+
+
+def test_snapshot_reads_latest_without_block_number(wallet):
+    """Test that wallets without block numbers read the latest block."""
+    wallet.get_block_number.return_value = None
+
+    snapshot = get_position_snapshot(wallet, "0xComet")
+
+    assert snapshot.block_number is None
+    assert wallet.read_contracts.call_args.kwargs["block_identifier"] == "latest"
+
+
+def test_health_ratios(wallet):
+    """Test current and projected health ratios computed from one snapshot."""
+    snapshot = get_position_snapshot(wallet, "0xComet")
+
+    assert snapshot.health_ratio() == Decimal("3.2")
+    assert snapshot.health_ratio_after_borrow(300 * 10**6) == Decimal("2")
+    assert snapshot.health_ratio_after_withdraw(WETH, 5 * 10**17) == Decimal("1.6")
+    assert snapshot.health_ratio_after_withdraw(CBBTC, 10**8) == Decimal("3.2")
+    assert wallet.read_contracts.call_count == 4
+
+
+def test_health_ratio_without_borrows(wallet):
+    """Test that a position without borrows is infinitely healthy."""
+    snapshot = get_position_snapshot(wallet, "0xComet").model_copy(update={"borrow_balance": 0})
+
+    assert snapshot.health_ratio() == Decimal("Infinity")
+    assert snapshot.health_ratio_after_borrow(1) > 0
+
+
+def test_utils_compute_from_snapshot(wallet):
+    """Test that the wallet-level helpers keep their results."""
+    assert get_health_ratio(wallet, "0xComet") == Decimal("3.2")
+    assert get_health_ratio_after_borrow(wallet, "0xComet", "300000000") == Decimal("2")
+    assert get_health_ratio_after_withdraw(wallet, "0xComet", WETH, str(5 * 10**17)) == Decimal(
+        "1.6"
+    )
+    assert get_borrow_details(wallet, "0xComet") == {
+        "Token Symbol": "USDC",
+        "Borrow Amount": Decimal(500),
+        "Price": Decimal(1),
+    }
+    assert get_supply_details(wallet, "0xComet") == [
+        {
+            "Token Symbol": "WETH",
+            "Supply Amount": Decimal(1),
+            "Price": Decimal(2000),
+            "Collateral Factor": Decimal("0.8"),
+            "Decimals": 18,
+        }
+    ]
+
+
+def test_portfolio_markdown(wallet):
+    """Test that the portfolio markdown is built from a single snapshot."""
+    markdown = get_portfolio_details_markdown(wallet, "0xComet")
+
+    assert wallet.read_contracts.call_count == 4
+    assert "### WETH\n- **Supply Amount:** 1.000000000000000000\n" in markdown
+    assert "- **Asset Value:** $2000.00" in markdown
+    assert "### Total Supply Value: $2000.00" in markdown
+    assert "- **Borrow Amount:** 500.000000" in markdown
+    assert "- **Health Ratio:** 3.20" in markdown
+    assert "cbBTC" not in markdown
@@ -17,6 +17,7 @@ from coinbase_agentkit.action_providers.compound.utils import (
     get_token_symbol,
 )
 from coinbase_agentkit.action_providers.erc20.constants import ERC20_ABI
+from coinbase_agentkit.wallet_providers import ContractCallResult
 
 
 def test_format_amount_with_decimals():
@@ -77,36 +78,48 @@ def test_get_collateral_balance():
     assert balance == 5000
 
 
+def _metadata_results(decimals, symbol):
+    return [
+        ContractCallResult(success=True, result=decimals),
+        ContractCallResult(success=True, result=symbol),
+        ContractCallResult(success=False, result=None),
+    ]
+
+
 def test_get_token_decimals():
-    """Test that get_token_decimals returns a predetermined value."""
+    """Test that get_token_decimals reads a token once and then uses the registry."""
     # Create a mock wallet
     mock_wallet = MagicMock()
 
-    # Set up the mock to return decimals
-    mock_wallet.read_contract.return_value = 18
+    # Set up the mock to return the token metadata
+    mock_wallet.read_contracts.return_value = _metadata_results(18, "WETH")
 
     decimals = get_token_decimals(mock_wallet, "0xToken")
 
-    # Verify the correct method was called
-    mock_wallet.read_contract.assert_called_once_with("0xToken", ERC20_ABI, "decimals")
+    # Verify the metadata was read in one batch
+    calls = mock_wallet.read_contracts.call_args.args[0]
+    assert [c.function_name for c in calls] == ["decimals", "symbol", "name"]
+    assert all(c.contract_address == "0xToken" and c.abi == ERC20_ABI for c in calls)
 
     assert decimals == 18
+    assert get_token_decimals(mock_wallet, "0xToken") == 18
+    mock_wallet.read_contracts.assert_called_once()
+    mock_wallet.read_contract.assert_not_called()
 
 
 def test_get_token_symbol():
-    """Test that get_token_symbol returns a predetermined symbol."""
+    """Test that get_token_symbol returns the symbol from the registry."""
     # Create a mock wallet
     mock_wallet = MagicMock()
 
-    # Set up the mock to return a symbol
-    mock_wallet.read_contract.return_value = "WETH"
+    # Set up the mock to return the token metadata
+    mock_wallet.read_contracts.return_value = _metadata_results(18, "WETH")
 
     symbol = get_token_symbol(mock_wallet, "0xToken")
 
-    # Verify the correct method was called
-    mock_wallet.read_contract.assert_called_once_with("0xToken", ERC20_ABI, "symbol")
-
     assert symbol == "WETH"
+    assert get_token_decimals(mock_wallet, "0xToken") == 18
+    mock_wallet.read_contracts.assert_called_once()
 
 
 def test_get_token_balance():
@@ -1,5 +1,7 @@
 from unittest.mock import MagicMock, patch
 
+from .conftest import make_position
+
 
 def test_withdraw_action_success(compound_wallet, compound_provider):
     """Test that the withdraw action in CompoundActionProvider successfully withdraws collateral."""
@@ -20,11 +22,8 @@ def test_withdraw_action_success(compound_wallet, compound_provider):
             "coinbase_agentkit.action_providers.compound.compound_action_provider.format_amount_from_decimals"
         ) as mock_format_amount_from_decimals,
         patch(
-            "coinbase_agentkit.action_providers.compound.compound_action_provider.get_health_ratio_after_withdraw"
-        ) as mock_get_health_ratio_after_withdraw,
-        patch(
-            "coinbase_agentkit.action_providers.compound.compound_action_provider.get_health_ratio"
-        ) as mock_get_health_ratio,
+            "coinbase_agentkit.action_providers.compound.compound_action_provider.get_position_snapshot"
+        ) as mock_get_position_snapshot,
         patch(
             "coinbase_agentkit.action_providers.compound.compound_action_provider.get_token_symbol"
         ) as mock_get_token_symbol,
@@ -38,8 +37,7 @@ def test_withdraw_action_success(compound_wallet, compound_provider):
         mock_format_amount_with_decimals.return_value = atomic_amount
         mock_get_collateral_balance.return_value = atomic_amount
         mock_format_amount_from_decimals.return_value = "1000"
-        mock_get_health_ratio_after_withdraw.return_value = 1.5
-        mock_get_health_ratio.side_effect = [2.0, 3.0]
+        mock_get_position_snapshot.side_effect = [make_position(2.0, 1.5), make_position(3.0)]
         mock_get_token_symbol.return_value = "USDC"
 
         fake_contract = MagicMock()
@@ -114,15 +112,15 @@ def test_withdraw_unhealthy_position(compound_wallet, compound_provider):
             "coinbase_agentkit.action_providers.compound.compound_action_provider.get_collateral_balance"
         ) as mock_get_collateral_balance,
         patch(
-            "coinbase_agentkit.action_providers.compound.compound_action_provider.get_health_ratio_after_withdraw"
-        ) as mock_get_health_ratio_after_withdraw,
+            "coinbase_agentkit.action_providers.compound.compound_action_provider.get_position_snapshot"
+        ) as mock_get_position_snapshot,
     ):
         token_decimals = 6
         atomic_amount = 1000000000  # 1000 USDC
         mock_get_token_decimals.return_value = token_decimals
         mock_format_amount_with_decimals.return_value = atomic_amount
         mock_get_collateral_balance.return_value = atomic_amount * 2
-        mock_get_health_ratio_after_withdraw.return_value = 0.8
+        mock_get_position_snapshot.return_value = make_position(2.0, 0.8)
 
         result = provider.withdraw(compound_wallet, input_args)
 
@@ -146,11 +144,8 @@ def test_withdraw_transaction_failure(compound_wallet, compound_provider):
             "coinbase_agentkit.action_providers.compound.compound_action_provider.get_collateral_balance"
         ) as mock_get_collateral_balance,
         patch(
-            "coinbase_agentkit.action_providers.compound.compound_action_provider.get_health_ratio_after_withdraw"
-        ) as mock_get_health_ratio_after_withdraw,
-        patch(
-            "coinbase_agentkit.action_providers.compound.compound_action_provider.get_health_ratio"
-        ) as mock_get_health_ratio,
+            "coinbase_agentkit.action_providers.compound.compound_action_provider.get_position_snapshot"
+        ) as mock_get_position_snapshot,
         patch(
             "coinbase_agentkit.action_providers.compound.compound_action_provider.Web3"
         ) as mock_web3,
@@ -160,8 +155,7 @@ def test_withdraw_transaction_failure(compound_wallet, compound_provider):
         mock_get_token_decimals.return_value = token_decimals
         mock_format_amount_with_decimals.return_value = atomic_amount
         mock_get_collateral_balance.return_value = atomic_amount * 2
-        mock_get_health_ratio_after_withdraw.return_value = 1.5
-        mock_get_health_ratio.return_value = 2.0
+        mock_get_position_snapshot.return_value = make_position(2.0, 1.5)
 
         fake_contract = MagicMock()
         fake_contract.encode_abi.return_value = "encoded_withdraw_data"
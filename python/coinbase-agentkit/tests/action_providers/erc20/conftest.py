@@ -4,6 +4,8 @@ from unittest.mock import Mock
 
 import pytest
 
+from coinbase_agentkit.network import Network
+from coinbase_agentkit.wallet_providers import ContractCallResult
 from coinbase_agentkit.wallet_providers.evm_wallet_provider import EvmWalletProvider
 
 MOCK_AMOUNT = "1000000000000000000"
@@ -18,5 +20,13 @@ def mock_wallet():
     """Create a mock wallet provider."""
     mock = Mock(spec=EvmWalletProvider)
     mock.get_address.return_value = MOCK_ADDRESS
-    mock.read_contract.side_effect = [int(MOCK_AMOUNT), MOCK_DECIMALS]
+    mock.get_network.return_value = Network(
+        protocol_family="evm", network_id="base-sepolia", chain_id="84532"
+    )
+    mock.read_contract.return_value = int(MOCK_AMOUNT)
+    mock.read_contracts.return_value = [
+        ContractCallResult(success=True, result=MOCK_DECIMALS),
+        ContractCallResult(success=True, result="TKN"),
+        ContractCallResult(success=True, result="Token"),
+    ]
     return mock
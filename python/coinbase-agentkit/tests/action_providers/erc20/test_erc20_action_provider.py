@@ -1,7 +1,5 @@
 """Tests for the ERC20 action provider."""
 
-from unittest.mock import call
-
 import pytest
 from web3 import Web3
 
@@ -40,28 +38,33 @@ def test_get_balance_success(mock_wallet):
 
     response = provider.get_balance(mock_wallet, args)
 
-    mock_wallet.read_contract.assert_has_calls(
-        [
-            call(
-                contract_address=MOCK_CONTRACT_ADDRESS,
-                abi=ERC20_ABI,
-                function_name="balanceOf",
-                args=[mock_wallet.get_address()],
-            ),
-            call(
-                contract_address=MOCK_CONTRACT_ADDRESS,
-                abi=ERC20_ABI,
-                function_name="decimals",
-                args=[],
-            ),
-        ]
+    mock_wallet.read_contract.assert_called_once_with(
+        contract_address=MOCK_CONTRACT_ADDRESS,
+        abi=ERC20_ABI,
+        function_name="balanceOf",
+        args=[mock_wallet.get_address()],
     )
+    metadata_calls = mock_wallet.read_contracts.call_args.args[0]
+    assert [c.function_name for c in metadata_calls] == ["decimals", "symbol", "name"]
     assert (
         f"Balance of {MOCK_CONTRACT_ADDRESS} is {int(MOCK_AMOUNT) / 10 ** MOCK_DECIMALS}"
         in response
     )
 
 
+def test_get_balance_reuses_token_metadata(mock_wallet):
+    """Test that token decimals are only read on the first get_balance call."""
+    args = {"contract_address": MOCK_CONTRACT_ADDRESS}
+    provider = erc20_action_provider()
+
+    provider.get_balance(mock_wallet, args)
+    response = provider.get_balance(mock_wallet, args)
+
+    mock_wallet.read_contracts.assert_called_once()
+    assert mock_wallet.read_contract.call_count == 2
+    assert f"is {int(MOCK_AMOUNT) / 10 ** MOCK_DECIMALS}" in response
+
+
 def test_get_balance_error(mock_wallet):
     """Test get_balance with error."""
     args = {"contract_address": MOCK_CONTRACT_ADDRESS}
@@ -0,0 +1,131 @@
+"""Tests for the token metadata registry."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from coinbase_agentkit.action_providers.compound.constants import USDC_ADDRESS
+from coinbase_agentkit.action_providers.erc20.token_metadata import (
+    TokenMetadata,
+    TokenMetadataRegistry,
+    get_token_metadata_registry,
+    prefill_known_tokens,
+    set_token_metadata_registry,
+)
+from coinbase_agentkit.network import Network
+from coinbase_agentkit.wallet_providers import ContractCallResult
+
+TOKENS = {
+    "0xAaaa": (18, "AAA", "Token A"),
+    "0xBbbb": (6, "BBB", None),
+}
+
+
+def _answer(call):
+    decimals, symbol, name = TOKENS[call.contract_address]
+    result = {"decimals": decimals, "symbol": symbol, "name": name}[call.function_name]
+    if result is None:
+        assert call.allow_failure
+        return ContractCallResult(success=False, result=None)
+    return ContractCallResult(success=True, result=result)
+
+
+@pytest.fixture
+def wallet():
+    """Create a mock wallet that answers token metadata reads."""
+    wallet = MagicMock()
+    wallet.get_network.return_value = Network(
+        protocol_family="evm", network_id="base-mainnet", chain_id="8453"
+    )
+    wallet.read_contracts.side_effect = lambda calls: [_answer(call) for call in calls]
+    return wallet
+
+
+def test_get_many_reads_misses_in_one_batch(wallet):
+    """Test that unknown tokens are read in a single batch and then served from memory."""
+    registry = TokenMetadataRegistry()
+
+    a, b, a_again = registry.get_many(wallet, ["0xAaaa", "0xBbbb", "0xAaaa"])
+
+    wallet.read_contracts.assert_called_once()
+    assert len(wallet.read_contracts.call_args.args[0]) == 6
+    assert a == TokenMetadata(
+        chain_id="8453", address="0xAaaa", symbol="AAA", decimals=18, name="Token A"
+    )
+    assert a_again == a
+    assert b.name is None
+
+    assert registry.get_many(wallet, ["0xaaaa", "0xBBBB"])[1].decimals == 6
+    wallet.read_contracts.assert_called_once()
+
+
+def test_failed_decimals_are_not_cached(wallet):
+    """Test that a token whose decimals cannot be read raises and is retried later."""
+    registry = TokenMetadataRegistry()
+    wallet.read_contracts.side_effect = Exception("execution reverted")
+
+    with pytest.raises(Exception, match="execution reverted"):
+        registry.get_many(wallet, ["0xAaaa"])
+
+    assert registry.get("8453", "0xAaaa") is None
+
+
+def test_entries_are_keyed_by_chain(wallet):
+    """Test that the same address on another chain is a different token."""
+    registry = TokenMetadataRegistry()
+    registry.put(TokenMetadata(chain_id="1", address="0xAaaa", symbol="OLD", decimals=8))
+
+    assert registry.get_many(wallet, ["0xAaaa"])[0].symbol == "AAA"
+    assert registry.get("1", "0xAaaa").symbol == "OLD"
+
+
+def test_least_recently_used_tokens_are_evicted():
+    """Test that the in-memory registry is bounded."""
+    registry = TokenMetadataRegistry(max_size=2)
+    for address in ["0x1", "0x2"]:
+        registry.put(TokenMetadata(chain_id="8453", address=address, decimals=18))
+    registry.get("8453", "0x1")
+    registry.put(TokenMetadata(chain_id="8453", address="0x3", decimals=18))
+
+    assert registry.get("8453", "0x2") is None
+    assert registry.get("8453", "0x1") is not None
+    assert registry.get("8453", "0x3") is not None
+
+
+def test_store_is_shared_between_registries(wallet, tmp_path):
+    """Test that registries using the same store read each token only once."""
+    store_path = str(tmp_path / "tokens.sqlite")
+    first = TokenMetadataRegistry(store_path=store_path)
+    first.get_many(wallet, ["0xAaaa"])
+    first.close()
+
+    second = TokenMetadataRegistry(store_path=store_path)
+    metadata = second.get_many(wallet, ["0xAaaa"])[0]
+    second.close()
+
+    wallet.read_contracts.assert_called_once()
+    assert metadata.name == "Token A"
+
+
+def test_known_tokens_are_prefilled():
+    """Test that the tokens listed by the action providers need no reads."""
+    registry = TokenMetadataRegistry()
+    prefill_known_tokens(registry)
+
+    usdc = registry.get("8453", USDC_ADDRESS)
+    assert (usdc.symbol, usdc.decimals) == ("USDC", 6)
+    assert registry.get("84532", "0x4200000000000000000000000000000000000006").decimals == 18
+
+
+def test_default_registry_uses_store_path(monkeypatch, tmp_path):
+    """Test that the shared registry is created from the environment."""
+    store_path = tmp_path / "tokens.sqlite"
+    monkeypatch.setenv("TOKEN_METADATA_STORE_PATH", str(store_path))
+    set_token_metadata_registry(None)
+
+    registry = get_token_metadata_registry()
+
+    assert get_token_metadata_registry() is registry
+    assert registry.get("8453", USDC_ADDRESS).symbol == "USDC"
+    assert store_path.exists()
+    registry.close()
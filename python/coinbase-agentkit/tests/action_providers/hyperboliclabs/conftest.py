@@ -32,8 +32,9 @@ def mock_api_key():
 def mock_request():
     """Mock requests for all tests."""
     with patch(
-        "coinbase_agentkit.action_providers.hyperboliclabs.service.requests.request"
-    ) as mock:
+        "coinbase_agentkit.action_providers.hyperboliclabs.service.get_http_client"
+    ) as mock_get_http_client:
+        mock = mock_get_http_client.return_value.request
         mock.return_value.status_code = 200
         mock.return_value.json.return_value = {"status": "success"}
         mock.return_value.raise_for_status.return_value = None
@@ -51,4 +51,4 @@ def test_factory_function(mock_api_key):
         "coinbase_agentkit.action_providers.hyperboliclabs.marketplace.action_provider.MarketplaceActionProvider"
     ) as mock:
         hyperbolic_marketplace_action_provider(mock_api_key)
-        mock.assert_called_once_with(api_key=mock_api_key)
+        mock.assert_called_once_with(api_key=mock_api_key, http_client=None)
@@ -12,8 +12,9 @@ from coinbase_agentkit.action_providers.hyperboliclabs.service import Base
 def mock_request():
     """Mock the request function for testing."""
     with patch(
-        "coinbase_agentkit.action_providers.hyperboliclabs.service.requests.request"
-    ) as mock:
+        "coinbase_agentkit.action_providers.hyperboliclabs.service.get_http_client"
+    ) as mock_get_http_client:
+        mock = mock_get_http_client.return_value.request
         mock.return_value.status_code = 200
         mock.return_value.json.return_value = {"status": "success"}
         mock.return_value.raise_for_status.return_value = None
@@ -32,8 +33,9 @@ def test_make_request():
     base = Base("test_api_key", "https://api.example.com")
 
     with patch(
-        "coinbase_agentkit.action_providers.hyperboliclabs.service.requests.request"
-    ) as mock_request:
+        "coinbase_agentkit.action_providers.hyperboliclabs.service.get_http_client"
+    ) as mock_get_http_client:
+        mock_request = mock_get_http_client.return_value.request
         mock_response = mock_request.return_value
         mock_response.json.return_value = {"status": "success"}
         mock_response.ok = True
@@ -3,6 +3,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from coinbase_agentkit.action_providers.erc20.token_metadata import TokenMetadata
 from coinbase_agentkit.action_providers.morpho.morpho_action_provider import morpho_action_provider
 from coinbase_agentkit.network import Network
 
@@ -11,14 +12,27 @@ MOCK_TOKEN_ADDRESS = "0x0987654321098765432109876543210987654321"
 MOCK_RECEIVER = "0x5555555555555555555555555555555555555555"
 MOCK_TX_HASH = "0xabcdef1234567890"
 MOCK_DECIMALS = 18
+MOCK_NETWORK = Network(protocol_family="evm", network_id="base-mainnet", chain_id="8453")
+
+
+@pytest.fixture
+def deposit_wallet(token_metadata_registry):
+    """Create a mock wallet for a token whose metadata is already known."""
+    token_metadata_registry.put(
+        TokenMetadata(
+            chain_id=MOCK_NETWORK.chain_id, address=MOCK_TOKEN_ADDRESS, decimals=MOCK_DECIMALS
+        )
+    )
+    mock_wallet = MagicMock()
+    mock_wallet.get_network.return_value = MOCK_NETWORK
+    return mock_wallet
 
 
 # Deposit Tests
-def test_morpho_deposit_success():
+def test_morpho_deposit_success(deposit_wallet):
     """Test successful morpho deposit with valid parameters."""
-    mock_wallet = MagicMock()
+    mock_wallet = deposit_wallet
     mock_wallet.send_transaction.return_value = MOCK_TX_HASH
-    mock_wallet.read_contract.return_value = MOCK_DECIMALS
 
     with patch(
         "coinbase_agentkit.action_providers.morpho.morpho_action_provider.approve"
@@ -41,6 +55,7 @@ def test_morpho_deposit_success():
 
         assert MOCK_TX_HASH in result
         assert "Deposited 1.0" in result
+        mock_wallet.read_contracts.assert_not_called()
         mock_wallet.send_transaction.assert_called_once()
         mock_wallet.wait_for_transaction_receipt.assert_called_once_with(MOCK_TX_HASH)
 
@@ -96,9 +111,9 @@ def test_morpho_deposit_invalid_amount():
         )
 
 
-def test_morpho_deposit_approval_error():
+def test_morpho_deposit_approval_error(deposit_wallet):
     """Test morpho deposit with approval error."""
-    mock_wallet = MagicMock()
+    mock_wallet = deposit_wallet
 
     with patch(
         "coinbase_agentkit.action_providers.morpho.morpho_action_provider.approve"
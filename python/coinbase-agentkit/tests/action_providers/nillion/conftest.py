@@ -6,6 +6,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 TEST_SCHEMA_ID = "1f105829-2698-47e5-8f35-c1665895f501"
+TEST_SCHEMAS_ETAG = '"schemas-v1"'
 TEST_SCHEMA_DEF = """{
   "name": "My names",
   "keys": ["_id"],
@@ -82,7 +83,11 @@ def mock_api_calls():
 
         if "/api/v1/schemas" in url:
             mock_response = MagicMock()
+            if kwargs.get("headers", {}).get("If-None-Match") == TEST_SCHEMAS_ETAG:
+                mock_response.status_code = 304
+                return mock_response
             mock_response.status_code = 200
+            mock_response.headers = {"ETag": TEST_SCHEMAS_ETAG}
             mock_response.json.return_value = {
                 "data": [{"_id": TEST_SCHEMA_ID, **json.loads(TEST_SCHEMA_DEF)}]
             }
@@ -143,7 +148,11 @@ def mock_api_calls():
             mock_response.status_code = 404
             return mock_response
 
-    with patch("requests.post") as mock_post, patch("requests.get") as mock_get:
+    with patch(
+        "coinbase_agentkit.action_providers.nillion.nillion_action_provider.get_http_client"
+    ) as mock_get_http_client:
+        mock_post = mock_get_http_client.return_value.post
+        mock_get = mock_get_http_client.return_value.get
         mock_post.side_effect = _post
         mock_get.side_effect = _get
         yield mock_post, mock_get
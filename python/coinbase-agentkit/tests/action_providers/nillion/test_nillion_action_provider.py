@@ -1,13 +1,19 @@
+import time
+from unittest.mock import MagicMock, patch
 from uuid import UUID
 
+import nilql
 import pytest
 
 from coinbase_agentkit.action_providers.nillion.nillion_action_provider import (
+    TOKEN_LIFETIME,
     NillionActionProvider,
+    NillionUploadError,
     nillion_action_provider,
 )
 from tests.action_providers.nillion.conftest import (
     TEST_SCHEMA_ID,
+    TEST_SCHEMAS_ETAG,
     DummyChatOpenAI,
     DummyChatOpenAILookup,
     DummyChatOpenAISchema,
@@ -82,3 +88,248 @@ def test_action_data_upload():
     assert len(result) > 0
     assert result[0] is not None
     assert isinstance(UUID(result[0]), UUID)
+
+
+@pytest.mark.usefixtures("mock_env")
+def test_nodes_are_read_concurrently(mock_api_calls):
+    """Test that a download waits for the slowest node rather than the sum of all nodes."""
+    mock_post, _ = mock_api_calls
+    provider = nillion_action_provider(DummyChatOpenAI())
+    respond = mock_post.side_effect
+
+    def slow_post(*args, **kwargs):
+        time.sleep(0.3)
+        return respond(*args, **kwargs)
+
+    mock_post.side_effect = slow_post
+    started = time.monotonic()
+    result = provider.data_download(args={"schema_uuid": TEST_SCHEMA_ID})
+    elapsed = time.monotonic() - started
+    provider.close()
+
+    assert result == []
+    assert mock_post.call_count == 1 + len(provider.nodes)
+    assert elapsed < 0.3 * len(provider.nodes)
+    assert all(call.kwargs["timeout"] == 30.0 for call in mock_post.call_args_list[1:])
+
+
+@pytest.mark.usefixtures("mock_env")
+def test_failing_node_fails_fast(mock_api_calls):
+    """Test that one failing node fails the call without waiting for the others."""
+    mock_post, _ = mock_api_calls
+    provider = nillion_action_provider(DummyChatOpenAI())
+    respond = mock_post.side_effect
+    failing_url = provider.nodes[1]["url"]
+
+    def post(*args, **kwargs):
+        if args[0].startswith(failing_url):
+            return MagicMock(status_code=500, content=b"unavailable")
+        time.sleep(1)
+        return respond(*args, **kwargs)
+
+    mock_post.side_effect = post
+    started = time.monotonic()
+    result = provider.data_download(args={"schema_uuid": TEST_SCHEMA_ID})
+    elapsed = time.monotonic() - started
+    provider.close()
+
+    assert result == []
+    assert elapsed < 1
+
+
+def _upload(provider):
+    return provider.data_upload(
+        args={"schema_uuid": TEST_SCHEMA_ID, "data_to_store": [{"_id": "dummy", "name": "dummy"}]}
+    )
+
+
+@pytest.mark.usefixtures("mock_env")
+def test_repeated_uploads_do_no_schema_io(mock_api_calls):
+    """Test that the schema list and validator are reused across uploads."""
+    _, mock_get = mock_api_calls
+    provider = nillion_action_provider(DummyChatOpenAI())
+
+    with patch.object(provider, "_validator_builder", wraps=provider._validator_builder) as builder:
+        assert _upload(provider)
+        assert _upload(provider)
+        assert _upload(provider)
+    provider.close()
+
+    assert mock_get.call_count == 1
+    assert builder.call_count == 1
+
+
+@pytest.mark.usefixtures("mock_env", "mock_api_calls")
+def test_validator_of_a_replaced_schema_list_is_not_cached():
+    """Test that a validator built while the schema list was replaced is not cached."""
+    provider = nillion_action_provider(DummyChatOpenAI())
+    find_schema = provider.find_schema
+
+    def find_schema_then_replace(*args, **kwargs):
+        schema = find_schema(*args, **kwargs)
+        provider.invalidate_schemas()
+        provider.fetch_schemas()
+        return schema
+
+    with patch.object(provider, "find_schema", side_effect=find_schema_then_replace):
+        validator = provider.get_validator(TEST_SCHEMA_ID)
+    cached = provider.get_validator(TEST_SCHEMA_ID)
+    provider.close()
+
+    assert validator is not None
+    assert cached is not validator
+    assert provider._validators == {TEST_SCHEMA_ID: cached}
+
+
+@pytest.mark.usefixtures("mock_env")
+def test_expired_schema_list_is_revalidated(mock_api_calls):
+    """Test that an expired schema list is revalidated with its ETag rather than refetched."""
+    _, mock_get = mock_api_calls
+    provider = nillion_action_provider(DummyChatOpenAI(), schema_cache_ttl=0)
+
+    first = provider.fetch_schemas()
+    second = provider.fetch_schemas()
+    provider.close()
+
+    assert second is first
+    assert mock_get.call_count == 2
+    assert mock_get.call_args.kwargs["headers"]["If-None-Match"] == TEST_SCHEMAS_ETAG
+
+
+@pytest.mark.usefixtures("mock_env")
+def test_created_schema_invalidates_cache(mock_api_calls):
+    """Test that creating a schema makes the next lookup fetch the schema list again."""
+    _, mock_get = mock_api_calls
+    provider = nillion_action_provider(DummyChatOpenAISchema())
+
+    provider.fetch_schemas()
+    provider.create_schema(args={"schema_description": "dummy"})
+    provider.fetch_schemas()
+    provider.close()
+
+    assert mock_get.call_count == 2
+    assert "If-None-Match" not in mock_get.call_args.kwargs["headers"]
+
+
+@pytest.mark.usefixtures("mock_env")
+def test_tokens_are_refreshed_in_the_background(mock_api_calls, monkeypatch):
+    """Test that bearer tokens are re-issued before they expire."""
+    monkeypatch.setattr(
+        "coinbase_agentkit.action_providers.nillion.nillion_action_provider.TOKEN_REFRESH_MARGIN",
+        TOKEN_LIFETIME - 1,
+    )
+    provider = nillion_action_provider(DummyChatOpenAI())
+    first_expiry = provider._tokens_expire_at
+    bearers = [node["bearer"] for node in provider.nodes]
+
+    deadline = time.monotonic() + 5
+    while time.monotonic() < deadline and provider._tokens_expire_at == first_expiry:
+        time.sleep(0.05)
+    provider.close()
+
+    assert provider._tokens_expire_at > first_expiry
+    assert [node["bearer"] for node in provider.nodes] != bearers
+
+
+@pytest.mark.usefixtures("mock_env")
+def test_bulk_upload_is_sent_in_batches(mock_api_calls):
+    """Test that records are uploaded in batches of the configured size."""
+    mock_post, _ = mock_api_calls
+    provider = nillion_action_provider(DummyChatOpenAI(), upload_batch_size=2, encrypt_workers=1)
+
+    records = ({"_id": "dummy", "name": f"name-{i}"} for i in range(5))
+    result = provider.bulk_upload(TEST_SCHEMA_ID, records)
+    provider.close()
+
+    bodies = [c.kwargs["json"] for c in mock_post.call_args_list if "data/create" in c.args[0]]
+    assert [len(body["data"]) for body in bodies] == [2, 2, 1]
+    assert result == [record["_id"] for body in bodies for record in body["data"]]
+    assert len({UUID(record_id) for record_id in result}) == 5
+
+
+@pytest.mark.usefixtures("mock_env")
+def test_bulk_upload_encrypts_in_worker_processes(mock_api_calls):
+    """Test that secret fields encrypted by worker processes can be decrypted again."""
+    mock_post, _ = mock_api_calls
+    provider = nillion_action_provider(DummyChatOpenAI(), upload_batch_size=2, encrypt_workers=2)
+
+    records = [{"_id": "dummy", "name": {"%share": f"secret-{i}"}} for i in range(5)]
+    with patch.object(provider, "get_validator"):
+        result = provider.bulk_upload(TEST_SCHEMA_ID, records)
+    start_method = provider._process_pool._mp_context.get_start_method()
+    provider.close()
+
+    assert start_method == "spawn"
+
+    shares = {}
+    for c in mock_post.call_args_list:
+        if "data/create" in c.args[0]:
+            for share in c.kwargs["json"]["data"]:
+                shares.setdefault(share["_id"], []).append(share)
+    assert list(shares) == result
+    assert all(len(record_shares) == len(provider.nodes) for record_shares in shares.values())
+    assert [nilql.unify(provider.key, shares[record_id])["name"] for record_id in result] == [
+        f"secret-{i}" for i in range(5)
+    ]
+
+
+@pytest.mark.usefixtures("mock_env")
+def test_download_is_filtered_and_paged(mock_api_calls):
+    """Test that the filter is sent to the nodes and records are unified within the page."""
+    mock_post, _ = mock_api_calls
+    provider = nillion_action_provider(DummyChatOpenAI())
+    records = [
+        {"_id": str(i), "name": {"%allot": nilql.encrypt(provider.key, f"secret-{i}")}}
+        for i in range(5)
+    ]
+    node_shares = nilql.allot(records)
+    respond = mock_post.side_effect
+
+    def post(*args, **kwargs):
+        if "data/read" in args[0]:
+            node = next(i for i, n in enumerate(provider.nodes) if args[0].startswith(n["url"]))
+            return MagicMock(status_code=200, json=lambda: {"data": node_shares[node]})
+        return respond(*args, **kwargs)
+
+    mock_post.side_effect = post
+    with patch.object(nilql, "unify", wraps=nilql.unify) as unify:
+        result = provider.data_download(
+            args={"schema_uuid": TEST_SCHEMA_ID, "filter": {"kind": "a"}, "offset": 1, "limit": 2}
+        )
+    provider.close()
+
+    assert [record["name"] for record in result] == ["secret-1", "secret-2"]
+    assert unify.call_count == 2
+    read_bodies = [c.kwargs["json"] for c in mock_post.call_args_list if "data/read" in c.args[0]]
+    assert all(body["filter"] == {"kind": "a"} for body in read_bodies)
+
+
+@pytest.mark.usefixtures("mock_env")
+def test_partial_upload_reports_stored_records(mock_api_calls):
+    """Test that records stored before a failing batch are still reported."""
+    mock_post, _ = mock_api_calls
+    provider = nillion_action_provider(DummyChatOpenAI(), upload_batch_size=2, encrypt_workers=1)
+    respond = mock_post.side_effect
+    creates = []
+
+    def post(*args, **kwargs):
+        if "data/create" in args[0]:
+            creates.append(kwargs["json"])
+            if len(creates) > 1:
+                return MagicMock(status_code=500, content=b"node down")
+        return respond(*args, **kwargs)
+
+    mock_post.side_effect = post
+    records = [{"_id": "dummy", "name": f"name-{i}"} for i in range(5)]
+
+    with pytest.raises(NillionUploadError) as exc_info:
+        provider.bulk_upload(TEST_SCHEMA_ID, [dict(record) for record in records])
+    stored = [record["_id"] for record in creates[0]["data"]]
+    assert exc_info.value.record_uuids == stored
+
+    creates.clear()
+    result = provider.data_upload(args={"schema_uuid": TEST_SCHEMA_ID, "data_to_store": records})
+    provider.close()
+
+    assert result == [record["_id"] for record in creates[0]["data"]]
+    assert len(result) == 2
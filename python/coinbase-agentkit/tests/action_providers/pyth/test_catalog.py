@@ -0,0 +1,137 @@
+"""Tests for the Pyth price feed catalog."""
+
+import json
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from coinbase_agentkit.action_providers.pyth.catalog import PythFeedCatalog
+from coinbase_agentkit.action_providers.pyth.pyth_action_provider import pyth_action_provider
+
+BTC_USD = "e62df6c8b4a85fe1a67db44dc12de5db330f7ac66b72dc658afedf0f4a415b43"
+BTC_EUR = "a1b2c3"
+BTCB_USD = "d4e5f6"
+ETH_USD = "ff61491a931112ddf1bd8147cd1b641375f79f5825126d665480874634fd0ace"
+AAPL_USD = "49f6b65cb1de6b10eaf75e7c03ca029c306d0357e91b5311b175084a5ad55688"
+
+
+def _feed(feed_id: str, asset_type: str, base: str, quote: str) -> dict:
+    return {
+        "id": feed_id,
+        "attributes": {
+            "asset_type": asset_type,
+            "base": base,
+            "quote_currency": quote,
+            "symbol": f"{asset_type}.{base}/{quote}",
+            "display_symbol": f"{base}/{quote}",
+            "generic_symbol": f"{base}{quote}",
+        },
+    }
+
+
+FEEDS = [
+    _feed(BTC_EUR, "Crypto", "BTC", "EUR"),
+    _feed(BTC_USD, "Crypto", "BTC", "USD"),
+    _feed(BTCB_USD, "Crypto", "BTCB", "USD"),
+    _feed(ETH_USD, "Crypto", "ETH", "USD"),
+    _feed(AAPL_USD, "Equity", "AAPL", "USD"),
+]
+
+
+@pytest.fixture
+def fetch_feeds():
+    """Create a fake feed list download."""
+    return MagicMock(return_value=FEEDS)
+
+
+def test_symbols_resolve_from_one_download(fetch_feeds):
+    """Test that every lookup is answered from a single download of the feed list."""
+    catalog = PythFeedCatalog(fetch_feeds=fetch_feeds)
+
+    assert catalog.resolve("btc") == BTC_USD
+    assert catalog.resolve("BTC/EUR") == BTC_EUR
+    assert catalog.resolve("Crypto.ETH/USD") == ETH_USD
+    assert catalog.resolve("ethusd") == ETH_USD
+    assert catalog.resolve("BTC", quote="EUR") == BTC_EUR
+    assert catalog.resolve("AAPL") is None
+    assert catalog.resolve("AAPL", asset_type="equity") == AAPL_USD
+    assert catalog.resolve("DOGE") is None
+    assert catalog.get("0x" + ETH_USD).base == "ETH"
+
+    fetch_feeds.assert_called_once()
+
+
+def test_prefix_search(fetch_feeds):
+    """Test that prefix search returns each matching feed once."""
+    catalog = PythFeedCatalog(fetch_feeds=fetch_feeds)
+
+    assert {feed.id for feed in catalog.search("bt")} == {BTC_EUR, BTC_USD, BTCB_USD}
+    assert [feed.id for feed in catalog.search("btcb")] == [BTCB_USD]
+    assert len(catalog.search("b", limit=2)) == 2
+    assert catalog.search("zzz") == []
+
+
+def test_stale_catalog_refreshes_in_background(fetch_feeds):
+    """Test that a stale catalog keeps answering while it is downloaded again."""
+    catalog = PythFeedCatalog(ttl=0, fetch_feeds=fetch_feeds)
+    catalog.resolve("BTC")
+    catalog._worker.join(timeout=5)
+
+    fetch_feeds.return_value = [_feed("0123", "Crypto", "BTC", "USD")]
+    assert catalog.resolve("BTC") == BTC_USD
+    catalog._worker.join(timeout=5)
+
+    assert catalog.resolve("BTC") == "0123"
+
+
+def test_failed_background_refresh_keeps_the_catalog(fetch_feeds):
+    """Test that a failed refresh is retried later and the old feeds stay usable."""
+    catalog = PythFeedCatalog(ttl=0, fetch_feeds=fetch_feeds, retry_interval=3600)
+    catalog.resolve("BTC")
+    catalog._worker.join(timeout=5)
+
+    fetch_feeds.side_effect = ConnectionError("offline")
+    catalog.resolve("BTC")
+    catalog._worker.join(timeout=5)
+
+    assert catalog.resolve("ETH") == ETH_USD
+    assert not catalog._worker.is_alive()
+    assert fetch_feeds.call_count == 3
+
+
+def test_catalog_warm_starts_from_disk(fetch_feeds, tmp_path):
+    """Test that a saved catalog is used without downloading the feed list again."""
+    store_path = str(tmp_path / "pyth.json")
+    PythFeedCatalog(store_path=store_path, fetch_feeds=fetch_feeds).resolve("BTC")
+
+    with open(store_path, encoding="utf-8") as f:
+        assert len(json.load(f)["feeds"]) == len(FEEDS)
+
+    offline = MagicMock(side_effect=ConnectionError("offline"))
+    assert PythFeedCatalog(store_path=store_path, fetch_feeds=offline).resolve("ETH") == ETH_USD
+    offline.assert_not_called()
+
+
+def test_stale_file_is_served_while_refreshing(fetch_feeds, tmp_path):
+    """Test that a stale saved catalog is served and then replaced in the background."""
+    store_path = tmp_path / "pyth.json"
+    store_path.write_text(json.dumps({"fetched_at": time.time() - 7200, "feeds": FEEDS[:1]}))
+
+    catalog = PythFeedCatalog(store_path=str(store_path), fetch_feeds=fetch_feeds)
+    assert catalog.resolve("BTC") == BTC_EUR
+    catalog._worker.join(timeout=5)
+
+    assert catalog.resolve("BTC") == BTC_USD
+    assert len(json.loads(store_path.read_text())["feeds"]) == len(FEEDS)
+
+
+def test_provider_resolves_from_the_catalog(fetch_feeds):
+    """Test that the action provider looks symbols up in its catalog."""
+    provider = pyth_action_provider(catalog=PythFeedCatalog(fetch_feeds=fetch_feeds))
+
+    assert provider.fetch_price_feed_id({"token_symbol": "ETH"}) == ETH_USD
+    assert provider.fetch_price_feed_id({"token_symbol": "btc"}) == BTC_USD
+    with pytest.raises(ValueError, match="No price feed found for DOGE"):
+        provider.fetch_price_feed_id({"token_symbol": "DOGE"})
+    fetch_feeds.assert_called_once()
@@ -0,0 +1,183 @@
+"""Tests for batched and streaming Pyth price fetching against a local Hermes stub."""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import MagicMock
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from coinbase_agentkit.action_providers.pyth.catalog import PythFeedCatalog
+from coinbase_agentkit.action_providers.pyth.price_service import PythPriceService, format_price
+from coinbase_agentkit.action_providers.pyth.pyth_action_provider import pyth_action_provider
+
+BTC = "e62df6c8b4a85fe1a67db44dc12de5db330f7ac66b72dc658afedf0f4a415b43"
+ETH = "ff61491a931112ddf1bd8147cd1b641375f79f5825126d665480874634fd0ace"
+SOL = "ef0d8b6fda2ceba41da15d4095d1da392a0d2f8ed0c6c7bc0f4cfac8c280b56d"
+PRICES = {BTC: 6500012345678, ETH: 250000000000, SOL: 15012345678}
+
+
+def _update(feed_id: str, price: int, publish_time: int | None = None) -> dict:
+    return {
+        "id": feed_id,
+        "price": {
+            "price": str(price),
+            "conf": "1000",
+            "expo": -8,
+            "publish_time": int(time.time()) if publish_time is None else publish_time,
+        },
+    }
+
+
+class HermesStub(ThreadingHTTPServer):
+    """A local server answering the Hermes latest price and price stream endpoints."""
+
+    daemon_threads = True
+
+    def __init__(self):
+        """Start listening on a free local port."""
+        super().__init__(("127.0.0.1", 0), _HermesHandler)
+        self.requests: list[tuple[str, list[str]]] = []
+        self.stream_updates: list[dict] = []
+        self.publish_time: int | None = None
+
+    @property
+    def url(self) -> str:
+        """The server's base URL."""
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class _HermesHandler(BaseHTTPRequestHandler):
+    def do_GET(self):  # noqa: N802
+        url = urlparse(self.path)
+        ids = parse_qs(url.query).get("ids[]", [])
+        self.server.requests.append((url.path, ids))
+
+        if url.path == "/v2/updates/price/latest":
+            body = json.dumps(
+                {
+                    "parsed": [
+                        _update(feed_id, PRICES[feed_id], self.server.publish_time)
+                        for feed_id in ids
+                        if feed_id in PRICES
+                    ]
+                }
+            ).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        elif url.path == "/v2/updates/price/stream":
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.end_headers()
+            for update in self.server.stream_updates:
+                self.wfile.write(f"data:{json.dumps({'parsed': [update]})}\n\n".encode())
+                self.wfile.flush()
+            time.sleep(0.5)
+        else:
+            self.send_response(404)
+            self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def hermes():
+    """Run a Hermes stub for the duration of a test."""
+    server = HermesStub()
+    thread = threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_many_prices_are_fetched_in_one_request(hermes):
+    """Test that several feeds are fetched together and then served from memory."""
+    service = PythPriceService(base_url=hermes.url)
+
+    prices = service.get_prices([BTC, "0x" + ETH, SOL])
+    assert {feed_id: price.price for feed_id, price in prices.items()} == PRICES
+    assert hermes.requests == [("/v2/updates/price/latest", [BTC, ETH, SOL])]
+
+    assert service.get_price(ETH).format() == "2500.00"
+    assert len(hermes.requests) == 1
+
+
+def test_stale_prices_are_fetched_again(hermes):
+    """Test that only prices older than the staleness bound are fetched again."""
+    service = PythPriceService(base_url=hermes.url, max_staleness=60)
+    hermes.publish_time = int(time.time()) - 120
+    service.get_prices([BTC])
+
+    hermes.publish_time = None
+    service.get_prices([BTC, ETH])
+    service.get_prices([BTC, ETH])
+
+    assert [ids for _, ids in hermes.requests] == [[BTC], [BTC, ETH]]
+
+
+def test_unknown_feed_raises(hermes):
+    """Test that a feed Hermes has no price for is reported."""
+    service = PythPriceService(base_url=hermes.url)
+
+    with pytest.raises(ValueError, match="No price data found for 0xdead"):
+        service.get_price("0xdead")
+
+
+def test_stream_keeps_prices_fresh(hermes):
+    """Test that streamed prices are served without fetching them."""
+    hermes.stream_updates = [_update(BTC, 1), _update(BTC, 7000000000000)]
+    service = PythPriceService(base_url=hermes.url)
+    service.subscribe([BTC])
+
+    deadline = time.time() + 5
+    while time.time() < deadline and service._prices.get(BTC) is None:
+        time.sleep(0.01)
+    while time.time() < deadline and service._prices[BTC].price != 7000000000000:
+        time.sleep(0.01)
+    service.close()
+
+    assert service.get_price(BTC).format() == "70000.00"
+    assert ("/v2/updates/price/stream", [BTC]) in hermes.requests
+    assert not any(path == "/v2/updates/price/latest" for path, _ in hermes.requests)
+
+
+def test_get_prices_action_returns_a_portfolio_in_one_request(hermes):
+    """Test that the action resolves symbols and fetches all prices together."""
+    catalog = MagicMock(spec=PythFeedCatalog)
+    catalog.resolve.side_effect = {"BTC": BTC, "ETH": ETH, "DOGE": None}.get
+    provider = pyth_action_provider(
+        catalog=catalog, price_service=PythPriceService(base_url=hermes.url)
+    )
+
+    result = provider.fetch_prices(
+        {"token_symbols": ["BTC", "ETH", "DOGE"], "price_feed_ids": [SOL]}
+    )
+
+    assert result.splitlines() == [
+        "BTC: 65000.12",
+        "ETH: 2500.00",
+        "DOGE: no price feed found",
+        f"{SOL}: 150.12",
+    ]
+    assert hermes.requests == [("/v2/updates/price/latest", [BTC, ETH, SOL])]
+
+
+def test_get_prices_action_requires_assets():
+    """Test that the action rejects an empty request."""
+    result = pyth_action_provider().fetch_prices({})
+
+    assert result.startswith("Error fetching prices from Pyth")
+
+
+def test_format_price():
+    """Test price formatting for negative and non-negative exponents."""
+    assert format_price(4212345, -2) == "42123.45"
+    assert format_price(5, -4) == "0.00"
+    assert format_price(7, 2) == "700"
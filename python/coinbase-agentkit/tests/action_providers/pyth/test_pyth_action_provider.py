@@ -1,4 +1,4 @@
-from unittest.mock import patch
+from unittest.mock import MagicMock
 
 import pytest
 import requests
@@ -9,7 +9,15 @@ MOCK_TOKEN_SYMBOL = "BTC"
 MOCK_PRICE_FEED_ID = "0ff1e87c65eb6e6f7768e66543859b7f3076ba8a3529636f6b2664f367c3344a"
 
 
-def test_pyth_fetch_price_feed_id_success():
+@pytest.fixture
+def mock_http_client():
+    """Create a mock HTTP client for Hermes requests."""
+    mock_client = MagicMock()
+    mock_client.get.return_value.raise_for_status.return_value = None
+    return mock_client
+
+
+def test_pyth_fetch_price_feed_id_success(mock_http_client):
     """Test successful pyth fetch price feed id with valid parameters."""
     mock_response = {
         "data": [
@@ -20,41 +28,41 @@ def test_pyth_fetch_price_feed_id_success():
             }
         ]
     }
+    mock_http_client.get.return_value.json.return_value = mock_response["data"]
 
-    with patch("requests.get") as mock_get:
-        mock_get.return_value.json.return_value = mock_response["data"]
-        mock_get.return_value.raise_for_status.return_value = None
-
-        result = pyth_action_provider().fetch_price_feed_id({"token_symbol": MOCK_TOKEN_SYMBOL})
+    result = pyth_action_provider(http_client=mock_http_client).fetch_price_feed_id(
+        {"token_symbol": MOCK_TOKEN_SYMBOL}
+    )
 
-        assert result == MOCK_PRICE_FEED_ID
-        mock_get.assert_called_once_with(
-            "https://hermes.pyth.network/v2/price_feeds?query=BTC&asset_type=crypto"
-        )
+    assert result == MOCK_PRICE_FEED_ID
+    mock_http_client.get.assert_called_once_with(
+        "https://hermes.pyth.network/v2/price_feeds", timeout=10.0
+    )
 
 
-def test_pyth_fetch_price_feed_id_empty_response():
+def test_pyth_fetch_price_feed_id_empty_response(mock_http_client):
     """Test pyth fetch price feed id error with empty response for ticker symbol."""
-    with patch("requests.get") as mock_get:
-        mock_get.return_value.json.return_value = []
-        mock_get.return_value.raise_for_status.return_value = None
+    mock_http_client.get.return_value.json.return_value = []
 
-        with pytest.raises(ValueError, match="No price feed found for TEST"):
-            pyth_action_provider().fetch_price_feed_id({"token_symbol": "TEST"})
+    with pytest.raises(ValueError, match="No price feed found for TEST"):
+        pyth_action_provider(http_client=mock_http_client).fetch_price_feed_id(
+            {"token_symbol": "TEST"}
+        )
 
 
-def test_pyth_fetch_price_feed_id_http_error():
+def test_pyth_fetch_price_feed_id_http_error(mock_http_client):
     """Test pyth fetch price feed id error with HTTP error."""
-    with patch("requests.get") as mock_get:
-        mock_get.return_value.raise_for_status.side_effect = requests.exceptions.HTTPError(
-            "404 Client Error: Not Found"
-        )
+    mock_http_client.get.return_value.raise_for_status.side_effect = requests.exceptions.HTTPError(
+        "404 Client Error: Not Found"
+    )
 
-        with pytest.raises(requests.exceptions.HTTPError):
-            pyth_action_provider().fetch_price_feed_id({"token_symbol": MOCK_TOKEN_SYMBOL})
+    with pytest.raises(requests.exceptions.HTTPError):
+        pyth_action_provider(http_client=mock_http_client).fetch_price_feed_id(
+            {"token_symbol": MOCK_TOKEN_SYMBOL}
+        )
 
 
-def test_pyth_fetch_price_success():
+def test_pyth_fetch_price_success(mock_http_client):
     """Test successful pyth fetch price with valid parameters."""
     mock_response = {
         "parsed": [
@@ -64,26 +72,26 @@ def test_pyth_fetch_price_success():
                     "expo": -2,
                     "conf": "1234",
                 },
-                "id": "test_feed_id",
+                "id": MOCK_PRICE_FEED_ID,
             }
         ]
     }
+    mock_http_client.get.return_value.json.return_value = mock_response
 
-    with patch("requests.get") as mock_get:
-        mock_get.return_value.json.return_value = mock_response
-        mock_get.return_value.raise_for_status.return_value = None
-
-        result = pyth_action_provider().fetch_price({"price_feed_id": MOCK_PRICE_FEED_ID})
+    result = pyth_action_provider(http_client=mock_http_client).fetch_price(
+        {"price_feed_id": MOCK_PRICE_FEED_ID}
+    )
 
-        assert result == "42123.45"
+    assert result == "42123.45"
 
 
-def test_pyth_fetch_price_http_error():
+def test_pyth_fetch_price_http_error(mock_http_client):
     """Test pyth fetch price error with HTTP error."""
-    with patch("requests.get") as mock_get:
-        mock_get.return_value.raise_for_status.side_effect = requests.exceptions.HTTPError(
-            "404 Client Error: Not Found"
-        )
-
-        result = pyth_action_provider().fetch_price({"price_feed_id": MOCK_PRICE_FEED_ID})
-        assert "Error fetching price from Pyth" in result
+    mock_http_client.get.return_value.raise_for_status.side_effect = requests.exceptions.HTTPError(
+        "404 Client Error: Not Found"
+    )
+
+    result = pyth_action_provider(http_client=mock_http_client).fetch_price(
+        {"price_feed_id": MOCK_PRICE_FEED_ID}
+    )
+    assert "Error fetching price from Pyth" in result
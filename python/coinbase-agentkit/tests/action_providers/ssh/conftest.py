@@ -16,6 +16,58 @@ MOCK_CONNECTION_PASSWORD = "test-pass"
 MOCK_CONNECTION_INFO = "Connection Info Mock"
 
 
+class ScriptedChannel:
+    """A stand-in for a paramiko channel that delivers scripted output.
+
+    Events are (stream, data) pairs delivered one per read in the given order. The
+    command exits with `exit_status` once all events are read, or never if it is None.
+    """
+
+    def __init__(self, stdout=b"", stderr=b"", exit_status=0, events=None):
+        """Script the channel's output and exit status."""
+        if events is None:
+            events = [("stdout", stdout), ("stderr", stderr)]
+        self.events = [(stream, data) for stream, data in events if data]
+        self.exit_status = exit_status
+        self.closed = False
+
+    def recv_ready(self):
+        """Whether stdout data is next."""
+        return bool(self.events) and self.events[0][0] == "stdout"
+
+    def recv_stderr_ready(self):
+        """Whether stderr data is next."""
+        return bool(self.events) and self.events[0][0] == "stderr"
+
+    def recv(self, nbytes):
+        """Read the next stdout event."""
+        return self._read(nbytes)
+
+    def recv_stderr(self, nbytes):
+        """Read the next stderr event."""
+        return self._read(nbytes)
+
+    def _read(self, nbytes):
+        stream, data = self.events[0]
+        if len(data) > nbytes:
+            self.events[0] = (stream, data[nbytes:])
+            return data[:nbytes]
+        self.events.pop(0)
+        return data
+
+    def exit_status_ready(self):
+        """Whether the command has exited."""
+        return not self.events and self.exit_status is not None
+
+    def recv_exit_status(self):
+        """Get the exit status."""
+        return self.exit_status
+
+    def close(self):
+        """Record that the channel was closed."""
+        self.closed = True
+
+
 @pytest.fixture
 def mock_ssh_client():
     """Create a mock SSH client with standard behaviors."""
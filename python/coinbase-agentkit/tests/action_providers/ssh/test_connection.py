@@ -200,27 +200,21 @@ def test_is_connected_true(ssh_connection):
         mock_client = mock_ssh_client_class.return_value
         ssh_connection.ssh_client = mock_client
         ssh_connection.connected = True
-
-        mock_stdout = mock.Mock()
-        mock_stdout.read.return_value = b"1"
-        mock_client.exec_command.return_value = (None, mock_stdout, None)
+        mock_client.get_transport.return_value.is_active.return_value = True
 
         result = ssh_connection.is_connected()
 
         assert result is True
-        mock_client.exec_command.assert_called_once_with("echo 1", timeout=5)
+        mock_client.exec_command.assert_not_called()
 
 
-def test_is_connected_failed_command(ssh_connection):
-    """Test is_connected when echo test fails."""
+def test_is_connected_inactive_transport(ssh_connection):
+    """Test is_connected when the transport is no longer active."""
     with mock.patch("paramiko.SSHClient") as mock_ssh_client_class:
         mock_client = mock_ssh_client_class.return_value
         ssh_connection.ssh_client = mock_client
         ssh_connection.connected = True
-
-        mock_stdout = mock.Mock()
-        mock_stdout.read.return_value = b""
-        mock_client.exec_command.return_value = (None, mock_stdout, None)
+        mock_client.get_transport.return_value.is_active.return_value = False
 
         result = ssh_connection.is_connected()
 
@@ -229,6 +223,25 @@ def test_is_connected_failed_command(ssh_connection):
         assert ssh_connection.ssh_client is None
 
 
+def test_is_connected_no_transport(ssh_connection):
+    """Test is_connected when the client has no transport."""
+    ssh_connection.ssh_client = mock.Mock()
+    ssh_connection.ssh_client.get_transport.return_value = None
+    ssh_connection.connected = True
+
+    assert ssh_connection.is_connected() is False
+    assert ssh_connection.ssh_client is None
+
+
+def test_connect_enables_keepalive(mock_ssh_client, connection_params):
+    """Test that connecting sets the transport keepalive interval."""
+    connection = SSHConnection(connection_params, keepalive_interval=15)
+    with mock.patch("paramiko.SSHClient", return_value=mock_ssh_client):
+        connection.connect()
+
+    mock_ssh_client.get_transport.return_value.set_keepalive.assert_called_once_with(15)
+
+
 def test_is_connected_no_client(ssh_connection):
     """Test is_connected when no SSH client exists."""
     assert ssh_connection.is_connected() is False
@@ -4,11 +4,14 @@ This module provides comprehensive tests for the SSHConnectionPool class
 and its interaction with SSHConnection.
 """
 
+import threading
+import time
 from unittest import mock
 
 import pytest
 
 from coinbase_agentkit.action_providers.ssh.connection import (
+    CommandResult,
     SSHConnection,
     SSHConnectionError,
     SSHConnectionParams,
@@ -40,7 +43,7 @@ def connection_params():
 @pytest.fixture
 def connection_pool():
     """Create a connection pool for testing."""
-    return SSHConnectionPool(max_connections=3)
+    return SSHConnectionPool(max_connections=3, heartbeat_interval=None)
 
 
 def test_pool_initialization(connection_pool):
@@ -146,14 +149,17 @@ def test_pool_create_connection(connection_pool, connection_params):
         assert result == mock_connection
         assert connection_pool.connections[MOCK_CONNECTION_ID] == mock_connection
         assert MOCK_CONNECTION_ID in connection_pool.connection_params
-        mock_connection_class.assert_called_once_with(connection_params)
+        mock_connection_class.assert_called_once_with(connection_params, keepalive_interval=30)
 
 
 def test_pool_create_connection_limit_reached(connection_pool, connection_params):
-    """Test creating a connection when limit is reached."""
+    """Test that creating a connection when the limit is reached evicts the oldest one."""
     connection_pool.max_connections = 1
-    with mock.patch("coinbase_agentkit.action_providers.ssh.connection_pool.SSHConnection"):
-        connection_pool.create_connection(connection_params)
+    with mock.patch(
+        "coinbase_agentkit.action_providers.ssh.connection_pool.SSHConnection",
+        side_effect=lambda params, **kwargs: mock.Mock(params=params),
+    ):
+        first = connection_pool.create_connection(connection_params)
 
         params2 = SSHConnectionParams(
             connection_id=MOCK_CONNECTION_ID2,
@@ -161,11 +167,103 @@ def test_pool_create_connection_limit_reached(connection_pool, connection_params
             username=MOCK_USERNAME2,
             password=MOCK_PASSWORD2,
         )
+        connection_pool.create_connection(params2)
+
+    first.disconnect.assert_called_once()
+    assert list(connection_pool.connections) == [MOCK_CONNECTION_ID2]
+    assert MOCK_CONNECTION_ID in connection_pool.connection_params
+    assert connection_pool.has_connection(MOCK_CONNECTION_ID) is True
+
+
+def test_pool_evicts_least_recently_used(connection_pool):
+    """Test that the connection unused the longest is evicted, not the oldest."""
+    connection_pool.max_connections = 2
+    params = [
+        SSHConnectionParams(connection_id=f"conn-{i}", host=MOCK_HOST, username="u", password="p")
+        for i in range(3)
+    ]
+    with mock.patch(
+        "coinbase_agentkit.action_providers.ssh.connection_pool.SSHConnection",
+        side_effect=lambda params, **kwargs: mock.Mock(params=params),
+    ):
+        connection_pool.create_connection(params[0])
+        connection_pool.create_connection(params[1])
+        connection_pool.get_connection("conn-0")
+        connection_pool.create_connection(params[2])
+
+    assert sorted(connection_pool.connections) == ["conn-0", "conn-2"]
+
+
+def test_pool_reconnects_evicted_connection(connection_pool, connection_params):
+    """Test that an evicted connection is recreated and reconnected on demand."""
+    with mock.patch(
+        "coinbase_agentkit.action_providers.ssh.connection_pool.SSHConnection",
+        side_effect=lambda params, **kwargs: mock.Mock(params=params),
+    ):
+        connection_pool.create_connection(connection_params)
+        connection_pool._evict(MOCK_CONNECTION_ID)
+
+        connection = connection_pool.get_connection(MOCK_CONNECTION_ID)
+
+    connection.connect.assert_called_once()
+    assert connection_pool.connections[MOCK_CONNECTION_ID] is connection
+    assert MOCK_CONNECTION_ID not in connection_pool._evicted
+
+
+def test_pool_closed_connection_is_not_reconnected(connection_pool, connection_params):
+    """Test that a connection closed explicitly is not reconnected automatically."""
+    with mock.patch(
+        "coinbase_agentkit.action_providers.ssh.connection_pool.SSHConnection",
+        side_effect=lambda params, **kwargs: mock.Mock(params=params),
+    ):
+        connection_pool.create_connection(connection_params)
+        connection_pool.close_connection(MOCK_CONNECTION_ID)
+
+        assert connection_pool.has_connection(MOCK_CONNECTION_ID) is False
+        connection = connection_pool.get_connection(MOCK_CONNECTION_ID)
+
+    connection.connect.assert_not_called()
+
+
+def test_pool_close_idle_connections_by_timeout(connection_pool, connection_params):
+    """Test that live connections unused for longer than the idle timeout are closed."""
+    connection_pool.idle_timeout = 60
+    with mock.patch(
+        "coinbase_agentkit.action_providers.ssh.connection_pool.SSHConnection",
+        side_effect=lambda params, **kwargs: mock.Mock(params=params),
+    ):
+        connection = connection_pool.create_connection(connection_params)
+    connection.is_connected.return_value = True
+
+    assert connection_pool.close_idle_connections() == 0
+
+    connection_pool._last_used[MOCK_CONNECTION_ID] -= 61
+    assert connection_pool.close_idle_connections() == 1
+    connection.disconnect.assert_called_once()
+    assert connection_pool.has_connection(MOCK_CONNECTION_ID) is True
+
 
-        with pytest.raises(SSHConnectionError) as exc_info:
-            connection_pool.create_connection(params2)
+def test_pool_heartbeat_reaps_dead_connections(connection_params):
+    """Test that the background heartbeat closes connections whose transport died."""
+    pool = SSHConnectionPool(heartbeat_interval=0.01)
+    with mock.patch(
+        "coinbase_agentkit.action_providers.ssh.connection_pool.SSHConnection",
+        side_effect=lambda params, **kwargs: mock.Mock(params=params),
+    ):
+        connection = pool.create_connection(connection_params)
+    connection.is_connected.return_value = False
 
-        assert "Connection limit reached" in str(exc_info.value)
+    try:
+        assert pool._heartbeat.name == "agentkit-ssh-heartbeat"
+        for _ in range(200):
+            if not pool.connections:
+                break
+            time.sleep(0.01)
+        assert pool.connections == {}
+    finally:
+        pool.clear_connection_pool()
+
+    assert pool._heartbeat is None
 
 
 def test_pool_create_connection_validation_error(connection_pool):
@@ -297,3 +395,107 @@ def test_pool_context_manager(connection_pool):
     ):
         assert pool == connection_pool
     mock_clear.assert_called_once()
+
+
+def test_pool_run_many_runs_concurrently(connection_pool):
+    """Test that a command runs on every host at once and results keep the given order."""
+    barrier = threading.Barrier(3, timeout=5)
+
+    def run(command, timeout):
+        barrier.wait()
+        return CommandResult(connection_id=f"{command}-{timeout}", exit_status=0)
+
+    for conn_id in ["a", "b", "c"]:
+        connection = mock.Mock()
+        connection.run.side_effect = lambda command, timeout, conn_id=conn_id: (
+            run(command, timeout).model_copy(update={"connection_id": conn_id})
+        )
+        connection_pool.connections[conn_id] = connection
+
+    results = connection_pool.run_many(["c", "a", "b", "a"], "uptime", timeout=7)
+
+    assert [result.connection_id for result in results] == ["c", "a", "b"]
+    assert all(result.succeeded for result in results)
+    connection_pool.connections["a"].run.assert_called_once_with("uptime", timeout=7)
+
+
+def test_pool_run_many_reports_missing_hosts(connection_pool):
+    """Test that an unknown connection is reported without affecting the others."""
+    connection = mock.Mock()
+    connection.run.return_value = CommandResult(connection_id="a", exit_status=0)
+    connection_pool.connections["a"] = connection
+
+    results = connection_pool.run_many(["a", "missing"], "ls")
+
+    assert results[0].succeeded is True
+    assert results[1].connection_id == "missing"
+    assert "not found" in results[1].error
+
+
+def test_pool_run_many_runs_in_waves_over_limit(connection_pool):
+    """Test that more hosts than the pool can hold run in waves, reconnecting evicted ones."""
+    params = [
+        SSHConnectionParams(connection_id=f"conn-{i}", host=MOCK_HOST, username="u", password="p")
+        for i in range(5)
+    ]
+    lock = threading.Lock()
+    running = []
+    peak = 0
+
+    def make_connection(params, **kwargs):
+        def run(command, timeout):
+            nonlocal peak
+            with lock:
+                running.append(params.connection_id)
+                peak = max(peak, len(running))
+            time.sleep(0.05)
+            with lock:
+                running.remove(params.connection_id)
+            return CommandResult(connection_id=params.connection_id, exit_status=0)
+
+        return mock.Mock(params=params, run=mock.Mock(side_effect=run))
+
+    with mock.patch(
+        "coinbase_agentkit.action_providers.ssh.connection_pool.SSHConnection",
+        side_effect=make_connection,
+    ):
+        for p in params:
+            connection_pool.create_connection(p)
+
+        ids = [p.connection_id for p in params]
+        results = connection_pool.run_many(ids, "ls")
+
+    assert [result.connection_id for result in results] == ids
+    assert all(result.succeeded for result in results)
+    assert peak == connection_pool.max_connections
+    assert len(connection_pool.connections) == connection_pool.max_connections
+
+
+def test_pool_run_many_protects_targets_from_eviction(connection_pool):
+    """Test that reconnecting a target evicts a connection outside the fan-out."""
+    params = [
+        SSHConnectionParams(connection_id=f"conn-{i}", host=MOCK_HOST, username="u", password="p")
+        for i in range(4)
+    ]
+
+    def make_connection(params, **kwargs):
+        connection = mock.Mock(params=params)
+        connection.run.return_value = CommandResult(
+            connection_id=params.connection_id, exit_status=0
+        )
+        return connection
+
+    with mock.patch(
+        "coinbase_agentkit.action_providers.ssh.connection_pool.SSHConnection",
+        side_effect=make_connection,
+    ):
+        for p in params:
+            connection_pool.create_connection(p)
+        target = connection_pool.connections["conn-1"]
+
+        results = connection_pool.run_many(["conn-0", "conn-1"], "ls", max_workers=1)
+
+    assert all(result.succeeded for result in results)
+    assert connection_pool.connections["conn-1"] is target
+    target.disconnect.assert_not_called()
+    assert sorted(connection_pool.connections) == ["conn-0", "conn-1", "conn-3"]
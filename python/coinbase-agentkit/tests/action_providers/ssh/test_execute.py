@@ -13,6 +13,8 @@ from coinbase_agentkit.action_providers.ssh.connection import (
     SSHConnectionError,
 )
 
+from .conftest import ScriptedChannel
+
 
 def test_execute_command_success(ssh_connection):
     """Test successful command execution."""
@@ -24,10 +26,10 @@ def test_execute_command_success(ssh_connection):
         with mock.patch.object(ssh_connection, "is_connected", return_value=True):
             mock_stdin = mock.Mock()
             mock_stdout = mock.Mock()
-            mock_stdout.read.return_value = b"command output"
-            mock_stdout.channel.recv_exit_status.return_value = 0
+            mock_stdout.channel = ScriptedChannel(
+                stdout=b"command output", stderr=b"", exit_status=0
+            )
             mock_stderr = mock.Mock()
-            mock_stderr.read.return_value = b""
             mock_client.exec_command.return_value = (mock_stdin, mock_stdout, mock_stderr)
 
             result = ssh_connection.execute("ls -la")
@@ -53,10 +55,10 @@ def test_execute_command_with_stderr(ssh_connection):
         with mock.patch.object(ssh_connection, "is_connected", return_value=True):
             mock_stdin = mock.Mock()
             mock_stdout = mock.Mock()
-            mock_stdout.read.return_value = b"command output"
-            mock_stdout.channel.recv_exit_status.return_value = 0
+            mock_stdout.channel = ScriptedChannel(
+                stdout=b"command output", stderr=b"warning message", exit_status=0
+            )
             mock_stderr = mock.Mock()
-            mock_stderr.read.return_value = b"warning message"
             mock_client.exec_command.return_value = (mock_stdin, mock_stdout, mock_stderr)
 
             result = ssh_connection.execute("ls -la")
@@ -75,10 +77,10 @@ def test_execute_command_with_stderr_ignore(ssh_connection):
         with mock.patch.object(ssh_connection, "is_connected", return_value=True):
             mock_stdin = mock.Mock()
             mock_stdout = mock.Mock()
-            mock_stdout.read.return_value = b"command output"
-            mock_stdout.channel.recv_exit_status.return_value = 1
+            mock_stdout.channel = ScriptedChannel(
+                stdout=b"command output", stderr=b"warning message", exit_status=1
+            )
             mock_stderr = mock.Mock()
-            mock_stderr.read.return_value = b"warning message"
             mock_client.exec_command.return_value = (mock_stdin, mock_stdout, mock_stderr)
 
             result = ssh_connection.execute("ls -la", ignore_stderr=True)
@@ -97,10 +99,10 @@ def test_execute_command_failure_stderr(ssh_connection):
         with mock.patch.object(ssh_connection, "is_connected", return_value=True):
             mock_stdin = mock.Mock()
             mock_stdout = mock.Mock()
-            mock_stdout.read.return_value = b""
-            mock_stdout.channel.recv_exit_status.return_value = 1
+            mock_stdout.channel = ScriptedChannel(
+                stdout=b"", stderr=b"command failed", exit_status=1
+            )
             mock_stderr = mock.Mock()
-            mock_stderr.read.return_value = b"command failed"
             mock_client.exec_command.return_value = (mock_stdin, mock_stdout, mock_stderr)
 
             with pytest.raises(SSHConnectionError) as exc_info:
@@ -121,10 +123,8 @@ def test_execute_command_failure_no_stderr(ssh_connection):
         with mock.patch.object(ssh_connection, "is_connected", return_value=True):
             mock_stdin = mock.Mock()
             mock_stdout = mock.Mock()
-            mock_stdout.read.return_value = b""
-            mock_stdout.channel.recv_exit_status.return_value = 1
+            mock_stdout.channel = ScriptedChannel(stdout=b"", stderr=b"", exit_status=1)
             mock_stderr = mock.Mock()
-            mock_stderr.read.return_value = b""
             mock_client.exec_command.return_value = (mock_stdin, mock_stdout, mock_stderr)
 
             with pytest.raises(SSHConnectionError) as exc_info:
@@ -144,10 +144,8 @@ def test_execute_command_empty_output(ssh_connection):
         with mock.patch.object(ssh_connection, "is_connected", return_value=True):
             mock_stdin = mock.Mock()
             mock_stdout = mock.Mock()
-            mock_stdout.read.return_value = b""
-            mock_stdout.channel.recv_exit_status.return_value = 0
+            mock_stdout.channel = ScriptedChannel(exit_status=0)
             mock_stderr = mock.Mock()
-            mock_stderr.read.return_value = b""
             mock_client.exec_command.return_value = (mock_stdin, mock_stdout, mock_stderr)
 
             result = ssh_connection.execute("touch file.txt")
@@ -183,10 +181,10 @@ def test_execute_command_custom_timeout(ssh_connection):
         with mock.patch.object(ssh_connection, "is_connected", return_value=True):
             mock_stdin = mock.Mock()
             mock_stdout = mock.Mock()
-            mock_stdout.read.return_value = b"command output"
-            mock_stdout.channel.recv_exit_status.return_value = 0
+            mock_stdout.channel = ScriptedChannel(
+                stdout=b"command output", stderr=b"", exit_status=0
+            )
             mock_stderr = mock.Mock()
-            mock_stderr.read.return_value = b""
             mock_client.exec_command.return_value = (mock_stdin, mock_stdout, mock_stderr)
 
             result = ssh_connection.execute("ls -la", timeout=60)
@@ -4,7 +4,10 @@ This module tests the remote_shell action of the SshActionProvider, which allows
 executing commands on a remote server.
 """
 
-from coinbase_agentkit.action_providers.ssh.connection import SSHConnectionError
+from coinbase_agentkit.action_providers.ssh.connection import (
+    SSHCommandTimeoutError,
+    SSHConnectionError,
+)
 
 
 def test_remote_shell_success(ssh_provider):
@@ -113,3 +116,23 @@ def test_remote_shell_empty_command(ssh_provider):
 
     assert "Error: Invalid parameters:" in result
     assert "min_length" in result or "at least" in result or "length" in result
+
+
+def test_remote_shell_timeout_returns_partial_output(ssh_provider):
+    """Test that a timed out command returns the output produced before the timeout."""
+    mock_pool = ssh_provider.connection_pool
+    mock_connection = mock_pool.get_connection.return_value
+
+    mock_pool.has_connection.return_value = True
+    mock_connection.is_connected.return_value = True
+    mock_connection.execute.side_effect = SSHCommandTimeoutError(
+        "Command timed out", partial_output="step 1 done"
+    )
+
+    result = ssh_provider.remote_shell(
+        {"connection_id": "test-conn", "command": "long-job", "timeout": 5}
+    )
+
+    assert result.startswith("Partial output from connection 'test-conn'")
+    assert "after 5s" in result
+    assert result.endswith("step 1 done")
@@ -0,0 +1,95 @@
+"""Tests for remote_shell_fan_out action.
+
+This module tests the remote_shell_fan_out action of the SshActionProvider, which
+executes a command on several remote servers concurrently.
+"""
+
+from coinbase_agentkit.action_providers.ssh.connection import CommandResult, SSHConnectionError
+
+
+def test_remote_shell_fan_out_success(ssh_provider):
+    """Test that per-host results are aggregated into one response."""
+    mock_pool = ssh_provider.connection_pool
+    mock_pool.run_many.return_value = [
+        CommandResult(connection_id="gpu-1", exit_status=0, stdout="ok\n", duration=0.5),
+        CommandResult(connection_id="gpu-2", exit_status=1, stderr="disk full\n", duration=0.4),
+        CommandResult(connection_id="gpu-3", timed_out=True, error="Command timed out after 5s"),
+    ]
+
+    result = ssh_provider.remote_shell_fan_out(
+        {"connection_ids": ["gpu-1", "gpu-2", "gpu-3"], "command": " nvidia-smi ", "timeout": 5}
+    )
+
+    assert result.startswith("Ran command on 3 connections: 1 succeeded, 2 failed")
+    assert "[gpu-1] exit 0 (0.50s)\nok" in result
+    assert "[gpu-2] exit 1 (0.40s)\n[stderr]: disk full" in result
+    assert "[gpu-3] Command timed out after 5s" in result
+    mock_pool.run_many.assert_called_once_with(["gpu-1", "gpu-2", "gpu-3"], "nvidia-smi", timeout=5)
+
+
+def test_remote_shell_fan_out_truncates_per_host(ssh_provider):
+    """Test that each host's output is truncated independently."""
+    mock_pool = ssh_provider.connection_pool
+    mock_pool.run_many.return_value = [
+        CommandResult(connection_id="gpu-1", exit_status=0, stdout="x" * 500),
+        CommandResult(connection_id="gpu-2", exit_status=0, stdout="short"),
+    ]
+
+    result = ssh_provider.remote_shell_fan_out(
+        {"connection_ids": ["gpu-1", "gpu-2"], "command": "dmesg", "max_output_chars": 100}
+    )
+
+    assert "[400 characters truncated]" in result
+    assert "x" * 101 not in result
+    assert "short" in result
+
+
+def test_remote_shell_fan_out_shows_partial_output_on_timeout(ssh_provider):
+    """Test that a timed out host reports the truncated output it produced before the timeout."""
+    mock_pool = ssh_provider.connection_pool
+    mock_pool.run_many.return_value = [
+        CommandResult(
+            connection_id="gpu-1",
+            timed_out=True,
+            error="Command timed out after 5s",
+            stdout="y" * 300,
+            output="y" * 300,
+        ),
+    ]
+
+    result = ssh_provider.remote_shell_fan_out(
+        {"connection_ids": ["gpu-1"], "command": "train", "max_output_chars": 100}
+    )
+
+    assert "[gpu-1] Command timed out after 5s, partial output:\n" in result
+    assert "[200 characters truncated]" in result
+
+
+def test_remote_shell_fan_out_reports_host_errors(ssh_provider):
+    """Test that a host that could not run the command is reported as an error."""
+    mock_pool = ssh_provider.connection_pool
+    mock_pool.run_many.return_value = [
+        CommandResult(connection_id="gone", error="Connection ID 'gone' not found"),
+    ]
+
+    result = ssh_provider.remote_shell_fan_out({"connection_ids": ["gone"], "command": "ls"})
+
+    assert "[gone] error: Connection ID 'gone' not found" in result
+
+
+def test_remote_shell_fan_out_pool_error(ssh_provider):
+    """Test that a pool error is returned as an error message."""
+    mock_pool = ssh_provider.connection_pool
+    mock_pool.run_many.side_effect = SSHConnectionError("Cannot run on 20 connections")
+
+    result = ssh_provider.remote_shell_fan_out({"connection_ids": ["a"], "command": "ls"})
+
+    assert result == "Error: Connection: Cannot run on 20 connections"
+
+
+def test_remote_shell_fan_out_invalid_params(ssh_provider):
+    """Test remote_shell_fan_out with no connection IDs."""
+    result = ssh_provider.remote_shell_fan_out({"connection_ids": [], "command": "ls"})
+
+    assert "Error: Invalid parameters" in result
+    ssh_provider.connection_pool.run_many.assert_not_called()
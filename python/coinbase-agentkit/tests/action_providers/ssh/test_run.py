@@ -0,0 +1,242 @@
+"""Tests for SSH command runs and output streaming.
+
+This module tests the run and stream methods of the SSHConnection class, which
+report exit status and output without raising, and the output capture helpers.
+"""
+
+from unittest import mock
+
+import pytest
+
+from coinbase_agentkit.action_providers.ssh.connection import (
+    BoundedOutput,
+    OutputChunk,
+    SSHCommandTimeoutError,
+    SSHConnectionError,
+    truncate_output,
+)
+
+from .conftest import ScriptedChannel
+
+
+def test_run_success(ssh_connection, mock_ssh_client):
+    """Test that a finished command reports its exit status and output."""
+    mock_ssh_client.mock_stdout.channel = ScriptedChannel(stdout=b"ok\n")
+
+    with ssh_connection.set_connected():
+        result = ssh_connection.run("uptime", timeout=5)
+
+    assert result.succeeded is True
+    assert result.exit_status == 0
+    assert result.stdout == "ok\n"
+    assert result.error is None
+    mock_ssh_client.exec_command.assert_called_once_with("uptime", timeout=5)
+
+
+def test_run_nonzero_exit_is_not_an_error(ssh_connection, mock_ssh_client):
+    """Test that a non-zero exit status is reported instead of raised."""
+    mock_ssh_client.mock_stdout.channel = ScriptedChannel(stderr=b"no such file", exit_status=2)
+
+    with ssh_connection.set_connected():
+        result = ssh_connection.run("ls /missing")
+
+    assert result.succeeded is False
+    assert result.exit_status == 2
+    assert result.stderr == "no such file"
+    assert result.error is None
+    assert ssh_connection.connected is True
+
+
+def test_run_timeout_keeps_partial_output(ssh_connection, mock_ssh_client):
+    """Test that a command still running at the deadline is abandoned with its output so far."""
+    channel = ScriptedChannel(stdout=b"step 1\n", exit_status=None)
+    mock_ssh_client.mock_stdout.channel = channel
+
+    with ssh_connection.set_connected(), mock.patch("time.sleep"):
+        result = ssh_connection.run("long-job", timeout=0)
+
+    assert result.timed_out is True
+    assert result.exit_status is None
+    assert result.stdout == "step 1\n"
+    assert "timed out" in result.error
+    assert channel.closed is True
+
+
+def test_run_interleaves_stdout_and_stderr(ssh_connection, mock_ssh_client):
+    """Test that the combined output keeps the order in which streams arrived."""
+    mock_ssh_client.mock_stdout.channel = ScriptedChannel(
+        events=[("stdout", b"a\n"), ("stderr", b"b\n"), ("stdout", b"c\n")]
+    )
+
+    with ssh_connection.set_connected():
+        result = ssh_connection.run("build")
+
+    assert result.output == "a\nb\nc\n"
+    assert result.stdout == "a\nc\n"
+    assert result.stderr == "b\n"
+
+
+def test_run_caps_output(ssh_connection, mock_ssh_client):
+    """Test that oversized output is cut to the cap, keeping its beginning and end."""
+    mock_ssh_client.mock_stdout.channel = ScriptedChannel(
+        events=[("stdout", b"start-"), *[("stdout", b"x" * 100)] * 50, ("stdout", b"-end")]
+    )
+
+    with ssh_connection.set_connected():
+        result = ssh_connection.run("cat big.log", max_output_chars=40)
+
+    assert result.truncated is True
+    assert result.stdout.startswith("start-")
+    assert result.stdout.endswith("-end")
+    assert "characters truncated" in result.stdout
+
+
+def test_run_stops_early(ssh_connection, mock_ssh_client):
+    """Test that the caller can stop waiting once the output it needs has arrived."""
+    channel = ScriptedChannel(
+        events=[("stdout", b"booting\n"), ("stdout", b"listening\n"), ("stdout", b"more\n")],
+        exit_status=None,
+    )
+    mock_ssh_client.mock_stdout.channel = channel
+
+    with ssh_connection.set_connected():
+        result = ssh_connection.run("serve", until=lambda chunk: "listening" in chunk.data)
+
+    assert result.stopped is True
+    assert result.timed_out is False
+    assert result.stdout == "booting\nlistening\n"
+    assert channel.closed is True
+
+
+def test_run_not_connected(ssh_connection):
+    """Test that running without a connection reports an error."""
+    result = ssh_connection.run("ls")
+
+    assert result.succeeded is False
+    assert "No active SSH connection" in result.error
+
+
+def test_run_channel_failure_resets_connection(ssh_connection, mock_ssh_client):
+    """Test that a failure to run the command is reported and resets the connection."""
+    mock_ssh_client.exec_command.side_effect = Exception("channel closed")
+
+    with ssh_connection.set_connected():
+        result = ssh_connection.run("ls")
+
+    assert "channel closed" in result.error
+    assert ssh_connection.ssh_client is None
+
+
+def test_stream_yields_chunks_as_they_arrive(ssh_connection, mock_ssh_client):
+    """Test that streaming yields each piece of output and records the exit status."""
+    mock_ssh_client.mock_stdout.channel = ScriptedChannel(
+        events=[("stdout", b"one\n"), ("stderr", b"warn\n"), ("stdout", b"two\n")],
+        exit_status=3,
+    )
+
+    with ssh_connection.set_connected():
+        stream = ssh_connection.stream("job")
+        chunks = list(stream)
+
+    assert chunks == [
+        OutputChunk("stdout", "one\n"),
+        OutputChunk("stderr", "warn\n"),
+        OutputChunk("stdout", "two\n"),
+    ]
+    assert stream.exit_status == 3
+
+
+def test_stream_decodes_split_characters(ssh_connection, mock_ssh_client):
+    """Test that a multi-byte character split across reads is decoded intact."""
+    data = "héllo".encode()
+    mock_ssh_client.mock_stdout.channel = ScriptedChannel(
+        events=[("stdout", data[:2]), ("stdout", data[2:])]
+    )
+
+    with ssh_connection.set_connected():
+        text = "".join(chunk.data for chunk in ssh_connection.stream("echo"))
+
+    assert text == "héllo"
+
+
+def test_stream_not_connected(ssh_connection):
+    """Test that streaming without a connection raises."""
+    with pytest.raises(SSHConnectionError):
+        ssh_connection.stream("ls")
+
+
+def test_execute_timeout_raises_with_partial_output(ssh_connection, mock_ssh_client):
+    """Test that execute reports a timeout with the output received before it."""
+    mock_ssh_client.mock_stdout.channel = ScriptedChannel(stdout=b"partial", exit_status=None)
+
+    with (
+        ssh_connection.set_connected(),
+        mock.patch("time.sleep"),
+        pytest.raises(SSHCommandTimeoutError) as exc_info,
+    ):
+        ssh_connection.execute("long-job", timeout=0)
+
+    assert exc_info.value.partial_output == "partial"
+    assert ssh_connection.ssh_client is not None
+
+
+def test_bounded_output_keeps_head_and_tail():
+    """Test that the buffer keeps the first and last characters within its cap."""
+    buffer = BoundedOutput(10)
+    for piece in ["abc", "defgh", "ijklmnop", "qrst"]:
+        buffer.append(piece)
+
+    assert buffer.truncated is True
+    assert buffer.dropped == 10
+    assert buffer.getvalue() == "abcde\n... [10 characters truncated] ...\npqrst"
+
+
+def test_bounded_output_under_cap():
+    """Test that output within the cap is returned unchanged."""
+    buffer = BoundedOutput(10)
+    buffer.append("abc")
+    buffer.append("def")
+
+    assert buffer.truncated is False
+    assert buffer.getvalue() == "abcdef"
+
+
+def test_truncate_output_keeps_head_and_tail():
+    """Test that long output keeps its beginning and end."""
+    text = "a" * 50 + "b" * 50
+
+    truncated = truncate_output(text, 20)
+
+    assert truncated.startswith("a" * 10)
+    assert truncated.endswith("b" * 10)
+    assert "[80 characters truncated]" in truncated
+    assert truncate_output("short", 20) == "short"
+
+
+class LateOutputChannel(ScriptedChannel):
+    """A channel whose final output is buffered at the same time as the exit status."""
+
+    def __init__(self, late_events, exit_status=0):
+        """Hold back the events until the exit status is checked."""
+        super().__init__(events=[], exit_status=exit_status)
+        self.late_events = list(late_events)
+
+    def exit_status_ready(self):
+        """Deliver the held back output together with the exit status."""
+        self.events.extend(self.late_events)
+        self.late_events = []
+        return self.exit_status is not None
+
+
+def test_stream_drains_output_arriving_with_exit_status(ssh_connection, mock_ssh_client):
+    """Test that output buffered together with the exit status is not dropped."""
+    mock_ssh_client.mock_stdout.channel = LateOutputChannel(
+        [("stdout", b"last line\n"), ("stderr", b"warning\n")], exit_status=0
+    )
+
+    with ssh_connection.set_connected():
+        stream = ssh_connection.stream("job")
+        chunks = list(stream)
+
+    assert chunks == [OutputChunk("stdout", "last line\n"), OutputChunk("stderr", "warning\n")]
+    assert stream.exit_status == 0
@@ -0,0 +1,139 @@
+"""Tests for sync and async action invocation."""
+
+import asyncio
+from typing import Any
+
+from pydantic import BaseModel
+
+from coinbase_agentkit.action_providers.action_decorator import create_action
+from coinbase_agentkit.action_providers.action_provider import ActionProvider, run_coroutine_sync
+
+
+class EchoSchema(BaseModel):
+    """Input schema for the test actions."""
+
+    message: str
+
+
+class MixedActionProvider(ActionProvider):
+    """Action provider with one sync and one async action."""
+
+    def __init__(self):
+        super().__init__("mixed", [])
+
+    @create_action(name="echo", description="Echo a message", schema=EchoSchema)
+    def echo(self, args: dict[str, Any]) -> str:
+        """Echo the message."""
+        return f"sync:{args['message']}"
+
+    @create_action(name="aecho", description="Echo a message asynchronously", schema=EchoSchema)
+    async def aecho(self, args: dict[str, Any]) -> str:
+        """Echo the message after yielding to the event loop."""
+        await asyncio.sleep(0)
+        return f"async:{args['message']}"
+
+    def supports_network(self, network) -> bool:
+        """Support every network."""
+        return True
+
+
+def _actions_by_suffix():
+    """Get the provider's actions keyed by method name."""
+    return {a.name.split("_")[-1]: a for a in MixedActionProvider().get_actions(None)}
+
+
+def test_sync_action_invoke_and_ainvoke():
+    """Test that a sync action can be invoked from sync and async code."""
+    action = _actions_by_suffix()["echo"]
+
+    assert action.async_invoke is None
+    assert action.invoke({"message": "hi"}) == "sync:hi"
+    assert asyncio.run(action.ainvoke({"message": "hi"})) == "sync:hi"
+
+
+def test_async_action_invoke_and_ainvoke():
+    """Test that an async action can be invoked from sync and async code."""
+    action = _actions_by_suffix()["aecho"]
+
+    assert action.async_invoke is not None
+    assert action.invoke({"message": "hi"}) == "async:hi"
+    assert asyncio.run(action.ainvoke({"message": "hi"})) == "async:hi"
+
+
+def test_async_action_invoke_inside_running_loop():
+    """Test that the sync entry point of an async action works while a loop is running."""
+    action = _actions_by_suffix()["aecho"]
+
+    async def call_sync_from_loop():
+        return action.invoke({"message": "nested"})
+
+    assert asyncio.run(call_sync_from_loop()) == "async:nested"
+
+
+def test_ainvoke_runs_actions_concurrently():
+    """Test that async actions can be gathered on a single event loop."""
+    action = _actions_by_suffix()["aecho"]
+
+    async def gather():
+        return await asyncio.gather(*(action.ainvoke({"message": str(i)}) for i in range(5)))
+
+    assert asyncio.run(gather()) == [f"async:{i}" for i in range(5)]
+
+
+def test_run_coroutine_sync():
+    """Test running a coroutine from sync code."""
+
+    async def value():
+        return 42
+
+    assert run_coroutine_sync(value()) == 42
+
+
+def test_actions_registered_at_class_creation():
+    """Test that the action registry is built once per class and shared by instances."""
+    assert [m.name for m in MixedActionProvider._actions] == [
+        "MixedActionProvider_aecho",
+        "MixedActionProvider_echo",
+    ]
+    assert MixedActionProvider()._actions is MixedActionProvider()._actions
+
+
+def test_registry_does_not_touch_properties():
+    """Test that constructing a provider does not evaluate its properties."""
+    calls = []
+
+    class PropertyActionProvider(MixedActionProvider):
+        """Action provider with a property."""
+
+        @property
+        def expensive(self):
+            """Record access."""
+            calls.append(1)
+            return 1
+
+    PropertyActionProvider()
+
+    assert calls == []
+
+
+def test_registry_follows_inheritance():
+    """Test that subclasses inherit actions and plain overrides remove them."""
+
+    class ChildActionProvider(MixedActionProvider):
+        """Child provider that replaces one action and drops another."""
+
+        @create_action(name="echo", description="Echo loudly", schema=EchoSchema)
+        def echo(self, args: dict[str, Any]) -> str:
+            """Echo the message in upper case."""
+            return f"child:{args['message'].upper()}"
+
+        async def aecho(self, args: dict[str, Any]) -> str:
+            """No longer an action."""
+            return ""
+
+    actions = ChildActionProvider().get_actions(None)
+
+    assert len(actions) == 1
+    assert actions[0].name.endswith("ChildActionProvider_echo")
+    assert actions[0].invoke({"message": "hi"}) == "child:HI"
+    assert len(MixedActionProvider._actions) == 2
@@ -0,0 +1,120 @@
+"""Tests for local WOW bonding curve quotes and the token state cache."""
+
+import math
+from unittest.mock import MagicMock
+
+import pytest
+
+from coinbase_agentkit.action_providers.wow import token_state
+from coinbase_agentkit.action_providers.wow.bonding_curve import BondingCurve
+from coinbase_agentkit.action_providers.wow.constants import addresses
+from coinbase_agentkit.action_providers.wow.token_state import WowTokenStateCache
+from coinbase_agentkit.action_providers.wow.utils import get_buy_quotes, get_sell_quotes
+from coinbase_agentkit.network import Network
+from coinbase_agentkit.wallet_providers import ContractCallResult
+
+A = 1060848709
+B = 4379701787
+CURVE = BondingCurve(a=A, b=B)
+BONDING_CURVE = addresses["base-sepolia"]["bonding_curve"]
+SUPPLY = 100_000_000 * 10**18
+CURVE_TOKEN = "0x1111111111111111111111111111111111111111"
+TOKENS = {
+    CURVE_TOKEN: (0, SUPPLY),
+    "0x2222222222222222222222222222222222222222": (1, 800_000_000 * 10**18),
+}
+
+
+def _answer(call):
+    if call.function_name == "A":
+        return A
+    if call.function_name == "B":
+        return B
+    market_type, supply = TOKENS[call.contract_address]
+    return {"marketType": market_type, "totalSupply": supply, "bondingCurve": BONDING_CURVE}[
+        call.function_name
+    ]
+
+
+@pytest.fixture
+def wallet():
+    """Create a mock wallet that answers reads from fake WOW tokens."""
+    token_state._token_state_cache.clear()
+    wallet = MagicMock()
+    wallet.get_network.return_value = Network(
+        protocol_family="evm", network_id="base-sepolia", chain_id="84532"
+    )
+    wallet.get_block_number.return_value = 10
+    wallet.read_contracts.side_effect = lambda calls, block_identifier="latest": [
+        ContractCallResult(success=True, result=_answer(call)) for call in calls
+    ]
+    return wallet
+
+
+def test_buy_quote_follows_the_curve():
+    """Test that buy quotes match the integral of the exponential price curve."""
+    eth_in = 10**17
+    tokens = CURVE.get_eth_buy_quote(SUPPLY, eth_in)
+
+    x0 = SUPPLY / 1e18
+    expected = math.log(math.exp(B / 1e18 * x0) + eth_in / 1e18 * B / A) / (B / 1e18) - x0
+    assert tokens / 1e18 == pytest.approx(expected, rel=1e-9)
+
+
+def test_sell_quote_inverts_buy_quote():
+    """Test that selling the tokens a buy returns gives back the ETH spent."""
+    eth_in = 10**17
+    tokens = CURVE.get_eth_buy_quote(SUPPLY, eth_in)
+
+    eth_out = CURVE.get_token_sell_quote(SUPPLY + tokens, tokens)
+
+    assert eth_out <= eth_in
+    assert eth_out == pytest.approx(eth_in, rel=1e-12)
+    with pytest.raises(ValueError):
+        CURVE.get_token_sell_quote(SUPPLY, SUPPLY + 1)
+
+
+def test_state_of_many_tokens_is_read_in_one_batch(wallet):
+    """Test that token states and the bonding curve are read together."""
+    cache = WowTokenStateCache()
+
+    states = cache.get_many(wallet, list(TOKENS))
+
+    wallet.read_contracts.assert_called_once()
+    assert len(wallet.read_contracts.call_args.args[0]) == 8
+    assert wallet.read_contracts.call_args.kwargs["block_identifier"] == 10
+    assert [state.has_graduated for state in states] == [False, True]
+    assert states[0].bonding_curve == CURVE
+    assert states[0].get_eth_buy_quote(10**17) == CURVE.get_eth_buy_quote(SUPPLY, 10**17)
+
+
+def test_states_are_reused_within_a_block(wallet):
+    """Test that bonding curve states expire with the block and graduated ones do not."""
+    cache = WowTokenStateCache()
+    cache.get_many(wallet, list(TOKENS))
+
+    cache.get_many(wallet, list(TOKENS))
+    wallet.read_contracts.assert_called_once()
+
+    wallet.get_block_number.return_value = 11
+    wallet.read_contracts.reset_mock()
+    states = cache.get_many(wallet, list(TOKENS))
+
+    calls = wallet.read_contracts.call_args.args[0]
+    assert {call.contract_address for call in calls} == {CURVE_TOKEN}
+    assert states[0].block_number == 11
+
+
+def test_quotes_for_many_amounts_use_one_read(wallet):
+    """Test that buy and sell quotes for many amounts need a single state read."""
+    token = CURVE_TOKEN
+    amounts = [str(10**15 * i) for i in range(1, 21)]
+
+    buys = get_buy_quotes(wallet, token, amounts)
+    sells = get_sell_quotes(wallet, token, amounts)
+
+    wallet.read_contracts.assert_called_once()
+    wallet.read_contract.assert_not_called()
+    assert buys == [CURVE.get_eth_buy_quote(SUPPLY, int(amount)) for amount in amounts]
+    assert sells == [CURVE.get_token_sell_quote(SUPPLY, int(amount)) for amount in amounts]
+    assert buys == sorted(buys)
@@ -1,6 +1,6 @@
 """Tests for WOW buy token action."""
 
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 from pydantic_core import ValidationError
@@ -66,8 +66,8 @@ def test_buy_token_success():
             return_value=MOCK_TOKEN_QUOTE,
         ),
         patch(
-            "coinbase_agentkit.action_providers.wow.wow_action_provider.get_has_graduated",
-            return_value=False,
+            "coinbase_agentkit.action_providers.wow.wow_action_provider.get_wow_token_state",
+            return_value=MagicMock(has_graduated=False),
         ),
     ):
         mock_contract.return_value.encode_abi.return_value = "0xencoded"
@@ -131,8 +131,8 @@ def test_buy_token_graduated_pool():
             return_value=MOCK_TOKEN_QUOTE,
         ),
         patch(
-            "coinbase_agentkit.action_providers.wow.wow_action_provider.get_has_graduated",
-            return_value=True,
+            "coinbase_agentkit.action_providers.wow.wow_action_provider.get_wow_token_state",
+            return_value=MagicMock(has_graduated=True),
         ),
     ):
         mock_contract.return_value.encode_abi.return_value = "0xencoded"
@@ -189,8 +189,8 @@ def test_buy_token_error():
             return_value=MOCK_TOKEN_QUOTE,
         ),
         patch(
-            "coinbase_agentkit.action_providers.wow.wow_action_provider.get_has_graduated",
-            return_value=False,
+            "coinbase_agentkit.action_providers.wow.wow_action_provider.get_wow_token_state",
+            return_value=MagicMock(has_graduated=False),
         ),
     ):
         mock_contract.return_value.encode_abi.return_value = "0xencoded"
@@ -0,0 +1,184 @@
+"""Tests for the WOW token indexer and the actions answered from it."""
+
+from unittest.mock import MagicMock
+
+import pytest
+from eth_abi import encode
+from hexbytes import HexBytes
+from web3 import Web3
+
+from coinbase_agentkit.action_providers.wow.constants import WOW_FACTORY_CONTRACT_ADDRESSES
+from coinbase_agentkit.action_providers.wow.indexer import TOKEN_CREATED_TOPIC, WowTokenIndexer
+from coinbase_agentkit.action_providers.wow.wow_action_provider import WowActionProvider
+from coinbase_agentkit.network import Network
+
+FACTORY = WOW_FACTORY_CONTRACT_ADDRESSES["base-sepolia"].lower()
+CREATOR = "0x" + "c" * 40
+CHAIN_ID = "84532"
+
+
+def _address(n: int) -> str:
+    return "0x" + f"{n:040x}"
+
+
+def _topic(address: str) -> HexBytes:
+    return HexBytes(bytes(12) + bytes.fromhex(address[2:]))
+
+
+def _log(block_number: int, n: int, name: str, symbol: str) -> dict:
+    data = encode(
+        ["address", "address", "address", "string", "string", "string", "address", "address"],
+        [
+            _address(0),
+            _address(1),
+            _address(2),
+            f"ipfs://{symbol}",
+            name,
+            symbol,
+            _address(1000 + n),
+            _address(2000 + n),
+        ],
+    )
+    return {
+        "address": _address(1000 + n),
+        "topics": [HexBytes(TOKEN_CREATED_TOPIC), _topic(FACTORY), _topic(CREATOR)],
+        "data": HexBytes(data),
+        "blockNumber": block_number,
+        "logIndex": 0,
+        "transactionIndex": 0,
+        "transactionHash": HexBytes(bytes([n]) * 32),
+        "blockHash": HexBytes(bytes(32)),
+    }
+
+
+LOGS = [
+    _log(950, 1, "Wow Coin", "WOW"),
+    _log(960, 2, "Wowza", "WOWZA"),
+    _log(990, 3, "Other", "OTH"),
+    _log(995, 4, "Lower Wow", "wow"),
+]
+
+
+@pytest.fixture
+def wallet():
+    """Create a mock wallet that serves the fake creation logs."""
+    wallet = MagicMock()
+    wallet.get_network.return_value = Network(
+        protocol_family="evm", network_id="base-sepolia", chain_id=CHAIN_ID
+    )
+    wallet.get_block_number.return_value = 1000
+    wallet.get_logs.side_effect = lambda params: [
+        log for log in LOGS if params["fromBlock"] <= log["blockNumber"] <= params["toBlock"]
+    ]
+    return wallet
+
+
+def test_sync_pages_logs_filtered_on_the_factory(wallet):
+    """Test that sync reads the lookback window in pages filtered by event and factory."""
+    indexer = WowTokenIndexer(lookback_blocks=100, block_range=40)
+
+    assert indexer.sync(wallet) == 4
+
+    ranges = [
+        (c.args[0]["fromBlock"], c.args[0]["toBlock"]) for c in wallet.get_logs.call_args_list
+    ]
+    assert ranges == [(901, 940), (941, 1000)]
+    topics = wallet.get_logs.call_args.args[0]["topics"]
+    assert topics == [TOKEN_CREATED_TOPIC, "0x" + FACTORY[2:].rjust(64, "0")]
+    assert indexer.get_checkpoint(CHAIN_ID, FACTORY) == 1000
+
+
+def test_block_range_is_split_on_error(wallet):
+    """Test that failing log queries are retried over smaller ranges."""
+    serve = wallet.get_logs.side_effect
+
+    def limited(params):
+        if params["toBlock"] - params["fromBlock"] >= 25:
+            raise ValueError("query returned more than 10000 results")
+        return serve(params)
+
+    wallet.get_logs.side_effect = limited
+    indexer = WowTokenIndexer(lookback_blocks=100, block_range=100)
+
+    assert indexer.sync(wallet) == 4
+
+    ranges = [
+        (c.args[0]["fromBlock"], c.args[0]["toBlock"]) for c in wallet.get_logs.call_args_list
+    ]
+    assert ranges[:4] == [(901, 1000), (901, 950), (901, 925), (926, 975)]
+    assert ranges[-1] == (976, 1000)
+
+
+def test_sync_resumes_from_the_checkpoint(wallet, tmp_path):
+    """Test that a new indexer on the same file only reads blocks after the checkpoint."""
+    store_path = str(tmp_path / "wow.db")
+    first = WowTokenIndexer(store_path, lookback_blocks=100)
+    first.sync(wallet, to_block=970)
+    first.close()
+
+    wallet.get_logs.reset_mock()
+    second = WowTokenIndexer(store_path, lookback_blocks=100)
+    assert second.sync(wallet) == 2
+
+    wallet.get_logs.assert_called_once()
+    assert wallet.get_logs.call_args.args[0]["fromBlock"] == 971
+    assert [t.symbol for t in second.list_recent(CHAIN_ID)] == ["wow", "OTH", "WOWZA", "WOW"]
+
+    wallet.get_logs.reset_mock()
+    assert second.sync(wallet) == 0
+    wallet.get_logs.assert_not_called()
+    second.close()
+
+
+def test_malformed_and_foreign_logs_are_skipped(wallet):
+    """Test that logs which do not decode or were not emitted by their token are skipped."""
+    malformed = {**_log(930, 5, "Broken", "BRK"), "data": HexBytes(b"\x00\x01")}
+    foreign = {**_log(940, 6, "Fake", "FAKE"), "address": _address(6666)}
+    logs = [*LOGS, malformed, foreign]
+    wallet.get_logs.side_effect = lambda params: [
+        log for log in logs if params["fromBlock"] <= log["blockNumber"] <= params["toBlock"]
+    ]
+    indexer = WowTokenIndexer(lookback_blocks=100)
+
+    assert indexer.sync(wallet) == 4
+
+    assert indexer.get_checkpoint(CHAIN_ID, FACTORY) == 1000
+    assert [t.symbol for t in indexer.list_recent(CHAIN_ID)] == ["wow", "OTH", "WOWZA", "WOW"]
+
+
+def test_search_is_a_case_insensitive_prefix_match(wallet):
+    """Test that exact symbol matches come first, then newer tokens."""
+    indexer = WowTokenIndexer(lookback_blocks=100)
+    indexer.sync(wallet)
+
+    results = indexer.search(CHAIN_ID, "wow")
+    assert [t.symbol for t in results] == ["wow", "WOW", "WOWZA"]
+    assert results[1].name == "Wow Coin"
+    assert results[1].token_address == Web3.to_checksum_address(_address(1001))
+    assert results[1].creator.lower() == CREATOR
+    assert indexer.search(CHAIN_ID, "w%") == []
+    assert indexer.search("8453", "wow") == []
+
+
+def test_list_and_search_actions(wallet):
+    """Test that the actions answer from the index."""
+    provider = WowActionProvider()
+
+    listed = provider.list_tokens(wallet, {"limit": 2})
+    assert "Lower Wow (wow)" in listed
+    assert "Other (OTH)" in listed
+    assert "WOWZA" not in listed
+
+    found = provider.search_tokens(wallet, {"symbol": "WOWZ"})
+    assert "Wowza (WOWZA)" in found
+    assert "No Zora Wow" in provider.search_tokens(wallet, {"symbol": "NOPE"})
+
+
+def test_actions_report_errors(wallet):
+    """Test that failing log reads are reported as errors."""
+    wallet.get_logs.side_effect = NotImplementedError("no logs")
+
+    result = WowActionProvider().list_tokens(wallet, {})
+
+    assert result == "Error listing Zora Wow ERC20 memecoins: no logs"
+    wallet.get_logs.assert_called_once()
@@ -0,0 +1,205 @@
+"""Tests for local Uniswap v3 quotes of graduated WOW tokens."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from coinbase_agentkit.action_providers.wow.uniswap import pool as pool_module
+from coinbase_agentkit.action_providers.wow.uniswap.pool import (
+    LocalQuoteUnavailableError,
+    UniswapV3PoolState,
+    get_pool_state,
+)
+from coinbase_agentkit.action_providers.wow.uniswap.utils import get_uniswap_quotes
+from coinbase_agentkit.action_providers.wow.uniswap.v3_math import (
+    MAX_SQRT_RATIO,
+    MAX_TICK,
+    MIN_SQRT_RATIO,
+    MIN_TICK,
+    Q96,
+    compute_swap_step,
+    get_sqrt_ratio_at_tick,
+    next_initialized_tick_within_one_word,
+)
+from coinbase_agentkit.network import Network
+from coinbase_agentkit.wallet_providers import ContractCallResult
+
+WETH = "0x4200000000000000000000000000000000000006"
+TOKEN = "0x9999999999999999999999999999999999999999"
+POOL = "0x7777777777777777777777777777777777777777"
+FEE = 10000
+TICK_SPACING = 200
+WIDE_LIQUIDITY = 10**21
+NARROW_LIQUIDITY = 9 * 10**21
+
+# A wide position and a narrow one over [-2000, 2000], with the price at tick 0
+TICK_BITMAP = {-1: 1 << 246, 0: 1 << 10}
+LIQUIDITY_NET = {-2000: NARROW_LIQUIDITY, 2000: -NARROW_LIQUIDITY}
+
+
+def _pool_state() -> UniswapV3PoolState:
+    return UniswapV3PoolState(
+        address=POOL,
+        token0=WETH,
+        token1=TOKEN,
+        fee=FEE,
+        tick_spacing=TICK_SPACING,
+        sqrt_price_x96=Q96,
+        tick=0,
+        liquidity=WIDE_LIQUIDITY + NARROW_LIQUIDITY,
+        balance0=5 * 10**21,
+        balance1=5 * 10**21,
+        tick_bitmap={word: TICK_BITMAP.get(word, 0) for word in range(-2, 3)},
+        liquidity_net=dict(LIQUIDITY_NET),
+    )
+
+
+def _answer(call):
+    name, args = call.function_name, call.args or []
+    answers = {
+        "slot0": lambda: (Q96, 0, 0, 1, 1, 0, True),
+        "liquidity": lambda: WIDE_LIQUIDITY + NARROW_LIQUIDITY,
+        "token0": lambda: WETH,
+        "token1": lambda: TOKEN,
+        "fee": lambda: FEE,
+        "tickSpacing": lambda: TICK_SPACING,
+        "balanceOf": lambda: 5 * 10**21,
+        "tickBitmap": lambda: TICK_BITMAP.get(args[0], 0),
+        "ticks": lambda: (0, LIQUIDITY_NET[args[0]], 0, 0, 0, 0, 0, True),
+    }
+    return ContractCallResult(success=True, result=answers[name]())
+
+
+@pytest.fixture
+def wallet():
+    """Create a mock wallet that answers reads from a fake pool."""
+    pool_module._pool_immutables.clear()
+    wallet = MagicMock()
+    wallet.get_network.return_value = Network(
+        protocol_family="evm", network_id="base-mainnet", chain_id="8453"
+    )
+    wallet.get_block_number.return_value = 100
+    wallet.read_contracts.side_effect = lambda calls, block_identifier: [
+        _answer(call) for call in calls
+    ]
+    wallet.read_contract.side_effect = lambda contract_address, abi, function_name, args: (
+        POOL if function_name == "poolAddress" else 12345
+    )
+    yield wallet
+    pool_module._pool_immutables.clear()
+
+
+def test_sqrt_ratio_at_tick():
+    """Test the tick math against its bounds and the exact price."""
+    assert get_sqrt_ratio_at_tick(0) == Q96
+    assert get_sqrt_ratio_at_tick(MIN_TICK) == MIN_SQRT_RATIO
+    assert get_sqrt_ratio_at_tick(MAX_TICK) == MAX_SQRT_RATIO
+    for tick in [1, -1, 200, -2000, 51200, -400000]:
+        assert get_sqrt_ratio_at_tick(tick) / Q96 == pytest.approx(1.0001 ** (tick / 2))
+    with pytest.raises(ValueError):
+        get_sqrt_ratio_at_tick(MAX_TICK + 1)
+
+
+def test_compute_swap_step_matches_core():
+    """Test swap steps against the Uniswap v3 core test vectors."""
+    price = 79228162514264337593543950336
+    price_target = 79623317895830914510487008059
+
+    capped = compute_swap_step(price, price_target, 2 * 10**18, 10**18, 600)
+    assert capped == (price_target, 9975124224178055, 9925619580021728, 5988667735148)
+
+    price_target = 250541448375047931186413801569
+    _, amount_in, amount_out, fee_amount = compute_swap_step(
+        price, price_target, 2 * 10**18, 10**18, 600
+    )
+    assert (amount_in, amount_out, fee_amount) == (
+        999400000000000000,
+        666399946655997866,
+        600000000000000,
+    )
+
+
+def test_next_initialized_tick_within_one_word():
+    """Test the tick bitmap search in both directions."""
+    assert next_initialized_tick_within_one_word(TICK_BITMAP[-1], -1, TICK_SPACING, True) == (
+        -2000,
+        True,
+    )
+    assert next_initialized_tick_within_one_word(TICK_BITMAP[0], 0, TICK_SPACING, False) == (
+        2000,
+        True,
+    )
+    assert next_initialized_tick_within_one_word(0, -2001, TICK_SPACING, True) == (
+        -51200,
+        False,
+    )
+
+
+def test_small_swap_stays_in_range():
+    """Test that a small swap is priced at the pool price minus the fee."""
+    amount_out = _pool_state().quote_exact_input(WETH, 10**18)
+
+    assert amount_out == pytest.approx(10**18 * 0.99, rel=1e-3)
+    assert amount_out < 10**18 * 0.99
+
+
+def test_swap_crosses_initialized_tick():
+    """Test that liquidity changes when a swap crosses an initialized tick."""
+    amount_in = 2 * 10**21
+    sqrt_price_at_cross = get_sqrt_ratio_at_tick(-2000)
+    _, in1, out1, fee1 = compute_swap_step(
+        Q96, sqrt_price_at_cross, WIDE_LIQUIDITY + NARROW_LIQUIDITY, amount_in, FEE
+    )
+    _, _, out2, _ = compute_swap_step(
+        sqrt_price_at_cross,
+        get_sqrt_ratio_at_tick(-51200),
+        WIDE_LIQUIDITY,
+        amount_in - in1 - fee1,
+        FEE,
+    )
+
+    assert _pool_state().quote_exact_input(WETH, amount_in) == out1 + out2
+
+
+def test_swap_outside_loaded_words_is_unavailable():
+    """Test that swaps leaving the loaded bitmap words cannot be quoted locally."""
+    with pytest.raises(LocalQuoteUnavailableError):
+        _pool_state().quote_exact_input(WETH, 10**24)
+    with pytest.raises(ValueError):
+        _pool_state().quote_exact_input("0x0000000000000000000000000000000000000001", 1)
+
+
+def test_pool_state_is_read_in_batches_and_caches_immutables(wallet):
+    """Test that pool state takes three batched reads and immutables are read once."""
+    state = get_pool_state(wallet, POOL)
+
+    assert wallet.read_contracts.call_count == 3
+    assert state.tick_bitmap == {word: TICK_BITMAP.get(word, 0) for word in range(-2, 3)}
+    assert state.liquidity_net == LIQUIDITY_NET
+    for read in wallet.read_contracts.call_args_list:
+        assert read.kwargs["block_identifier"] == 100
+
+    wallet.read_contracts.reset_mock()
+    get_pool_state(wallet, POOL)
+
+    first_batch = [c.function_name for c in wallet.read_contracts.call_args_list[0].args[0]]
+    assert first_batch == ["slot0", "liquidity"]
+
+
+def test_quotes_fall_back_to_quoter_only_when_needed(wallet):
+    """Test that the on-chain quoter is only used for swaps leaving the loaded ticks."""
+    quotes = get_uniswap_quotes(wallet, TOKEN, [10**18, 2 * 10**21, 10**24], "buy")
+
+    assert quotes[0].amount_out == _pool_state().quote_exact_input(WETH, 10**18)
+    assert quotes[1].amount_out == _pool_state().quote_exact_input(WETH, 2 * 10**21)
+    assert quotes[2].amount_out == 12345
+    assert quotes[0].fee == 0.01
+    assert wallet.read_contracts.call_count == 3
+
+    quoter_calls = [
+        c
+        for c in wallet.read_contract.call_args_list
+        if c.kwargs["function_name"] == "quoteExactInputSingle"
+    ]
+    assert len(quoter_calls) == 1
+    assert quoter_calls[0].kwargs["args"][0]["amountIn"] == 10**24
@@ -0,0 +1,168 @@
+"""Tests for the analytics dispatcher."""
+
+import json
+import threading
+from unittest.mock import Mock, patch
+
+import pytest
+
+from coinbase_agentkit.analytics import (
+    AnalyticsConfig,
+    AnalyticsDispatcher,
+    RequiredEventData,
+    send_analytics_event,
+)
+from coinbase_agentkit.analytics.dispatcher import post_analytics_events
+
+
+@pytest.fixture
+def transport():
+    """Create a transport that records delivered batches."""
+    return Mock()
+
+
+def _event(i: int) -> dict:
+    return {"event_type": "test", "event_properties": {"i": i}}
+
+
+def test_enqueue_does_not_block_on_transport():
+    """Test that enqueue returns while the transport is still blocked."""
+    release = threading.Event()
+    delivered = threading.Event()
+
+    def slow_transport(batch):
+        release.wait(5)
+        delivered.set()
+
+    dispatcher = AnalyticsDispatcher(
+        AnalyticsConfig(batch_size=1, flush_interval=0.01), transport=slow_transport
+    )
+    dispatcher.enqueue(_event(0))
+
+    assert not delivered.is_set()
+    release.set()
+    assert delivered.wait(5)
+    dispatcher.shutdown(timeout=5)
+
+
+def test_flush_sends_batches(transport):
+    """Test that flush delivers queued events in batches of at most batch_size."""
+    dispatcher = AnalyticsDispatcher(
+        AnalyticsConfig(batch_size=2, flush_interval=60), transport=transport
+    )
+    with patch.object(dispatcher, "_ensure_worker"):
+        for i in range(5):
+            dispatcher.enqueue(_event(i))
+        dispatcher.flush()
+
+    batches = [call.args[0] for call in transport.call_args_list]
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    assert [e["event_properties"]["i"] for batch in batches for e in batch] == list(range(5))
+
+
+def test_overflow_drops_oldest(transport):
+    """Test that the oldest events are dropped when the queue is full."""
+    dispatcher = AnalyticsDispatcher(
+        AnalyticsConfig(max_queue_size=3, batch_size=10, flush_interval=60), transport=transport
+    )
+    with patch.object(dispatcher, "_ensure_worker"):
+        for i in range(5):
+            dispatcher.enqueue(_event(i))
+        dispatcher.flush()
+
+    batch = transport.call_args.args[0]
+    assert [e["event_properties"]["i"] for e in batch] == [2, 3, 4]
+    assert dispatcher.dropped_events == 2
+
+
+def test_disabled_and_sampled_out(transport):
+    """Test that disabled or sampled-out events are never queued."""
+    disabled = AnalyticsDispatcher(AnalyticsConfig(enabled=False), transport=transport)
+    disabled.enqueue(_event(0))
+    disabled.flush()
+
+    sampled = AnalyticsDispatcher(AnalyticsConfig(sample_rate=0), transport=transport)
+    sampled.enqueue(_event(0))
+    sampled.flush()
+
+    transport.assert_not_called()
+
+
+def test_shutdown_flushes_remaining(transport):
+    """Test that shutdown delivers queued events and stops accepting new ones."""
+    dispatcher = AnalyticsDispatcher(
+        AnalyticsConfig(batch_size=10, flush_interval=60), transport=transport
+    )
+    dispatcher.enqueue(_event(0))
+    dispatcher.shutdown(timeout=5)
+
+    transport.assert_called_once()
+    dispatcher.enqueue(_event(1))
+    dispatcher.flush()
+    assert transport.call_count == 1
+
+
+def test_transport_errors_are_swallowed():
+    """Test that delivery errors do not propagate."""
+    dispatcher = AnalyticsDispatcher(
+        AnalyticsConfig(flush_interval=60), transport=Mock(side_effect=Exception("down"))
+    )
+    with patch.object(dispatcher, "_ensure_worker"):
+        dispatcher.enqueue(_event(0))
+        dispatcher.flush()
+
+
+def test_local_sink(tmp_path):
+    """Test that events are written as JSONL when a sink path is configured."""
+    sink = tmp_path / "events.jsonl"
+    dispatcher = AnalyticsDispatcher(AnalyticsConfig(sink_path=str(sink), flush_interval=60))
+    with patch.object(dispatcher, "_ensure_worker"):
+        dispatcher.enqueue(_event(0))
+        dispatcher.enqueue(_event(1))
+        dispatcher.flush()
+
+    lines = sink.read_text().splitlines()
+    assert [json.loads(line)["event_properties"]["i"] for line in lines] == [0, 1]
+
+
+def test_config_from_env(monkeypatch):
+    """Test that the configuration can be read from environment variables."""
+    monkeypatch.setenv("AGENTKIT_ANALYTICS_DISABLED", "true")
+    monkeypatch.setenv("AGENTKIT_ANALYTICS_SAMPLE_RATE", "0.25")
+    monkeypatch.setenv("AGENTKIT_ANALYTICS_SINK_PATH", "/tmp/events.jsonl")
+
+    config = AnalyticsConfig.from_env()
+
+    assert not config.enabled
+    assert config.sample_rate == 0.25
+    assert config.sink_path == "/tmp/events.jsonl"
+
+
+def test_post_analytics_events_sends_one_request():
+    """Test that a batch is posted as a single request with a timeout."""
+    http_client = Mock()
+    post_analytics_events([_event(0), _event(1)], timeout=3, http_client=http_client)
+
+    mock_post = http_client.post
+    mock_post.assert_called_once()
+    payload = mock_post.call_args.kwargs["json"]
+    assert len(json.loads(payload["e"])) == 2
+    assert payload["checksum"]
+    assert mock_post.call_args.kwargs["timeout"] == 3
+
+
+def test_send_analytics_event_enqueues():
+    """Test that send_analytics_event builds the event and queues it."""
+    dispatcher = Mock()
+    with patch(
+        "coinbase_agentkit.analytics.send_analytics_event.get_analytics_dispatcher",
+        return_value=dispatcher,
+    ):
+        send_analytics_event(
+            RequiredEventData(name="agent_initialization", action="init", component="test")
+        )
+
+    event = dispatcher.enqueue.call_args.args[0]
+    assert event["event_type"] == "agent_initialization"
+    assert event["event_properties"]["component_type"] == "test"
+    assert event["event_properties"]["agentkit_language"] == "python"
@@ -0,0 +1,17 @@
+"""Shared test fixtures."""
+
+import pytest
+
+from coinbase_agentkit.action_providers.erc20.token_metadata import (
+    TokenMetadataRegistry,
+    set_token_metadata_registry,
+)
+
+
+@pytest.fixture(autouse=True)
+def token_metadata_registry():
+    """Give every test an empty token metadata registry."""
+    registry = TokenMetadataRegistry()
+    set_token_metadata_registry(registry)
+    yield registry
+    set_token_metadata_registry(None)
@@ -0,0 +1,234 @@
+"""Tests for the read-only action result cache."""
+
+import asyncio
+from typing import Any
+from unittest.mock import Mock, patch
+
+import pytest
+from pydantic import BaseModel, Field
+
+from coinbase_agentkit import AgentKit, AgentKitConfig
+from coinbase_agentkit.action_cache import ActionResultCache, cache_action_results
+from coinbase_agentkit.action_providers.action_decorator import create_action
+from coinbase_agentkit.action_providers.action_provider import ActionProvider
+from coinbase_agentkit.network import Network
+from coinbase_agentkit.wallet_providers import EvmWalletProvider
+
+NETWORK = Network(protocol_family="evm", network_id="base-sepolia", chain_id="84532")
+
+
+class LookupSchema(BaseModel):
+    """Input schema for the lookup actions."""
+
+    symbol: str = Field(..., description="The symbol to look up")
+    decimals: int = Field(18, description="The number of decimals")
+
+
+class LookupActionProvider(ActionProvider):
+    """Action provider with read-only and side-effecting actions."""
+
+    def __init__(self):
+        super().__init__("lookup", [])
+        self.calls = 0
+
+    @create_action(name="balance", description="Read", schema=LookupSchema, read_only=True)
+    def balance(self, wallet_provider: EvmWalletProvider, args: dict[str, Any]) -> str:
+        """Count the call and return the symbol."""
+        self.calls += 1
+        return f"{args['symbol']} {self.calls}"
+
+    @create_action(
+        name="price", description="Read", schema=LookupSchema, read_only=True, cache_ttl=10
+    )
+    async def price(self, args: dict[str, Any]) -> str:
+        """Count the call and return the symbol."""
+        self.calls += 1
+        if args["symbol"] == "BAD":
+            return "Error fetching price"
+        return f"{args['symbol']} {self.calls}"
+
+    @create_action(name="transfer", description="Write", schema=LookupSchema)
+    def transfer(self, wallet_provider: EvmWalletProvider, args: dict[str, Any]) -> str:
+        """Count the call."""
+        self.calls += 1
+        return str(self.calls)
+
+    def supports_network(self, network: Network) -> bool:
+        """Support every network."""
+        return True
+
+
+@pytest.fixture
+def wallet_provider():
+    """Create a mock EVM wallet provider at block 100."""
+    wallet_provider = Mock(spec=EvmWalletProvider)
+    wallet_provider.get_address.return_value = "0x1234"
+    wallet_provider.get_network.return_value = NETWORK
+    wallet_provider.get_block_number.return_value = 100
+    return wallet_provider
+
+
+@pytest.fixture
+def provider():
+    """Create a lookup action provider."""
+    return LookupActionProvider()
+
+
+@pytest.fixture
+def agent_kit(provider, wallet_provider):
+    """Create an AgentKit instance with the lookup provider."""
+    return AgentKit(AgentKitConfig(wallet_provider=wallet_provider, action_providers=[provider]))
+
+
+def test_create_action_metadata(provider):
+    """Test that the read-only declaration is carried onto actions."""
+    actions = {a.name.split("_", 1)[1]: a for a in provider.get_actions(Mock())}
+
+    assert actions["balance"].read_only
+    assert actions["balance"].block_scoped
+    assert actions["balance"].cache_ttl is None
+    assert actions["price"].read_only
+    assert not actions["price"].block_scoped
+    assert actions["price"].cache_ttl == 10
+    assert not actions["transfer"].read_only
+
+
+def test_create_action_rejects_ttl_without_read_only():
+    """Test that a TTL on a side-effecting action is rejected."""
+    with pytest.raises(ValueError, match="read_only"):
+        create_action(name="x", description="x", cache_ttl=5)
+
+
+def test_lru_eviction():
+    """Test that the least recently used result is evicted first."""
+    cache = ActionResultCache(max_size=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("a") == (True, 1)
+    assert cache.get("b") == (False, None)
+    assert cache.get("c") == (True, 3)
+    assert len(cache) == 2
+
+
+def test_ttl_expiry():
+    """Test that results expire after their TTL."""
+    cache = ActionResultCache()
+    with patch("coinbase_agentkit.action_cache.time.monotonic", return_value=0.0):
+        cache.set("a", 1, ttl=5)
+    with patch("coinbase_agentkit.action_cache.time.monotonic", return_value=4.0):
+        assert cache.get("a") == (True, 1)
+    with patch("coinbase_agentkit.action_cache.time.monotonic", return_value=5.0):
+        assert cache.get("a") == (False, None)
+
+
+def test_block_pinning():
+    """Test that block-pinned results are dropped when the block changes."""
+    cache = ActionResultCache()
+    cache.set("a", 1, block_number=100)
+
+    assert cache.get("a", 100) == (True, 1)
+    assert cache.get("a", 101) == (False, None)
+    assert cache.get("a", 100) == (False, None)
+
+
+def test_zero_size_disables_cache(provider, wallet_provider):
+    """Test that a zero-sized cache leaves actions unwrapped."""
+    action = provider.get_actions(wallet_provider)[0]
+
+    assert cache_action_results(action, ActionResultCache(0), wallet_provider, NETWORK) is action
+
+
+def test_read_only_results_are_cached(agent_kit, provider):
+    """Test that equivalent arguments share one cached result."""
+    action = agent_kit.get_action("LookupActionProvider_balance")
+
+    assert action.invoke({"symbol": "USDC"}) == "USDC 1"
+    assert action.invoke({"symbol": "USDC", "decimals": 18}) == "USDC 1"
+    assert action.invoke({"symbol": "USDC", "decimals": 6}) == "USDC 2"
+    assert provider.calls == 2
+
+
+def test_block_advance_invalidates(agent_kit, provider, wallet_provider):
+    """Test that on-chain reads are refreshed when the chain advances."""
+    action = agent_kit.get_action("LookupActionProvider_balance")
+    action.invoke({"symbol": "USDC"})
+
+    wallet_provider.get_block_number.return_value = 101
+
+    assert action.invoke({"symbol": "USDC"}) == "USDC 2"
+
+
+def test_unknown_block_is_not_cached(agent_kit, provider, wallet_provider):
+    """Test that block-scoped reads without a block or a TTL always run."""
+    wallet_provider.get_block_number.return_value = None
+    action = agent_kit.get_action("LookupActionProvider_balance")
+
+    assert action.invoke({"symbol": "USDC"}) == "USDC 1"
+    assert action.invoke({"symbol": "USDC"}) == "USDC 2"
+
+
+def test_unknown_block_falls_back_to_ttl(provider, wallet_provider):
+    """Test that block-scoped reads with a TTL are cached by TTL when the block is unknown."""
+    wallet_provider.get_block_number.return_value = None
+    balance = next(a for a in provider.get_actions(wallet_provider) if a.name.endswith("balance"))
+    action = cache_action_results(
+        balance.model_copy(update={"cache_ttl": 10}), ActionResultCache(), wallet_provider, NETWORK
+    )
+
+    assert action.invoke({"symbol": "USDC"}) == "USDC 1"
+    assert action.invoke({"symbol": "USDC"}) == "USDC 1"
+
+
+def test_wallet_address_is_part_of_key(agent_kit, provider, wallet_provider):
+    """Test that results are not shared between wallet addresses."""
+    action = agent_kit.get_action("LookupActionProvider_balance")
+    action.invoke({"symbol": "USDC"})
+
+    wallet_provider.get_address.return_value = "0x5678"
+
+    assert action.invoke({"symbol": "USDC"}) == "USDC 2"
+
+
+def test_side_effecting_actions_are_not_cached(agent_kit, provider):
+    """Test that actions without the read-only declaration always run."""
+    action = agent_kit.get_action("LookupActionProvider_transfer")
+    action.invoke({"symbol": "USDC"})
+    action.invoke({"symbol": "USDC"})
+
+    assert provider.calls == 2
+
+
+def test_async_results_are_cached(agent_kit, provider, wallet_provider):
+    """Test caching of async actions, which are not pinned to a block."""
+    action = agent_kit.get_action("LookupActionProvider_price")
+
+    assert asyncio.run(action.ainvoke({"symbol": "ETH"})) == "ETH 1"
+    assert action.invoke({"symbol": "ETH"}) == "ETH 1"
+    wallet_provider.get_block_number.assert_not_called()
+
+
+def test_errors_and_invalid_args_are_not_cached(agent_kit, provider):
+    """Test that error results and invalid arguments bypass the cache."""
+    action = agent_kit.get_action("LookupActionProvider_price")
+    action.invoke({"symbol": "BAD"})
+    action.invoke({"symbol": "BAD"})
+    assert provider.calls == 2
+
+    action = agent_kit.get_action("LookupActionProvider_balance")
+    for _ in range(2):
+        with pytest.raises(KeyError):
+            action.invoke({})
+    assert provider.calls == 4
+
+
+def test_invalidate_actions_clears_results(agent_kit, provider):
+    """Test that invalidating the catalog also drops cached results."""
+    agent_kit.get_action("LookupActionProvider_balance").invoke({"symbol": "USDC"})
+    agent_kit.invalidate_actions()
+
+    assert agent_kit.get_action("LookupActionProvider_balance").invoke({"symbol": "USDC"}) == (
+        "USDC 2"
+    )
@@ -0,0 +1,121 @@
+"""Tests for AgentKit action catalog caching."""
+
+from typing import Any
+from unittest.mock import Mock
+
+import pytest
+from pydantic import BaseModel
+
+from coinbase_agentkit import AgentKit, AgentKitConfig
+from coinbase_agentkit.action_providers.action_decorator import create_action
+from coinbase_agentkit.action_providers.action_provider import ActionProvider
+from coinbase_agentkit.network import Network
+from coinbase_agentkit.wallet_providers import WalletProvider
+
+
+class PingSchema(BaseModel):
+    """Input schema for the ping action."""
+
+
+class PingActionProvider(ActionProvider):
+    """Action provider that only supports one network."""
+
+    def __init__(self, network_id: str = "base-sepolia"):
+        super().__init__(f"ping_{network_id}", [])
+        self.network_id = network_id
+        self.get_actions = Mock(wraps=self.get_actions)
+
+    @create_action(name="ping", description="Ping", schema=PingSchema)
+    def ping(self, args: dict[str, Any]) -> str:
+        """Return pong."""
+        return "pong"
+
+    def supports_network(self, network: Network) -> bool:
+        """Support only the configured network."""
+        return network.network_id == self.network_id
+
+
+def _wallet_provider(network_id: str = "base-sepolia") -> Mock:
+    """Create a mock wallet provider on a network."""
+    wallet_provider = Mock(spec=WalletProvider)
+    wallet_provider.get_network.return_value = Network(
+        protocol_family="evm", network_id=network_id, chain_id="84532"
+    )
+    return wallet_provider
+
+
+@pytest.fixture
+def provider():
+    """Create a ping action provider."""
+    return PingActionProvider()
+
+
+@pytest.fixture
+def agent_kit(provider):
+    """Create an AgentKit instance with the ping provider."""
+    return AgentKit(AgentKitConfig(wallet_provider=_wallet_provider(), action_providers=[provider]))
+
+
+def test_get_actions_is_cached(agent_kit, provider):
+    """Test that repeated calls reuse the same actions."""
+    first = agent_kit.get_actions()
+    second = agent_kit.get_actions()
+
+    assert [a.name for a in first] == ["PingActionProvider_ping"]
+    assert first[0] is second[0]
+    assert first is not second
+    provider.get_actions.assert_called_once()
+
+
+def test_get_action_by_name(agent_kit):
+    """Test looking up an action by name."""
+    action = agent_kit.get_action("PingActionProvider_ping")
+
+    assert action is not None
+    assert action.invoke({}) == "pong"
+    assert agent_kit.get_action("missing") is None
+
+
+def test_network_change_rebuilds_catalog(agent_kit, provider):
+    """Test that switching networks rebuilds the catalog."""
+    assert len(agent_kit.get_actions()) == 1
+
+    agent_kit.wallet_provider.get_network.return_value = Network(
+        protocol_family="evm", network_id="base-mainnet", chain_id="8453"
+    )
+
+    assert agent_kit.get_actions() == []
+    assert provider.get_actions.call_count == 1
+
+
+def test_provider_changes_invalidate_catalog(agent_kit, provider):
+    """Test that replacing or appending providers and wallets rebuilds the catalog."""
+    agent_kit.get_actions()
+
+    other = PingActionProvider()
+    agent_kit.action_providers.append(other)
+    assert len(agent_kit.get_actions()) == 2
+
+    agent_kit.wallet_provider = _wallet_provider()
+    agent_kit.get_actions()
+    assert provider.get_actions.call_count == 3
+
+    agent_kit.action_providers = [other]
+    assert len(agent_kit.get_actions()) == 1
+
+
+def test_invalidate_actions(agent_kit, provider):
+    """Test explicit invalidation."""
+    agent_kit.get_actions()
+    agent_kit.invalidate_actions()
+    agent_kit.get_actions()
+
+    assert provider.get_actions.call_count == 2
+
+
+def test_get_actions_without_wallet_provider(agent_kit):
+    """Test that a missing wallet provider is still reported."""
+    agent_kit.wallet_provider = None
+
+    with pytest.raises(ValueError, match="No wallet provider configured"):
+        agent_kit.get_actions()
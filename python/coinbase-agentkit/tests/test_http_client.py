@@ -0,0 +1,284 @@
+"""Tests for the shared HTTP client against a local stub server."""
+
+import asyncio
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import httpx
+import pytest
+import requests
+
+from coinbase_agentkit.http_client import (
+    AsyncHttpClient,
+    HttpClient,
+    HttpClientConfig,
+    get_http_client,
+    retry_delay,
+    set_http_client,
+)
+
+
+class StubServer(ThreadingHTTPServer):
+    """A local server answering each request with the next queued status and delay."""
+
+    daemon_threads = True
+
+    def __init__(self):
+        """Start listening on a free local port."""
+        super().__init__(("127.0.0.1", 0), _StubHandler)
+        self.statuses: list[int] = []
+        self.delays: list[float] = []
+        self.headers: dict[str, str] = {}
+        self.requests: list[tuple[str, str]] = []
+
+    @property
+    def url(self) -> str:
+        """The server's base URL."""
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def handle_error(self, request, client_address):
+        """Ignore clients that hung up after timing out, and report anything else."""
+        if not isinstance(sys.exc_info()[1], ConnectionError):
+            super().handle_error(request, client_address)
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def _respond(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        if length:
+            self.rfile.read(length)
+        self.server.requests.append((self.command, self.path))
+
+        if self.server.delays:
+            time.sleep(self.server.delays.pop(0))
+        status = self.server.statuses.pop(0) if self.server.statuses else 200
+        self.send_response(status)
+        for name, value in self.server.headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"ok")
+
+    do_GET = _respond  # noqa: N815
+    do_POST = _respond  # noqa: N815
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    """Run a stub server for the duration of a test."""
+    stub = StubServer()
+    thread = threading.Thread(target=stub.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    yield stub
+    stub.shutdown()
+    stub.server_close()
+
+
+@pytest.fixture
+def client():
+    """Create a client that retries without waiting."""
+    http_client = HttpClient(HttpClientConfig(backoff_factor=0))
+    yield http_client
+    http_client.close()
+
+
+def test_get_is_retried_until_it_succeeds(server, client):
+    """Test that a GET answered with retryable statuses is sent again."""
+    server.statuses = [503, 502]
+
+    response = client.get(f"{server.url}/prices")
+
+    assert response.status_code == 200
+    assert server.requests == [("GET", "/prices")] * 3
+
+
+def test_retries_are_bounded(server, client):
+    """Test that the last failed response is returned once retries run out."""
+    server.statuses = [500] * 10
+
+    response = client.get(f"{server.url}/prices")
+
+    assert response.status_code == 500
+    assert len(server.requests) == client.config.max_retries + 1
+
+
+def test_post_is_not_retried_after_a_server_error(server, client):
+    """Test that a POST the server may have acted on is not sent twice."""
+    server.statuses = [500]
+
+    response = client.post(f"{server.url}/orders", json={"id": 1})
+
+    assert response.status_code == 500
+    assert server.requests == [("POST", "/orders")]
+
+
+def test_post_is_retried_when_rate_limited(server, client):
+    """Test that a POST rejected with 429 is sent again."""
+    server.statuses = [429]
+
+    response = client.post(f"{server.url}/orders", json={"id": 1})
+
+    assert response.status_code == 200
+    assert len(server.requests) == 2
+
+
+def test_connection_errors_are_retried():
+    """Test that a refused connection is retried for idempotent requests."""
+    client = HttpClient(HttpClientConfig(backoff_factor=0, max_retries=2))
+    with (
+        patch.object(client.session, "request", wraps=client.session.request) as request,
+        pytest.raises(requests.ConnectionError),
+    ):
+        client.get("http://127.0.0.1:9/")
+
+    assert request.call_count == 3
+
+
+def test_default_timeout_is_applied(server, client):
+    """Test that requests get the configured timeouts unless the caller passes one."""
+    with patch.object(client.session, "request", wraps=client.session.request) as request:
+        client.get(server.url)
+        client.get(server.url, timeout=1)
+
+    assert request.call_args_list[0].kwargs["timeout"] == (5.0, 30.0)
+    assert request.call_args_list[1].kwargs["timeout"] == 1
+
+
+def test_retry_after_is_honored(server):
+    """Test that the Retry-After header sets the delay, capped at the maximum backoff."""
+    server.headers = {"Retry-After": "2"}
+    config = HttpClientConfig(max_backoff=10)
+    client = HttpClient(config)
+    server.statuses = [503]
+
+    with patch("coinbase_agentkit.http_client.time.sleep") as sleep:
+        client.get(server.url)
+
+    sleep.assert_called_once_with(2.0)
+    assert retry_delay(HttpClientConfig(max_backoff=1), 0, client.get(server.url)) == 1.0
+
+
+def test_backoff_is_jittered_and_capped():
+    """Test that delays are random and never exceed the exponential bound or the cap."""
+    config = HttpClientConfig(backoff_factor=1, max_backoff=5)
+
+    delays = [retry_delay(config, attempt) for attempt in range(6) for _ in range(20)]
+
+    assert all(0 <= delay <= 5 for delay in delays)
+    assert all(retry_delay(config, 0) <= 1 for _ in range(20))
+    assert len(set(delays)) > 1
+
+
+def test_shared_client_can_be_replaced():
+    """Test that the process-wide client is created once and can be swapped."""
+    shared = get_http_client()
+    assert get_http_client() is shared
+
+    replacement = HttpClient()
+    set_http_client(replacement)
+    try:
+        assert get_http_client() is replacement
+    finally:
+        set_http_client(shared)
+
+
+def _run_async(config, method, url, **kwargs):
+    async def send():
+        client = AsyncHttpClient(config)
+        try:
+            return await client.request(method, url, **kwargs)
+        finally:
+            await client.aclose()
+
+    return asyncio.run(send())
+
+
+def test_async_get_is_retried_until_it_succeeds(server):
+    """Test that the async client sends a GET again after retryable statuses."""
+    server.statuses = [503, 502]
+
+    response = _run_async(HttpClientConfig(backoff_factor=0), "GET", f"{server.url}/prices")
+
+    assert response.status_code == 200
+    assert server.requests == [("GET", "/prices")] * 3
+
+
+def test_async_post_is_not_retried_after_a_server_error(server):
+    """Test that the async client does not send a POST twice after a server error."""
+    server.statuses = [500, 429]
+
+    response = _run_async(HttpClientConfig(backoff_factor=0), "POST", f"{server.url}/orders")
+
+    assert response.status_code == 500
+    assert server.requests == [("POST", "/orders")]
+
+
+def test_async_read_timeout_is_retried_for_get(server):
+    """Test that a GET that times out reading the response is sent again."""
+    server.delays = [0.5]
+    config = HttpClientConfig(backoff_factor=0, read_timeout=0.1)
+
+    response = _run_async(config, "GET", f"{server.url}/prices")
+
+    assert response.status_code == 200
+    assert len(server.requests) == 2
+
+
+def test_async_read_timeout_is_not_retried_for_post(server):
+    """Test that a POST that times out is not sent again, since the server may have acted on it."""
+    server.delays = [0.5]
+    config = HttpClientConfig(backoff_factor=0, read_timeout=0.1)
+
+    with pytest.raises(httpx.ReadTimeout):
+        _run_async(config, "POST", f"{server.url}/orders")
+
+    assert server.requests == [("POST", "/orders")]
+
+
+def test_async_connection_errors_are_retried():
+    """Test that the async client retries a refused connection for idempotent requests."""
+    attempts = []
+
+    async def send():
+        client = AsyncHttpClient(HttpClientConfig(backoff_factor=0, max_retries=2))
+        request = client.client.request
+
+        async def counting_request(*args, **kwargs):
+            attempts.append(args)
+            return await request(*args, **kwargs)
+
+        try:
+            with patch.object(client.client, "request", counting_request):
+                await client.get("http://127.0.0.1:9/")
+        finally:
+            await client.aclose()
+
+    with pytest.raises(httpx.ConnectError):
+        asyncio.run(send())
+
+    assert len(attempts) == 3
+
+
+def test_async_client_uses_configured_timeouts_and_http2(server):
+    """Test that the async client applies the configured timeouts and can negotiate HTTP/2."""
+    config = HttpClientConfig(connect_timeout=2, read_timeout=7, http2=True)
+
+    async def send():
+        client = AsyncHttpClient(config)
+        try:
+            return client.client.timeout, await client.get(server.url)
+        finally:
+            await client.aclose()
+
+    timeout, response = asyncio.run(send())
+
+    assert timeout == httpx.Timeout(7, connect=2)
+    assert response.status_code == 200
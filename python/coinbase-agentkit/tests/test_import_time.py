@@ -0,0 +1,74 @@
+"""Import time benchmark and lazy import checks for coinbase_agentkit."""
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+import coinbase_agentkit
+from coinbase_agentkit import action_providers, wallet_providers
+
+IMPORT_TIME_BUDGET_SECONDS = float(os.environ.get("AGENTKIT_IMPORT_TIME_BUDGET", "3.0"))
+
+HEAVY_MODULES = [
+    "cdp",
+    "paramiko",
+    "nilql",
+    "jwt",
+    "ecdsa",
+    "allora_sdk",
+    "coinbase_agentkit.action_providers.wow.constants",
+    "coinbase_agentkit.action_providers.erc721.constants",
+]
+
+
+def _import_in_subprocess(statement: str) -> tuple[float, list[str]]:
+    """Time an import statement in a fresh interpreter and list the heavy modules it loaded."""
+    code = (
+        "import json, sys, time\n"
+        "start = time.perf_counter()\n"
+        f"{statement}\n"
+        "elapsed = time.perf_counter() - start\n"
+        f"loaded = [m for m in {HEAVY_MODULES!r} if m in sys.modules]\n"
+        "print(json.dumps([elapsed, loaded]))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    elapsed, loaded = json.loads(result.stdout.strip().splitlines()[-1])
+    return elapsed, loaded
+
+
+def test_import_time_budget():
+    """Test that importing the package stays within the cold start budget."""
+    elapsed, loaded = _import_in_subprocess("import coinbase_agentkit")
+
+    assert loaded == []
+    assert (
+        elapsed < IMPORT_TIME_BUDGET_SECONDS
+    ), f"import coinbase_agentkit took {elapsed:.2f}s, budget is {IMPORT_TIME_BUDGET_SECONDS}s"
+
+
+def test_single_provider_import_is_isolated():
+    """Test that using one provider does not import the dependencies of the others."""
+    _, loaded = _import_in_subprocess(
+        "from coinbase_agentkit import AgentKit, erc20_action_provider"
+    )
+
+    assert loaded == []
+
+
+@pytest.mark.parametrize("module", [coinbase_agentkit, action_providers, wallet_providers])
+def test_public_api_is_unchanged(module):
+    """Test that every exported name still resolves and is listed by dir()."""
+    for name in module.__all__:
+        assert getattr(module, name) is not None
+        assert name in dir(module)
+
+
+def test_unknown_attribute_raises():
+    """Test that unknown attributes still raise AttributeError."""
+    with pytest.raises(AttributeError):
+        _ = coinbase_agentkit.not_a_provider
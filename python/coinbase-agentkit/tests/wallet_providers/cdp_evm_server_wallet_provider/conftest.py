@@ -137,12 +137,12 @@ def mocked_wallet_provider(mock_cdp_client, mock_account, mock_web3, mock_wallet
         network_id=MOCK_NETWORK_ID,
     )
 
-    # Patch the async run to return the mock account directly
-    with patch("asyncio.run", return_value=mock_account):
-        provider = CdpEvmServerWalletProvider(config)
+    provider = CdpEvmServerWalletProvider(config)
 
-        # Manually set account and wallet attributes
-        provider._account = mock_account
-        provider._wallet = mock_wallet
+    # Manually set account and wallet attributes
+    provider._account = mock_account
+    provider._wallet = mock_wallet
 
-        yield provider
+    yield provider
+
+    provider.close()
@@ -5,6 +5,7 @@ from unittest.mock import patch
 
 import pytest
 
+from coinbase_agentkit.wallet_providers import cdp_evm_server_wallet_provider
 from coinbase_agentkit.wallet_providers.cdp_evm_server_wallet_provider import (
     CdpEvmServerWalletProvider,
     CdpEvmServerWalletProviderConfig,
@@ -25,26 +26,25 @@ from .conftest import (
 
 def test_init_with_config(mock_cdp_client, mock_account):
     """Test initialization with config."""
-    with patch("asyncio.run") as mock_run:
-        mock_run.return_value = mock_account
+    mock_cdp_client.evm.create_account.return_value = mock_account
 
-        config = CdpEvmServerWalletProviderConfig(
-            api_key_id=MOCK_API_KEY_ID,
-            api_key_secret=MOCK_API_KEY_SECRET,
-            wallet_secret=MOCK_WALLET_SECRET,
-            network_id=MOCK_NETWORK_ID,
-        )
-
-        provider = CdpEvmServerWalletProvider(config)
+    config = CdpEvmServerWalletProviderConfig(
+        api_key_id=MOCK_API_KEY_ID,
+        api_key_secret=MOCK_API_KEY_SECRET,
+        wallet_secret=MOCK_WALLET_SECRET,
+        network_id=MOCK_NETWORK_ID,
+    )
 
+    with CdpEvmServerWalletProvider(config) as provider:
         assert provider.get_address() == MOCK_ADDRESS
         assert provider.get_network().network_id == MOCK_NETWORK_ID
 
 
 def test_init_with_env_vars(mock_cdp_client, mock_account):
     """Test initialization with environment variables."""
+    mock_cdp_client.evm.create_account.return_value = mock_account
+
     with (
-        patch("asyncio.run") as mock_run,
         patch.dict(
             os.environ,
             {
@@ -54,37 +54,32 @@ def test_init_with_env_vars(mock_cdp_client, mock_account):
                 "NETWORK_ID": MOCK_NETWORK_ID,
             },
         ),
+        CdpEvmServerWalletProvider(CdpEvmServerWalletProviderConfig()) as provider,
     ):
-        mock_run.return_value = mock_account
-
-        provider = CdpEvmServerWalletProvider(CdpEvmServerWalletProviderConfig())
-
         assert provider.get_address() == MOCK_ADDRESS
         assert provider.get_network().network_id == MOCK_NETWORK_ID
 
 
 def test_init_with_default_network(mock_cdp_client, mock_account):
     """Test initialization with default network when no network ID is provided."""
+    mock_cdp_client.evm.create_account.return_value = mock_account
+
     with (
-        patch("asyncio.run") as mock_run,
         patch(
             "os.getenv",
             side_effect=lambda key, default=None: "base-sepolia" if key == "NETWORK_ID" else None,
         ),
         patch.dict(os.environ, {}, clear=True),
     ):
-        mock_run.return_value = mock_account
-
         config = CdpEvmServerWalletProviderConfig(
             api_key_id=MOCK_API_KEY_ID,
             api_key_secret=MOCK_API_KEY_SECRET,
             wallet_secret=MOCK_WALLET_SECRET,
         )
 
-        provider = CdpEvmServerWalletProvider(config)
-
-        network = provider.get_network()
-        assert network.network_id == "base-sepolia"
+        with CdpEvmServerWalletProvider(config) as provider:
+            network = provider.get_network()
+            assert network.network_id == "base-sepolia"
 
 
 def test_init_with_missing_credentials():
@@ -99,27 +94,44 @@ def test_init_with_missing_credentials():
 def test_init_with_invalid_network(mock_cdp_client):
     """Test initialization with invalid network."""
     # Use a known invalid network ID
-    with patch("asyncio.run", side_effect=ValueError("Invalid network ID")):
-        config = CdpEvmServerWalletProviderConfig(
-            api_key_id=MOCK_API_KEY_ID,
-            api_key_secret=MOCK_API_KEY_SECRET,
-            wallet_secret=MOCK_WALLET_SECRET,
-            network_id="invalid-network",
-        )
+    config = CdpEvmServerWalletProviderConfig(
+        api_key_id=MOCK_API_KEY_ID,
+        api_key_secret=MOCK_API_KEY_SECRET,
+        wallet_secret=MOCK_WALLET_SECRET,
+        network_id="invalid-network",
+    )
 
-        with pytest.raises(ValueError, match="Failed to initialize CDP wallet"):
-            CdpEvmServerWalletProvider(config)
+    with pytest.raises(ValueError, match="Failed to initialize CDP wallet"):
+        CdpEvmServerWalletProvider(config)
 
 
 def test_init_with_account_creation_error(mock_cdp_client):
     """Test initialization when account creation fails."""
-    with patch("asyncio.run", side_effect=Exception("Failed to create account")):
-        config = CdpEvmServerWalletProviderConfig(
-            api_key_id=MOCK_API_KEY_ID,
-            api_key_secret=MOCK_API_KEY_SECRET,
-            wallet_secret=MOCK_WALLET_SECRET,
-            network_id=MOCK_NETWORK_ID,
-        )
+    mock_cdp_client.evm.create_account.side_effect = Exception("Failed to create account")
 
-        with pytest.raises(ValueError, match="Failed to initialize CDP wallet"):
-            CdpEvmServerWalletProvider(config)
+    config = CdpEvmServerWalletProviderConfig(
+        api_key_id=MOCK_API_KEY_ID,
+        api_key_secret=MOCK_API_KEY_SECRET,
+        wallet_secret=MOCK_WALLET_SECRET,
+        network_id=MOCK_NETWORK_ID,
+    )
+
+    with pytest.raises(ValueError, match="Failed to initialize CDP wallet"):
+        CdpEvmServerWalletProvider(config)
+
+    mock_cdp_client.close.assert_awaited_once()
+
+
+def test_client_reused_across_operations(mocked_wallet_provider, mock_cdp_client):
+    """Test that one client and one event loop thread serve every operation."""
+    mocked_wallet_provider.sign_message("first")
+    mocked_wallet_provider.sign_message("second")
+    mocked_wallet_provider.send_transaction({"to": MOCK_ADDRESS})
+
+    assert cdp_evm_server_wallet_provider.CdpClient.call_count == 1
+    mock_cdp_client.__aenter__.assert_not_called()
+    mock_cdp_client.close.assert_not_called()
+
+    mocked_wallet_provider.close()
+
+    mock_cdp_client.close.assert_awaited_once()
@@ -6,6 +6,7 @@ import pytest
 from eth_account.account import Account
 
 from coinbase_agentkit.network import Network
+from coinbase_agentkit.wallet_providers.cdp_client_session import CdpClientSession
 from coinbase_agentkit.wallet_providers.cdp_evm_smart_wallet_provider import (
     CdpEvmSmartWalletProvider,
     CdpEvmSmartWalletProviderConfig,
@@ -107,31 +108,6 @@ def mock_web3():
         yield mock_web3
 
 
-@pytest.fixture
-def mock_asyncio():
-    """Create a mock for asyncio."""
-    with patch(
-        "coinbase_agentkit.wallet_providers.cdp_evm_smart_wallet_provider.asyncio"
-    ) as mock_asyncio:
-        # Create a side effect for asyncio.run that handles the initialization coroutine
-        def run_side_effect(coro):
-            # Special handling for the initialization_accounts coroutine
-            if coro.__name__ == "initialize_accounts":
-                # Return a tuple of mock owner and smart account
-                mock_owner = Mock(spec=Account)
-                mock_owner.address = "0x123456789012345678901234567890123456789012"
-
-                mock_smart_account = Mock()
-                mock_smart_account.address = MOCK_ADDRESS
-
-                return (mock_owner, mock_smart_account)
-            # For client.close, just return None
-            return None
-
-        mock_asyncio.run = Mock(side_effect=run_side_effect)
-        yield mock_asyncio
-
-
 @pytest.fixture
 def mock_network_id_to_chain():
     """Create a mock for NETWORK_ID_TO_CHAIN."""
@@ -154,7 +130,6 @@ def mocked_wallet_provider(
     mock_owner,
     mock_smart_account,
     mock_web3,
-    mock_asyncio,
     mock_network_id_to_chain,
 ):
     """Create a CdpEvmSmartWalletProvider instance with mocked dependencies."""
@@ -198,77 +173,13 @@ def mocked_wallet_provider(
 
         provider._web3 = mock_web3.return_value
         provider._owner = mock_owner
+        provider._smart_account = None
         provider._gas_limit_multiplier = 1.2
         provider._fee_per_gas_multiplier = 1
         provider.get_client = Mock(return_value=mock_cdp_client)
-
-        # Update _run_async to properly handle coroutines
-        async def mock_coro_func():
-            # This is a dummy async function that returns a mock with a transaction_hash
-            mock_result = Mock()
-            mock_result.transaction_hash = MOCK_TRANSACTION_HASH
-            return mock_result
-
-        def run_async_side_effect(coro):
-            # If the coroutine is one related to user operations, return a mock with transaction_hash
-            if hasattr(coro, "__name__") and coro.__name__ == "_send_user_operation":
-                # For transaction failure tests
-                if isinstance(mock_cdp_client.evm.send_user_operation.side_effect, Exception) or (
-                    callable(mock_cdp_client.evm.send_user_operation.side_effect)
-                    and not isinstance(
-                        mock_cdp_client.evm.send_user_operation.side_effect, AsyncMock
-                    )
-                ):
-                    # Use the side_effect function/exception directly
-                    if callable(mock_cdp_client.evm.send_user_operation.side_effect):
-                        try:
-                            # Call the side effect function
-                            mock_cdp_client.evm.send_user_operation.side_effect()
-                        except Exception as e:
-                            raise e
-                    else:
-                        # It's an exception instance
-                        raise mock_cdp_client.evm.send_user_operation.side_effect
-
-                # For wait_for_user_operation timeout tests
-                if isinstance(
-                    mock_cdp_client.evm.wait_for_user_operation.side_effect, Exception
-                ) or (
-                    callable(mock_cdp_client.evm.wait_for_user_operation.side_effect)
-                    and not isinstance(
-                        mock_cdp_client.evm.wait_for_user_operation.side_effect, AsyncMock
-                    )
-                ):
-                    # Use the side_effect function/exception directly
-                    if callable(
-                        mock_cdp_client.evm.wait_for_user_operation.side_effect
-                    ) and not isinstance(
-                        mock_cdp_client.evm.wait_for_user_operation.side_effect, type
-                    ):
-                        try:
-                            # Call the side effect function
-                            mock_cdp_client.evm.wait_for_user_operation.side_effect()
-                        except Exception as e:
-                            raise e
-                    else:
-                        # It's an exception instance or class
-                        if isinstance(
-                            mock_cdp_client.evm.wait_for_user_operation.side_effect, type
-                        ):
-                            raise mock_cdp_client.evm.wait_for_user_operation.side_effect(
-                                "Transaction timed out"
-                            )
-                        else:
-                            raise mock_cdp_client.evm.wait_for_user_operation.side_effect
-
-                # Return a mock with transaction_hash property for successful cases
-                mock_result = Mock()
-                mock_result.transaction_hash = MOCK_TRANSACTION_HASH
-                return mock_result
-            # For client.close, just return None
-            return None
-
-        provider._run_async = Mock(side_effect=run_async_side_effect)
+        provider._session = CdpClientSession(provider.get_client)
         provider._paymaster_url = MOCK_PAYMASTER_URL
 
         yield provider
+
+        provider.close()
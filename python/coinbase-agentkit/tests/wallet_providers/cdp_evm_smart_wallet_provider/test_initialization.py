@@ -13,6 +13,7 @@ from coinbase_agentkit.wallet_providers.cdp_evm_smart_wallet_provider import (
 
 from .conftest import (
     MOCK_ADDRESS,
+    MOCK_ADDRESS_TO,
     MOCK_API_KEY_ID,
     MOCK_API_KEY_SECRET,
     MOCK_NETWORK_ID,
@@ -20,16 +21,18 @@ from .conftest import (
     MOCK_WALLET_SECRET,
 )
 
+MOCK_OWNER_ADDRESS = MOCK_ADDRESS_TO
+
 # =========================================================
 # initialization tests
 # =========================================================
 
 
-def test_init_with_config(mock_cdp_client, mock_asyncio, mock_network_id_to_chain):
+def test_init_with_config(mock_cdp_client, mock_network_id_to_chain):
     """Test initialization with full configuration."""
     # Setup the mocks for async operation
     mock_owner = Mock(spec=Account)
-    mock_owner.address = "0x123456789012345678901234567890123456789012"
+    mock_owner.address = MOCK_OWNER_ADDRESS
 
     mock_smart_account = Mock()
     mock_smart_account.address = MOCK_ADDRESS
@@ -58,21 +61,21 @@ def test_init_with_config(mock_cdp_client, mock_asyncio, mock_network_id_to_chai
         paymaster_url=MOCK_PAYMASTER_URL,
     )
 
-    provider = CdpEvmSmartWalletProvider(config)
-
-    assert provider.get_address() == MOCK_ADDRESS
-    assert provider.get_name() == "cdp_evm_smart_wallet_provider"
-    assert provider._api_key_id == MOCK_API_KEY_ID
-    assert provider._api_key_secret == MOCK_API_KEY_SECRET
-    assert provider._wallet_secret == MOCK_WALLET_SECRET
-    assert provider._paymaster_url == MOCK_PAYMASTER_URL
+    with CdpEvmSmartWalletProvider(config) as provider:
+        assert provider.get_address() == MOCK_ADDRESS
+        assert provider.get_name() == "cdp_evm_smart_wallet_provider"
+        assert provider._api_key_id == MOCK_API_KEY_ID
+        assert provider._api_key_secret == MOCK_API_KEY_SECRET
+        assert provider._wallet_secret == MOCK_WALLET_SECRET
+        assert provider._paymaster_url == MOCK_PAYMASTER_URL
+        assert provider._smart_account is mock_smart_account
 
 
-def test_init_with_env_vars(mock_cdp_client, mock_asyncio, mock_network_id_to_chain):
+def test_init_with_env_vars(mock_cdp_client, mock_network_id_to_chain):
     """Test initialization using environment variables."""
     # Setup the mocks for async operation
     mock_owner = Mock(spec=Account)
-    mock_owner.address = "0x123456789012345678901234567890123456789012"
+    mock_owner.address = MOCK_OWNER_ADDRESS
 
     mock_smart_account = Mock()
     mock_smart_account.address = MOCK_ADDRESS
@@ -101,20 +104,19 @@ def test_init_with_env_vars(mock_cdp_client, mock_asyncio, mock_network_id_to_ch
 
     with patch.dict(os.environ, mock_env_vars, clear=True):
         config = CdpEvmSmartWalletProviderConfig()
-        provider = CdpEvmSmartWalletProvider(config)
+        with CdpEvmSmartWalletProvider(config) as provider:
+            assert provider.get_name() == "cdp_evm_smart_wallet_provider"
+            assert provider._api_key_id == MOCK_API_KEY_ID
+            assert provider._api_key_secret == MOCK_API_KEY_SECRET
+            assert provider._wallet_secret == MOCK_WALLET_SECRET
 
-        assert provider.get_name() == "cdp_evm_smart_wallet_provider"
-        assert provider._api_key_id == MOCK_API_KEY_ID
-        assert provider._api_key_secret == MOCK_API_KEY_SECRET
-        assert provider._wallet_secret == MOCK_WALLET_SECRET
 
-
-def test_init_with_private_key_owner(mock_cdp_client, mock_asyncio, mock_network_id_to_chain):
+def test_init_with_private_key_owner(mock_cdp_client, mock_network_id_to_chain):
     """Test initialization with private key owner."""
     # Setup the mocks for async operation
     private_key = "0x0123456789abcdef0123456789abcdef0123456789abcdef0123456789abcdef"
     mock_owner = Mock(spec=Account)
-    mock_owner.address = "0x123456789012345678901234567890123456789012"
+    mock_owner.address = MOCK_OWNER_ADDRESS
 
     mock_smart_account = Mock()
     mock_smart_account.address = MOCK_ADDRESS
@@ -124,14 +126,6 @@ def test_init_with_private_key_owner(mock_cdp_client, mock_asyncio, mock_network
     ) as mock_account_class:
         mock_account_class.from_key.return_value = mock_owner
 
-        # Update mock_asyncio.run to return a tuple with the owner and smart_account for initialization
-        def run_side_effect(coro):
-            if coro.__name__ == "initialize_accounts":
-                return (mock_owner, mock_smart_account)
-            return None
-
-        mock_asyncio.run.side_effect = run_side_effect
-
         async def create_smart_account_mock(*args, **kwargs):
             return mock_smart_account
 
@@ -147,10 +141,10 @@ def test_init_with_private_key_owner(mock_cdp_client, mock_asyncio, mock_network
 
         provider = CdpEvmSmartWalletProvider(config)
 
-        # Don't check if from_key was called, since we're mocking asyncio.run
-        # We only care that the provider was initialized correctly
         assert provider.get_address() == MOCK_ADDRESS
         assert provider._owner == mock_owner
+        mock_account_class.from_key.assert_called_once_with(private_key)
+        provider.close()
 
 
 def test_init_without_required_credentials():
@@ -175,7 +169,7 @@ def test_init_without_owner():
         CdpEvmSmartWalletProvider(config)
 
 
-def test_init_with_invalid_network_id(mock_cdp_client, mock_asyncio):
+def test_init_with_invalid_network_id(mock_cdp_client):
     """Test initialization with invalid network ID."""
     invalid_network_id = "invalid-network"
 
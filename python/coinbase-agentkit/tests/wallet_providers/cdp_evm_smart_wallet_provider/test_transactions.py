@@ -360,3 +360,24 @@ def test_native_transfer(mocked_wallet_provider, mock_cdp_client, mock_smart_acc
 
     assert tx_hash == MOCK_TRANSACTION_HASH
     mock_web3.to_wei.assert_called_once_with(amount, "ether")
+
+
+def test_session_and_smart_account_reused(mocked_wallet_provider, mock_cdp_client):
+    """Test that consecutive user operations share one client and one smart account lookup."""
+    user_op = Mock()
+    user_op.user_op_hash = "mock_user_op_hash"
+    mock_cdp_client.evm.send_user_operation.return_value = user_op
+
+    transaction = {"to": MOCK_ADDRESS_TO, "value": MOCK_ONE_ETH_WEI}
+    assert mocked_wallet_provider.send_transaction(transaction) == MOCK_TRANSACTION_HASH
+    assert mocked_wallet_provider.native_transfer(MOCK_ADDRESS_TO, Decimal("1")) == (
+        MOCK_TRANSACTION_HASH
+    )
+
+    assert mocked_wallet_provider.get_client.call_count == 1
+    assert mock_cdp_client.evm.get_smart_account.await_count == 1
+    mock_cdp_client.close.assert_not_called()
+
+    mocked_wallet_provider.close()
+
+    mock_cdp_client.close.assert_awaited_once()
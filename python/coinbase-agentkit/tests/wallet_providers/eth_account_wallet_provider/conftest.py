@@ -30,6 +30,8 @@ MOCK_ADDRESS_TO = "0x1234567890123456789012345678901234567890"
 MOCK_GAS_LIMIT = 21000
 MOCK_GAS_PRICE = 20000000000
 MOCK_BASE_FEE_PER_GAS = 10000000000
+MOCK_PRIORITY_FEE_PER_GAS = 1000000000
+MOCK_BLOCK_NUMBER = 1000
 
 MOCK_ONE_ETH_WEI = 1000000000000000000
 MOCK_BALANCE = Decimal(MOCK_ONE_ETH_WEI)
@@ -83,6 +85,13 @@ def mock_web3():
         mock_block = {"baseFeePerGas": MOCK_BASE_FEE_PER_GAS}
         mock_web3_instance.eth.get_block.return_value = mock_block
 
+        mock_web3_instance.eth.block_number = MOCK_BLOCK_NUMBER
+        mock_web3_instance.eth.fee_history.return_value = {
+            "oldestBlock": MOCK_BLOCK_NUMBER - 2,
+            "baseFeePerGas": [MOCK_BASE_FEE_PER_GAS] * 4,
+            "reward": [[MOCK_PRIORITY_FEE_PER_GAS]] * 3,
+        }
+
         mock_web3_instance.eth.estimate_gas.return_value = MOCK_GAS_LIMIT
 
         mock_web3_instance.eth.send_transaction.return_value = bytes.fromhex(MOCK_TX_HASH[2:])
@@ -4,7 +4,7 @@ import pytest
 
 from coinbase_agentkit.network import Network
 
-from .conftest import MOCK_ADDRESS, MOCK_BALANCE, MOCK_CHAIN_ID
+from .conftest import MOCK_ADDRESS, MOCK_BALANCE, MOCK_BLOCK_NUMBER, MOCK_CHAIN_ID
 
 # =========================================================
 # basic methods tests
@@ -24,6 +24,20 @@ def test_get_network(wallet_provider):
     assert network.chain_id == MOCK_CHAIN_ID
 
 
+def test_get_block_number(wallet_provider):
+    """Test get_block_number method."""
+    assert wallet_provider.get_block_number() == MOCK_BLOCK_NUMBER
+
+
+def test_get_logs(wallet_provider, mock_web3):
+    """Test get_logs method."""
+    filter_params = {"fromBlock": 1, "toBlock": 2, "topics": ["0x01"]}
+    mock_web3.return_value.eth.get_logs.return_value = [{"logIndex": 0}]
+
+    assert wallet_provider.get_logs(filter_params) == [{"logIndex": 0}]
+    mock_web3.return_value.eth.get_logs.assert_called_once_with(filter_params)
+
+
 def test_get_balance(wallet_provider, mock_web3):
     """Test get_balance method."""
     balance = wallet_provider.get_balance()
@@ -1,10 +1,14 @@
 """Tests for ETH Account Wallet Provider contract operations."""
 
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pytest
+from eth_abi import encode
+from web3 import Web3
 
-from .conftest import MOCK_ADDRESS_TO
+from coinbase_agentkit.wallet_providers import ContractCall
+
+from .conftest import MOCK_ADDRESS, MOCK_ADDRESS_TO
 
 # =========================================================
 # contract tests
@@ -85,3 +89,164 @@ def test_read_contract_with_contract_logic_error(wallet_provider, mock_web3):
 
     with pytest.raises(ContractLogicError, match=error_message):
         wallet_provider.read_contract(contract_address, abi, "testFunction")
+
+
+# =========================================================
+# batched contract read tests
+# =========================================================
+
+BALANCE_OF_ABI = [
+    {
+        "name": "balanceOf",
+        "type": "function",
+        "inputs": [{"name": "account", "type": "address"}],
+        "outputs": [{"name": "", "type": "uint256"}],
+        "stateMutability": "view",
+    },
+    {
+        "name": "owner",
+        "type": "function",
+        "inputs": [],
+        "outputs": [{"name": "", "type": "address"}],
+        "stateMutability": "view",
+    },
+]
+
+
+def test_read_contracts_uses_multicall3(wallet_provider):
+    """Test read_contracts aggregates all calls into a single multicall3 read."""
+    calls = [
+        ContractCall(
+            contract_address=MOCK_ADDRESS_TO,
+            abi=BALANCE_OF_ABI,
+            function_name="balanceOf",
+            args=[MOCK_ADDRESS],
+        ),
+        ContractCall(contract_address=MOCK_ADDRESS_TO, abi=BALANCE_OF_ABI, function_name="owner"),
+    ]
+
+    with patch.object(
+        wallet_provider,
+        "read_contract",
+        return_value=[
+            (True, encode(["uint256"], [42])),
+            (True, encode(["address"], [MOCK_ADDRESS.lower()])),
+        ],
+    ) as mock_read_contract:
+        results = wallet_provider.read_contracts(calls, block_identifier=20_000_000)
+
+    mock_read_contract.assert_called_once()
+    kwargs = mock_read_contract.call_args.kwargs
+    assert kwargs["function_name"] == "aggregate3"
+    assert kwargs["block_identifier"] == 20_000_000
+    assert kwargs["contract_address"] == Web3.to_checksum_address(
+        "0xca11bde05977b3631167028862be2a173976ca11"
+    )
+    assert len(kwargs["args"][0]) == 2
+
+    assert [r.success for r in results] == [True, True]
+    assert results[0].result == 42
+    assert results[1].result == MOCK_ADDRESS
+
+
+def test_read_contracts_allow_failure(wallet_provider):
+    """Test read_contracts reports failed calls that allow failure."""
+    calls = [
+        ContractCall(
+            contract_address=MOCK_ADDRESS_TO,
+            abi=BALANCE_OF_ABI,
+            function_name="owner",
+            allow_failure=True,
+        ),
+        ContractCall(
+            contract_address=MOCK_ADDRESS_TO,
+            abi=BALANCE_OF_ABI,
+            function_name="balanceOf",
+            args=[MOCK_ADDRESS],
+            allow_failure=True,
+        ),
+    ]
+
+    with patch.object(
+        wallet_provider,
+        "read_contract",
+        return_value=[(False, b""), (True, b"")],
+    ):
+        results = wallet_provider.read_contracts(calls)
+
+    assert not results[0].success
+    assert "owner" in results[0].error
+    assert not results[1].success
+    assert results[1].error
+
+
+def test_read_contracts_sequential_fallback(wallet_provider):
+    """Test read_contracts falls back to sequential reads without multicall3."""
+    calls = [
+        ContractCall(contract_address=MOCK_ADDRESS_TO, abi=BALANCE_OF_ABI, function_name="owner"),
+        ContractCall(
+            contract_address=MOCK_ADDRESS_TO,
+            abi=BALANCE_OF_ABI,
+            function_name="balanceOf",
+            args=[MOCK_ADDRESS],
+            allow_failure=True,
+        ),
+    ]
+
+    with (
+        patch(
+            "coinbase_agentkit.wallet_providers.evm_wallet_provider.get_multicall3_address",
+            return_value=None,
+        ),
+        patch.object(
+            wallet_provider,
+            "read_contract",
+            side_effect=[MOCK_ADDRESS, Exception("execution reverted")],
+        ) as mock_read_contract,
+    ):
+        results = wallet_provider.read_contracts(calls)
+
+    assert mock_read_contract.call_count == 2
+    assert results[0].success and results[0].result == MOCK_ADDRESS
+    assert not results[1].success
+    assert results[1].error == "execution reverted"
+
+
+def test_read_contracts_sequential_fallback_raises(wallet_provider):
+    """Test read_contracts raises in fallback mode when a strict call fails."""
+    calls = [
+        ContractCall(contract_address=MOCK_ADDRESS_TO, abi=BALANCE_OF_ABI, function_name="owner"),
+    ]
+
+    with (
+        patch(
+            "coinbase_agentkit.wallet_providers.evm_wallet_provider.get_multicall3_address",
+            return_value=None,
+        ),
+        patch.object(wallet_provider, "read_contract", side_effect=Exception("boom")),
+        pytest.raises(Exception, match="boom"),
+    ):
+        wallet_provider.read_contracts(calls)
+
+
+def test_read_contracts_before_multicall3_deployment(wallet_provider):
+    """Test read_contracts does not use multicall3 for blocks before its deployment."""
+    calls = [
+        ContractCall(contract_address=MOCK_ADDRESS_TO, abi=BALANCE_OF_ABI, function_name="owner"),
+    ]
+
+    with patch.object(
+        wallet_provider, "read_contract", return_value=MOCK_ADDRESS
+    ) as mock_read_contract:
+        results = wallet_provider.read_contracts(calls, block_identifier=1)
+
+    assert mock_read_contract.call_args.kwargs["function_name"] == "owner"
+    assert results[0].result == MOCK_ADDRESS
+
+
+def test_read_contracts_empty(wallet_provider):
+    """Test read_contracts with no calls does not hit the network."""
+    with patch.object(wallet_provider, "read_contract") as mock_read_contract:
+        assert wallet_provider.read_contracts([]) == []
+
+    mock_read_contract.assert_not_called()
@@ -169,3 +169,126 @@ def test_native_transfer_with_invalid_address(wallet_provider, mock_web3):
 
     with pytest.raises(Exception, match="Failed to transfer native tokens: Invalid address format"):
         wallet_provider.native_transfer(invalid_address, Decimal("1.0"))
+
+
+def test_send_transactions_pipelines_nonces(wallet_provider, mock_web3):
+    """Test that back to back sends use consecutive local nonces."""
+    eth = mock_web3.return_value.eth
+    eth.get_transaction_count.return_value = 5
+
+    wallet_provider.send_transaction({"to": MOCK_ADDRESS_TO, "value": 1})
+    wallet_provider.send_transactions(
+        [{"to": MOCK_ADDRESS_TO, "value": 2}, {"to": MOCK_ADDRESS_TO, "value": 3}]
+    )
+
+    nonces = [c.args[0]["nonce"] for c in eth.send_transaction.call_args_list]
+    assert nonces == [5, 6, 7]
+    eth.get_transaction_count.assert_called_once_with(MOCK_ADDRESS, "pending")
+    eth.fee_history.assert_called_once()
+
+
+def test_send_transaction_resyncs_on_nonce_error(wallet_provider, mock_web3):
+    """Test that a nonce error triggers a resync and a single retry."""
+    eth = mock_web3.return_value.eth
+    eth.get_transaction_count.side_effect = [0, 9]
+    sent_nonces = []
+
+    def send_transaction(transaction):
+        sent_nonces.append(transaction["nonce"])
+        if len(sent_nonces) == 1:
+            raise ValueError({"code": -32000, "message": "nonce too low"})
+        return bytes.fromhex(MOCK_TX_HASH[2:])
+
+    eth.send_transaction.side_effect = send_transaction
+
+    assert wallet_provider.send_transaction({"to": MOCK_ADDRESS_TO, "value": 1}) == MOCK_TX_HASH
+    assert sent_nonces == [0, 9]
+
+
+def test_send_transaction_failure_releases_nonce(wallet_provider, mock_web3):
+    """Test that a nonce is reused after a transaction fails to broadcast."""
+    eth = mock_web3.return_value.eth
+    eth.get_transaction_count.return_value = 3
+    eth.send_transaction.side_effect = [
+        Exception("insufficient funds"),
+        bytes.fromhex(MOCK_TX_HASH[2:]),
+    ]
+
+    with pytest.raises(Exception, match="insufficient funds"):
+        wallet_provider.send_transaction({"to": MOCK_ADDRESS_TO, "value": 1})
+    wallet_provider.send_transaction({"to": MOCK_ADDRESS_TO, "value": 1})
+
+    assert [c.args[0]["nonce"] for c in eth.send_transaction.call_args_list] == [3, 3]
+
+
+def test_send_transaction_keeps_explicit_nonce(wallet_provider, mock_web3):
+    """Test that a caller supplied nonce bypasses the nonce manager."""
+    eth = mock_web3.return_value.eth
+
+    wallet_provider.send_transaction({"to": MOCK_ADDRESS_TO, "value": 1, "nonce": 42})
+
+    assert eth.send_transaction.call_args.args[0]["nonce"] == 42
+    eth.get_transaction_count.assert_not_called()
+
+
+def test_send_transactions_reassigns_nonces_after_resync(wallet_provider, mock_web3):
+    """Test that a resync mid-batch gives the rest of the batch consecutive fresh nonces."""
+    eth = mock_web3.return_value.eth
+    eth.get_transaction_count.side_effect = [0, 9]
+    sent_nonces = []
+
+    def send_transaction(transaction):
+        sent_nonces.append(transaction["nonce"])
+        if len(sent_nonces) == 2:
+            raise ValueError({"code": -32000, "message": "nonce too low"})
+        return bytes.fromhex(MOCK_TX_HASH[2:])
+
+    eth.send_transaction.side_effect = send_transaction
+
+    wallet_provider.send_transactions(
+        [{"to": MOCK_ADDRESS_TO, "value": value} for value in (1, 2, 3)]
+    )
+
+    assert sent_nonces == [0, 1, 9, 10]
+    wallet_provider.send_transaction({"to": MOCK_ADDRESS_TO, "value": 4})
+    assert sent_nonces[-1] == 11
+
+
+def test_send_transactions_estimates_gas_before_each_send(wallet_provider, mock_web3):
+    """Test that gas is estimated lazily and a failed estimate releases the unsent nonces."""
+    eth = mock_web3.return_value.eth
+    eth.get_transaction_count.return_value = 4
+    calls = []
+    eth.send_transaction.side_effect = lambda tx: calls.append(("send", tx["nonce"])) or bytes(32)
+
+    def estimate_gas(transaction):
+        calls.append(("estimate", transaction["nonce"]))
+        if transaction["value"] == 2:
+            raise ValueError("execution reverted")
+        return 21000
+
+    eth.estimate_gas.side_effect = estimate_gas
+
+    with pytest.raises(ValueError, match="execution reverted"):
+        wallet_provider.send_transactions(
+            [{"to": MOCK_ADDRESS_TO, "value": value} for value in (1, 2, 3)]
+        )
+
+    assert calls == [("estimate", 4), ("send", 4), ("estimate", 5)]
+
+    eth.estimate_gas.side_effect = None
+    eth.estimate_gas.return_value = 21000
+    wallet_provider.send_transaction({"to": MOCK_ADDRESS_TO, "value": 1})
+    assert calls[-1] == ("send", 5)
+
+
+def test_send_transactions_keeps_explicit_gas(wallet_provider, mock_web3):
+    """Test that a caller supplied gas limit skips estimation, e.g. for dependent batches."""
+    eth = mock_web3.return_value.eth
+
+    wallet_provider.send_transactions(
+        [{"to": MOCK_ADDRESS_TO, "value": 1}, {"to": MOCK_ADDRESS_TO, "value": 2, "gas": 90000}]
+    )
+
+    assert eth.estimate_gas.call_count == 1
+    assert eth.send_transaction.call_args.args[0]["gas"] == 90000
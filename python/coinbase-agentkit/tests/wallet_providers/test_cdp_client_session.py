@@ -0,0 +1,107 @@
+"""Tests for the long-lived CDP client session."""
+
+import asyncio
+import threading
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from coinbase_agentkit.wallet_providers.cdp_client_session import CdpClientSession
+
+
+@pytest.fixture
+def client():
+    """Create a mock CDP client."""
+    client = Mock()
+    client.close = AsyncMock()
+    return client
+
+
+@pytest.fixture
+def session(client):
+    """Create a session around the mock client."""
+    session = CdpClientSession(Mock(return_value=client))
+    yield session
+    session.close()
+
+
+def test_run_uses_one_background_loop(session):
+    """Test that every call runs on the same background loop thread."""
+
+    async def current_thread():
+        return threading.current_thread()
+
+    first = session.run(current_thread())
+    second = session.run(current_thread())
+
+    assert first is second
+    assert first is not threading.current_thread()
+
+
+def test_client_is_created_once(session, client):
+    """Test that the client is built lazily and reused."""
+    assert session.client is client
+    assert session.client is client
+    assert session._client_factory.call_count == 1
+
+
+def test_arun_from_another_loop(session):
+    """Test running a coroutine on the session loop from a caller's event loop."""
+
+    async def loop_id():
+        return id(asyncio.get_running_loop())
+
+    async def caller():
+        return id(asyncio.get_running_loop()), await session.arun(loop_id())
+
+    caller_loop, session_loop = asyncio.run(caller())
+
+    assert caller_loop != session_loop
+    assert session.run(loop_id()) == session_loop
+
+
+def test_run_propagates_exceptions(session):
+    """Test that exceptions raised on the session loop reach the caller."""
+
+    async def fail():
+        raise ConnectionError("boom")
+
+    with pytest.raises(ConnectionError, match="boom"):
+        session.run(fail())
+
+
+def test_run_from_session_loop_raises(session):
+    """Test that blocking on the session from its own loop is rejected."""
+
+    async def nested():
+        async def inner():
+            return 1
+
+        session.run(inner())
+
+    with pytest.raises(RuntimeError, match="session loop"):
+        session.run(nested())
+
+
+def test_close_closes_client_and_reopens(session, client):
+    """Test that close releases the client and the session can be reused afterwards."""
+
+    async def use_client():
+        return session.client
+
+    session.run(use_client())
+    session.close()
+
+    client.close.assert_awaited_once()
+    assert not session.is_open
+
+    assert session.run(use_client()) is client
+    assert session.is_open
+
+
+def test_close_without_use_is_noop(client):
+    """Test that closing an unused session does nothing."""
+    session = CdpClientSession(Mock(return_value=client))
+    session.close()
+
+    client.close.assert_not_called()
@@ -27,6 +27,7 @@ def test_required_methods():
     assert hasattr(EvmWalletProvider, "send_transaction")
     assert hasattr(EvmWalletProvider, "wait_for_transaction_receipt")
     assert hasattr(EvmWalletProvider, "read_contract")
+    assert hasattr(EvmWalletProvider, "read_contracts")
 
     assert hasattr(EvmWalletProvider, "get_address")
     assert hasattr(EvmWalletProvider, "get_network")
@@ -58,6 +59,7 @@ def test_method_signatures():
         "send_transaction": ["transaction"],
         "wait_for_transaction_receipt": ["tx_hash", "timeout", "poll_latency"],
         "read_contract": ["contract_address", "abi", "function_name", "args", "block_identifier"],
+        "read_contracts": ["calls", "block_identifier"],
         "get_address": [],
         "get_network": [],
         "get_balance": [],
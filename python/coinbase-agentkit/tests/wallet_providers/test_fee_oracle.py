@@ -0,0 +1,80 @@
+"""Tests for the shared EIP-1559 fee oracle."""
+
+import threading
+from unittest.mock import Mock
+
+from coinbase_agentkit.wallet_providers.fee_oracle import (
+    DEFAULT_PRIORITY_FEE_PER_GAS,
+    FeeOracle,
+    get_fee_oracle,
+)
+
+MOCK_BLOCK_NUMBER = 500
+MOCK_NEXT_BASE_FEE = 7_000_000
+
+
+def _mock_web3(rewards):
+    web3 = Mock()
+    web3.eth.block_number = MOCK_BLOCK_NUMBER
+    web3.eth.fee_history.return_value = {
+        "oldestBlock": MOCK_BLOCK_NUMBER - len(rewards) + 1,
+        "baseFeePerGas": [1] * len(rewards) + [MOCK_NEXT_BASE_FEE],
+        "reward": [[reward] for reward in rewards],
+    }
+    return web3
+
+
+def test_uses_median_reward_and_next_base_fee():
+    """Test that the estimate uses the median sampled reward and the projected base fee."""
+    oracle = FeeOracle(_mock_web3([1, 0, 5, 3, 100]), block_count=5, reward_percentile=40)
+
+    fees = oracle.get_fees()
+
+    assert fees.block_number == MOCK_BLOCK_NUMBER
+    assert fees.base_fee_per_gas == MOCK_NEXT_BASE_FEE
+    assert fees.max_priority_fee_per_gas == 4
+    oracle._web3.eth.fee_history.assert_called_once_with(5, MOCK_BLOCK_NUMBER, [40])
+
+
+def test_empty_blocks_use_fallback_priority_fee():
+    """Test that blocks without priority fees fall back to the default."""
+    oracle = FeeOracle(_mock_web3([0, 0]))
+
+    assert oracle.get_fees().max_priority_fee_per_gas == DEFAULT_PRIORITY_FEE_PER_GAS
+
+
+def test_falls_back_to_latest_block_without_fee_history():
+    """Test the fallback for nodes that do not support eth_feeHistory."""
+    web3 = _mock_web3([1])
+    web3.eth.fee_history.side_effect = ValueError("method not found")
+    web3.eth.get_block.return_value = {"baseFeePerGas": 123}
+
+    fees = FeeOracle(web3).get_fees()
+
+    assert fees.base_fee_per_gas == 123
+    assert fees.max_priority_fee_per_gas == DEFAULT_PRIORITY_FEE_PER_GAS
+    web3.eth.get_block.assert_called_once_with(MOCK_BLOCK_NUMBER)
+
+
+def test_concurrent_callers_share_one_fetch():
+    """Test that callers in the same block share a single fee history request."""
+    web3 = _mock_web3([2])
+    oracle = FeeOracle(web3)
+
+    threads = [threading.Thread(target=oracle.get_fees) for _ in range(10)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    web3.eth.fee_history.assert_called_once()
+
+
+def test_get_fee_oracle_is_shared_per_endpoint():
+    """Test that providers connected to the same endpoint share an oracle."""
+    first, second, other = Mock(), Mock(), Mock()
+    first.provider.endpoint_uri = second.provider.endpoint_uri = "https://rpc.example/shared"
+    other.provider.endpoint_uri = "https://rpc.example/other"
+
+    assert get_fee_oracle(first) is get_fee_oracle(second)
+    assert get_fee_oracle(first) is not get_fee_oracle(other)
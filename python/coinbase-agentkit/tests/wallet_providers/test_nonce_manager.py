@@ -0,0 +1,128 @@
+"""Tests for the local nonce manager."""
+
+import threading
+from unittest.mock import Mock
+
+import pytest
+
+from coinbase_agentkit.wallet_providers.nonce_manager import NonceManager, is_nonce_error
+
+MOCK_KEY = "84532:0x742d35Cc6634C0532925a3b844Bc454e4438f44e"
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def make_manager(request, tmp_path):
+    """Build nonce managers backed by memory or by a shared SQLite file."""
+    managers = []
+
+    def make(fetch_nonce):
+        store_path = str(tmp_path / "nonces.db") if request.param == "sqlite" else None
+        manager = NonceManager(MOCK_KEY, fetch_nonce, store_path=store_path)
+        managers.append(manager)
+        return manager
+
+    yield make
+
+    for manager in managers:
+        manager.close()
+
+
+def test_reserve_fetches_chain_nonce_once(make_manager):
+    """Test that only the first reservation queries the chain."""
+    fetch_nonce = Mock(return_value=7)
+    manager = make_manager(fetch_nonce)
+
+    assert [manager.reserve() for _ in range(3)] == [7, 8, 9]
+    assert manager.reserve_many(2) == [10, 11]
+    fetch_nonce.assert_called_once()
+
+
+def test_release_last_nonce_rolls_back(make_manager):
+    """Test that releasing the most recent nonce hands it out again."""
+    manager = make_manager(Mock(return_value=0))
+
+    nonce = manager.reserve()
+    manager.release(nonce)
+
+    assert manager.reserve() == nonce
+
+
+def test_release_fills_gaps_first(make_manager):
+    """Test that a released nonce in the middle is reused before new ones."""
+    manager = make_manager(Mock(return_value=0))
+    manager.reserve_many(3)
+
+    manager.release(1)
+
+    assert manager.reserve() == 1
+    assert manager.reserve() == 3
+
+
+def test_release_collapses_trailing_gaps(make_manager):
+    """Test that releasing nonces out of order still rolls the counter back."""
+    manager = make_manager(Mock(return_value=0))
+    manager.reserve_many(3)
+
+    manager.release(1)
+    manager.release(2)
+
+    assert manager.reserve_many(2) == [1, 2]
+
+
+def test_resync_reloads_from_chain(make_manager):
+    """Test that resync discards local state."""
+    fetch_nonce = Mock(side_effect=[0, 5])
+    manager = make_manager(fetch_nonce)
+    manager.reserve_many(2)
+    manager.release(0)
+
+    assert manager.resync() == 5
+    assert manager.reserve() == 5
+
+
+def test_concurrent_reservations_are_unique(make_manager, request):
+    """Test that threads, and managers sharing a store, never receive the same nonce."""
+    first = make_manager(Mock(return_value=0))
+    second = make_manager(Mock(return_value=0)) if "sqlite" in request.node.name else first
+    reserved = []
+
+    def worker(manager):
+        for _ in range(25):
+            reserved.append(manager.reserve())
+
+    threads = [threading.Thread(target=worker, args=(m,)) for m in (first, second) * 2]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(set(reserved)) == len(reserved) == 100
+
+
+def test_sqlite_store_is_shared(tmp_path):
+    """Test that two managers pointing at one file continue each other's sequence."""
+    store_path = str(tmp_path / "nonces.db")
+    first = NonceManager(MOCK_KEY, Mock(return_value=3), store_path=store_path)
+    second_fetch = Mock(return_value=0)
+    second = NonceManager(MOCK_KEY, second_fetch, store_path=store_path)
+
+    assert first.reserve() == 3
+    assert second.reserve() == 4
+    second_fetch.assert_not_called()
+
+    first.close()
+    second.close()
+
+
+@pytest.mark.parametrize(
+    ("message", "expected"),
+    [
+        ("nonce too low: next nonce 5, tx nonce 4", True),
+        ("already known", True),
+        ("replacement transaction underpriced", True),
+        ("insufficient funds for gas * price + value", False),
+    ],
+)
+def test_is_nonce_error(message, expected):
+    """Test detection of nonce related RPC errors."""
+    assert is_nonce_error(ValueError({"code": -32000, "message": message})) is expected
@@ -14,7 +14,9 @@ import questionary
 import requests
 from copier import run_copy
 from prompt_toolkit.styles import Style  # Import for custom styling
+from requests.adapters import HTTPAdapter
 from rich.console import Console
+from urllib3.util.retry import Retry
 
 # Enforce Python version 3.10 or 3.11
 REQUIRED_MAJOR = 3
@@ -34,6 +36,10 @@ GITHUB_ZIP_URL_TEMPLATE = f"https://github.com/{GITHUB_REPO}/archive/"
 TEMPLATES_SUBDIR_PREFIX = "python/create-onchain-agent/templates"
 LOCAL_CACHE_DIR = Path(platformdirs.user_cache_dir("create-onchain-agent"))
 
+# HTTP timeouts in seconds, as (connect, read)
+GITHUB_API_TIMEOUT = (5, 10)
+GITHUB_ZIP_TIMEOUT = (5, 60)
+
 console = Console()
 
 # Define a custom style for Questionary prompts
@@ -47,6 +53,20 @@ custom_style = Style.from_dict(
     }
 )
 
+
+def create_http_session() -> requests.Session:
+    """Create a session that reuses connections to GitHub and retries transient failures."""
+    session = requests.Session()
+    retries = Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset({"GET"}),
+    )
+    session.mount("https://", HTTPAdapter(max_retries=retries))
+    return session
+
+
 # Network constants
 EVM_NETWORKS = [
     ("base-mainnet", "Base Mainnet"),
@@ -113,9 +133,10 @@ def get_template_path(template_name: str, templates_path: str | None = None) ->
             zip_path.unlink()
 
     # Get the latest commit SHA from the GitHub API
+    session = create_http_session()
     commit_sha = None
     try:
-        response = requests.get(GITHUB_API_URL, timeout=10)
+        response = session.get(GITHUB_API_URL, timeout=GITHUB_API_TIMEOUT)
         response.raise_for_status()
         commit_sha = response.json()["sha"]
         github_zip_url = f"{GITHUB_ZIP_URL_TEMPLATE}{commit_sha}.zip"
@@ -127,11 +148,12 @@ def get_template_path(template_name: str, templates_path: str | None = None) ->
         )
 
     # Download the zip file
-    response = requests.get(github_zip_url)
-    response.raise_for_status()
+    with session, session.get(github_zip_url, timeout=GITHUB_ZIP_TIMEOUT, stream=True) as response:
+        response.raise_for_status()
 
-    with open(zip_path, "wb") as f:
-        f.write(response.content)
+        with open(zip_path, "wb") as f:
+            for chunk in response.iter_content(chunk_size=64 * 1024):
+                f.write(chunk)
 
     # Determine the root directory within the ZIP
     root_dir = None
@@ -30,10 +30,17 @@ def get_langchain_tools(agent_kit: AgentKit) -> list[StructuredTool]:
 
             return tool_fn
 
+        def create_tool_coroutine(action=action):
+            async def tool_coroutine(**kwargs) -> str:
+                return await action.ainvoke(kwargs)
+
+            return tool_coroutine
+
         tool = StructuredTool(
             name=action.name,
             description=action.description,
             func=create_tool_fn(action),
+            coroutine=create_tool_coroutine(action),
             args_schema=action.args_schema,
         )
         tools.append(tool)
@@ -4,15 +4,11 @@ import json
 import warnings
 from typing import Any
 
-import nest_asyncio
 import pkg_resources
 from agents import FunctionTool, RunContextWrapper
 
 from coinbase_agentkit import Action, AgentKit
 
-# Apply nest-asyncio to allow nested event loops
-nest_asyncio.apply()
-
 
 def _check_web3_version() -> bool:
     """Check if web3 version is compatible with voice features.
@@ -90,7 +86,7 @@ def get_openai_agents_sdk_tools(agent_kit: AgentKit) -> list[FunctionTool]:
 
         async def invoke_tool(ctx: RunContextWrapper[Any], input_str: str, action=action) -> str:
             args = json.loads(input_str) if input_str else {}
-            return str(action.invoke(args))
+            return str(await action.ainvoke(args))
 
         # Get the schema and modify it for OpenAI compatibility
         schema = action.args_schema.model_json_schema()